@@ -9,6 +9,10 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
+# Background audit checkpointing is opt-in for tests (TestClient runs the
+# application lifespan); tests drive AuditCheckpointService directly
+os.environ.setdefault("AUDIT_CHECKPOINT_INTERVAL_SECONDS", "0")
+
 from backend.main import app
 from backend.models.ai_provider_config import AIProviderConfig
 from backend.models.base import Base, get_db
@@ -346,6 +346,7 @@ def get_session_manager(
 
     Note:
         - Uses database persistence (memory cache disabled)
+        - Validations are served from the process-wide session cache
         - Handles session creation, validation, and expiration
         - Supports 24-hour default or 30-day "remember me" sessions
     """
@@ -370,6 +371,7 @@ def get_session_manager(
         db=db,
         audit_logger=audit_logger,
         enable_memory_cache=False,  # Use database for persistence
+        use_validation_cache=True,  # Shared TTL cache of validated sessions
     )
 
 
@@ -437,11 +439,6 @@ async def get_current_user(
 
         now = datetime.now(timezone.utc)
         if db_session.expires_at.replace(tzinfo=timezone.utc) < now:
-            try:
-                db.delete(db_session)
-                db.commit()
-            except Exception:
-                db.rollback()
             return None
 
         user = db.query(User).filter(User.id == db_session.user_id).first()
@@ -567,7 +564,10 @@ async def get_current_user_id(
     # Use SessionManager for consistency with get_current_user dependency
     audit_logger = AuditLogger(db)
     session_manager = SessionManager(
-        db=db, audit_logger=audit_logger, enable_memory_cache=False
+        db=db,
+        audit_logger=audit_logger,
+        enable_memory_cache=False,
+        use_validation_cache=True,
     )
 
     try:
@@ -6,7 +6,6 @@ This backend replaces the Node.js Electron IPC handlers with HTTP REST API.
 The Electron frontend will make HTTP requests to this backend instead of using IPC.
 """
 
-import json
 import logging
 import os
 import sys
@@ -30,14 +29,15 @@ for env_path in env_paths:
 else:
     print("WARNING: No .env file found!")
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from backend.middleware.error_handler import ErrorHandlingMiddleware
+from backend.middleware.compression import CompressionMiddleware
 from backend.middleware.logging_middleware import LoggingMiddleware
 from backend.middleware.performance_middleware import PerformanceMiddleware
+from backend.middleware.tracing_middleware import TracingMiddleware
+from backend.middleware.response_wrapper import ResponseWrapperMiddleware
 from backend.models.base import init_db
 from backend.routes import auth_router
 from backend.routes.ai_config import router as ai_config_router
@@ -47,6 +47,7 @@ from backend.routes.chat import router as chat_router
 from backend.routes.dashboard import router as dashboard_router
 from backend.routes.database import router as database_router
 from backend.routes.deadlines import router as deadlines_router
+from backend.routes.diagnostics import router as diagnostics_router
 from backend.routes.evidence import router as evidence_router
 from backend.routes.export import router as export_router
 from backend.routes.gdpr import router as gdpr_router
@@ -57,10 +58,16 @@ from backend.routes.tags import router as tags_router
 from backend.routes.templates import router as templates_router
 from backend.routes.ui import router as ui_router
 from backend.routes.legal import router as legal_router
+from backend.utils.json_response import DEFAULT_RESPONSE_CLASS
 
 # Configure structured logging BEFORE any imports that create loggers
 # This sets up JSON-formatted logging for the entire application
-from backend.utils.structured_logger import StructuredFormatter, LogLevel
+from backend.utils.structured_logger import (
+    LogLevel,
+    StructuredFormatter,
+    start_queue_logging,
+    stop_queue_logging,
+)
 
 # Get root logger and configure with structured formatter
 root_logger = logging.getLogger()
@@ -70,10 +77,11 @@ root_logger.setLevel(logging.INFO)
 for handler in root_logger.handlers[:]:
     root_logger.removeHandler(handler)
 
-# Add structured JSON handler
+# Add structured JSON handler, written from a background thread through a
+# bounded queue (LOG_QUEUE_SIZE=0 writes synchronously instead)
 json_handler = logging.StreamHandler(sys.stdout)
 json_handler.setFormatter(StructuredFormatter(include_trace=True))
-root_logger.addHandler(json_handler)
+root_logger.addHandler(start_queue_logging([json_handler]) or json_handler)
 
 print("Structured JSON logging configured")
 
@@ -85,19 +93,35 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - Initialize database
-    - Initialize ServiceContainer with core services
+    - Initialize ServiceContainer with core services (audit logger built on first use)
     - Store container in app.state for dependency injection
+    - Start nightly UserStatsReconciler for dashboard counters
+    - Start idle-time incremental vacuum (DatabaseMaintenanceService)
+    - Start periodic WAL checkpointing (WalCheckpointManager)
+    - Load the signed-token revocation set (if SESSION_TOKEN_SECRET is set)
+    - Start batched deletion of expired sessions (ExpiredSessionSweeper)
 
     Shutdown:
     - Reset ServiceContainer
     - Cleanup resources
+    - Dispose the engine so pooled connections run PRAGMA optimize on close
+    - Flush the log queue
     """
     import base64
 
-    from backend.models.base import SessionLocal
+    from backend.models.base import SessionLocal, engine
+    from backend.services.audit_archive import get_audit_archive_service
+    from backend.services.audit_checkpoints import get_audit_checkpoint_service
     from backend.services.audit_logger import AuditLogger
+    from backend.services.audit_writer import get_audit_write_mode, get_audit_writer
     from backend.services.security.encryption import EncryptionService
     from backend.services.service_container import ServiceContainer
+    from backend.services.auth.password_hasher import get_password_hasher
+    from backend.services.auth.session_sweeper import get_session_sweeper
+    from backend.services.auth.session_tokens import get_session_token_service
+    from backend.services.database_maintenance import get_database_maintenance_service
+    from backend.services.user_stats_reconciler import UserStatsReconciler
+    from backend.services.wal_checkpoint_manager import get_wal_checkpoint_manager
 
     # Startup: Initialize database
     print("Initializing database...")
@@ -114,37 +138,149 @@ async def lifespan(app: FastAPI):
             "Then set: ENCRYPTION_KEY_BASE64=<generated_key>"
         )
 
+    # Built now so that an invalid key fails startup
     encryption_service = EncryptionService(encryption_key)
     print("EncryptionService initialized with persistent key")
 
-    # Initialize audit logger with a dedicated session
-    audit_db = SessionLocal()
-    audit_logger = AuditLogger(audit_db)
-    print("AuditLogger initialized")
+    # The audit logger and its dedicated session are created on first use
+    audit_sessions = []
+
+    def build_audit_logger() -> AuditLogger:
+        audit_db = SessionLocal()
+        audit_sessions.append(audit_db)
+        return AuditLogger(audit_db)
 
     # Initialize ServiceContainer singleton
     container = ServiceContainer()
-    container.initialize(
-        encryption_service=encryption_service,
-        audit_logger=audit_logger,
+    container.initialize_deferred(
+        encryption_service=lambda: encryption_service,
+        audit_logger=build_audit_logger,
         key_manager=None,  # KeyManager is optional for now
     )
-    print("ServiceContainer initialized")
+    print("ServiceContainer initialized (audit logger deferred)")
 
     # Store container in app state for dependency injection
     app.state.container = container
 
+    # Nightly reconciliation of trigger-maintained dashboard counters
+    stats_db = SessionLocal()
+    stats_reconciler = UserStatsReconciler(stats_db)
+    stats_reconciler.start()
+    app.state.user_stats_reconciler = stats_reconciler
+
+    # Reclaim free pages in small steps while the server is idle
+    maintenance = get_database_maintenance_service()
+    maintenance.start()
+
+    # Keep the -wal file bounded under constant audit writes
+    wal_manager = get_wal_checkpoint_manager()
+    wal_manager.start()
+
+    # Mirror token revocations so signed sessions validate without the database
+    token_service = get_session_token_service()
+    if token_service is not None:
+        token_service.start()
+
+    # Validation only rejects expired sessions; delete them here in batches
+    session_sweeper = get_session_sweeper()
+    session_sweeper.start()
+
+    # Batch audit writes off the request path (AUDIT_WRITE_MODE=batched)
+    audit_writer = get_audit_writer() if get_audit_write_mode() == "batched" else None
+    if audit_writer is not None:
+        audit_writer.start()
+
+    # Hourly signed audit checkpoints (needs a checkpoint or encryption key;
+    # AUDIT_CHECKPOINT_INTERVAL_SECONDS=0 disables the background task)
+    audit_checkpoints = get_audit_checkpoint_service()
+    if audit_checkpoints is not None and audit_checkpoints.interval_seconds > 0:
+        audit_checkpoints.start()
+
+    # Daily archival of old checkpointed audit segments (AUDIT_ARCHIVE_AFTER_DAYS)
+    audit_archive = get_audit_archive_service()
+    if audit_archive is not None:
+        audit_archive.start()
+
     yield  # Application runs here
 
     # Shutdown: Cleanup
     print("Shutting down backend...")
 
-    # Close audit logger's database session
+    # Stop dashboard counter reconciliation
     try:
-        audit_db.close()
-        print("AuditLogger session closed")
+        stats_reconciler.stop()
+        stats_db.close()
+        print("UserStatsReconciler stopped")
     except Exception as e:
-        print(f"Error closing audit db: {e}")
+        print(f"Error stopping user stats reconciler: {e}")
+
+    # Stop audit archival
+    if audit_archive is not None:
+        try:
+            audit_archive.stop()
+            print("AuditArchiveService stopped")
+        except Exception as e:
+            print(f"Error stopping audit archive service: {e}")
+
+    # Stop audit checkpointing
+    if audit_checkpoints is not None:
+        try:
+            audit_checkpoints.stop()
+            print("AuditCheckpointService stopped")
+        except Exception as e:
+            print(f"Error stopping audit checkpoint service: {e}")
+
+    # Flush queued audit entries and restore synchronous writes
+    if audit_writer is not None:
+        try:
+            audit_writer.stop()
+            print("AuditWriter stopped")
+        except Exception as e:
+            print(f"Error stopping audit writer: {e}")
+
+    # Close audit logger's database session (if it was ever created)
+    for audit_db in audit_sessions:
+        try:
+            audit_db.close()
+            print("AuditLogger session closed")
+        except Exception as e:
+            print(f"Error closing audit db: {e}")
+
+    # Stop background maintenance
+    try:
+        maintenance.stop()
+        print("DatabaseMaintenanceService stopped")
+    except Exception as e:
+        print(f"Error stopping database maintenance: {e}")
+
+    # Stop WAL checkpointing
+    try:
+        wal_manager.stop()
+        print("WalCheckpointManager stopped")
+    except Exception as e:
+        print(f"Error stopping WAL checkpoint manager: {e}")
+
+    # Stop revocation refresh
+    if token_service is not None:
+        try:
+            token_service.stop()
+            print("SessionTokenService stopped")
+        except Exception as e:
+            print(f"Error stopping session token service: {e}")
+
+    # Stop expired session sweeping
+    try:
+        session_sweeper.stop()
+        print("ExpiredSessionSweeper stopped")
+    except Exception as e:
+        print(f"Error stopping session sweeper: {e}")
+
+    # Stop password hashing workers
+    try:
+        get_password_hasher().shutdown()
+        print("PasswordHasher stopped")
+    except Exception as e:
+        print(f"Error stopping password hasher: {e}")
 
     # Reset ServiceContainer
     try:
@@ -153,6 +289,16 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Error resetting container: {e}")
 
+    # Close pooled connections (each runs a bounded PRAGMA optimize)
+    try:
+        engine.dispose()
+        print("Database connections closed")
+    except Exception as e:
+        print(f"Error disposing engine: {e}")
+
+    # Write out queued log records; later records are written synchronously
+    stop_queue_logging()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -160,12 +306,17 @@ app = FastAPI(
     description="REST API backend for Justice Companion desktop application",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
 )
 
 # Global error handling middleware must be registered before response wrapping so
 # that all downstream errors are normalized before the success envelope is added.
 app.add_middleware(ErrorHandlingMiddleware)
 
+# Request tracing for a sampled fraction of requests (TRACE_SAMPLE_RATE);
+# registered inside logging so trace IDs are correlation IDs
+app.add_middleware(TracingMiddleware)
+
 # Structured logging middleware with correlation ID tracking
 # Logs all requests/responses with structured JSON output
 app.add_middleware(LoggingMiddleware)
@@ -174,95 +325,16 @@ app.add_middleware(LoggingMiddleware)
 # Records request duration, system metrics, and provides /metrics endpoint
 app.add_middleware(PerformanceMiddleware)
 
-# Response wrapper middleware to match frontend expectations
-
-
-class ResponseWrapperMiddleware(BaseHTTPMiddleware):
-    """
-    Wraps all API responses in {success: true, data: {...}} format
-    to match frontend apiClient expectations.
-
-    Excludes: /health, /docs, /redoc, /openapi.json
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        print(f"[ResponseWrapperMiddleware] Intercepting request: {request.url.path}")
-
-        # Skip wrapping for special endpoints
-        if request.url.path in ["/health", "/", "/docs", "/redoc", "/openapi.json"]:
-            print(f"[ResponseWrapperMiddleware] Skipping {request.url.path}")
-            return await call_next(request)
-
-        response = await call_next(request)
-        print(f"[ResponseWrapperMiddleware] Response status: {response.status_code}")
-
-        # Only wrap successful JSON responses (all 2xx status codes)
-        if 200 <= response.status_code < 300:
-            # Read the original response body without assuming streaming attributes
-            body_chunks: list[bytes] = []
-            body_iterator = getattr(response, "body_iterator", None)
-
-            if body_iterator is not None:
-                async for chunk in body_iterator:
-                    body_chunks.append(chunk)
-            else:
-                raw_body = getattr(response, "body", b"")
-                if isinstance(raw_body, (bytes, bytearray)):
-                    body_chunks.append(bytes(raw_body))
-                elif raw_body:
-                    body_chunks.append(str(raw_body).encode())
-
-            body = b"".join(body_chunks)
-
-            # Try to parse as JSON
-            try:
-                data = json.loads(bytes(body).decode())
-
-                # If response is already wrapped with success field, don't wrap again
-                if isinstance(data, dict) and "success" in data:
-                    # Remove Content-Length - Response will recalculate it
-                    headers = dict(response.headers)
-                    headers.pop("content-length", None)
-
-                    return Response(
-                        content=body,
-                        status_code=response.status_code,
-                        media_type="application/json",
-                        headers=headers,
-                    )
-
-                # Wrap the response
-                wrapped = {"success": True, "data": data}
-
-                # Remove Content-Length from headers - JSONResponse will recalculate it
-                headers = dict(response.headers)
-                headers.pop("content-length", None)
-
-                return JSONResponse(
-                    content=wrapped,
-                    status_code=response.status_code,
-                    headers=headers,
-                )
-            except json.JSONDecodeError:
-                # Not a JSON response, return as is
-                # Remove Content-Length - Response will recalculate it
-                headers = dict(response.headers)
-                headers.pop("content-length", None)
-
-                return Response(
-                    content=body,
-                    status_code=response.status_code,
-                    media_type=response.media_type,
-                    headers=headers,
-                )
-
-        # For non-200 responses, return as is
-        return response
-
-
-# Add response wrapper middleware - wraps all 200 OK JSON responses for frontend
+# Response wrapper middleware - wraps all 2xx JSON responses for the frontend
 app.add_middleware(ResponseWrapperMiddleware)
 
+# Response compression (zstd/br/gzip by Accept-Encoding) of the wrapped body;
+# SSE and small responses are sent uncompressed
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+)
+
 
 # CORS configuration for frontend (Electron + PWA)
 # Cloud-ready: Supports both local development and production PWA
@@ -348,6 +420,7 @@ app.include_router(evidence_router)  # Evidence routes at /evidence/*
 app.include_router(chat_router)  # Chat routes at /chat/*
 app.include_router(database_router)  # Database management routes at /database/*
 app.include_router(deadlines_router)  # Deadline routes at /deadlines/*
+app.include_router(diagnostics_router)  # Tracing diagnostics at /diagnostics/* (admin)
 app.include_router(export_router)  # Export routes at /export/*
 app.include_router(gdpr_router)  # GDPR compliance routes at /gdpr/*
 app.include_router(tags_router)  # Tag management routes at /tags/*
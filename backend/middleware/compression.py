@@ -0,0 +1,280 @@
+"""
+Negotiated response compression middleware.
+
+Compresses response bodies with the best encoding the client accepts:
+zstd and brotli when their libraries are installed, gzip (stdlib) always.
+Evidence lists carry full document content and GDPR exports or search
+results can run to megabytes, so this mostly pays off for remote and
+mobile (Capacitor Android) clients.
+
+Implemented as pure ASGI middleware, registered outside ResponseWrapper so
+it compresses the final enveloped body:
+
+- Complete (single-chunk) bodies below ``minimum_size`` are sent as is;
+  larger ones are compressed in one go with an exact Content-Length.
+- Streaming bodies (audit log exports, ...) are compressed chunk by chunk
+  without buffering the response.
+- text/event-stream (/chat/stream), already encoded responses, media types
+  that are compressed already and ``Cache-Control: no-transform`` are
+  never touched, so SSE tokens reach the client immediately.
+
+Original and compressed byte counts are recorded per encoding in the
+metrics collector (see /metrics).
+
+Usage in main.py:
+    from backend.middleware.compression import CompressionMiddleware
+
+    app = FastAPI()
+    app.add_middleware(ResponseWrapperMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+"""
+
+import zlib
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.utils.performance_metrics import metrics_collector
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # gzip only
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # gzip only
+
+# Server preference when the client weights several encodings equally
+ENCODING_PREFERENCE = ("zstd", "br", "gzip")
+
+# Never compressed: SSE must flush per event, the rest is compressed already
+EXCLUDED_MEDIA_TYPES = frozenset(
+    {
+        "text/event-stream",
+        "application/gzip",
+        "application/zip",
+        "application/zstd",
+        "application/x-7z-compressed",
+        "application/pdf",
+    }
+)
+EXCLUDED_MEDIA_PREFIXES = ("image/", "audio/", "video/", "font/woff")
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, in server preference order."""
+    installed = {"zstd": zstandard is not None, "br": brotli is not None, "gzip": True}
+    return tuple(name for name in ENCODING_PREFERENCE if installed[name])
+
+
+def negotiate_encoding(accept_encoding: str, available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Pick a content coding from an Accept-Encoding header (RFC 9110 12.5.3).
+
+    The highest q-value wins; ties go to the earlier entry in ``available``.
+    ``*`` covers every encoding not listed explicitly, ``q=0`` refuses one.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        available: Encodings the server can produce, most preferred first
+
+    Returns:
+        Encoding name, or None to send the body uncompressed
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best: Optional[str] = None
+    best_weight = 0.0
+    for name in available:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses HTTP responses with the client's preferred supported encoding.
+
+    Skips: SSE, already encoded bodies, small bodies, 1xx/204/304 responses
+    and ``Cache-Control: no-transform``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        encodings: Optional[Tuple[str, ...]] = None,
+    ):
+        """
+        Initialize compression middleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Complete bodies smaller than this are sent as is
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11); 4 suits dynamic responses
+            zstd_level: Zstandard level (1-22)
+            encodings: Restrict to these encodings (default: all available)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        supported = available_encodings()
+        self.encodings = tuple(e for e in supported if encodings is None or e in encodings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor = None
+        original_bytes = 0
+        compressed_bytes = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, original_bytes, compressed_bytes
+
+            if message["type"] == "http.response.start":
+                if self._should_compress(message):
+                    # Hold headers until the first chunk shows the body size
+                    start = message
+                    return
+            elif message["type"] == "http.response.body" and start is not None:
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if not body and more_body:
+                    return
+
+                if not more_body and len(body) < self.minimum_size:
+                    # Negotiated bodies must not be cached for other encodings
+                    MutableHeaders(scope=start).add_vary_header("Accept-Encoding")
+                    await send(start)
+                    start = None
+                    await send(message)
+                    return
+
+                compressor = self._compressor(encoding)
+                data = compressor.compress(body)
+                if not more_body:
+                    data += compressor.finish()
+
+                headers = MutableHeaders(scope=start)
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    headers["content-length"] = str(len(data))
+
+                original_bytes += len(body)
+                compressed_bytes += len(data)
+                await send(start)
+                start = None
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                if not more_body:
+                    metrics_collector.record_compression(encoding, original_bytes, compressed_bytes)
+                return
+            elif message["type"] == "http.response.body" and compressor is not None:
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                data = compressor.compress(body)
+                if not more_body:
+                    data += compressor.finish()
+
+                original_bytes += len(body)
+                compressed_bytes += len(data)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                if not more_body:
+                    metrics_collector.record_compression(encoding, original_bytes, compressed_bytes)
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compressor(self, encoding: str):
+        if encoding == "zstd":
+            return _ZstdCompressor(self.zstd_level)
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+    @staticmethod
+    def _should_compress(start: Message) -> bool:
+        """Whether the response may carry a compressed body at all."""
+        status = start["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if media_type in EXCLUDED_MEDIA_TYPES or media_type.startswith(EXCLUDED_MEDIA_PREFIXES):
+            return False
+        return True
@@ -1,22 +1,28 @@
-"""Middleware for consistent error handling across the FastAPI backend."""
+"""Middleware for consistent error handling across the FastAPI backend.
+
+Pure ASGI: successful responses pass straight through (streaming intact);
+only error responses (status >= 400) are buffered so their body can be
+normalized.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Tuple, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("backend.error_handler")
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Catch unhandled exceptions and normalize the error response shape."""
 
     _EXCEPTION_STATUS_MAP: Dict[Type[BaseException], Tuple[int, str]] = {
@@ -27,20 +33,53 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         TimeoutError: (504, "timeout"),
     }
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+        error_start: Optional[Message] = None
+        error_body: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started, error_start
+
+            if message["type"] == "http.response.start":
+                response_started = True
+                if message["status"] >= 400:
+                    # Hold error responses until the whole body is available
+                    error_start = message
+                    return
+            elif message["type"] == "http.response.body" and error_start is not None:
+                error_body.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response = self._normalize_error_response(
+                        Request(scope), error_start, b"".join(error_body)
+                    )
+                    await response(scope, receive, send)
+                return
+
+            await send(message)
+
         try:
-            response = await call_next(request)
-        except HTTPException as exc:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:  # pylint: disable=broad-except
+            if response_started:
+                # Headers already went out; nothing can be replaced
+                raise
+            response = self._handle_exception(Request(scope), exc)
+            await response(scope, receive, send)
+
+    def _handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
+        if isinstance(exc, HTTPException):
             return self._handle_http_exception(request, exc)
-        except RequestValidationError as exc:
+        if isinstance(exc, RequestValidationError):
             return self._handle_request_validation(request, exc)
-        except Exception as exc:  # pylint: disable=broad-except
-            return self._handle_generic_exception(request, exc)
-
-        if response.status_code >= 400:
-            return await self._normalize_error_response(request, response)
-
-        return response
+        return self._handle_generic_exception(request, exc)
 
     def _handle_http_exception(
         self, request: Request, exc: HTTPException
@@ -167,10 +206,12 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return detail
         return None
 
-    async def _normalize_error_response(
-        self, request: Request, response: Response
+    def _normalize_error_response(
+        self, request: Request, start: Message, body: bytes
     ) -> Response:
-        body, headers = await self._consume_response_body(response)
+        status_code = start["status"]
+        headers = dict(Headers(raw=start.get("headers", [])))
+        headers.pop("content-length", None)
 
         parsed_body: Any = None
         if body:
@@ -186,8 +227,8 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         ):
             return Response(
                 content=body,
-                status_code=response.status_code,
-                media_type=response.media_type or "application/json",
+                status_code=status_code,
+                media_type=headers.get("content-type") or "application/json",
                 headers=headers,
             )
 
@@ -213,15 +254,15 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         elif isinstance(parsed_body, list):
             message = self._extract_message(parsed_body, default=message)
             details = parsed_body
-            if response.status_code == 422:
+            if status_code == 422:
                 error_code = "request_validation_error"
         elif body:
             message = body.decode(errors="ignore") or message
 
-        if response.status_code == 422 and error_code == "http_error":
+        if status_code == 422 and error_code == "http_error":
             error_code = "request_validation_error"
 
-        self._log_error(request, response.status_code, error_code, message)
+        self._log_error(request, status_code, error_code, message)
 
         normalized = {
             "success": False,
@@ -232,28 +273,6 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             },
         }
 
-        return JSONResponse(
-            status_code=response.status_code, content=normalized, headers=headers
-        )
-
-    @staticmethod
-    async def _consume_response_body(
-        response: Response,
-    ) -> tuple[bytes, Dict[str, str]]:
-        body_chunks: list[bytes] = []
-        body_iterator = getattr(response, "body_iterator", None)
-
-        if body_iterator is not None:
-            async for chunk in body_iterator:
-                body_chunks.append(chunk)
-        else:
-            raw_body = getattr(response, "body", b"")
-            if isinstance(raw_body, (bytes, bytearray)):
-                body_chunks.append(bytes(raw_body))
-            elif raw_body:
-                body_chunks.append(str(raw_body).encode())
-
-        body = b"".join(body_chunks)
-        headers = dict(response.headers)
-        headers.pop("content-length", None)
-        return body, headers
+        # The body is re-encoded as JSON; drop the original type so JSONResponse sets it
+        headers.pop("content-type", None)
+        return JSONResponse(status_code=status_code, content=normalized, headers=headers)
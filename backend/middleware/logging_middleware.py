@@ -16,6 +16,9 @@ Features:
 - Response status and timing
 - Exception logging with stack traces
 
+Implemented as pure ASGI middleware: the response is never buffered, and
+the completion log (status, duration) is written once the body is sent.
+
 Usage in main.py:
     from backend.middleware.logging_middleware import LoggingMiddleware
 
@@ -25,11 +28,10 @@ Usage in main.py:
 
 import time
 import logging
-from typing import Callable, Optional, Dict, Any
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional, Dict, Any
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.utils.structured_logger import (
     get_logger,
@@ -45,7 +47,7 @@ from backend.utils.structured_logger import (
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for structured request/response logging.
 
@@ -66,21 +68,24 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         exclude_paths: Optional[set] = None,
         log_request_body: bool = False,
         log_response_body: bool = False,
     ):
-        super().__init__(app)
+        self.app = app
         self.exclude_paths = exclude_paths or self.EXCLUDED_PATHS
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging."""
         # Skip excluded paths
-        if request.url.path in self.exclude_paths:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Extract or generate correlation ID
         correlation_id = request.headers.get('x-correlation-id')
@@ -97,20 +102,25 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             set_user_id(user_id)
 
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # Log request
-        request_log = self._build_request_log(request)
-        logger.info("Request started", extra=request_log)
+        # Log request (skip building the entry when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Request started", extra=self._build_request_log(request))
 
-        # Process request
-        response: Optional[Response] = None
-        exception: Optional[Exception] = None
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers
+                MutableHeaders(scope=message)['X-Correlation-ID'] = correlation_id
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            exception = exc
             # Log exception
             logger.error(
                 "Request failed with exception",
@@ -126,26 +136,21 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         finally:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log response (if we have one)
-            if response:
-                response_log = self._build_response_log(response, duration_ms)
-                log_level = self._determine_log_level(response.status_code)
+            if status_code is not None:
+                response_log = self._build_response_log(status_code, duration_ms)
+                log_level = self._determine_log_level(status_code)
                 logger.log(
                     getattr(logging, log_level.value),
                     "Request completed",
                     extra=response_log
                 )
 
-                # Add correlation ID to response headers
-                response.headers['X-Correlation-ID'] = correlation_id
-
             # Clean up context
             clear_context()
 
-        return response
-
     def _extract_user_id(self, request: Request) -> Optional[int]:
         """
         Extract user ID from JWT token in Authorization header.
@@ -190,10 +195,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         return log_entry
 
-    def _build_response_log(self, response: Response, duration_ms: float) -> Dict[str, Any]:
+    def _build_response_log(self, status_code: int, duration_ms: float) -> Dict[str, Any]:
         """Build structured log entry for response."""
         return {
-            'status_code': response.status_code,
+            'status_code': status_code,
             'duration_ms': round(duration_ms, 2),
         }
 
@@ -15,6 +15,9 @@ Features:
 - Endpoint statistics aggregation
 - Memory leak detection
 
+Implemented as pure ASGI middleware, so responses stream through untouched
+and request duration covers sending the full body.
+
 Usage in main.py:
     from backend.middleware.performance_middleware import PerformanceMiddleware
 
@@ -27,10 +30,9 @@ Usage in main.py:
 import time
 import asyncio
 import logging
-from typing import Callable, Optional
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response, PlainTextResponse
+from typing import Optional
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.utils.performance_metrics import (
     metrics_collector,
@@ -45,7 +47,7 @@ from backend.utils.structured_logger import (
 logger = get_logger(__name__)
 
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
+class PerformanceMiddleware:
     """
     Middleware for performance monitoring and metrics collection.
 
@@ -63,15 +65,19 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
     # Slow request threshold (milliseconds)
     SLOW_REQUEST_THRESHOLD_MS = 1000.0
 
+    # Endpoint key for requests no route matched (404/405), so probing
+    # arbitrary URLs cannot create unbounded metric series
+    UNMATCHED_ROUTE = '<unmatched>'
+
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         exclude_paths: Optional[set] = None,
         slow_threshold_ms: float = 1000.0,
         enable_system_metrics: bool = True,
         system_metrics_interval: int = 60,  # seconds
     ):
-        super().__init__(app)
+        self.app = app
         self.exclude_paths = exclude_paths or self.EXCLUDED_PATHS
         self.slow_threshold_ms = slow_threshold_ms
         self.enable_system_metrics = enable_system_metrics
@@ -86,47 +92,61 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
                 f"system_metrics_interval={system_metrics_interval}s)"
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with performance monitoring."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # Handle /metrics endpoint
-        if request.url.path == '/metrics':
-            return await self._handle_metrics_endpoint(request)
+        if path == '/metrics':
+            response = await self._handle_metrics_endpoint()
+            await response(scope, receive, send)
+            return
 
         # Skip excluded paths
-        if request.url.path in self.exclude_paths:
-            return await call_next(request)
+        if path in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
 
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = 500
 
-        # Process request
-        response: Optional[Response] = None
-        exception: Optional[Exception] = None
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-        except Exception as exc:
-            exception = exc
-            raise
+            await self.app(scope, receive, send_wrapper)
         finally:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Record metrics (only if we have a response or exception occurred)
-            if response or exception:
-                self._record_request_metrics(
-                    request=request,
-                    duration_ms=duration_ms,
-                    status_code=response.status_code if response else 500,
-                )
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # Record metrics (an exception without a response counts as 500)
+            self._record_request_metrics(
+                method=scope["method"],
+                path=path,
+                duration_ms=duration_ms,
+                status_code=status_code,
+                route=self._route_template(scope),
+            )
 
-        return response
+    def _route_template(self, scope: Scope) -> str:
+        """Path template of the matched route (set in scope by the router)."""
+        return getattr(scope.get("route"), "path", None) or self.UNMATCHED_ROUTE
 
     def _record_request_metrics(
         self,
-        request: Request,
+        method: str,
+        path: str,
         duration_ms: float,
         status_code: int,
+        route: Optional[str] = None,
     ) -> None:
         """Record request metrics to collector."""
         # Get context from structured logging
@@ -135,21 +155,22 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
 
         # Record to metrics collector
         metrics_collector.record_request(
-            method=request.method,
-            path=request.url.path,
+            method=method,
+            path=path,
             duration_ms=duration_ms,
             status_code=status_code,
             correlation_id=correlation_id,
             user_id=user_id,
+            route=route,
         )
 
         # Log performance warning if slow
         if duration_ms > self.slow_threshold_ms:
             logger.warning(
-                f"Slow request: {request.method} {request.url.path}",
+                f"Slow request: {method} {path}",
                 extra={
-                    'method': request.method,
-                    'path': request.url.path,
+                    'method': method,
+                    'path': path,
                     'duration_ms': round(duration_ms, 2),
                     'status_code': status_code,
                     'threshold_ms': self.slow_threshold_ms,
@@ -157,7 +178,7 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
                 }
             )
 
-    async def _handle_metrics_endpoint(self, request: Request) -> Response:
+    async def _handle_metrics_endpoint(self) -> PlainTextResponse:
         """
         Handle /metrics endpoint request.
 
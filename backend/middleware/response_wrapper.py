@@ -0,0 +1,120 @@
+"""
+Response wrapper middleware to match frontend expectations.
+
+Wraps successful JSON API responses in {success: true, data: {...}}, the
+shape the frontend apiClient expects. Responses that already carry a
+"success" field, non-JSON bodies and non-2xx responses are sent unchanged.
+
+Implemented as pure ASGI middleware that never buffers a response body:
+
+- Streaming responses (no Content-Length, e.g. the text/event-stream from
+  /chat/stream or audit log exports) and non-JSON media types pass straight
+  through, chunk by chunk.
+- JSON bodies are wrapped incrementally: the envelope prefix is sent with
+  the first chunk and the closing brace with the last, so the body itself
+  is never decoded or re-encoded.
+
+Usage in main.py:
+    from backend.middleware.response_wrapper import ResponseWrapperMiddleware
+
+    app = FastAPI()
+    app.add_middleware(ResponseWrapperMiddleware)
+"""
+
+import json
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Byte-identical to JSONResponse rendering {"success": True, "data": ...}
+WRAP_PREFIX = b'{"success":true,"data":'
+WRAP_SUFFIX = b"}"
+
+
+class ResponseWrapperMiddleware:
+    """
+    Wraps all API responses in {success: true, data: {...}} format
+    to match frontend apiClient expectations.
+
+    Excludes: /health, /, /docs, /redoc, /openapi.json
+    """
+
+    EXCLUDED_PATHS = {"/health", "/", "/docs", "/redoc", "/openapi.json"}
+
+    def __init__(self, app: ASGIApp, exclude_paths: Optional[set] = None):
+        self.app = app
+        self.exclude_paths = exclude_paths or self.EXCLUDED_PATHS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip wrapping for special endpoints
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        wrapping = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, wrapping
+
+            if message["type"] == "http.response.start":
+                if self._should_wrap(message):
+                    # Hold headers until the first chunk decides whether to wrap
+                    start = message
+                    return
+            elif message["type"] == "http.response.body" and start is not None:
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if not body and more_body:
+                    return
+
+                wrapping = not self._already_wrapped(body, more_body)
+                if wrapping:
+                    headers = MutableHeaders(scope=start)
+                    headers["content-length"] = str(
+                        int(headers["content-length"]) + len(WRAP_PREFIX) + len(WRAP_SUFFIX)
+                    )
+                    body = WRAP_PREFIX + body
+                    if not more_body:
+                        body += WRAP_SUFFIX
+
+                await send(start)
+                start = None
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+            elif message["type"] == "http.response.body" and wrapping:
+                if not message.get("more_body", False):
+                    message = {**message, "body": message.get("body", b"") + WRAP_SUFFIX}
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _should_wrap(start: Message) -> bool:
+        """Only complete (Content-Length) 2xx JSON bodies are wrapped."""
+        # Only wrap successful responses (all 2xx status codes)
+        if not 200 <= start["status"] < 300:
+            return False
+        headers = Headers(raw=start["headers"])
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type == "application/json" and "content-length" in headers
+
+    @staticmethod
+    def _already_wrapped(first_chunk: bytes, more_body: bool) -> bool:
+        """
+        Whether the body must go out unchanged: empty, not JSON, or already
+        carrying a "success" field. Only decodes when "success" appears.
+        """
+        if not first_chunk.strip():
+            return True
+        if b'"success"' not in first_chunk:
+            return False
+        if more_body:
+            return first_chunk.lstrip().startswith(b'{"success"')
+        try:
+            data = json.loads(first_chunk)
+        except ValueError:
+            return True  # Not a JSON response, return as is
+        return isinstance(data, dict) and "success" in data
@@ -0,0 +1,66 @@
+"""
+Request tracing middleware.
+
+Starts a trace (see backend.utils.tracing) for a sampled fraction of
+requests. Spans recorded by repositories and services during the request
+become children of its root span, which covers the whole response
+including streamed bodies. Unsampled requests pass straight through.
+
+Must be registered inside LoggingMiddleware so the trace ID is the
+request's correlation ID.
+
+Usage in main.py:
+    from backend.middleware.tracing_middleware import TracingMiddleware
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(LoggingMiddleware)
+"""
+
+import asyncio
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.utils.tracing import TraceRecorder, get_trace_recorder
+
+
+class TracingMiddleware:
+    """Traces sampled HTTP requests into the trace recorder."""
+
+    def __init__(self, app: ASGIApp, recorder: Optional[TraceRecorder] = None):
+        self.app = app
+        self.recorder = recorder or get_trace_recorder()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.recorder.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        root = self.recorder.start(f"{scope['method']} {scope['path']}")
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        error: Optional[BaseException] = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            # Name by route template once routing has run (raw path otherwise)
+            route_path = getattr(scope.get("route"), "path", None)
+            if route_path is not None:
+                root.name = root.trace.name = f"{scope['method']} {route_path}"
+            root.set_attribute("http.method", scope["method"])
+            root.set_attribute("http.route", route_path or "")
+            root.set_attribute("http.status_code", status_code)
+
+            trace = self.recorder.finish(root, error)
+            if self.recorder.export_dir is not None:
+                await asyncio.to_thread(self.recorder.export_file, trace)
@@ -0,0 +1,89 @@
+"""
+Migration 003: Enable Incremental Auto-Vacuum
+
+Switches existing SQLite databases to auto_vacuum=INCREMENTAL so free pages
+can be reclaimed in small background steps instead of a blocking full VACUUM.
+
+New databases get INCREMENTAL automatically on first connect (see
+models/base.py). Existing files only change mode when they are rebuilt, so
+this migration performs a one-off offline compaction (VACUUM INTO + atomic
+swap) with the new mode applied.
+
+IMPORTANT: Stop the backend before running this migration.
+
+Run with: python -m backend.migrations.003_enable_incremental_auto_vacuum
+"""
+
+from sqlalchemy import text
+from backend.models.base import engine, is_sqlite, SQLALCHEMY_DATABASE_URL
+from backend.services.database_maintenance import compact_database, get_auto_vacuum_mode
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _database_path() -> str:
+    return SQLALCHEMY_DATABASE_URL.replace("sqlite:///", "", 1)
+
+
+def _set_auto_vacuum(mode: str) -> None:
+    if not is_sqlite:
+        logger.info("⊘ Not a SQLite database - nothing to do")
+        return
+
+    with engine.connect() as conn:
+        current = get_auto_vacuum_mode(conn)
+
+    if current == mode:
+        logger.info(f"✓ auto_vacuum already '{mode}' - skipping")
+        return
+
+    logger.info(f"Rebuilding database: auto_vacuum '{current}' -> '{mode}'")
+    result = compact_database(engine, _database_path(), auto_vacuum=mode)
+
+    logger.info(f"✓ auto_vacuum is now '{result['auto_vacuum']}'")
+    logger.info(f"  Size before: {result['size_before_bytes']} bytes")
+    logger.info(f"  Size after:  {result['size_after_bytes']} bytes")
+
+
+def upgrade():
+    """Apply migration: Enable incremental auto-vacuum."""
+    logger.info("=" * 70)
+    logger.info("Migration 003: Enabling Incremental Auto-Vacuum")
+    logger.info("=" * 70)
+
+    _set_auto_vacuum("incremental")
+
+    # Seed planner statistics on the rebuilt file
+    if is_sqlite:
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA analysis_limit = 400"))
+            conn.execute(text("PRAGMA optimize"))
+            conn.commit()
+
+    logger.info("=" * 70)
+    logger.info("Migration Complete!")
+    logger.info("=" * 70)
+
+
+def downgrade():
+    """Rollback migration: Disable auto-vacuum."""
+    logger.info("=" * 70)
+    logger.info("Migration 003 Rollback: Disabling Auto-Vacuum")
+    logger.info("=" * 70)
+
+    _set_auto_vacuum("none")
+
+    logger.info("=" * 70)
+    logger.info("Rollback Complete!")
+    logger.info("=" * 70)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        downgrade()
+    else:
+        upgrade()
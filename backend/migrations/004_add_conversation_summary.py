@@ -0,0 +1,86 @@
+"""
+Migration 004: Add Conversation Summary Columns
+
+Adds the rolling summary used to bound the history sent to the AI provider
+(see services/chat_history.py):
+- chat_conversations.summary: summary of messages older than the verbatim window
+- chat_conversations.summary_message_id: last message folded into the summary
+
+New databases get the columns from the model, and init_db() adds them to
+existing databases at startup (models/base.py add_missing_columns), so this
+script is only needed to upgrade a database without starting the backend.
+Existing conversations start without a summary and are summarized gradually
+on their next turns.
+
+Run with: python -m backend.migrations.004_add_conversation_summary
+"""
+
+from sqlalchemy import inspect, text
+from backend.models.base import add_missing_columns, engine, is_sqlite
+from backend.models.chat import Conversation
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TABLE = "chat_conversations"
+COLUMNS = ["summary", "summary_message_id"]
+
+
+def _existing_columns(conn) -> set:
+    return {column["name"] for column in inspect(conn).get_columns(TABLE)}
+
+
+def upgrade():
+    """Apply migration: Add conversation summary columns."""
+    logger.info("=" * 70)
+    logger.info("Migration 004: Adding Conversation Summary Columns")
+    logger.info("=" * 70)
+
+    with engine.begin() as conn:
+        added = add_missing_columns(conn, Conversation.__table__, COLUMNS)
+
+    for name in COLUMNS:
+        if name in added:
+            logger.info(f"✓ Added column '{TABLE}.{name}'")
+        else:
+            logger.info(f"✓ Column '{TABLE}.{name}' already exists - skipping")
+
+    logger.info("=" * 70)
+    logger.info("Migration Complete!")
+    logger.info("=" * 70)
+
+
+def downgrade():
+    """Rollback migration: Remove conversation summary columns."""
+    logger.info("=" * 70)
+    logger.info("Migration 004 Rollback: Removing Conversation Summary Columns")
+    logger.info("=" * 70)
+
+    with engine.connect() as conn:
+        if is_sqlite:
+            version = conn.execute(text("SELECT sqlite_version()")).scalar()
+            logger.info(f"SQLite version: {version} (DROP COLUMN needs 3.35+)")
+
+        existing = _existing_columns(conn)
+
+        for name in COLUMNS:
+            if name not in existing:
+                logger.info(f"⊘ Column '{TABLE}.{name}' not present - skipping")
+                continue
+            conn.execute(text(f"ALTER TABLE {TABLE} DROP COLUMN {name}"))
+            conn.commit()
+            logger.info(f"✓ Dropped column '{TABLE}.{name}'")
+
+    logger.info("=" * 70)
+    logger.info("Rollback Complete!")
+    logger.info("=" * 70)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        downgrade()
+    else:
+        upgrade()
@@ -3,6 +3,8 @@ SQLAlchemy database models for Justice Companion backend.
 """
 
 from backend.models.ai_provider_config import AIProviderConfig
+from backend.models.audit_archive import AuditArchiveSegment
+from backend.models.audit_checkpoint import AuditCheckpoint
 from backend.models.backup import BackupSettings
 from backend.models.base import Base
 from backend.models.case import Case
@@ -14,15 +16,18 @@ from backend.models.evidence import Evidence
 from backend.models.notification import Notification, NotificationPreferences
 from backend.models.password_reset import PasswordResetToken
 from backend.models.profile import UserProfile
-from backend.models.session import Session
+from backend.models.resource_version import ResourceVersion
+from backend.models.session import Session, SessionRevocation
 from backend.models.tag import Tag
 from backend.models.template import CaseTemplate, TemplateUsage
 from backend.models.user import User
+from backend.models.user_stats import UserStats
 
 __all__ = [
     "Base",
     "User",
     "Session",
+    "SessionRevocation",
     "Case",
     "CaseFact",
     "FactCategory",
@@ -42,4 +47,8 @@ __all__ = [
     "BackupSettings",
     "AIProviderConfig",
     "PasswordResetToken",
+    "UserStats",
+    "AuditCheckpoint",
+    "AuditArchiveSegment",
+    "ResourceVersion",
 ]
@@ -0,0 +1,53 @@
+"""
+AuditArchiveSegment model - index of audit log segments moved to files.
+
+AuditArchiveService moves old, checkpointed audit_logs segments into
+gzip-compressed NDJSON files. Each row here records where one segment went,
+the timestamp range it covers (so AuditLogger.query can skip files that
+cannot match) and the file's SHA-256. Every file also embeds the previous
+file's SHA-256, so the archive files form their own hash chain alongside
+the entries' integrity chain.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+
+class AuditArchiveSegment(Base):
+    """
+    AuditArchiveSegment model - one archived audit log segment.
+
+    Columns:
+    - checkpoint_id: AuditCheckpoint id of the segment
+    - first_rowid / last_rowid: Original audit_logs ROWID range
+    - entry_count: Entries in the file
+    - first_timestamp / last_timestamp: Entry timestamp range (ISO strings)
+    - last_hash: integrity_hash of the last entry (chain anchor for the next segment)
+    - file_name: File name relative to the archive directory
+    - file_sha256: SHA-256 of the compressed file
+    - previous_file_sha256: SHA-256 of the previous segment's file (NULL for the first)
+    - archived_at: When the segment was moved
+    """
+
+    __tablename__ = "audit_archive_segments"
+
+    checkpoint_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    first_rowid: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_rowid: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_timestamp: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    last_timestamp: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    last_hash: Mapped[str] = mapped_column(String, nullable=False)
+    file_name: Mapped[str] = mapped_column(String, nullable=False)
+    file_sha256: Mapped[str] = mapped_column(String, nullable=False)
+    previous_file_sha256: Mapped[str | None] = mapped_column(String, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<AuditArchiveSegment(checkpoint_id={self.checkpoint_id}, file={self.file_name})>"
@@ -0,0 +1,57 @@
+"""
+AuditCheckpoint model - signed summaries of audit log segments.
+
+The audit_logs hash chain can only be verified by rehashing every entry. A
+checkpoint records, for one contiguous ROWID range (a segment), the chain
+anchor before it, the chain tail after it, the entry count and the Merkle
+root of the entries' integrity hashes. The record is HMAC-signed and each
+checkpoint signs its predecessor's signature, so the checkpoints themselves
+form a chain.
+
+Verification can then start from the newest checkpoint, or re-check
+individual segments, instead of scanning the whole table.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+
+class AuditCheckpoint(Base):
+    """
+    AuditCheckpoint model - one signed, verified audit log segment.
+
+    Columns:
+    - id: Sequence number (1, 2, ...); part of the signed payload
+    - first_rowid / last_rowid: Inclusive audit_logs ROWID range of the segment
+    - entry_count: Entries in the segment
+    - anchor_hash: previous_log_hash of the first entry (previous segment's tail)
+    - last_hash: integrity_hash of the last entry
+    - merkle_root: Merkle root over the entries' integrity hashes
+    - previous_signature: Signature of checkpoint id - 1 (NULL for the first)
+    - signature: HMAC-SHA256 over all fields above
+    - created_at: When the checkpoint was recorded
+    """
+
+    __tablename__ = "audit_checkpoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    first_rowid: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_rowid: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    anchor_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_hash: Mapped[str] = mapped_column(String, nullable=False)
+    merkle_root: Mapped[str] = mapped_column(String, nullable=False)
+    previous_signature: Mapped[str | None] = mapped_column(String, nullable=True)
+    signature: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<AuditCheckpoint(id={self.id}, rows={self.first_rowid}-{self.last_rowid})>"
+        )
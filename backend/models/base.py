@@ -12,9 +12,9 @@ Security improvements:
 - GDPR-compliant data protection for legal PII
 """
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
-from typing import Generator
+from typing import Generator, Iterable, List
 import os
 import secrets
 
@@ -143,7 +143,9 @@ if is_sqlite:
 
                     # Set basic SQLite pragmas only (skip encryption settings)
                     cursor.execute("PRAGMA foreign_keys = ON")
+                    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")  # New DBs only; must precede WAL
                     cursor.execute("PRAGMA journal_mode = WAL")
+                    cursor.execute("PRAGMA journal_size_limit = 67108864")
                     cursor.execute("PRAGMA busy_timeout = 5000")
                     cursor.execute("PRAGMA synchronous = NORMAL")
                     cursor.execute("PRAGMA cache_size = -40000")
@@ -159,7 +161,9 @@ if is_sqlite:
 
             # Standard SQLite optimizations
             cursor.execute("PRAGMA foreign_keys = ON")           # Enable foreign keys
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")   # New DBs only; must precede WAL
             cursor.execute("PRAGMA journal_mode = WAL")          # Write-ahead logging
+            cursor.execute("PRAGMA journal_size_limit = 67108864")  # Trim WAL to 64MB after checkpoints
             cursor.execute("PRAGMA busy_timeout = 5000")         # Wait 5s for locks
             cursor.execute("PRAGMA synchronous = NORMAL")        # Safe with WAL
             cursor.execute("PRAGMA cache_size = -40000")         # 40MB cache
@@ -173,6 +177,20 @@ if is_sqlite:
             raise
         finally:
             cursor.close()
+
+    @event.listens_for(engine, "close")
+    def optimize_sqlite_on_close(dbapi_conn, connection_record):
+        """
+        Run a bounded PRAGMA optimize before a pooled connection is closed.
+
+        SQLite recommends this on close: it re-analyzes only tables whose
+        statistics the connection found stale, so it is normally a no-op.
+        """
+        try:
+            dbapi_conn.execute("PRAGMA analysis_limit = 400")
+            dbapi_conn.execute("PRAGMA optimize")
+        except Exception as e:
+            print(f"WARNING: PRAGMA optimize on close failed: {e}")
 elif is_postgresql:
     # PostgreSQL configuration with connection pooling
     engine = create_engine(
@@ -207,6 +225,41 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+def add_missing_columns(connection, table, column_names: Iterable[str]) -> List[str]:
+    """
+    Add nullable model columns that an existing table was created without.
+
+    create_all() never alters existing tables, so columns added to a model
+    later are applied here. Safe to run on every startup and from several
+    processes at once.
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+        table: SQLAlchemy Table of the model
+        column_names: Columns to ensure (must be nullable)
+
+    Returns:
+        Names of the columns added
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    added = []
+    for name in column_names:
+        if name in existing:
+            continue
+        column_type = table.c[name].type.compile(dialect=connection.dialect)
+        try:
+            # SAVEPOINT: another worker may add the same column concurrently
+            with connection.begin_nested():
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+        except Exception:
+            inspector = inspect(connection)
+            inspector.clear_cache()
+            if name not in {column["name"] for column in inspector.get_columns(table.name)}:
+                raise
+            continue
+        added.append(name)
+    return added
+
 def init_db():
     """
     Initialize database: create all tables defined in models.
@@ -223,12 +276,16 @@ def init_db():
         deadline,  # noqa: F401
         tag,  # noqa: F401
         template,  # noqa: F401
-        chat,  # noqa: F401
+        chat,
         profile,  # noqa: F401
         consent,  # noqa: F401
         notification,  # noqa: F401
         backup,  # noqa: F401
         ai_provider_config,  # noqa: F401
+        user_stats,  # noqa: F401
+        audit_checkpoint,  # noqa: F401
+        audit_archive,  # noqa: F401
+        resource_version,  # noqa: F401
     )
     # pylint: enable=import-outside-toplevel,unused-import
 
@@ -237,3 +294,17 @@ def init_db():
     print(
         f"Created {len(Base.metadata.tables)} tables: {list(Base.metadata.tables.keys())}"
     )
+
+    # Columns added to models after their tables existed (migrations/004)
+    with engine.begin() as connection:
+        added = add_missing_columns(
+            connection, chat.Conversation.__table__, ["summary", "summary_message_id"]
+        )
+    if added:
+        print(f"Added columns to chat_conversations: {added}")
+
+    # Full-text search index (FTS5 on SQLite, tsvector + GIN on PostgreSQL)
+    from backend.services.search_backends import install_search_index
+
+    with engine.begin() as connection:
+        install_search_index(connection)
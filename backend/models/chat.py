@@ -33,6 +33,10 @@ class Conversation(Base):
         index=True,
     )
     message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Rolling summary of older turns sent to the AI instead of the full history
+    # (see services/chat_history.py); covers messages up to summary_message_id
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    summary_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Relationships
     messages: Mapped[list["Message"]] = relationship(
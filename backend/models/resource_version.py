@@ -0,0 +1,163 @@
+"""
+ResourceVersion model - per-user generation counters for polled collections.
+
+Each row counts writes to one collection (cases, evidence, deadlines,
+notifications) owned by one user. The counters are bumped by SQLite
+triggers, so every write path (ORM and raw SQL alike) invalidates them, and
+list endpoints can compare a client's ETag against them before doing any
+query, decryption or serialization work.
+
+``epoch`` is fixed when a row is created. It is part of every ETag so a
+recreated database, whose counters start from zero again, never matches an
+ETag issued by the old one.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer, String, event, inspect, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+# Collections with a version counter
+COLLECTIONS = ("cases", "evidence", "deadlines", "notifications")
+
+
+class ResourceVersion(Base):
+    """
+    ResourceVersion model - one write counter per user and collection.
+
+    Columns:
+    - user_id: Owner of the collection (rows outlive deleted users)
+    - collection: One of COLLECTIONS
+    - version: Incremented on every insert, update or delete in the collection
+    - epoch: Milliseconds since the Unix epoch when the row was created
+    """
+
+    __tablename__ = "resource_versions"
+
+    # No foreign key: case triggers fire while a user's cascade delete runs
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    collection: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    epoch: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<ResourceVersion(user_id={self.user_id}, collection='{self.collection}', "
+            f"version={self.version})>"
+        )
+
+
+# ===== TRIGGERS (SQLite) =====
+
+_EPOCH_MS = "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+# INSERT ... SELECT so rows whose owner cannot be resolved are skipped; the
+# WHERE clause also keeps SQLite from parsing ON CONFLICT as a join clause.
+_BUMP = """
+    INSERT INTO resource_versions (user_id, collection, version, epoch)
+    SELECT owner, '{collection}', 1, """ + _EPOCH_MS + """
+    FROM (SELECT {owner} AS owner) WHERE owner IS NOT NULL
+    ON CONFLICT (user_id, collection) DO UPDATE SET version = version + 1;
+"""
+
+
+def _bump(collection: str, owner: str) -> str:
+    return _BUMP.format(collection=collection, owner=owner)
+
+
+def _evidence_owner(row: str) -> str:
+    return f"(SELECT user_id FROM cases WHERE id = {row}.case_id)"
+
+
+def _trigger(name: str, timing: str, table: str, *bodies: str) -> str:
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {name} {timing} ON {table} "
+        f"FOR EACH ROW BEGIN {''.join(bodies)} END"
+    )
+
+
+RESOURCE_VERSION_TRIGGERS = {
+    "cases": [
+        _trigger("trg_resource_versions_cases_insert", "AFTER INSERT", "cases",
+                 _bump("cases", "NEW.user_id")),
+        _trigger("trg_resource_versions_cases_update", "AFTER UPDATE", "cases",
+                 _bump("cases", "OLD.user_id"),
+                 _bump("cases", "NEW.user_id")),
+        # Moving a case moves its evidence and deadlines with it
+        _trigger("trg_resource_versions_cases_owner", "AFTER UPDATE OF user_id", "cases",
+                 _bump("evidence", "OLD.user_id"),
+                 _bump("evidence", "NEW.user_id"),
+                 _bump("deadlines", "OLD.user_id"),
+                 _bump("deadlines", "NEW.user_id")),
+        # BEFORE DELETE: cascaded evidence deletes can no longer resolve the owner
+        _trigger("trg_resource_versions_cases_delete", "BEFORE DELETE", "cases",
+                 _bump("cases", "OLD.user_id"),
+                 _bump("evidence", "OLD.user_id"),
+                 _bump("deadlines", "OLD.user_id")),
+    ],
+    "evidence": [
+        _trigger("trg_resource_versions_evidence_insert", "AFTER INSERT", "evidence",
+                 _bump("evidence", _evidence_owner("NEW"))),
+        _trigger("trg_resource_versions_evidence_update", "AFTER UPDATE", "evidence",
+                 _bump("evidence", _evidence_owner("OLD")),
+                 _bump("evidence", _evidence_owner("NEW"))),
+        _trigger("trg_resource_versions_evidence_delete", "AFTER DELETE", "evidence",
+                 _bump("evidence", _evidence_owner("OLD"))),
+    ],
+    "deadlines": [
+        _trigger("trg_resource_versions_deadlines_insert", "AFTER INSERT", "deadlines",
+                 _bump("deadlines", "NEW.user_id")),
+        _trigger("trg_resource_versions_deadlines_update", "AFTER UPDATE", "deadlines",
+                 _bump("deadlines", "OLD.user_id"),
+                 _bump("deadlines", "NEW.user_id")),
+        _trigger("trg_resource_versions_deadlines_delete", "AFTER DELETE", "deadlines",
+                 _bump("deadlines", "OLD.user_id")),
+    ],
+    "notifications": [
+        _trigger("trg_resource_versions_notifications_insert", "AFTER INSERT", "notifications",
+                 _bump("notifications", "NEW.user_id")),
+        _trigger("trg_resource_versions_notifications_update", "AFTER UPDATE", "notifications",
+                 _bump("notifications", "OLD.user_id"),
+                 _bump("notifications", "NEW.user_id")),
+        _trigger("trg_resource_versions_notifications_delete", "AFTER DELETE", "notifications",
+                 _bump("notifications", "OLD.user_id")),
+    ],
+}
+
+
+def install_resource_version_triggers(connection) -> int:
+    """
+    Create the resource_versions maintenance triggers (SQLite only, idempotent).
+
+    Triggers are only installed for source tables that exist, so partial
+    metadata.create_all() calls are safe.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        Number of trigger statements executed
+    """
+    if connection.dialect.name != "sqlite":
+        return 0
+
+    inspector = inspect(connection)
+    if not inspector.has_table("resource_versions"):
+        return 0
+
+    executed = 0
+    for table, statements in RESOURCE_VERSION_TRIGGERS.items():
+        if not inspector.has_table(table):
+            continue
+        for statement in statements:
+            connection.execute(text(statement))
+            executed += 1
+    return executed
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_resource_version_triggers(target, connection, **kw):
+    """Install triggers whenever the schema is (re)created."""
+    install_resource_version_triggers(connection)
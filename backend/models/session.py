@@ -1,4 +1,4 @@
-"""Session model for user authentication sessions."""
+"""Session models for user authentication sessions and signed-token revocations."""
 
 from __future__ import annotations
 
@@ -62,3 +62,34 @@ class Session(Base):
 
     def __repr__(self):
         return f"<Session(id='{self.id}', user_id={self.user_id}, expires_at='{self.expires_at}')>"
+
+
+class SessionRevocation(Base):
+    """
+    SessionRevocation model - sessions whose signed tokens must be rejected.
+
+    Signed session tokens (see services/auth/session_tokens.py) are verified
+    without reading the sessions table, so logout and revocation are recorded
+    here and mirrored into an in-memory revocation set on every worker.
+    Rows are only needed until the token itself expires.
+
+    Columns:
+    - session_id: Revoked session ID (primary key)
+    - user_id: Owning user
+    - revoked_at: When the revocation was recorded (incremental refresh watermark)
+    - expires_at: Expiry of the revoked session; the row can be purged afterwards
+    """
+
+    __tablename__ = "session_revocations"
+
+    session_id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<SessionRevocation(session_id='{self.session_id}', user_id={self.user_id})>"
@@ -0,0 +1,221 @@
+"""
+UserStats model - per-user aggregate counters for the dashboard.
+
+The counters are maintained by SQLite triggers on cases, evidence, deadlines
+and notifications so that every write path (ORM and raw SQL alike) keeps them
+current. /dashboard/stats then becomes a single primary-key lookup.
+
+Overdue deadlines depend on the wall clock and cannot be maintained by
+triggers alone. Instead the row stores the overdue count together with
+``overdue_valid_until`` (the earliest open deadline that is not yet overdue);
+deadline triggers clear that column and the repository recomputes the
+overdue count lazily once it is missing or in the past.
+
+Rows are created lazily by UserStatsRepository and corrected by the nightly
+UserStatsReconciler, so drift (e.g. from writes made before the triggers
+existed) never outlives a reconciliation pass.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, event, inspect, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from backend.models.base import Base
+
+
+class UserStats(Base):
+    """
+    UserStats model - denormalized dashboard counters, one row per user.
+
+    Columns:
+    - user_id: Primary key and foreign key to users table
+    - total_cases / active_cases / closed_cases / pending_cases: Case counts by status
+    - evidence_count: Evidence attached to the user's cases
+    - total_deadlines: Non-deleted deadlines
+    - open_deadlines: Non-deleted, non-completed deadlines
+    - overdue_deadlines: Open deadlines past their due date
+    - overdue_valid_until: ISO timestamp until which overdue_deadlines is exact
+      (NULL means it must be recomputed)
+    - unread_notifications: Notifications neither read nor dismissed
+    - reconciled_at: Last full recomputation from the source tables
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    total_cases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    active_cases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    closed_cases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pending_cases: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    evidence_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_deadlines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    open_deadlines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    overdue_deadlines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    overdue_valid_until: Mapped[str | None] = mapped_column(String, nullable=True)
+    unread_notifications: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def to_dict(self):
+        """Convert UserStats model to dictionary for JSON serialization."""
+        return {
+            "userId": self.user_id,
+            "totalCases": self.total_cases,
+            "activeCases": self.active_cases,
+            "closedCases": self.closed_cases,
+            "pendingCases": self.pending_cases,
+            "evidenceCount": self.evidence_count,
+            "totalDeadlines": self.total_deadlines,
+            "openDeadlines": self.open_deadlines,
+            "overdueDeadlines": self.overdue_deadlines,
+            "unreadNotifications": self.unread_notifications,
+            "reconciledAt": (
+                self.reconciled_at.isoformat() if self.reconciled_at is not None else None
+            ),
+        }
+
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id}, total_cases={self.total_cases})>"
+
+
+# ===== TRIGGERS (SQLite) =====
+
+# Case status is written both as enum names (ORM) and values (raw SQL), so
+# every comparison is done on LOWER(status).
+_CASE_DELTA = """
+    UPDATE user_stats SET
+        total_cases = total_cases {op} 1,
+        active_cases = active_cases {op} (LOWER({row}.status) = 'active'),
+        closed_cases = closed_cases {op} (LOWER({row}.status) = 'closed'),
+        pending_cases = pending_cases {op} (LOWER({row}.status) = 'pending')
+    WHERE user_id = {row}.user_id;
+"""
+
+_CASE_EVIDENCE_DELTA = """
+    UPDATE user_stats SET
+        evidence_count = evidence_count {op}
+            (SELECT COUNT(*) FROM evidence WHERE case_id = {row}.id)
+    WHERE user_id = {row}.user_id;
+"""
+
+_EVIDENCE_DELTA = """
+    UPDATE user_stats SET evidence_count = evidence_count {op} 1
+    WHERE user_id = (SELECT user_id FROM cases WHERE id = {row}.case_id);
+"""
+
+_DEADLINE_DELTA = """
+    UPDATE user_stats SET
+        total_deadlines = total_deadlines {op} ({row}.deleted_at IS NULL),
+        open_deadlines = open_deadlines {op}
+            ({row}.deleted_at IS NULL AND LOWER({row}.status) != 'completed'),
+        overdue_valid_until = NULL
+    WHERE user_id = {row}.user_id;
+"""
+
+_NOTIFICATION_DELTA = """
+    UPDATE user_stats SET
+        unread_notifications = unread_notifications {op}
+            ({row}.is_read = 0 AND {row}.is_dismissed = 0)
+    WHERE user_id = {row}.user_id;
+"""
+
+
+def _trigger(name: str, timing: str, table: str, *bodies: str) -> str:
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {name} {timing} ON {table} "
+        f"FOR EACH ROW BEGIN {''.join(bodies)} END"
+    )
+
+
+USER_STATS_TRIGGERS = {
+    "cases": [
+        _trigger("trg_user_stats_cases_insert", "AFTER INSERT", "cases",
+                 _CASE_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_cases_update", "AFTER UPDATE OF status, user_id", "cases",
+                 _CASE_DELTA.format(op="-", row="OLD"),
+                 _CASE_DELTA.format(op="+", row="NEW"),
+                 _CASE_EVIDENCE_DELTA.format(op="-", row="OLD"),
+                 _CASE_EVIDENCE_DELTA.format(op="+", row="NEW")),
+        # BEFORE DELETE: cascaded evidence deletes run after the case row is
+        # gone and can no longer resolve the owner, so subtract them here.
+        _trigger("trg_user_stats_cases_delete", "BEFORE DELETE", "cases",
+                 _CASE_DELTA.format(op="-", row="OLD"),
+                 _CASE_EVIDENCE_DELTA.format(op="-", row="OLD")),
+    ],
+    "evidence": [
+        _trigger("trg_user_stats_evidence_insert", "AFTER INSERT", "evidence",
+                 _EVIDENCE_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_evidence_update", "AFTER UPDATE OF case_id", "evidence",
+                 _EVIDENCE_DELTA.format(op="-", row="OLD"),
+                 _EVIDENCE_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_evidence_delete", "AFTER DELETE", "evidence",
+                 _EVIDENCE_DELTA.format(op="-", row="OLD")),
+    ],
+    "deadlines": [
+        _trigger("trg_user_stats_deadlines_insert", "AFTER INSERT", "deadlines",
+                 _DEADLINE_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_deadlines_update", "AFTER UPDATE", "deadlines",
+                 _DEADLINE_DELTA.format(op="-", row="OLD"),
+                 _DEADLINE_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_deadlines_delete", "AFTER DELETE", "deadlines",
+                 _DEADLINE_DELTA.format(op="-", row="OLD")),
+    ],
+    "notifications": [
+        _trigger("trg_user_stats_notifications_insert", "AFTER INSERT", "notifications",
+                 _NOTIFICATION_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_notifications_update",
+                 "AFTER UPDATE OF is_read, is_dismissed, user_id", "notifications",
+                 _NOTIFICATION_DELTA.format(op="-", row="OLD"),
+                 _NOTIFICATION_DELTA.format(op="+", row="NEW")),
+        _trigger("trg_user_stats_notifications_delete", "AFTER DELETE", "notifications",
+                 _NOTIFICATION_DELTA.format(op="-", row="OLD")),
+    ],
+}
+
+
+def install_user_stats_triggers(connection) -> int:
+    """
+    Create the user_stats maintenance triggers (SQLite only, idempotent).
+
+    Triggers are only installed for source tables that exist, so partial
+    metadata.create_all() calls are safe.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        Number of trigger statements executed
+    """
+    if connection.dialect.name != "sqlite":
+        return 0
+
+    inspector = inspect(connection)
+    if not inspector.has_table("user_stats"):
+        return 0
+
+    executed = 0
+    for table, statements in USER_STATS_TRIGGERS.items():
+        if not inspector.has_table(table):
+            continue
+        for statement in statements:
+            connection.execute(text(statement))
+            executed += 1
+    return executed
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_user_stats_triggers(target, connection, **kw):
+    """Install triggers whenever the schema is (re)created."""
+    install_user_stats_triggers(connection)
@@ -11,6 +11,8 @@ Available repositories:
 - EvidenceRepository: Evidence records with file management
 - DeadlineRepository: Deadline tracking with status management
 - DashboardRepository: Aggregate queries for dashboard widgets
+- UserStatsRepository: Trigger-maintained per-user dashboard counters
+- ResourceVersionRepository: Trigger-maintained collection versions (ETags)
 """
 
 from backend.repositories.base import BaseRepository
@@ -19,6 +21,8 @@ from backend.repositories.case_repository import CaseRepository
 from backend.repositories.dashboard_repository import DashboardRepository
 from backend.repositories.deadline_repository import DeadlineRepository
 from backend.repositories.evidence_repository import EvidenceRepository
+from backend.repositories.resource_version_repository import ResourceVersionRepository
+from backend.repositories.user_stats_repository import UserStatsRepository
 
 __all__ = [
     "BaseRepository",
@@ -27,4 +31,6 @@ __all__ = [
     "EvidenceRepository",
     "DeadlineRepository",
     "DashboardRepository",
+    "UserStatsRepository",
+    "ResourceVersionRepository",
 ]
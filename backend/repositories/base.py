@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session
 
 from backend.services.security.encryption import EncryptionService
 from backend.services.audit_logger import AuditLogger
+from backend.utils.tracing import trace_methods
 
 # Type variable for SQLAlchemy model
 T = TypeVar("T")
@@ -27,6 +28,7 @@ CreateSchema = TypeVar("CreateSchema")
 UpdateSchema = TypeVar("UpdateSchema")
 
 
+@trace_methods()
 class BaseRepository(ABC, Generic[T]):
     """
     Abstract base repository providing common data access patterns.
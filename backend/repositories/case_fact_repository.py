@@ -17,8 +17,10 @@ from backend.models.case_fact import CaseFact
 from backend.repositories.base import BaseRepository
 from backend.services.audit_logger import AuditLogger
 from backend.services.security.encryption import EncryptionService
+from backend.utils.tracing import trace_methods
 
 
+@trace_methods()
 class CaseFactRepository(BaseRepository[CaseFact]):
     """
     Repository for CaseFact entity data access.
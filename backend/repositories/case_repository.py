@@ -22,7 +22,9 @@ from backend.models.case import Case, CaseStatus
 from backend.schemas.case import CaseCreate, CaseUpdate
 from backend.services.security.encryption import EncryptionService, EncryptedData
 from backend.services.audit_logger import AuditLogger
+from backend.utils.tracing import trace_methods
 
+@trace_methods()
 class CaseRepository:
     def __init__(
         self,
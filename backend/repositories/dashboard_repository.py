@@ -16,7 +16,10 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from backend.utils.tracing import trace_methods
 
+
+@trace_methods()
 class DashboardRepository:
     """
     Repository for dashboard aggregate queries.
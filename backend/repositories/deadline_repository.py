@@ -22,8 +22,10 @@ from backend.models.deadline import Deadline, DeadlinePriority, DeadlineStatus
 from backend.repositories.base import BaseRepository
 from backend.services.security.encryption import EncryptionService
 from backend.services.audit_logger import AuditLogger
+from backend.utils.tracing import trace_methods
 
 
+@trace_methods()
 class DeadlineRepository(BaseRepository[Deadline]):
     """
     Repository for Deadline entity data access.
@@ -20,8 +20,10 @@ from backend.models.evidence import Evidence
 from backend.repositories.base import BaseRepository
 from backend.services.security.encryption import EncryptionService
 from backend.services.audit_logger import AuditLogger
+from backend.utils.tracing import trace_methods
 
 
+@trace_methods()
 class EvidenceRepository(BaseRepository[Evidence]):
     """
     Repository for Evidence entity data access.
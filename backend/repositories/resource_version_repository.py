@@ -0,0 +1,113 @@
+"""
+ResourceVersion repository for trigger-maintained collection versions.
+
+Features:
+- One indexed lookup returning a version stamp for several collections
+- Lazy creation of missing rows (fixing their epoch) on a connection of its
+  own, so a read never commits the request's session
+- Graceful fallback when the table has not been created yet or the rows
+  cannot be created right now
+
+On databases without the maintenance triggers (anything but SQLite) no
+stamp is available and callers fall back to unconditional responses.
+"""
+
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from backend.utils.tracing import trace_methods
+
+_SELECT_VERSIONS = text(
+    """
+    SELECT collection, version, epoch
+    FROM resource_versions
+    WHERE user_id = :user_id AND collection IN :collections
+    """
+).bindparams(bindparam("collections", expanding=True))
+
+_INSERT_VERSION = text(
+    """
+    INSERT OR IGNORE INTO resource_versions (user_id, collection, version, epoch)
+    VALUES (:user_id, :collection, 0, :epoch)
+    """
+)
+
+
+@trace_methods()
+class ResourceVersionRepository:
+    """
+    Repository for per-user collection version counters.
+
+    The counters only ever grow while a row exists, so a stamp changes
+    whenever anything in one of its collections is written.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize resource version repository.
+
+        Args:
+            db: SQLAlchemy session
+        """
+        self.db = db
+
+    @property
+    def uses_triggers(self) -> bool:
+        """Whether versions are trigger-maintained on this database."""
+        return self.db.get_bind().dialect.name == "sqlite"
+
+    def get_stamp(self, user_id: int, collections: Sequence[str]) -> Optional[str]:
+        """
+        Get the combined version stamp of some of a user's collections.
+
+        Args:
+            user_id: User ID
+            collections: Collection names (see resource_version.COLLECTIONS)
+
+        Returns:
+            Opaque stamp string, or None when versions are not maintained
+        """
+        if not self.uses_triggers:
+            return None
+
+        try:
+            versions = self._read(user_id, collections)
+        except OperationalError:
+            # Schema predates resource_versions; serve unconditionally
+            return None
+
+        missing = [name for name in collections if name not in versions]
+        if missing:
+            try:
+                self._create(user_id, missing)
+            except OperationalError:
+                # e.g. database locked by another writer; try again next time
+                return None
+            versions = self._read(user_id, collections)
+
+        return ";".join(
+            f"{name}:{versions[name][1]}:{versions[name][0]}" for name in sorted(collections)
+        )
+
+    def _read(self, user_id: int, collections: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        rows = self.db.execute(
+            _SELECT_VERSIONS, {"user_id": user_id, "collections": list(collections)}
+        ).fetchall()
+        return {row.collection: (row.version, row.epoch) for row in rows}
+
+    def _create(self, user_id: int, collections: Sequence[str]) -> None:
+        epoch = int(time.time() * 1000)
+        # Committed on a separate connection: committing self.db would also
+        # commit whatever else the request has pending in its session
+        with self.db.get_bind().begin() as connection:
+            connection.execute(
+                _INSERT_VERSION,
+                [
+                    {"user_id": user_id, "collection": name, "epoch": epoch}
+                    for name in collections
+                ],
+            )
@@ -0,0 +1,300 @@
+"""
+UserStats repository for trigger-maintained dashboard counters.
+
+Features:
+- Single primary-key lookup for dashboard statistics
+- Lazy creation of missing rows from the source tables
+- Lazy refresh of the time-dependent overdue deadline count
+- Full reconciliation (used by the nightly UserStatsReconciler)
+
+Rows are written with single upsert/UPDATE statements rather than ORM
+objects, so concurrent first reads of the same user cannot collide on the
+primary key.
+
+On databases without the maintenance triggers (anything but SQLite) the
+counters are computed directly from the source tables instead.
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from backend.models.user_stats import UserStats
+from backend.utils.tracing import trace_methods
+
+# Stored in overdue_valid_until when the user has no upcoming open deadline
+NO_UPCOMING_DEADLINE = "9999-12-31T23:59:59"
+
+COUNTER_FIELDS = (
+    "total_cases",
+    "active_cases",
+    "closed_cases",
+    "pending_cases",
+    "evidence_count",
+    "total_deadlines",
+    "open_deadlines",
+    "overdue_deadlines",
+    "unread_notifications",
+)
+
+_UPSERT_COLUMNS = COUNTER_FIELDS + ("overdue_valid_until", "reconciled_at")
+
+_UPSERT_SQL = """
+    INSERT INTO user_stats (user_id, {columns})
+    VALUES (:user_id, {values})
+    ON CONFLICT (user_id) DO {conflict}
+""".format(
+    columns=", ".join(_UPSERT_COLUMNS),
+    values=", ".join(f":{column}" for column in _UPSERT_COLUMNS),
+    conflict="{conflict}",
+)
+
+_READ_SQL = text(
+    f"SELECT {', '.join(COUNTER_FIELDS)}, overdue_valid_until "
+    "FROM user_stats WHERE user_id = :user_id"
+)
+
+
+@trace_methods()
+class UserStatsRepository:
+    """
+    Repository for per-user aggregate counters.
+
+    Reads are served from the user_stats row; the source tables are only
+    scanned when the row is missing, when the overdue count has expired,
+    or during reconciliation.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize user stats repository.
+
+        Args:
+            db: SQLAlchemy session
+        """
+        self.db = db
+
+    @property
+    def uses_triggers(self) -> bool:
+        """Whether counters are trigger-maintained on this database."""
+        return self.db.get_bind().dialect.name == "sqlite"
+
+    # ===== READ PATH =====
+
+    def get_stats(self, user_id: int) -> Dict[str, int]:
+        """
+        Get dashboard counters for a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dictionary keyed by COUNTER_FIELDS
+        """
+        if not self.uses_triggers:
+            return self._compute_counts(user_id, self._now())
+
+        row = self._read_row(user_id)
+        if row is None:
+            # Concurrent first reads both insert; the loser's insert is a no-op
+            self._write_row(user_id, overwrite=False)
+            row = self._read_row(user_id)
+
+        stats = {field: getattr(row, field) for field in COUNTER_FIELDS}
+        if self._overdue_expired(row.overdue_valid_until):
+            stats["overdue_deadlines"] = self._refresh_overdue(
+                user_id, row.overdue_valid_until
+            )
+        return stats
+
+    # ===== RECONCILIATION =====
+
+    def reconcile_user(self, user_id: int) -> UserStats:
+        """
+        Recompute all counters for a user from the source tables.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            The up-to-date UserStats row
+        """
+        self._write_row(user_id, overwrite=True)
+        return self.db.get(UserStats, user_id, populate_existing=True)
+
+    def reconcile_all(self) -> Dict[str, int]:
+        """
+        Recompute counters for every user and report drift.
+
+        Returns:
+            Dictionary with number of users checked and rows corrected
+        """
+        user_ids = [
+            row.id for row in self.db.execute(text("SELECT id FROM users")).fetchall()
+        ]
+
+        corrected = 0
+        for user_id in user_ids:
+            existing = self.db.get(UserStats, user_id)
+            before: Optional[Dict[str, Any]] = (
+                {field: getattr(existing, field) for field in COUNTER_FIELDS}
+                if existing is not None
+                else None
+            )
+            stats = self.reconcile_user(user_id)
+            after = {field: getattr(stats, field) for field in COUNTER_FIELDS}
+            if before != after:
+                corrected += 1
+
+        return {"users": len(user_ids), "corrected": corrected}
+
+    # ===== INTERNAL HELPERS =====
+
+    @staticmethod
+    def _now() -> str:
+        # Same format the deadline queries have always compared against
+        return datetime.utcnow().isoformat()
+
+    def _overdue_expired(self, overdue_valid_until: Optional[str]) -> bool:
+        return overdue_valid_until is None or overdue_valid_until <= self._now()
+
+    def _read_row(self, user_id: int):
+        return self.db.execute(_READ_SQL, {"user_id": user_id}).fetchone()
+
+    def _write_row(self, user_id: int, overwrite: bool) -> None:
+        """
+        Insert the user's row computed from the source tables.
+
+        Args:
+            user_id: User ID
+            overwrite: Replace an existing row (reconciliation) instead of
+                keeping it (lazy creation)
+        """
+        now = self._now()
+        params: Dict[str, Any] = self._compute_counts(user_id, now)
+        params.update(
+            user_id=user_id,
+            overdue_valid_until=self._next_overdue_boundary(user_id, now),
+            reconciled_at=datetime.now(timezone.utc),
+        )
+
+        if overwrite:
+            updates = ", ".join(
+                f"{column} = excluded.{column}" for column in _UPSERT_COLUMNS
+            )
+            conflict = f"UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP"
+        else:
+            conflict = "NOTHING"
+
+        statement = text(_UPSERT_SQL.format(conflict=conflict)).bindparams(
+            bindparam("reconciled_at", type_=UserStats.__table__.c.reconciled_at.type)
+        )
+        self.db.execute(statement, params)
+        self.db.commit()
+
+    def _refresh_overdue(self, user_id: int, seen_valid_until: Optional[str]) -> int:
+        """
+        Recompute the overdue count and store it with its new expiry.
+
+        The row is only updated if overdue_valid_until is still the value
+        read, so a deadline trigger invalidating it meanwhile is not undone.
+
+        Returns:
+            Current overdue deadline count
+        """
+        now = self._now()
+        result = self.db.execute(
+            text(
+                """
+                SELECT COUNT(*) AS count
+                FROM deadlines
+                WHERE user_id = :user_id
+                  AND deleted_at IS NULL
+                  AND LOWER(status) != 'completed'
+                  AND deadline_date < :now
+            """
+            ),
+            {"user_id": user_id, "now": now},
+        ).fetchone()
+        overdue = result.count if result else 0
+
+        self.db.execute(
+            text(
+                """
+                UPDATE user_stats
+                SET overdue_deadlines = :overdue,
+                    overdue_valid_until = :valid_until
+                WHERE user_id = :user_id
+                  AND overdue_valid_until IS :seen
+            """
+            ),
+            {
+                "overdue": overdue,
+                "valid_until": self._next_overdue_boundary(user_id, now),
+                "user_id": user_id,
+                "seen": seen_valid_until,
+            },
+        )
+        self.db.commit()
+        return overdue
+
+    def _next_overdue_boundary(self, user_id: int, now: str) -> str:
+        result = self.db.execute(
+            text(
+                """
+                SELECT MIN(deadline_date) AS next_date
+                FROM deadlines
+                WHERE user_id = :user_id
+                  AND deleted_at IS NULL
+                  AND LOWER(status) != 'completed'
+                  AND deadline_date >= :now
+            """
+            ),
+            {"user_id": user_id, "now": now},
+        ).fetchone()
+        return result.next_date if result and result.next_date else NO_UPCOMING_DEADLINE
+
+    def _compute_counts(self, user_id: int, now: str) -> Dict[str, int]:
+        row = self.db.execute(
+            text(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM cases WHERE user_id = :user_id)
+                        AS total_cases,
+                    (SELECT COUNT(*) FROM cases
+                     WHERE user_id = :user_id AND LOWER(status) = 'active')
+                        AS active_cases,
+                    (SELECT COUNT(*) FROM cases
+                     WHERE user_id = :user_id AND LOWER(status) = 'closed')
+                        AS closed_cases,
+                    (SELECT COUNT(*) FROM cases
+                     WHERE user_id = :user_id AND LOWER(status) = 'pending')
+                        AS pending_cases,
+                    (SELECT COUNT(*) FROM evidence e
+                     JOIN cases c ON e.case_id = c.id
+                     WHERE c.user_id = :user_id)
+                        AS evidence_count,
+                    (SELECT COUNT(*) FROM deadlines
+                     WHERE user_id = :user_id AND deleted_at IS NULL)
+                        AS total_deadlines,
+                    (SELECT COUNT(*) FROM deadlines
+                     WHERE user_id = :user_id AND deleted_at IS NULL
+                       AND LOWER(status) != 'completed')
+                        AS open_deadlines,
+                    (SELECT COUNT(*) FROM deadlines
+                     WHERE user_id = :user_id AND deleted_at IS NULL
+                       AND LOWER(status) != 'completed'
+                       AND deadline_date < :now)
+                        AS overdue_deadlines,
+                    (SELECT COUNT(*) FROM notifications
+                     WHERE user_id = :user_id
+                       AND is_read = :false AND is_dismissed = :false)
+                        AS unread_notifications
+            """
+            ),
+            {"user_id": user_id, "now": now, "false": False},
+        ).fetchone()
+
+        return {field: int(getattr(row, field) or 0) for field in COUNTER_FIELDS}
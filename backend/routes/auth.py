@@ -10,6 +10,7 @@ Routes:
 - GET /auth/session/{session_id} - Get session and user info
 - POST /auth/change-password - Change user password
 - POST /auth/cleanup-sessions - Cleanup expired sessions (admin endpoint)
+- GET /auth/hashing-status - Password hashing pool metrics (admin only)
 
 Security Features:
 - User-controlled rate limiting (DISABLED by default, see RATE_LIMITING_GUIDE.md)
@@ -20,6 +21,8 @@ Security Features:
 - Session management with 24-hour or 30-day expiration
 - OWASP-compliant password requirements
 - Timing-safe password comparison
+- Password hashing off the event loop; 503 with Retry-After when the
+  bounded hashing queue is full (login storms only degrade auth endpoints)
 
 Rate Limiting Configuration:
 - Set ENABLE_RATE_LIMITING=true to enable (false by default)
@@ -34,7 +37,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, text
 
 from backend.models.base import get_db
 from backend.models.session import Session as SessionModel
@@ -42,9 +45,11 @@ from backend.models.user import User
 from backend.models.profile import UserProfile
 from backend.models.password_reset import PasswordResetToken
 from backend.services.audit_logger import AuditLogger
+from backend.services.auth.password_hasher import PasswordHasherBusyError, get_password_hasher
 from backend.services.auth.service import AuthenticationError, AuthenticationService
 from backend.services.rate_limit_service import RateLimitService, get_rate_limiter
 from backend.services.auth.session_manager import SessionManager
+from backend.services.auth.session_tokens import is_session_token
 
 # Import schemas from consolidated schema file
 from backend.schemas.auth import (
@@ -79,6 +84,14 @@ def _build_auth_payload(result: dict) -> dict:
         "session": result["session"],
     }
 
+def _hashing_busy(exc: PasswordHasherBusyError) -> HTTPException:
+    """503 response for requests shed by the password hashing pool."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 # ===== Dependency injection functions =====
 
 def get_auth_service(db: Session = Depends(get_db)) -> AuthenticationService:
@@ -100,12 +113,14 @@ def get_session_manager(db: Session = Depends(get_db)) -> SessionManager:
     - Database session
     - Audit logger (for session lifecycle logging)
     - Memory cache disabled (database-backed sessions only)
+    - Process-wide validation cache (short TTL, invalidated on logout/revocation)
     """
     audit_logger = AuditLogger(db)
     return SessionManager(
         db=db,
         audit_logger=audit_logger,
         enable_memory_cache=False,  # Use database for persistence
+        use_validation_cache=True,
     )
 
 def _are_test_routes_enabled() -> bool:
@@ -165,6 +180,32 @@ async def get_current_user(
 
     return validation_result.user_id
 
+async def require_admin_user(
+    user_id: int = Depends(get_current_user), db: Session = Depends(get_db)
+) -> int:
+    """
+    Verify the authenticated user has admin privileges.
+
+    Returns:
+        User ID if admin, raises HTTPException otherwise
+    """
+    # Query user role from database
+    user_query = text("SELECT role FROM users WHERE id = :user_id")
+    result = db.execute(user_query, {"user_id": user_id})
+    user = result.fetchone()
+
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+    # Check if user has admin role
+    if user[0] != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required for this operation",
+        )
+
+    return user_id
+
 # ===== Routes =====
 
 @router.post(
@@ -282,6 +323,8 @@ async def register(
 
         return _build_auth_payload(result)
 
+    except PasswordHasherBusyError as exc:
+        raise _hashing_busy(exc) from exc
     except AuthenticationError as e:
         # Increment rate limit on failed attempt (only if enabled)
         if enable_rate_limiting:
@@ -455,6 +498,9 @@ async def login(
             "session": result["session"],
         }
 
+    except PasswordHasherBusyError as exc:
+        # Shed load without counting it as a failed attempt
+        raise _hashing_busy(exc) from exc
     except AuthenticationError as e:
         # Increment rate limit on failed login
         rate_limiter.increment(user_id, "login")
@@ -583,7 +629,8 @@ async def get_session(
                 "is_active": user.is_active,
             },
             "session": {
-                "id": session.id,
+                # Token clients keep using the token they presented
+                "id": session_id if is_session_token(session_id) else session.id,
                 "user_id": session.user_id,
                 "expires_at": session.expires_at.isoformat(),
             },
@@ -677,6 +724,8 @@ async def change_password(
             "message": "Password changed successfully. All sessions have been invalidated.",
         }
 
+    except PasswordHasherBusyError as exc:
+        raise _hashing_busy(exc) from exc
     except AuthenticationError as e:
         # Increment rate limit on failure
         rate_limiter.increment(request.user_id, "password_change")
@@ -783,6 +832,25 @@ async def get_rate_limit_status(
             detail=f"Failed to get rate limit status: {str(exc)}",
         ) from exc
 
+@router.get(
+    "/hashing-status",
+    response_model=dict,
+    responses={
+        200: {"description": "Password hashing pool metrics retrieved"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin privileges required"},
+    },
+)
+async def get_hashing_status(user_id: int = Depends(require_admin_user)):
+    """
+    Get password hashing pool metrics (ADMIN ONLY).
+
+    **Use Case:**
+    - Spot login storms (queue wait growing, requests rejected)
+    - Size PASSWORD_HASH_WORKERS / PASSWORD_HASH_QUEUE
+    """
+    return get_password_hasher().get_stats()
+
 
 
 # ===== Password Reset Endpoints =====
@@ -963,7 +1031,7 @@ async def reset_password(
 
         # Hash new password
         new_salt = secrets.token_bytes(16)
-        new_hash = auth_service._hash_password(request.new_password, new_salt)
+        new_hash = await auth_service._hash_password_async(request.new_password, new_salt)
 
         # Update user password
         user.password_hash = new_hash.hex()
@@ -984,6 +1052,8 @@ async def reset_password(
 
     except HTTPException:
         raise
+    except PasswordHasherBusyError as exc:
+        raise _hashing_busy(exc) from exc
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,11 +29,12 @@ import os
 from datetime import datetime
 from typing import Any, Awaitable, Dict, List, Optional, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from backend.models.base import get_db
+from backend.repositories.resource_version_repository import ResourceVersionRepository
 from backend.routes.auth import get_current_user, get_session_manager
 
 # Import schemas from consolidated schema file
@@ -75,6 +76,7 @@ from backend.services.case_service import (
     UpdateCaseInput,
 )
 from backend.services.security.encryption import EncryptionService
+from backend.utils.etag import build_etag, etag_headers, etag_matches, not_modified
 
 router = APIRouter(prefix="/cases", tags=["cases"])
 
@@ -332,8 +334,11 @@ async def create_case(
 
 @router.get("", response_model=List[LegacyCaseResponse])
 async def list_cases(
+    request: Request,
+    response: Response,
     user_id: int = Depends(resolve_current_user_id),
     case_service: CaseService = Depends(resolve_case_service),
+    db: Session = Depends(get_db),
     status_filter: Optional[str] = Query(
         None, alias="status", description="Filter by case status"
     ),
@@ -369,9 +374,18 @@ async def list_cases(
 
     Returns cases ordered by most recently updated first (default).
 
+    Supports conditional GET: responses carry an ETag derived from the user's
+    case version counter, and a matching If-None-Match returns 304 before
+    any query or decryption runs.
+
     Example:
         GET /cases?status=active&caseType=employment&page=1&page_size=20
     """
+    stamp = ResourceVersionRepository(db).get_stamp(user_id, ("cases",))
+    etag = build_etag(request, user_id, stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
         # Build search filters
         filters = None
@@ -408,6 +422,8 @@ async def list_cases(
         end_idx = start_idx + page_size
         paginated_cases = cases[start_idx:end_idx]
 
+        response.headers.update(etag_headers(etag))
+
         # Convert to legacy format
         return [convert_to_legacy_format(case) for case in paginated_cases]
 
@@ -22,7 +22,6 @@ Usage:
     app.include_router(chat_router)
 """
 
-import json
 import logging
 import os
 import re
@@ -31,16 +30,21 @@ import tempfile
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import (APIRouter, Depends, File, HTTPException, Query,
-                     UploadFile, status)
+from fastapi import (APIRouter, BackgroundTasks, Depends, File,
+                     HTTPException, Query, UploadFile, status)
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from backend.models.base import get_db
 from backend.routes.auth import get_current_user
 from backend.services.ai.stub import StubAIService
 from backend.services.audit_logger import AuditLogger
+from backend.services.chat_history import (build_history_messages,
+                                           get_history_turns,
+                                           make_ai_summarizer,
+                                           max_loaded_messages)
 from backend.services.chat_service import (ChatService, ConversationResponse,
                                            ConversationWithMessagesResponse,
                                            CreateConversationInput,
@@ -50,11 +54,11 @@ from backend.services.ai.rag import (RAGService, build_system_prompt,
                                           extract_sources)
 from backend.services.ai.service import (AIProviderConfig, 
                                                  CaseAnalysisRequest,
-                                                 ChatMessage,
                                                  DocumentDraftRequest,
                                                  EvidenceAnalysisRequest,
                                                  ParsedDocument,
                                                  UnifiedAIService, UserProfile)
+from backend.utils.json_response import json_dumps
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -316,6 +320,40 @@ def generate_conversation_title(message: str) -> str:
 
     return truncated + "..."
 
+# Conversations whose summary is being rewritten (one summarizer per conversation)
+_summaries_in_progress: set = set()
+
+async def update_conversation_summary(
+    bind: Engine,
+    ai_service: UnifiedAIService,
+    conversation_id: int,
+    history_turns: int,
+) -> None:
+    """
+    Fold turns older than the verbatim window into the rolling summary.
+
+    Runs as a background task after the response has been sent, with its own
+    database session. Failures are logged only: the turn has already been
+    saved, and the summary catches up on a later turn.
+    """
+    if conversation_id in _summaries_in_progress:
+        return
+    _summaries_in_progress.add(conversation_id)
+
+    db = Session(bind=bind)
+    try:
+        chat_service = ChatService(db, audit_logger=AuditLogger(db))
+        await chat_service.update_rolling_summary(
+            conversation_id,
+            make_ai_summarizer(ai_service),
+            keep_messages=2 * history_turns,
+        )
+    except Exception as exc:
+        logger.error(f"Failed to update conversation summary: {exc}")
+    finally:
+        db.close()
+        _summaries_in_progress.discard(conversation_id)
+
 # ===== STREAMING IMPLEMENTATION =====
 
 async def stream_ai_chat(
@@ -328,16 +366,18 @@ async def stream_ai_chat(
     ai_service: UnifiedAIService,
     rag_service: RAGService,
     db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> AsyncIterator[str]:
     """
     Stream AI chat response with RAG context and save to database.
 
     This function:
-    1. Loads conversation history if conversationId provided
+    1. Loads the rolling summary and recent turns if conversationId provided
     2. Fetches legal context if useRAG=True
     3. Streams AI response token by token
     4. Saves conversation and messages after streaming completes
     5. Returns conversation ID as final event
+    6. Schedules the conversation summary update to run after the stream closes
 
     Yields:
         SSE-formatted data strings
@@ -348,16 +388,14 @@ async def stream_ai_chat(
     logger.info(f"[DEBUG] AI Service Config - Provider: {ai_service.config.provider}, Model: {ai_service.config.model}")
 
     try:
-        # Load conversation history if provided
-        history_messages = []
+        # Load summary + recent messages (bounded, however long the conversation)
+        history = None
+        history_turns = get_history_turns()
         if conversation_id:
             try:
-                await chat_service.verify_ownership(conversation_id, user_id)
-                conversation = await chat_service.load_conversation(conversation_id, user_id)
-
-                # Convert messages to ChatMessage format
-                for msg in conversation.messages:
-                    history_messages.append(ChatMessage(role=msg.role, content=msg.content))
+                history = await chat_service.load_recent_history(
+                    conversation_id, user_id, max_messages=max_loaded_messages(history_turns)
+                )
             except Exception as exc:
                 logger.error(f"Failed to load conversation history: {exc}")
                 # Continue without history
@@ -377,11 +415,7 @@ async def stream_ai_chat(
                 # Continue without RAG
 
         # Build messages array
-        messages = (
-            [ChatMessage(role="system", content=system_prompt)]
-            + history_messages
-            + [ChatMessage(role="user", content=message)]
-        )
+        messages = build_history_messages(system_prompt, history, message)
 
         # Stream AI response
         full_response = ""
@@ -391,7 +425,7 @@ async def stream_ai_chat(
 
             # Yield token in SSE format
             data = {"type": "token", "data": token, "done": False}
-            yield f"data: {json.dumps(data)}\n\n"
+            yield f"data: {json_dumps(data)}\n\n"
 
         # Save to database
         full_response = full_response.strip()
@@ -421,22 +455,33 @@ async def stream_ai_chat(
         # Send sources if available
         if sources:
             sources_data = {"type": "sources", "data": sources, "done": False}
-            yield f"data: {json.dumps(sources_data)}\n\n"
+            yield f"data: {json_dumps(sources_data)}\n\n"
+
+        # Fold older turns into the rolling summary once the stream has closed
+        if background_tasks is not None:
+            background_tasks.add_task(
+                update_conversation_summary,
+                chat_service.db.get_bind(),
+                ai_service,
+                conversation_id,
+                history_turns,
+            )
 
         # Send final event with conversation ID
         final_data = {"type": "complete", "conversationId": conversation_id, "done": True}
-        yield f"data: {json.dumps(final_data)}\n\n"
+        yield f"data: {json_dumps(final_data)}\n\n"
 
     except Exception as exc:
         logger.exception(f"Streaming error: {exc}")
         error_data = {"type": "error", "error": str(exc), "done": True}
-        yield f"data: {json.dumps(error_data)}\n\n"
+        yield f"data: {json_dumps(error_data)}\n\n"
 
 # ===== ROUTES =====
 
 @router.post("/stream")
 async def stream_chat(
     request: ChatStreamRequest,
+    background_tasks: BackgroundTasks,
     user_id: int = Depends(get_current_user),
     db: Session = Depends(get_db),
     chat_service: ChatService = Depends(get_chat_service),
@@ -471,6 +516,7 @@ async def stream_chat(
                 ai_service=ai_service,
                 rag_service=rag_service,
                 db=db,
+                background_tasks=background_tasks,
             ),
             media_type="text/event-stream",
             headers={
@@ -478,6 +524,7 @@ async def stream_chat(
                 "Connection": "keep-alive",
                 "X-Accel-Buffering": "no",
             },
+            background=background_tasks,
         )
 
     except HTTPException:
@@ -492,6 +539,7 @@ async def stream_chat(
 @router.post("/send", response_model=Dict[str, Any])
 async def send_chat(
     request: ChatSendRequest,
+    background_tasks: BackgroundTasks,
     user_id: int = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     ai_service: UnifiedAIService = Depends(get_ai_service),
@@ -511,16 +559,15 @@ async def send_chat(
         }
     """
     try:
-        # Load conversation history
-        history_messages = []
+        # Load summary + recent messages (bounded, however long the conversation)
+        history = None
+        history_turns = get_history_turns()
         conversation_id = request.conversationId
 
         if conversation_id:
-            await chat_service.verify_ownership(conversation_id, user_id)
-            conversation = await chat_service.load_conversation(conversation_id, user_id)
-
-            for msg in conversation.messages:
-                history_messages.append(ChatMessage(role=msg.role, content=msg.content))
+            history = await chat_service.load_recent_history(
+                conversation_id, user_id, max_messages=max_loaded_messages(history_turns)
+            )
 
         # Fetch legal context if RAG enabled
         system_prompt = "You are Justice Companion AI, a helpful legal assistant for UK civil legal matters. Remember: You offer information and guidance, not legal advice."
@@ -533,11 +580,7 @@ async def send_chat(
                 sources = extract_sources(context)
 
         # Build messages and get response
-        messages = (
-            [ChatMessage(role="system", content=system_prompt)]
-            + history_messages
-            + [ChatMessage(role="user", content=request.message)]
-        )
+        messages = build_history_messages(system_prompt, history, request.message)
 
         response = await ai_service.chat(messages)
 
@@ -563,6 +606,15 @@ async def send_chat(
             user_id,
         )
 
+        # Summary update runs after the response is sent
+        background_tasks.add_task(
+            update_conversation_summary,
+            chat_service.db.get_bind(),
+            ai_service,
+            conversation_id,
+            history_turns,
+        )
+
         return {"response": response, "conversationId": conversation_id, "sources": sources}
 
     except HTTPException:
@@ -17,6 +17,7 @@ Routes:
 
 Services Integrated:
 - CaseService: Case management with statistics
+- UserStatsRepository: Trigger-maintained per-user counters (statistics widget)
 - NotificationService: Notification counts and recent notifications
 - DeadlineReminderScheduler: Upcoming deadlines tracking
 - SearchService: Activity search (optional)
@@ -24,7 +25,7 @@ Services Integrated:
 SECURITY: All queries are filtered by user_id to prevent horizontal privilege escalation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -33,6 +34,8 @@ import os
 import base64
 
 from backend.models.base import get_db
+from backend.repositories.resource_version_repository import ResourceVersionRepository
+from backend.repositories.user_stats_repository import UserStatsRepository
 from backend.routes.auth import get_current_user
 from backend.services.auth.service import AuthenticationService
 from backend.services.case_service import CaseService
@@ -42,6 +45,7 @@ from backend.services.notification_service import (
 )
 from backend.services.security.encryption import EncryptionService
 from backend.services.audit_logger import AuditLogger
+from backend.utils.etag import build_etag, etag_headers, etag_matches, not_modified
 
 # Import schemas from consolidated schema file
 from backend.schemas.dashboard import (
@@ -62,6 +66,9 @@ from backend.schemas.dashboard import (
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Collections whose writes can change the dashboard overview
+DASHBOARD_COLLECTIONS = ("cases", "evidence", "deadlines", "notifications")
+
 # ===== DEPENDENCY INJECTION =====
 
 def get_auth_service(db: Session = Depends(get_db)) -> AuthenticationService:
@@ -108,6 +115,8 @@ async def get_notification_service(
 
 @router.get("", response_model=DashboardOverviewResponse)
 async def get_dashboard_overview(
+    request: Request,
+    response: Response,
     user_id: int = Depends(get_current_user),
     case_service: CaseService = Depends(get_case_service),
     notification_service: NotificationService = Depends(get_notification_service),
@@ -123,16 +132,29 @@ async def get_dashboard_overview(
     - Deadlines widget data
     - Activity widget data
 
+    Supports conditional GET: the ETag combines the user's case, evidence,
+    deadline and notification version counters with the clock-dependent
+    values (see _dashboard_clock_stamp), and a matching If-None-Match
+    returns 304 before any widget is built.
+
     SECURITY: All data filtered by user_id.
     """
+    etag = None
+    stamp = ResourceVersionRepository(db).get_stamp(user_id, DASHBOARD_COLLECTIONS)
+    if stamp is not None:
+        etag = build_etag(request, user_id, stamp, _dashboard_clock_stamp(user_id, db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
         # Fetch all dashboard components in parallel
-        stats = await get_dashboard_stats_internal(user_id, case_service, notification_service, db)
+        stats = await get_dashboard_stats_internal(user_id, db)
         recent_cases = await get_recent_cases_internal(user_id, case_service)
         notifications = await get_notifications_widget_internal(user_id, notification_service)
         deadlines = await get_deadlines_widget_internal(user_id, db)
         activity = await get_activity_widget_internal(user_id, db)
 
+        response.headers.update(etag_headers(etag))
         return DashboardOverviewResponse(
             stats=stats,
             recentCases=recent_cases,
@@ -147,11 +169,59 @@ async def get_dashboard_overview(
             detail=f"Failed to load dashboard overview: {str(e)}",
         )
 
+def _dashboard_clock_stamp(user_id: int, db: Session, limit: int = 10) -> str:
+    """
+    Summarize the parts of the overview that change with time alone.
+
+    Overdue flags, daysUntil and notification expiry move without any write
+    bumping a version counter, so they go into the ETag: the daysUntil and
+    overdue flag of the deadlines the widget shows, the total overdue count
+    and the number of expired notifications.
+    """
+    now = datetime.utcnow()
+    rows = db.execute(
+        text(
+            """
+            SELECT deadline_date
+            FROM deadlines
+            WHERE user_id = :user_id
+              AND status != 'completed'
+              AND deleted_at IS NULL
+            ORDER BY deadline_date ASC
+            LIMIT :limit
+        """
+        ),
+        {"user_id": user_id, "limit": limit},
+    ).fetchall()
+
+    parts = []
+    for row in rows:
+        try:
+            deadline_date = datetime.fromisoformat(row.deadline_date.replace("Z", "+00:00"))
+            parts.append(f"{(deadline_date - now).days}:{int(deadline_date < now)}")
+        except (ValueError, AttributeError, TypeError):
+            parts.append("-")
+
+    counts = db.execute(
+        text(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM deadlines
+                 WHERE user_id = :user_id AND status != 'completed'
+                   AND deleted_at IS NULL AND deadline_date < :now_iso) AS overdue,
+                (SELECT COUNT(*) FROM notifications
+                 WHERE user_id = :user_id AND expires_at IS NOT NULL
+                   AND expires_at <= :local_now) AS expired
+        """
+        ),
+        {"user_id": user_id, "now_iso": now.isoformat(), "local_now": datetime.now()},
+    ).fetchone()
+
+    return f"{','.join(parts)}|{counts.overdue}|{counts.expired}"
+
 @router.get("/stats", response_model=DashboardStatsResponse)
 async def get_dashboard_stats(
     user_id: int = Depends(get_current_user),
-    case_service: CaseService = Depends(get_case_service),
-    notification_service: NotificationService = Depends(get_notification_service),
     db: Session = Depends(get_db),
 ):
     """
@@ -166,77 +236,31 @@ async def get_dashboard_stats(
     - Overdue deadlines count
     - Unread notifications count
 
+    Served from the trigger-maintained user_stats row (one primary-key lookup).
+
     SECURITY: All queries are filtered by user_id to prevent data leakage.
     """
-    return await get_dashboard_stats_internal(user_id, case_service, notification_service, db)
+    return await get_dashboard_stats_internal(user_id, db)
 
-async def get_dashboard_stats_internal(
-    user_id: int, case_service: CaseService, notification_service: NotificationService, db: Session
-) -> DashboardStatsResponse:
+async def get_dashboard_stats_internal(user_id: int, db: Session) -> DashboardStatsResponse:
     """Internal method to get dashboard statistics."""
     try:
-        # Get case statistics from CaseService
-        case_stats = await case_service.get_case_statistics(user_id)
-        total_cases = case_stats.get("total_cases", 0)
-        status_counts = case_stats.get("status_counts", {})
-        active_cases = status_counts.get("active", 0)
-        closed_cases = status_counts.get("closed", 0)
-
-        # Get total evidence count (filtered by user's cases only)
-        # SECURITY: Only count evidence from cases owned by this user
-        evidence_query = text(
-            """
-            SELECT COUNT(*) as count
-            FROM evidence
-            WHERE case_id IN (SELECT id FROM cases WHERE user_id = :user_id)
-        """
-        )
-        evidence_result = db.execute(evidence_query, {"user_id": user_id}).fetchone()
-        total_evidence = evidence_result.count if evidence_result else 0
-
-        # Get total deadlines count
-        deadlines_query = text(
-            """
-            SELECT COUNT(*) as count
-            FROM deadlines
-            WHERE user_id = :user_id AND deleted_at IS NULL
-        """
-        )
-        deadlines_result = db.execute(deadlines_query, {"user_id": user_id}).fetchone()
-        total_deadlines = deadlines_result.count if deadlines_result else 0
-
-        # Get overdue deadlines count
-        now = datetime.utcnow().isoformat()
-        overdue_query = text(
-            """
-            SELECT COUNT(*) as count
-            FROM deadlines
-            WHERE user_id = :user_id
-              AND deleted_at IS NULL
-              AND status != 'completed'
-              AND deadline_date < :now
-        """
-        )
-        overdue_result = db.execute(overdue_query, {"user_id": user_id, "now": now}).fetchone()
-        overdue_deadlines = overdue_result.count if overdue_result else 0
-
-        # Get unread notifications count from NotificationService
-        unread_notifications = await notification_service.get_unread_count(user_id)
+        stats = UserStatsRepository(db).get_stats(user_id)
 
         return DashboardStatsResponse(
-            totalCases=total_cases,
-            activeCases=active_cases,
-            closedCases=closed_cases,
-            totalEvidence=total_evidence,
-            totalDeadlines=total_deadlines,
-            overdueDeadlines=overdue_deadlines,
-            unreadNotifications=unread_notifications,
+            totalCases=stats["total_cases"],
+            activeCases=stats["active_cases"],
+            closedCases=stats["closed_cases"],
+            totalEvidence=stats["evidence_count"],
+            totalDeadlines=stats["total_deadlines"],
+            overdueDeadlines=stats["overdue_deadlines"],
+            unreadNotifications=stats["unread_notifications"],
         )
 
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load dashboard statistics: {str(e)}",
+            detail=f"Failed to load dashboard statistics: {str(exc)}",
         )
 
 @router.get("/recent-cases", response_model=RecentCasesResponse)
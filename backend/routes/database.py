@@ -9,41 +9,44 @@ ENHANCED WITH SERVICE LAYER INTEGRATION:
 - Uses AuditLogger for comprehensive audit trail (enhanced logging)
 
 Routes:
-- GET /database/stats - Get database statistics (table counts, size)
+- GET /database/stats - Get database statistics (table counts, size, per-object storage, WAL)
 - POST /database/backup - Create database backup
 - GET /database/backups - List available backups
 - GET /database/backups/{backup_id} - Get specific backup details
 - POST /database/restore - Restore from backup (admin only)
 - DELETE /database/backups/{backup_filename} - Delete a backup (admin only)
-- POST /database/optimize - Run VACUUM and ANALYZE to optimize (admin only)
+- POST /database/optimize - Run PRAGMA optimize and a background incremental vacuum (admin only)
 - POST /database/backup/schedule - Configure automated backups
 - GET /database/backup/schedule - Get backup schedule settings
 - DELETE /database/backup/schedule - Disable automated backups
 - POST /database/retention - Apply retention policy to cleanup old backups
 - GET /database/scheduler/stats - Get scheduler statistics
+- GET /database/audit-logs/export - Stream an audit log export (admin only)
 
 Admin-only endpoints enforce role checks for system-critical operations.
 
 Security:
 - Session-based authorization for all endpoints
-- Admin role required for restore, delete, optimize
+- Admin role required for restore, delete, optimize, audit export
 - Rate limiting on backup creation (5 per hour)
 - Path traversal prevention on all file operations
 - Audit logging for all database operations
 - Background tasks for long-running operations (backup, restore, optimize)
 """
 
+import asyncio
 import os
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from backend.models.base import get_db
-from backend.routes.auth import get_current_user
+from backend.routes.auth import get_current_user, require_admin_user
 from backend.models.backup import (
     BackupSettingsUpdate,
     BackupSettingsResponse,
@@ -54,7 +57,15 @@ from backend.services.auth.service import AuthenticationService
 from backend.services.backup.backup_service import BackupService
 from backend.services.backup.backup_scheduler import BackupScheduler
 from backend.services.backup.backup_retention_policy import BackupRetentionPolicy
-from backend.services.audit_logger import AuditLogger
+from backend.services.audit_logger import AuditLogger, gzip_chunks
+from backend.services.database_maintenance import (
+    DatabaseMaintenanceService,
+    get_database_maintenance_service,
+)
+from backend.services.wal_checkpoint_manager import (
+    WalCheckpointManager,
+    get_wal_checkpoint_manager,
+)
 
 import logging
 
@@ -143,6 +154,30 @@ def get_table_metadata(db: Session) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Failed to get table metadata: {str(e)}")
 
 # ===== PYDANTIC MODELS =====
+class StorageObjectResponse(BaseModel):
+    """On-disk size of a single table or index (from dbstat)."""
+
+    name: str
+    type: str = Field(..., description="'table' or 'index'")
+    table: str = Field(..., description="Table the object belongs to")
+    pages: int
+    size_bytes: int
+    unused_bytes: int
+
+class WalStatusResponse(BaseModel):
+    """Write-ahead log size and checkpoint statistics."""
+
+    enabled: bool
+    is_running: bool
+    wal_size_bytes: int
+    last_checkpoint_mode: Optional[str] = None
+    last_checkpoint_at: Optional[float] = None
+    last_checkpoint_busy: Optional[bool] = None
+    wal_frames: int = 0
+    checkpoint_lag_frames: int = Field(0, description="WAL frames not yet copied into the database")
+    checkpoint_counts: Dict[str, int] = Field(default_factory=dict)
+    busy_count: int = 0
+
 class DatabaseStatsResponse(BaseModel):
     """Response model for database statistics."""
 
@@ -156,6 +191,13 @@ class DatabaseStatsResponse(BaseModel):
     backups_count: int = Field(..., description="Number of backups")
     backups_size_bytes: int = Field(..., description="Total size of all backups")
     backups_size_mb: float = Field(..., description="Total size of all backups in MB")
+    table_sizes_bytes: Optional[Dict[str, int]] = Field(
+        None, description="Map of table names to on-disk size including their indexes"
+    )
+    storage: Optional[List[StorageObjectResponse]] = Field(
+        None, description="Per-table and per-index storage, largest first (None if dbstat unavailable)"
+    )
+    wal: Optional[WalStatusResponse] = Field(None, description="WAL checkpoint status")
 
 class CreateBackupResponse(BaseModel):
     """Response model for backup creation."""
@@ -197,7 +239,7 @@ class RestoreBackupResponse(BaseModel):
     pre_restore_backup: str
 
 class OptimizeResponse(BaseModel):
-    """Response model for database optimization (VACUUM + ANALYZE)."""
+    """Response model for database optimization (PRAGMA optimize + incremental vacuum)."""
 
     success: bool
     message: str
@@ -206,6 +248,9 @@ class OptimizeResponse(BaseModel):
     space_reclaimed_bytes: int
     space_reclaimed_mb: float
     analyze_completed: bool
+    auto_vacuum: str = Field("none", description="SQLite auto_vacuum mode")
+    reclaimable_bytes: int = Field(0, description="Free pages awaiting incremental vacuum")
+    vacuum_scheduled: bool = Field(False, description="Incremental vacuum queued in background")
 
 class DeleteBackupResponse(BaseModel):
     """Response model for backup deletion."""
@@ -262,31 +307,13 @@ def get_audit_logger(db: Session = Depends(get_db)) -> AuditLogger:
     """Get audit logger instance."""
     return AuditLogger(db)
 
-async def require_admin_user(
-    user_id: int = Depends(get_current_user), db: Session = Depends(get_db)
-) -> int:
-    """
-    Verify the authenticated user has admin privileges.
-
-    Returns:
-        User ID if admin, raises HTTPException otherwise
-    """
-    # Query user role from database
-    user_query = text("SELECT role FROM users WHERE id = :user_id")
-    result = db.execute(user_query, {"user_id": user_id})
-    user = result.fetchone()
+def get_maintenance_service() -> DatabaseMaintenanceService:
+    """Get the process-wide database maintenance service."""
+    return get_database_maintenance_service()
 
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
-    # Check if user has admin role
-    if user[0] != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required for this operation",
-        )
-
-    return user_id
+def get_wal_manager() -> WalCheckpointManager:
+    """Get the process-wide WAL checkpoint manager."""
+    return get_wal_checkpoint_manager()
 
 # ===== BACKGROUND TASKS =====
 async def background_create_backup(
@@ -322,54 +349,40 @@ async def background_create_backup(
         )
 
 async def background_optimize_database(
-    db_path: str, audit_logger: AuditLogger, user_id: int, db: Session
+    maintenance: DatabaseMaintenanceService, audit_logger: AuditLogger, user_id: int
 ) -> None:
-    """Background task for optimizing database."""
+    """Background task reclaiming free pages with small incremental vacuum steps."""
     try:
-        # Get size before
-        size_before = os.path.getsize(db_path) if os.path.exists(db_path) else 0
-
-        # Run VACUUM
-        db.execute(text("VACUUM"))
-        db.commit()
-
-        # Run ANALYZE
-        db.execute(text("ANALYZE"))
-        db.commit()
-
-        # Get size after
-        size_after = os.path.getsize(db_path) if os.path.exists(db_path) else 0
-
-        space_reclaimed = size_before - size_after
+        pages_freed = await maintenance.run_incremental_vacuum(require_idle=False)
+        storage = maintenance.get_storage_info()
 
         audit_logger.log(
-            event_type="database.optimized",
+            event_type="database.incremental_vacuum",
             user_id=str(user_id),
             resource_type="database",
             resource_id="main",
             action="optimize",
             details={
-                "size_before_bytes": size_before,
-                "size_after_bytes": size_after,
-                "space_reclaimed_bytes": space_reclaimed,
-                "operations": ["VACUUM", "ANALYZE"],
+                "pages_freed": pages_freed,
+                "bytes_freed": pages_freed * storage.get("page_size", 0),
+                "operations": ["incremental_vacuum"],
             },
             success=True,
         )
 
-        logger.info(f"Background optimization completed: reclaimed {space_reclaimed} bytes")
+        logger.info(f"Background incremental vacuum completed: freed {pages_freed} pages")
 
     except Exception as exc:
-        logger.error(f"Background optimization failed: {str(e)}", exc_info=True)
+        logger.error(f"Background incremental vacuum failed: {str(exc)}", exc_info=True)
 
         audit_logger.log(
-            event_type="database.optimized",
+            event_type="database.incremental_vacuum",
             user_id=str(user_id),
             resource_type="database",
             resource_id="main",
             action="optimize",
             success=False,
-            error_message=str(e),
+            error_message=str(exc),
         )
 
 # ===== ROUTES =====
@@ -379,6 +392,8 @@ async def get_database_stats(
     db: Session = Depends(get_db),
     backup_service: BackupService = Depends(get_backup_service),
     audit_logger: AuditLogger = Depends(get_audit_logger),
+    maintenance: DatabaseMaintenanceService = Depends(get_maintenance_service),
+    wal_manager: WalCheckpointManager = Depends(get_wal_manager),
 ):
     """
     Get database statistics (table counts, size, backup info).
@@ -388,6 +403,8 @@ async def get_database_stats(
     - Number of tables
     - Total record count
     - Per-table row counts
+    - Per-table and per-index on-disk size (dbstat)
+    - WAL size and checkpoint lag
     - Backup count and total size
     """
     try:
@@ -397,6 +414,14 @@ async def get_database_stats(
         # Get table metadata
         metadata = get_table_metadata(db)
 
+        # dbstat walks every page, keep it off the event loop
+        storage = await asyncio.to_thread(maintenance.get_storage_report)
+        table_sizes = None
+        if storage is not None:
+            table_sizes = {}
+            for obj in storage:
+                table_sizes[obj["table"]] = table_sizes.get(obj["table"], 0) + obj["size_bytes"]
+
         # Get backup information
         backups = backup_service.list_backups()
         backups_size_bytes = backup_service.get_backups_dir_size()
@@ -423,13 +448,16 @@ async def get_database_stats(
             "backups_count": len(backups),
             "backups_size_bytes": backups_size_bytes,
             "backups_size_mb": backups_size_mb,
+            "table_sizes_bytes": table_sizes,
+            "storage": storage,
+            "wal": wal_manager.get_status(),
         }
 
     except HTTPException:
         raise
     except Exception as exc:
-        logger.error(f"Failed to get database stats: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to get database stats: {str(e)}")
+        logger.error(f"Failed to get database stats: {str(exc)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to get database stats: {str(exc)}")
 
 @router.post("/backup", response_model=CreateBackupResponse, status_code=status.HTTP_201_CREATED)
 async def create_backup(
@@ -664,21 +692,22 @@ async def restore_backup(
 async def optimize_database(
     background_tasks: BackgroundTasks,
     user_id: int = Depends(require_admin_user),
-    db: Session = Depends(get_db),
     backup_service: BackupService = Depends(get_backup_service),
     audit_logger: AuditLogger = Depends(get_audit_logger),
+    maintenance: DatabaseMaintenanceService = Depends(get_maintenance_service),
 ):
     """
-    Optimize database with VACUUM and ANALYZE (ADMIN ONLY).
-
-    The VACUUM command rebuilds the database file, repacking it into a minimal
-    amount of disk space. ANALYZE updates query planner statistics.
+    Optimize database without blocking writers (ADMIN ONLY).
 
     This operation:
-    - Defragments the database
-    - Reclaims unused space
-    - Optimizes page layout
-    - Updates query statistics
+    - Runs a bounded PRAGMA optimize (re-analyzes only stale statistics)
+    - Queues a background incremental vacuum that returns free pages to the
+      filesystem in small steps, each in its own short transaction
+
+    A full VACUUM is never run here because it rewrites the whole file and
+    blocks every writer. Databases still on auto_vacuum=NONE need the offline
+    migration (migrations/003_enable_incremental_auto_vacuum.py) before space
+    can be reclaimed.
 
     Requires admin privileges as this is a system-wide operation.
     Rate limited to 1 optimization per hour.
@@ -687,23 +716,33 @@ async def optimize_database(
         # Rate limiting: 1 optimization per hour
         check_rate_limit(user_id, "optimize", 1, 1)
 
-        # Get database size before VACUUM
         size_before = backup_service.get_database_size()
 
-        # Run VACUUM command
-        db.execute(text("VACUUM"))
-        db.commit()
+        # Cheap planner statistics refresh
+        await asyncio.to_thread(maintenance.optimize)
 
-        # Run ANALYZE command
-        db.execute(text("ANALYZE"))
-        db.commit()
+        storage = await asyncio.to_thread(maintenance.get_storage_info)
+        auto_vacuum = storage.get("auto_vacuum", "none")
+        reclaimable = storage.get("reclaimable_bytes", 0)
 
-        # Get database size after VACUUM
-        size_after = backup_service.get_database_size()
+        vacuum_scheduled = auto_vacuum == "incremental" and reclaimable > 0
+        if vacuum_scheduled:
+            background_tasks.add_task(
+                background_optimize_database, maintenance, audit_logger, user_id
+            )
 
-        # Calculate space reclaimed
+        if auto_vacuum == "incremental":
+            message = "Database statistics optimized"
+            if vacuum_scheduled:
+                message += "; incremental vacuum running in background"
+        else:
+            message = (
+                "Database statistics optimized; run migration 003 offline to "
+                "enable incremental space reclamation"
+            )
+
+        size_after = backup_service.get_database_size()
         space_reclaimed = size_before - size_after
-        space_reclaimed_mb = round(space_reclaimed / (1024 * 1024), 2)
 
         # Log audit event
         audit_logger.log(
@@ -715,24 +754,31 @@ async def optimize_database(
             details={
                 "size_before_bytes": size_before,
                 "size_after_bytes": size_after,
-                "space_reclaimed_bytes": space_reclaimed,
-                "operations": ["VACUUM", "ANALYZE"],
+                "reclaimable_bytes": reclaimable,
+                "auto_vacuum": auto_vacuum,
+                "operations": ["PRAGMA optimize"]
+                + (["incremental_vacuum"] if vacuum_scheduled else []),
             },
             success=True,
         )
 
         return {
             "success": True,
-            "message": "Database optimized successfully",
+            "message": message,
             "size_before_bytes": size_before,
             "size_after_bytes": size_after,
             "space_reclaimed_bytes": space_reclaimed,
-            "space_reclaimed_mb": space_reclaimed_mb,
+            "space_reclaimed_mb": round(space_reclaimed / (1024 * 1024), 2),
             "analyze_completed": True,
+            "auto_vacuum": auto_vacuum,
+            "reclaimable_bytes": reclaimable,
+            "vacuum_scheduled": vacuum_scheduled,
         }
 
+    except HTTPException:
+        raise
     except Exception as exc:
-        logger.error(f"Failed to optimize database: {str(e)}", exc_info=True)
+        logger.error(f"Failed to optimize database: {str(exc)}", exc_info=True)
 
         # Log failed optimization
         audit_logger.log(
@@ -742,10 +788,10 @@ async def optimize_database(
             resource_id="main",
             action="optimize",
             success=False,
-            error_message=str(e),
+            error_message=str(exc),
         )
 
-        raise HTTPException(status_code=500, detail=f"Failed to optimize database: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to optimize database: {str(exc)}")
 
 @router.delete("/backups/{backup_filename}", response_model=DeleteBackupResponse)
 async def delete_backup(
@@ -1059,3 +1105,75 @@ async def get_scheduler_stats(
     except Exception as exc:
         logger.error(f"Failed to get scheduler stats: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get scheduler stats: {str(e)}")
+
+_EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+@router.get("/audit-logs/export")
+async def export_audit_logs(
+    format: Literal["json", "ndjson", "csv"] = Query("ndjson"),
+    start_date: Optional[str] = Query(None, description="ISO timestamp lower bound"),
+    end_date: Optional[str] = Query(None, description="ISO timestamp upper bound"),
+    resource_type: Optional[str] = Query(None),
+    resource_id: Optional[str] = Query(None),
+    event_type: Optional[str] = Query(None),
+    gzip: bool = Query(False, description="Download as a .gz file"),
+    user_id: int = Depends(require_admin_user),
+    audit_logger: AuditLogger = Depends(get_audit_logger),
+):
+    """
+    Stream an audit log export (ADMIN ONLY).
+
+    Rows are read in keyset-ordered pages (most recent first) and encoded
+    page by page, so memory stays flat however large the date range is.
+    With gzip=true the stream is compressed incrementally and served as a
+    .gz attachment.
+
+    Requires admin privileges as audit logs cover every user.
+    """
+    # Recorded before streaming so the export itself is part of the trail
+    audit_logger.log(
+        event_type="database.audit_exported",
+        user_id=str(user_id),
+        resource_type="audit_logs",
+        resource_id="export",
+        action="export",
+        details={
+            "format": format,
+            "gzip": gzip,
+            "start_date": start_date,
+            "end_date": end_date,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "event_type": event_type,
+        },
+        success=True,
+    )
+
+    chunks = audit_logger.iter_export(
+        format=format,
+        start_date=start_date,
+        end_date=end_date,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        event_type=event_type,
+    )
+
+    filename = f"audit-logs-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.{format}"
+    if gzip:
+        body = gzip_chunks(chunks)
+        media_type = "application/gzip"
+        filename += ".gz"
+    else:
+        body = (chunk.encode("utf-8") for chunk in chunks)
+        media_type = _EXPORT_MEDIA_TYPES[format]
+
+    # Sync generator: Starlette iterates it in a worker thread, off the event loop
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
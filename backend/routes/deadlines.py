@@ -20,7 +20,7 @@ Routes:
 - POST /deadlines/{id}/reminders - Schedule/update reminder for deadline
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from typing import Optional, List
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -28,6 +28,7 @@ from sqlalchemy import and_
 
 from backend.models.base import get_db
 from backend.models.deadline import Deadline, DeadlinePriority, DeadlineStatus
+from backend.repositories.resource_version_repository import ResourceVersionRepository
 from backend.routes.auth import get_current_user
 from backend.services.deadline_reminder_scheduler import DeadlineReminderScheduler
 from backend.services.notification_service import (
@@ -44,6 +45,7 @@ from backend.dependencies import (
     get_audit_logger,
 )
 from backend.services.audit_logger import AuditLogger
+from backend.utils.etag import build_etag, etag_headers, etag_matches, not_modified
 
 # Import schemas from consolidated schema file
 from backend.schemas.deadline import (
@@ -269,6 +271,8 @@ async def create_deadline(
 
 @router.get("", response_model=dict)
 async def list_all_deadlines(
+    request: Request,
+    response: Response,
     case_id: Optional[int] = Query(None, description="Filter by case ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
@@ -282,7 +286,17 @@ async def list_all_deadlines(
 
     Supports pagination and filtering by case, status, and priority.
     Returns deadlines ordered by deadline_date (earliest first).
+
+    Supports conditional GET: the ETag combines the user's deadline version
+    counter with today's date (overdueCount changes at midnight), and a
+    matching If-None-Match returns 304 before any query runs.
     """
+    today = datetime.now().strftime("%Y-%m-%d")
+    stamp = ResourceVersionRepository(db).get_stamp(user_id, ("deadlines",))
+    etag = build_etag(request, user_id, stamp, today)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
         # Build base query - all user's deadlines
         query = (
@@ -319,7 +333,6 @@ async def list_all_deadlines(
         total_count = query.count()
 
         # Calculate overdue count
-        today = datetime.now().strftime("%Y-%m-%d")
         overdue_count = query.filter(
             and_(Deadline.deadline_date < today, Deadline.status != DeadlineStatus.COMPLETED)
         ).count()
@@ -327,6 +340,8 @@ async def list_all_deadlines(
         # Apply pagination and ordering
         deadlines = query.order_by(Deadline.deadline_date.asc()).limit(limit).offset(offset).all()
 
+        response.headers.update(etag_headers(etag))
+
         # Return paginated response
         return {
             "items": [d.to_dict() for d in deadlines],
@@ -0,0 +1,216 @@
+"""
+Diagnostics routes for Justice Companion (admin only).
+
+Routes:
+- GET /diagnostics/traces - List recently recorded request traces
+- GET /diagnostics/traces/{trace_id} - Download one trace (Chrome trace or OTLP/JSON)
+- PUT /diagnostics/tracing - Change the request sampling rate at runtime
+- POST /diagnostics/profile - Sample all thread stacks for N seconds (CPU profile)
+- POST /diagnostics/memory - tracemalloc snapshot diff over N seconds
+
+Traces contain span names, timings and non-personal attributes only; see
+backend.utils.tracing. Profiles contain code locations only; see
+backend.utils.profiler.
+
+Security:
+- Admin role required for every endpoint
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from backend.routes.auth import require_admin_user
+from backend.utils.json_response import json_dumps
+from backend.utils.profiler import (
+    MAX_DURATION_SECONDS,
+    MemorySession,
+    ProfilerBusyError,
+    SamplingProfiler,
+)
+from backend.utils.tracing import TraceRecorder, get_trace_recorder
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+# ===== PYDANTIC MODELS =====
+class TraceSummary(BaseModel):
+    """Summary of one recorded trace."""
+
+    trace_id: str
+    name: str
+    started_at: int = Field(..., description="Unix epoch milliseconds")
+    duration_ms: float
+    span_count: int
+    dropped_spans: int
+
+
+class TraceListResponse(BaseModel):
+    """Recently recorded traces, newest first."""
+
+    sample_rate: float
+    export_dir: Optional[str] = None
+    traces: List[TraceSummary]
+
+
+class TracingSettings(BaseModel):
+    """Request sampling configuration."""
+
+    sample_rate: float = Field(..., ge=0.0, le=1.0, description="Fraction of requests traced")
+
+
+class MemoryGrowthSite(BaseModel):
+    """One allocation site and how much it grew during the window."""
+
+    size_diff_bytes: int
+    size_bytes: int
+    count_diff: int
+    count: int
+    traceback: List[str]
+
+
+class MemoryGrowthResponse(BaseModel):
+    """tracemalloc snapshot diff."""
+
+    seconds: float
+    traced_memory_bytes: int
+    traced_peak_bytes: int
+    total_growth_bytes: int
+    top: List[MemoryGrowthSite]
+
+
+# ===== DEPENDENCIES =====
+def get_recorder() -> TraceRecorder:
+    """Get the process-wide trace recorder."""
+    return get_trace_recorder()
+
+
+# ===== ROUTES =====
+@router.get("/traces", response_model=TraceListResponse)
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500),
+    user_id: int = Depends(require_admin_user),
+    recorder: TraceRecorder = Depends(get_recorder),
+):
+    """List recently recorded request traces (ADMIN ONLY)."""
+    return TraceListResponse(
+        sample_rate=recorder.sample_rate,
+        export_dir=str(recorder.export_dir) if recorder.export_dir else None,
+        traces=recorder.recent(limit),
+    )
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(
+    trace_id: str,
+    format: Literal["chrome", "otlp"] = Query("chrome"),
+    user_id: int = Depends(require_admin_user),
+    recorder: TraceRecorder = Depends(get_recorder),
+):
+    """
+    Download one trace as a JSON file (ADMIN ONLY).
+
+    format=chrome loads in chrome://tracing or https://ui.perfetto.dev;
+    format=otlp is an OTLP/JSON export request for OpenTelemetry collectors.
+    Served as an attachment so the file is not wrapped in the API envelope.
+    """
+    trace = recorder.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trace not found")
+
+    payload = trace.to_otlp_json() if format == "otlp" else trace.to_chrome_trace()
+    # Correlation IDs can come from clients; keep the filename header-safe
+    safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", trace_id)
+    return Response(
+        content=json_dumps(payload),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="trace-{safe_id}-{format}.json"'},
+    )
+
+
+@router.put("/tracing", response_model=TracingSettings)
+async def update_tracing(
+    settings: TracingSettings,
+    user_id: int = Depends(require_admin_user),
+    recorder: TraceRecorder = Depends(get_recorder),
+):
+    """Change the fraction of requests traced (ADMIN ONLY). 0 disables tracing."""
+    recorder.set_sample_rate(settings.sample_rate)
+    return TracingSettings(sample_rate=recorder.sample_rate)
+
+
+@router.post("/profile")
+async def profile_cpu(
+    seconds: float = Query(10.0, gt=0, le=MAX_DURATION_SECONDS),
+    interval_ms: float = Query(10.0, ge=1.0, le=1000.0),
+    format: Literal["speedscope", "collapsed"] = Query("speedscope"),
+    include_idle: bool = Query(False, description="Keep samples of idle/waiting threads"),
+    user_id: int = Depends(require_admin_user),
+):
+    """
+    Profile the running process for a number of seconds (ADMIN ONLY).
+
+    A background thread samples every thread's Python stack; request
+    handling is never paused. format=speedscope downloads a file for
+    https://www.speedscope.app, format=collapsed returns folded stacks for
+    flamegraph tools. Only one profiling session runs at a time (409).
+    """
+    profiler = SamplingProfiler(interval=interval_ms / 1000, include_idle=include_idle)
+    try:
+        profiler.start()
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    logger.info(f"CPU profile started by user {user_id} ({seconds}s @ {interval_ms}ms)")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profile = await asyncio.to_thread(profiler.stop)
+
+    headers = {f"X-Profile-{key.replace('_', '-').title()}": str(value)
+               for key, value in profile.summary().items()}
+    if format == "collapsed":
+        return PlainTextResponse(profile.to_collapsed(), headers=headers)
+
+    headers["Content-Disposition"] = 'attachment; filename="profile.speedscope.json"'
+    return Response(
+        content=json_dumps(profile.to_speedscope()),
+        media_type="application/octet-stream",
+        headers=headers,
+    )
+
+
+@router.post("/memory", response_model=MemoryGrowthResponse)
+async def profile_memory(
+    seconds: float = Query(30.0, gt=0, le=MAX_DURATION_SECONDS),
+    top: int = Query(25, ge=1, le=200),
+    frames: int = Query(5, ge=1, le=25, description="Traceback depth per allocation"),
+    user_id: int = Depends(require_admin_user),
+):
+    """
+    Report memory growth over a number of seconds (ADMIN ONLY).
+
+    Takes tracemalloc snapshots at the start and end of the window and
+    returns the allocation sites that grew most. Allocations are slower
+    while tracing, so keep the window short on busy workers.
+    """
+    session = MemorySession(frames=frames)
+    try:
+        await asyncio.to_thread(session.start)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    logger.info(f"Memory profile started by user {user_id} ({seconds}s)")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        result: Dict[str, Any] = await asyncio.to_thread(session.stop, top)
+
+    return MemoryGrowthResponse(seconds=seconds, **result)
@@ -22,7 +22,7 @@ Services Integrated:
 - AuditLogger: Comprehensive audit trail for all operations
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status, Form, Request, Response
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -33,12 +33,14 @@ from pathlib import Path
 import logging
 
 from backend.models.base import get_db
+from backend.repositories.resource_version_repository import ResourceVersionRepository
 from backend.routes.auth import get_current_user
 from backend.services.document_parser_service import DocumentParserService
 from backend.services.citation_service import CitationService
 from backend.services.security.encryption import EncryptionService
 from backend.services.audit_logger import AuditLogger
 from backend.services.date_extraction_service import DateExtractionService
+from backend.utils.etag import build_etag, etag_headers, etag_matches, not_modified
 
 # Import schemas from consolidated schema file
 from backend.schemas.evidence import (
@@ -243,6 +245,8 @@ async def save_uploaded_file(file: UploadFile, case_id: int) -> str:
 
 @router.get("", response_model=List[EvidenceResponse])
 async def list_all_evidence(
+    request: Request,
+    response: Response,
     user_id: int = Depends(get_current_user),
     db: Session = Depends(get_db),
     case_id: Optional[int] = None,
@@ -255,10 +259,18 @@ async def list_all_evidence(
 
     Returns evidence ordered by creation date (newest first).
 
+    Supports conditional GET: a matching If-None-Match (ETag derived from the
+    user's evidence version counter) returns 304 without querying evidence.
+
     Example:
         GET /evidence
         GET /evidence?case_id=123
     """
+    stamp = ResourceVersionRepository(db).get_stamp(user_id, ("evidence",))
+    etag = build_etag(request, user_id, stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
         # Build query
         if case_id:
@@ -312,6 +324,7 @@ async def list_all_evidence(
             normalize_evidence_dict(evidence_dict)
             result.append(evidence_dict)
 
+        response.headers.update(etag_headers(etag))
         return result
 
     except HTTPException:
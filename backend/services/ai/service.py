@@ -60,6 +60,7 @@ from backend.utils.timeout_config import (
     get_timeout_for_operation,
 )
 from backend.utils.timeout_wrapper import run_with_timeout
+from backend.utils.tracing import trace_methods
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -70,6 +71,9 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
+@trace_methods(
+    exclude=("is_configured", "get_provider", "get_model", "get_provider_capabilities", "update_config")
+)
 class UnifiedAIService:
     """
     Multi-provider AI service with unified interface.
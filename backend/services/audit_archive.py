@@ -0,0 +1,470 @@
+"""
+Archive old audit log segments to compressed, hash-chained files.
+
+audit_logs otherwise grows forever in the primary database, inflating
+backups, VACUUM time and every ORDER BY ROWID lookup. AuditArchiveService
+moves checkpointed segments (see audit_checkpoints.py) whose newest entry is
+older than retention_days into gzip-compressed NDJSON files:
+
+    <archive_dir>/segment-00000001.ndjson.gz
+        {"segment": 1, "first_rowid": ..., "previous_file_sha256": null, ...}
+        {"rowid": 1, "entry": {...}}
+        ...
+
+Per segment, the job:
+1. verifies the rows against the signed checkpoint,
+2. writes the file (temp file, fsync, rename),
+3. in one transaction, records it in audit_archive_segments and deletes the
+   rows from audit_logs.
+
+Chain continuity:
+- Segments are archived oldest first and contiguously, so the first hot
+  entry's previous_log_hash is always the last archived segment's
+  last_hash (AuditLogger.verify_integrity starts from that anchor).
+- The newest checkpointed segment is never archived, so audit_logs always
+  keeps its highest ROWID (new ROWIDs never reuse archived ones) and
+  verify_since_checkpoint() keeps its anchor row.
+- Each file header embeds the previous file's SHA-256, and the index stores
+  every file's SHA-256, so replaced or reordered files are detected by
+  verify_archive().
+
+AuditLogger.query(include_archived=True) continues into the archive after
+the hot table, using the index's timestamp ranges to skip files.
+
+Configuration:
+- AUDIT_ARCHIVE_AFTER_DAYS: Archive segments older than this (unset: disabled)
+- AUDIT_ARCHIVE_DIR: Directory for segment files (default: ./data/audit_archive)
+
+Usage:
+    from backend.services.audit_archive import get_audit_archive_service
+
+    service = get_audit_archive_service()
+    if service is not None:
+        service.archive_segments()
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from backend.models.audit_archive import AuditArchiveSegment
+from backend.models.audit_checkpoint import AuditCheckpoint
+from backend.services.audit_checkpoints import AuditCheckpointService, get_audit_checkpoint_service
+from backend.services.audit_logger import AuditLogger
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = "./data/audit_archive"
+
+_DELETE_SEGMENT_SQL = text(
+    "DELETE FROM audit_logs WHERE ROWID >= :first_rowid AND ROWID <= :last_rowid"
+)
+
+
+def get_archive_dir() -> Path:
+    """Get the configured archive directory."""
+    return Path(os.getenv("AUDIT_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR))
+
+
+def segment_file_name(checkpoint_id: int) -> str:
+    """File name of an archived segment."""
+    return f"segment-{checkpoint_id:08d}.ndjson.gz"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 (hex) of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_segment_header(path: Path) -> Dict[str, Any]:
+    """Read the header line of a segment file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.loads(f.readline())
+
+
+def iter_segment_file(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream the entries of a segment file in chain order.
+
+    Yields:
+        (rowid, entry) tuples, as AuditLogger.iter_entries does
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        f.readline()  # header
+        for line in f:
+            record = json.loads(line)
+            yield record["rowid"], record["entry"]
+
+
+def iter_archived_logs(
+    db: Session,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    event_type: Optional[str] = None,
+    user_id: Optional[str] = None,
+    success: Optional[bool] = None,
+    archive_dir: Optional[Path] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream archived entries matching the filters, most recent first.
+
+    Segments whose timestamp range cannot match are skipped via the index;
+    only one segment is held in memory at a time.
+
+    Yields:
+        Audit log entries (same shape as AuditLogger.query results)
+    """
+    archive_dir = archive_dir or get_archive_dir()
+    segments = select(AuditArchiveSegment).order_by(AuditArchiveSegment.checkpoint_id.desc())
+    if start_date:
+        segments = segments.where(AuditArchiveSegment.last_timestamp >= start_date)
+    if end_date:
+        segments = segments.where(AuditArchiveSegment.first_timestamp <= end_date)
+
+    expected = {
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "event_type": event_type,
+        "user_id": user_id,
+    }
+    expected = {field: value for field, value in expected.items() if value}
+
+    for segment in db.scalars(segments).all():
+        entries = [entry for _, entry in iter_segment_file(archive_dir / segment.file_name)]
+        for entry in reversed(entries):
+            if start_date and entry["timestamp"] < start_date:
+                continue
+            if end_date and entry["timestamp"] > end_date:
+                continue
+            if success is not None and entry["success"] != success:
+                continue
+            if any(entry.get(field) != value for field, value in expected.items()):
+                continue
+            yield entry
+
+
+class AuditArchiveService:
+    """
+    Move old audit log segments from audit_logs into archive files.
+
+    Attributes:
+        archive_dir: Directory holding segment files
+        retention_days: Segments newer than this stay in audit_logs
+        interval_seconds: Seconds between background archival runs
+        is_running: Flag indicating if the background task is active
+    """
+
+    def __init__(
+        self,
+        checkpoints: AuditCheckpointService,
+        archive_dir: Optional[Path] = None,
+        retention_days: int = 90,
+        session_factory: Optional[Callable[[], Session]] = None,
+        interval_seconds: int = 86400,
+    ):
+        """
+        Initialize archive service.
+
+        Args:
+            checkpoints: AuditCheckpointService used to verify segments
+            archive_dir: Directory for segment files (default: AUDIT_ARCHIVE_DIR)
+            retention_days: Archive segments whose newest entry is older than this
+            session_factory: Callable returning a new database session
+                (defaults to backend.models.base.SessionLocal)
+            interval_seconds: Seconds between background runs (default: daily)
+        """
+        self.checkpoints = checkpoints
+        self.archive_dir = Path(archive_dir) if archive_dir else get_archive_dir()
+        self.retention_days = retention_days
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from backend.models.base import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    # ===== ARCHIVAL =====
+
+    def archive_segments(self, now: Optional[datetime] = None) -> List[AuditArchiveSegment]:
+        """
+        Archive every eligible checkpointed segment, oldest first.
+
+        Stops at the first segment that is too recent, fails verification,
+        or is the newest checkpoint.
+
+        Args:
+            now: Current time (injectable for tests)
+
+        Returns:
+            Segments archived by this run
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=self.retention_days)).isoformat()
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        db = self._new_session()
+        try:
+            archived: List[AuditArchiveSegment] = []
+            previous = db.scalars(
+                select(AuditArchiveSegment)
+                .order_by(AuditArchiveSegment.checkpoint_id.desc())
+                .limit(1)
+            ).first()
+            latest_id = db.scalar(select(func.max(AuditCheckpoint.id))) or 0
+            next_id = (previous.checkpoint_id if previous else 0) + 1
+
+            while next_id < latest_id:
+                checkpoint = db.get(AuditCheckpoint, next_id)
+                segment = self._archive_segment(db, checkpoint, previous, cutoff)
+                if segment is None:
+                    break
+                archived.append(segment)
+                previous = segment
+                next_id += 1
+
+            if archived:
+                logger.info(
+                    "Archived %d audit segments (%d entries) to %s",
+                    len(archived),
+                    sum(segment.entry_count for segment in archived),
+                    self.archive_dir,
+                )
+            return archived
+        finally:
+            db.close()
+
+    def _archive_segment(
+        self,
+        db: Session,
+        checkpoint: AuditCheckpoint,
+        previous: Optional[AuditArchiveSegment],
+        cutoff: str,
+    ) -> Optional[AuditArchiveSegment]:
+        """Write one segment's file, index it and delete its rows."""
+        entries = AuditLogger(db).iter_entries(
+            after_rowid=checkpoint.last_rowid - 1, until_rowid=checkpoint.last_rowid
+        )
+        newest = next((entry for _, entry in entries), None)
+        if newest is None or newest["timestamp"] >= cutoff:
+            return None
+
+        verification = self.checkpoints.verify_segment(checkpoint.id)
+        if not verification["valid"]:
+            logger.error(
+                "Not archiving audit segment %d: %s", checkpoint.id, verification.get("error")
+            )
+            return None
+
+        file_name = segment_file_name(checkpoint.id)
+        path = self.archive_dir / file_name
+        previous_sha = previous.file_sha256 if previous else None
+        first_timestamp = self._write_segment_file(db, checkpoint, previous_sha, path)
+
+        segment = AuditArchiveSegment(
+            checkpoint_id=checkpoint.id,
+            first_rowid=checkpoint.first_rowid,
+            last_rowid=checkpoint.last_rowid,
+            entry_count=checkpoint.entry_count,
+            first_timestamp=first_timestamp,
+            last_timestamp=newest["timestamp"],
+            last_hash=checkpoint.last_hash,
+            file_name=file_name,
+            file_sha256=file_sha256(path),
+            previous_file_sha256=previous_sha,
+            archived_at=datetime.now(timezone.utc),
+        )
+        try:
+            db.add(segment)
+            db.execute(
+                _DELETE_SEGMENT_SQL,
+                {"first_rowid": checkpoint.first_rowid, "last_rowid": checkpoint.last_rowid},
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return segment
+
+    def _write_segment_file(
+        self,
+        db: Session,
+        checkpoint: AuditCheckpoint,
+        previous_sha: Optional[str],
+        path: Path,
+    ) -> str:
+        """Stream a segment's rows to path atomically; return its first timestamp."""
+        header = {
+            "segment": checkpoint.id,
+            "first_rowid": checkpoint.first_rowid,
+            "last_rowid": checkpoint.last_rowid,
+            "entry_count": checkpoint.entry_count,
+            "anchor_hash": checkpoint.anchor_hash,
+            "last_hash": checkpoint.last_hash,
+            "merkle_root": checkpoint.merkle_root,
+            "previous_file_sha256": previous_sha,
+        }
+        first_timestamp = None
+        temp_path = path.with_name(path.name + ".tmp")
+
+        with open(temp_path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write((json.dumps(header) + "\n").encode("utf-8"))
+                entries = AuditLogger(db).iter_entries(
+                    after_rowid=checkpoint.first_rowid - 1, until_rowid=checkpoint.last_rowid
+                )
+                for rowid, entry in entries:
+                    first_timestamp = first_timestamp or entry["timestamp"]
+                    f.write((json.dumps({"rowid": rowid, "entry": entry}) + "\n").encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+        os.replace(temp_path, path)
+        return first_timestamp
+
+    # ===== VERIFICATION =====
+
+    def verify_archive(self) -> Dict[str, Any]:
+        """
+        Verify every archived segment file.
+
+        Checks each file's SHA-256 against the index, the file hash chain,
+        and the entries against the segment's signed checkpoint.
+
+        Returns:
+            Dictionary with "valid", "totalSegments", "checkedLogs" and, on
+            failure, "brokenAt" (checkpoint id) and "error"
+        """
+        db = self._new_session()
+        try:
+            total = checked = 0
+            previous_sha = None
+
+            for segment in db.scalars(
+                select(AuditArchiveSegment).order_by(AuditArchiveSegment.checkpoint_id)
+            ):
+                path = self.archive_dir / segment.file_name
+                error = None
+                if not path.exists():
+                    error = "Archive file missing"
+                elif file_sha256(path) != segment.file_sha256:
+                    error = "Archive file hash differs from index"
+                elif (
+                    segment.previous_file_sha256 != previous_sha
+                    or read_segment_header(path)["previous_file_sha256"] != previous_sha
+                ):
+                    error = "Archive file chain broken"
+                else:
+                    result = self.checkpoints.verify_entries(
+                        db.get(AuditCheckpoint, segment.checkpoint_id), iter_segment_file(path)
+                    )
+                    checked += result["checkedLogs"]
+                    error = result.get("error")
+
+                if error:
+                    return {
+                        "valid": False,
+                        "totalSegments": total,
+                        "checkedLogs": checked,
+                        "brokenAt": segment.checkpoint_id,
+                        "error": error,
+                    }
+
+                previous_sha = segment.file_sha256
+                total += 1
+
+            return {"valid": True, "totalSegments": total, "checkedLogs": checked}
+        finally:
+            db.close()
+
+    # ===== BACKGROUND TASK =====
+
+    def start(self) -> None:
+        """
+        Start daily archival in the background.
+
+        This method is non-blocking.
+        """
+        if self.is_running:
+            logger.warning("AuditArchiveService is already running")
+            return
+
+        self.is_running = True
+        logger.info(
+            "Starting AuditArchiveService (segments older than %d days -> %s)",
+            self.retention_days,
+            self.archive_dir,
+        )
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped AuditArchiveService")
+
+    async def _run_scheduler(self) -> None:
+        """Archive eligible segments every interval_seconds."""
+        while self.is_running:
+            try:
+                await asyncio.to_thread(self.archive_segments)
+                await asyncio.sleep(self.interval_seconds)
+            except asyncio.CancelledError:
+                logger.info("Audit archive task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error archiving audit segments: {str(error)}", exc_info=True)
+                await asyncio.sleep(self.interval_seconds)
+
+
+# ===== SINGLETON =====
+
+_audit_archive_service: Optional[AuditArchiveService] = None
+_audit_archive_service_loaded = False
+
+
+def get_audit_archive_service() -> Optional[AuditArchiveService]:
+    """
+    Get the process-wide archive service.
+
+    Returns:
+        AuditArchiveService, or None when AUDIT_ARCHIVE_AFTER_DAYS is unset or
+        checkpoints are disabled (archival only moves signed segments)
+    """
+    global _audit_archive_service, _audit_archive_service_loaded
+
+    if not _audit_archive_service_loaded:
+        days = os.getenv("AUDIT_ARCHIVE_AFTER_DAYS")
+        checkpoints = get_audit_checkpoint_service()
+        if days and checkpoints is not None:
+            _audit_archive_service = AuditArchiveService(checkpoints, retention_days=int(days))
+        _audit_archive_service_loaded = True
+
+    return _audit_archive_service
@@ -0,0 +1,621 @@
+"""
+Checkpointed, incremental verification of the audit log hash chain.
+
+AuditLogger.verify_integrity rehashes every entry ever written. This service
+records a signed AuditCheckpoint for every segment_size entries (and, from
+the background task, for whatever accumulated in the last hour). Each
+checkpoint is created only after its segment verified, and it stores the
+segment's chain anchor, tail hash, entry count and Merkle root.
+
+Verification modes:
+- verify_since_checkpoint(): check the newest checkpoint's signature and
+  anchor row, then rehash only the entries written after it
+- verify_segment(): re-verify one checkpointed segment (hashes, chain,
+  count and Merkle root)
+- verify_random_segments(): spot-check k random segments
+- verify_entries(): check a segment read from elsewhere (archive files)
+- verify_checkpoint_chain(): check every checkpoint's signature and link
+- AuditLogger.verify_integrity(): the full scan, kept for audits
+
+Every mode streams rows in ROWID pages and computes Merkle roots with a
+O(log n) stack, so memory is constant regardless of table size.
+
+Configuration:
+- AUDIT_CHECKPOINT_KEY: HMAC key for checkpoint signatures (default: derived
+  from ENCRYPTION_KEY_BASE64; checkpoints are disabled if neither is set)
+- AUDIT_CHECKPOINT_SEGMENT_SIZE: Entries per checkpoint (default: 1000)
+- AUDIT_CHECKPOINT_INTERVAL_SECONDS: Seconds between background runs
+  (default: 3600, 0 = no background task)
+
+Usage:
+    from backend.services.audit_checkpoints import get_audit_checkpoint_service
+
+    service = get_audit_checkpoint_service()
+    if service is not None:
+        service.create_checkpoints()
+        result = service.verify_since_checkpoint()
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import random
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session
+
+from backend.models.audit_archive import AuditArchiveSegment
+from backend.models.audit_checkpoint import AuditCheckpoint
+from backend.services.audit_logger import AuditLogger, calculate_integrity_hash
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_SIZE = int(os.getenv("AUDIT_CHECKPOINT_SEGMENT_SIZE", "1000"))
+DEFAULT_INTERVAL_SECONDS = 3600
+
+# RFC 6962 domain separation between leaves and interior nodes
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def merkle_leaf(integrity_hash: str) -> bytes:
+    """Hash one entry's integrity hash into a Merkle leaf."""
+    return hashlib.sha256(_LEAF_PREFIX + integrity_hash.encode("ascii")).digest()
+
+
+def merkle_node(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent."""
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+class MerkleAccumulator:
+    """
+    Streaming RFC 6962 Merkle tree hash.
+
+    Keeps one pending subtree root per power of two, so adding n leaves
+    needs O(log n) memory.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._stack: List[Tuple[int, bytes]] = []
+        self.count = 0
+
+    def add(self, integrity_hash: str) -> None:
+        """Append one entry."""
+        height, node = 0, merkle_leaf(integrity_hash)
+        while self._stack and self._stack[-1][0] == height:
+            _, left = self._stack.pop()
+            node = merkle_node(left, node)
+            height += 1
+        self._stack.append((height, node))
+        self.count += 1
+
+    def root(self) -> str:
+        """Merkle root (hex) of the leaves added so far."""
+        if not self._stack:
+            return hashlib.sha256(b"").hexdigest()
+        node = self._stack[-1][1]
+        for _, left in reversed(self._stack[:-1]):
+            node = merkle_node(left, node)
+        return node.hex()
+
+
+def get_checkpoint_key() -> Optional[bytes]:
+    """
+    Get the checkpoint signing key.
+
+    Returns:
+        AUDIT_CHECKPOINT_KEY, a key derived from ENCRYPTION_KEY_BASE64, or None
+    """
+    if key := os.getenv("AUDIT_CHECKPOINT_KEY"):
+        return key.encode("utf-8")
+
+    if encryption_key := os.getenv("ENCRYPTION_KEY_BASE64"):
+        try:
+            master = base64.b64decode(encryption_key)
+        except ValueError:
+            master = encryption_key.encode("utf-8")
+        # Derived, so the data encryption key itself never signs anything
+        return hmac.new(master, b"audit-checkpoint-v1", hashlib.sha256).digest()
+
+    return None
+
+
+def get_checkpoint_interval_seconds() -> int:
+    """
+    Get the background checkpoint interval.
+
+    Environment:
+        AUDIT_CHECKPOINT_INTERVAL_SECONDS: Seconds between runs (default: 3600,
+            0 = no background task; checkpoints can still be created on demand)
+    """
+    try:
+        return max(0, int(os.getenv("AUDIT_CHECKPOINT_INTERVAL_SECONDS", DEFAULT_INTERVAL_SECONDS)))
+    except ValueError:
+        return DEFAULT_INTERVAL_SECONDS
+
+
+class AuditCheckpointService:
+    """
+    Create signed audit checkpoints and verify the chain incrementally.
+
+    Attributes:
+        segment_size: Entries per full checkpoint
+        interval_seconds: Seconds between background checkpoint runs
+        is_running: Flag indicating if the background task is active
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        session_factory: Optional[Callable[[], Session]] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        interval_seconds: int = DEFAULT_INTERVAL_SECONDS,
+        page_size: int = 1000,
+    ):
+        """
+        Initialize checkpoint service.
+
+        Args:
+            key: HMAC signing key
+            session_factory: Callable returning a new database session
+                (defaults to backend.models.base.SessionLocal)
+            segment_size: Entries per full checkpoint
+            interval_seconds: Seconds between background runs (default: hourly)
+            page_size: Rows fetched per query while streaming
+        """
+        self._key = key
+        self._session_factory = session_factory
+        self.segment_size = max(1, segment_size)
+        self.interval_seconds = interval_seconds
+        self.page_size = page_size
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from backend.models.base import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    # ===== SIGNING =====
+
+    def sign(self, checkpoint: AuditCheckpoint) -> str:
+        """
+        Compute the HMAC signature of a checkpoint.
+
+        Args:
+            checkpoint: Checkpoint with every field except signature set
+
+        Returns:
+            Hex HMAC-SHA256 signature
+        """
+        payload = "|".join(
+            str(value)
+            for value in (
+                checkpoint.id,
+                checkpoint.first_rowid,
+                checkpoint.last_rowid,
+                checkpoint.entry_count,
+                checkpoint.anchor_hash or "",
+                checkpoint.last_hash,
+                checkpoint.merkle_root,
+                checkpoint.previous_signature or "",
+            )
+        )
+        return hmac.new(self._key, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def _signature_valid(self, checkpoint: AuditCheckpoint) -> bool:
+        return hmac.compare_digest(checkpoint.signature, self.sign(checkpoint))
+
+    # ===== CHECKPOINTING =====
+
+    def create_checkpoints(self, include_partial: bool = False) -> List[AuditCheckpoint]:
+        """
+        Verify and checkpoint every complete segment after the last checkpoint.
+
+        Args:
+            include_partial: Also checkpoint a trailing segment with fewer
+                than segment_size entries (used by the hourly task)
+
+        Returns:
+            Checkpoints created (none if the audit tables do not exist yet)
+        """
+        db = self._new_session()
+        try:
+            tables = inspect(db.get_bind())
+            if not (tables.has_table("audit_logs") and tables.has_table(AuditCheckpoint.__tablename__)):
+                return []
+
+            created: List[AuditCheckpoint] = []
+            previous = self._latest(db)
+
+            while True:
+                checkpoint = self._build_checkpoint(db, previous, include_partial)
+                if checkpoint is None:
+                    break
+                db.add(checkpoint)
+                db.commit()
+                created.append(checkpoint)
+                previous = checkpoint
+
+            # Return loaded, detached checkpoints (commits expired them)
+            for checkpoint in created:
+                db.refresh(checkpoint)
+            db.expunge_all()
+
+            if created:
+                logger.info(
+                    "Created %d audit checkpoints (through ROWID %d)",
+                    len(created),
+                    created[-1].last_rowid,
+                )
+            return created
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _build_checkpoint(
+        self, db: Session, previous: Optional[AuditCheckpoint], include_partial: bool
+    ) -> Optional[AuditCheckpoint]:
+        """Verify the next segment and build (not persist) its checkpoint."""
+        anchor = previous.last_hash if previous else None
+        after_rowid = previous.last_rowid if previous else 0
+        merkle = MerkleAccumulator()
+        first_rowid = last_rowid = None
+        last_hash = anchor
+
+        entries = AuditLogger(db).iter_entries(
+            after_rowid=after_rowid, page_size=self.page_size
+        )
+        for rowid, entry in entries:
+            error = self._check_entry(entry, last_hash)
+            if error:
+                logger.error(
+                    "Audit chain invalid at ROWID %d (%s); checkpointing stopped", rowid, error
+                )
+                return None
+            if first_rowid is None:
+                first_rowid = rowid
+            last_rowid, last_hash = rowid, entry["integrity_hash"]
+            merkle.add(last_hash)
+            if merkle.count == self.segment_size:
+                break
+
+        if merkle.count == 0 or (merkle.count < self.segment_size and not include_partial):
+            return None
+
+        checkpoint = AuditCheckpoint(
+            id=(previous.id + 1) if previous else 1,
+            first_rowid=first_rowid,
+            last_rowid=last_rowid,
+            entry_count=merkle.count,
+            anchor_hash=anchor,
+            last_hash=last_hash,
+            merkle_root=merkle.root(),
+            previous_signature=previous.signature if previous else None,
+            created_at=datetime.now(timezone.utc),
+        )
+        checkpoint.signature = self.sign(checkpoint)
+        return checkpoint
+
+    # ===== VERIFICATION =====
+
+    def verify_since_checkpoint(self) -> Dict[str, Any]:
+        """
+        Verify only the entries written after the newest checkpoint.
+
+        Returns:
+            Dictionary with validation status:
+            {
+                "valid": bool,
+                "checkpointId": int or None,
+                "checkedLogs": int,
+                "brokenAtRowid": int (optional),
+                "error": str (optional)
+            }
+        """
+        db = self._new_session()
+        try:
+            checkpoint = self._latest(db)
+            previous_hash = None
+            after_rowid = 0
+
+            if checkpoint is not None:
+                if not self._signature_valid(checkpoint):
+                    return self._failure(checkpoint, 0, None, "Checkpoint signature invalid")
+                anchor = self._anchor_hash(db, checkpoint.last_rowid)
+                if anchor != checkpoint.last_hash:
+                    return self._failure(
+                        checkpoint,
+                        0,
+                        checkpoint.last_rowid,
+                        "Checkpoint anchor mismatch - checkpointed entry altered or removed",
+                    )
+                previous_hash = checkpoint.last_hash
+                after_rowid = checkpoint.last_rowid
+
+            checked = 0
+            entries = AuditLogger(db).iter_entries(
+                after_rowid=after_rowid, page_size=self.page_size
+            )
+            for rowid, entry in entries:
+                error = self._check_entry(entry, previous_hash)
+                if error:
+                    return self._failure(checkpoint, checked, rowid, error)
+                previous_hash = entry["integrity_hash"]
+                checked += 1
+
+            return {
+                "valid": True,
+                "checkpointId": checkpoint.id if checkpoint else None,
+                "checkedLogs": checked,
+            }
+        except Exception as exc:
+            logger.error("Incremental audit verification failed: %s", exc, exc_info=True)
+            return {"valid": False, "checkpointId": None, "checkedLogs": 0, "error": str(exc)}
+        finally:
+            db.close()
+
+    def verify_segment(self, checkpoint_id: int) -> Dict[str, Any]:
+        """
+        Re-verify one checkpointed segment against its checkpoint.
+
+        Args:
+            checkpoint_id: Checkpoint sequence number
+
+        Returns:
+            Dictionary with validation status (same keys as verify_since_checkpoint)
+        """
+        db = self._new_session()
+        try:
+            checkpoint = db.get(AuditCheckpoint, checkpoint_id)
+            if checkpoint is None:
+                return self._failure(None, 0, None, f"Checkpoint {checkpoint_id} not found")
+            if db.get(AuditArchiveSegment, checkpoint_id) is not None:
+                return self._failure(
+                    checkpoint,
+                    0,
+                    None,
+                    "Segment is archived - verify it with AuditArchiveService.verify_archive()",
+                )
+            return self._verify_segment(db, checkpoint)
+        finally:
+            db.close()
+
+    def verify_random_segments(
+        self, count: int = 3, rng: Optional[random.Random] = None
+    ) -> Dict[str, Any]:
+        """
+        Spot-check randomly chosen checkpointed segments still in audit_logs.
+
+        Args:
+            count: Segments to verify
+            rng: Random source (injectable for tests)
+
+        Returns:
+            Dictionary with "valid", "segments" (ids checked), "checkedLogs",
+            and the first failure's details if any
+        """
+        rng = rng or random.SystemRandom()
+        db = self._new_session()
+        try:
+            total = db.scalar(select(func.max(AuditCheckpoint.id))) or 0
+            # Archived segments (always the oldest) are verified from their files
+            first_hot = (db.scalar(select(func.max(AuditArchiveSegment.checkpoint_id))) or 0) + 1
+            candidates = range(first_hot, total + 1)
+            segment_ids = sorted(rng.sample(candidates, min(count, len(candidates))))
+            checked = 0
+
+            for segment_id in segment_ids:
+                result = self._verify_segment(db, db.get(AuditCheckpoint, segment_id))
+                checked += result["checkedLogs"]
+                if not result["valid"]:
+                    result["segments"] = segment_ids
+                    return result
+
+            return {"valid": True, "segments": segment_ids, "checkedLogs": checked}
+        finally:
+            db.close()
+
+    def verify_checkpoint_chain(self) -> Dict[str, Any]:
+        """
+        Verify every checkpoint's signature and its link to the previous one.
+
+        Returns:
+            Dictionary with "valid", "totalCheckpoints" and, on failure,
+            "brokenAt" (checkpoint id) and "error"
+        """
+        db = self._new_session()
+        try:
+            previous: Optional[AuditCheckpoint] = None
+            total = 0
+
+            for checkpoint in db.scalars(
+                select(AuditCheckpoint).order_by(AuditCheckpoint.id).execution_options(
+                    yield_per=self.page_size
+                )
+            ):
+                expected_id = previous.id + 1 if previous else 1
+                linked = (
+                    checkpoint.id == expected_id
+                    and checkpoint.previous_signature == (previous.signature if previous else None)
+                    and checkpoint.anchor_hash == (previous.last_hash if previous else None)
+                    and checkpoint.first_rowid > (previous.last_rowid if previous else 0)
+                )
+                if not self._signature_valid(checkpoint) or not linked:
+                    return {
+                        "valid": False,
+                        "totalCheckpoints": total,
+                        "brokenAt": checkpoint.id,
+                        "error": "Checkpoint signature or link invalid",
+                    }
+                previous = checkpoint
+                total += 1
+
+            return {"valid": True, "totalCheckpoints": total}
+        finally:
+            db.close()
+
+    def verify_entries(
+        self, checkpoint: AuditCheckpoint, entries: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Verify a segment's entries, from any source, against its checkpoint.
+
+        Args:
+            checkpoint: Checkpoint of the segment
+            entries: (rowid, entry) tuples in chain order
+
+        Returns:
+            Dictionary with validation status (same keys as verify_since_checkpoint)
+        """
+        if not self._signature_valid(checkpoint):
+            return self._failure(checkpoint, 0, None, "Checkpoint signature invalid")
+
+        merkle = MerkleAccumulator()
+        previous_hash = checkpoint.anchor_hash
+        for rowid, entry in entries:
+            error = self._check_entry(entry, previous_hash)
+            if error:
+                return self._failure(checkpoint, merkle.count, rowid, error)
+            previous_hash = entry["integrity_hash"]
+            merkle.add(previous_hash)
+
+        if merkle.count != checkpoint.entry_count:
+            return self._failure(
+                checkpoint, merkle.count, None, "Segment entry count differs from checkpoint"
+            )
+        if previous_hash != checkpoint.last_hash or merkle.root() != checkpoint.merkle_root:
+            return self._failure(
+                checkpoint, merkle.count, None, "Segment Merkle root differs from checkpoint"
+            )
+
+        return {"valid": True, "checkpointId": checkpoint.id, "checkedLogs": merkle.count}
+
+    def _verify_segment(self, db: Session, checkpoint: AuditCheckpoint) -> Dict[str, Any]:
+        entries = AuditLogger(db).iter_entries(
+            after_rowid=checkpoint.first_rowid - 1,
+            until_rowid=checkpoint.last_rowid,
+            page_size=self.page_size,
+        )
+        return self.verify_entries(checkpoint, entries)
+
+    @staticmethod
+    def _check_entry(entry: Dict[str, Any], previous_hash: Optional[str]) -> Optional[str]:
+        """Return an error message if an entry's hash or chain link is wrong."""
+        if entry["integrity_hash"] != calculate_integrity_hash(entry):
+            return "Integrity hash mismatch - log entry may have been tampered with"
+        if entry["previous_log_hash"] != previous_hash:
+            return "Chain broken - previousLogHash does not match previous entry"
+        return None
+
+    @staticmethod
+    def _failure(
+        checkpoint: Optional[AuditCheckpoint], checked: int, rowid: Optional[int], error: str
+    ) -> Dict[str, Any]:
+        result = {
+            "valid": False,
+            "checkpointId": checkpoint.id if checkpoint else None,
+            "checkedLogs": checked,
+            "error": error,
+        }
+        if rowid is not None:
+            result["brokenAtRowid"] = rowid
+        return result
+
+    @staticmethod
+    def _latest(db: Session) -> Optional[AuditCheckpoint]:
+        return db.scalars(
+            select(AuditCheckpoint).order_by(AuditCheckpoint.id.desc()).limit(1)
+        ).first()
+
+    @staticmethod
+    def _anchor_hash(db: Session, rowid: int) -> Optional[str]:
+        for _, entry in AuditLogger(db).iter_entries(
+            after_rowid=rowid - 1, until_rowid=rowid, page_size=1
+        ):
+            return entry["integrity_hash"]
+        return None
+
+    # ===== BACKGROUND TASK =====
+
+    def start(self) -> None:
+        """
+        Start hourly checkpointing in the background.
+
+        This method is non-blocking.
+        """
+        if self.is_running:
+            logger.warning("AuditCheckpointService is already running")
+            return
+
+        self.is_running = True
+        logger.info(
+            "Starting AuditCheckpointService (every %ds, segment size %d)",
+            self.interval_seconds,
+            self.segment_size,
+        )
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped AuditCheckpointService")
+
+    async def _run_scheduler(self) -> None:
+        """Checkpoint everything written so far, every interval_seconds."""
+        while self.is_running:
+            try:
+                # First run after one interval, not during application startup
+                await asyncio.sleep(self.interval_seconds)
+                await asyncio.to_thread(self.create_checkpoints, True)
+            except asyncio.CancelledError:
+                logger.info("Audit checkpoint task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error creating audit checkpoints: {str(error)}", exc_info=True)
+
+
+# ===== SINGLETON =====
+
+_audit_checkpoint_service: Optional[AuditCheckpointService] = None
+_audit_checkpoint_service_loaded = False
+
+
+def get_audit_checkpoint_service() -> Optional[AuditCheckpointService]:
+    """
+    Get the process-wide checkpoint service.
+
+    Returns:
+        AuditCheckpointService, or None when no signing key is configured
+    """
+    global _audit_checkpoint_service, _audit_checkpoint_service_loaded
+
+    if not _audit_checkpoint_service_loaded:
+        key = get_checkpoint_key()
+        _audit_checkpoint_service = (
+            AuditCheckpointService(key, interval_seconds=get_checkpoint_interval_seconds())
+            if key
+            else None
+        )
+        _audit_checkpoint_service_loaded = True
+
+    return _audit_checkpoint_service
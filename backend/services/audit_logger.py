@@ -6,10 +6,12 @@ Migrated from: src/services/AuditLogger.ts
 Features:
 - Cryptographic hash chaining (blockchain-style)
 - Tamper-evident logging
-- INSERT-ONLY (no updates/deletes)
+- INSERT-ONLY (no updates; old segments are only deleted after archival)
 - Never throws exceptions (audit failures shouldn't break app)
 - SHA-256 integrity hashing
 - Async-compatible with SQLAlchemy
+- Optional batched writes through AuditWriter (see audit_writer.py)
+- Streaming JSON/NDJSON/CSV exports in constant memory (iter_export)
 
 Usage:
     from backend.services.audit_logger import log_audit_event
@@ -29,8 +31,10 @@ Usage:
 import json
 import hashlib
 import logging
+import zlib
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from itertools import chain, islice
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from uuid import uuid4
 
 from sqlalchemy import text
@@ -39,6 +43,147 @@ from sqlalchemy.orm import Session
 # Configure logger
 logger = logging.getLogger(__name__)
 
+_INSERT_AUDIT_LOG_SQL = text(
+    """
+    INSERT INTO audit_logs (
+        id, timestamp, event_type, user_id, resource_type, resource_id,
+        action, details, ip_address, user_agent, success, error_message,
+        integrity_hash, previous_log_hash, created_at
+    ) VALUES (
+        :id, :timestamp, :event_type, :user_id, :resource_type, :resource_id,
+        :action, :details, :ip_address, :user_agent, :success, :error_message,
+        :integrity_hash, :previous_log_hash, :created_at
+    )
+"""
+)
+
+_LAST_LOG_HASH_SQL = text(
+    """
+    SELECT integrity_hash
+    FROM audit_logs
+    ORDER BY ROWID DESC
+    LIMIT 1
+"""
+)
+
+EXPORT_FORMATS = ("json", "ndjson", "csv")
+
+CSV_HEADERS = (
+    "id",
+    "timestamp",
+    "event_type",
+    "user_id",
+    "resource_type",
+    "resource_id",
+    "action",
+    "details",
+    "ip_address",
+    "user_agent",
+    "success",
+    "error_message",
+    "integrity_hash",
+    "previous_log_hash",
+    "created_at",
+)
+
+# Batched writer installed by AuditWriter.start(); None means synchronous writes
+_audit_writer = None
+
+def set_audit_writer(writer) -> None:
+    """
+    Route AuditLogger.log through a batched writer (None restores sync writes).
+
+    Args:
+        writer: Object with submit(db, entry, durable) or None
+    """
+    global _audit_writer
+    _audit_writer = writer
+
+def calculate_integrity_hash(entry: Dict[str, Any]) -> str:
+    """
+    Calculate cryptographic integrity hash for an audit log entry.
+
+    Hash includes: id, timestamp, event_type, user_id, resource_type,
+    resource_id, action, details, success, previous_log_hash
+
+    Args:
+        entry: Audit log entry dictionary
+
+    Returns:
+        SHA-256 hash (hex string)
+    """
+    data = {
+        "id": entry["id"],
+        "timestamp": entry["timestamp"],
+        "event_type": entry["event_type"],
+        "user_id": entry.get("user_id"),
+        "resource_type": entry["resource_type"],
+        "resource_id": entry["resource_id"],
+        "action": entry["action"],
+        "details": entry.get("details"),
+        "success": entry["success"],
+        "previous_log_hash": entry.get("previous_log_hash"),
+    }
+
+    # Deterministic JSON string (same input = same hash)
+    json_string = json.dumps(data, sort_keys=True)
+    return hashlib.sha256(json_string.encode()).hexdigest()
+
+def audit_log_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an audit log entry to INSERT parameters.
+
+    Args:
+        entry: Audit log entry dictionary
+
+    Returns:
+        Bind parameters for the audit_logs INSERT
+    """
+    return {
+        "id": entry["id"],
+        "timestamp": entry["timestamp"],
+        "event_type": entry["event_type"],
+        "user_id": entry.get("user_id"),
+        "resource_type": entry["resource_type"],
+        "resource_id": entry["resource_id"],
+        "action": entry["action"],
+        "details": json.dumps(entry["details"]) if entry.get("details") else None,
+        "ip_address": entry.get("ip_address"),
+        "user_agent": entry.get("user_agent"),
+        "success": 1 if entry["success"] else 0,
+        "error_message": entry.get("error_message"),
+        "integrity_hash": entry["integrity_hash"],
+        "previous_log_hash": entry.get("previous_log_hash"),
+        "created_at": entry["created_at"],
+    }
+
+def insert_audit_logs(db: Session, entries: List[Dict[str, Any]]) -> None:
+    """
+    Insert hashed audit log entries in one statement batch (no commit).
+
+    Args:
+        db: SQLAlchemy database session
+        entries: Entries in chain order
+    """
+    db.execute(_INSERT_AUDIT_LOG_SQL, [audit_log_row(entry) for entry in entries])
+
+def get_last_log_hash(db: Session) -> Optional[str]:
+    """
+    Get the integrity hash of the most recent audit log entry.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        Hash of last log, or None if no logs exist or table doesn't exist
+    """
+    try:
+        row = db.execute(_LAST_LOG_HASH_SQL).fetchone()
+        return row[0] if row else None
+    except Exception:
+        # Table doesn't exist yet, return None (genesis block)
+        return None
+
 class AuditLogger:
     """
     AuditLogger - Blockchain-style immutable audit trail.
@@ -69,6 +214,7 @@ class AuditLogger:
         user_agent: Optional[str] = None,
         success: bool = True,
         error_message: Optional[str] = None,
+        durable: Optional[bool] = None,
     ) -> None:
         """
         Log an audit event (immutable, blockchain-style).
@@ -76,6 +222,10 @@ class AuditLogger:
         NOTE: This method NEVER throws. Audit logging failures are logged
         to console but don't break application flow.
 
+        While an AuditWriter is running the entry is hashed and queued, and
+        written by a later grouped transaction; durable entries (security
+        events by default) are written and committed before returning.
+
         Args:
             event_type: Type of event (e.g., "case.created", "user.login")
             user_id: User who performed the action (optional)
@@ -87,11 +237,9 @@ class AuditLogger:
             user_agent: Client user agent (optional)
             success: Whether the operation succeeded (default: True)
             error_message: Error message if operation failed (optional)
+            durable: Commit before returning when batched (default: by event type)
         """
         try:
-            # Get previous hash for chaining
-            previous_hash = self._get_last_log_hash()
-
             # Generate unique ID and timestamp
             log_id = str(uuid4())
             timestamp = datetime.now(timezone.utc).isoformat()
@@ -111,11 +259,20 @@ class AuditLogger:
                 "user_agent": user_agent,
                 "success": success,
                 "error_message": error_message,
-                "previous_log_hash": previous_hash,
+                "previous_log_hash": None,
                 "integrity_hash": "",  # Calculate next
                 "created_at": created_at,
             }
 
+            # Batched writer chains from its in-memory head
+            writer = _audit_writer
+            if writer is not None:
+                writer.submit(self.db, entry, durable)
+                return
+
+            # Get previous hash for chaining
+            entry["previous_log_hash"] = self._get_last_log_hash()
+
             # Calculate integrity hash
             entry["integrity_hash"] = self._calculate_integrity_hash(entry)
 
@@ -137,6 +294,7 @@ class AuditLogger:
         success: Optional[bool] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        include_archived: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Query audit logs with optional filters.
@@ -151,41 +309,34 @@ class AuditLogger:
             success: Filter by success status
             limit: Maximum number of results
             offset: Number of results to skip
+            include_archived: Continue into archived segment files (see
+                audit_archive.py) after the entries still in audit_logs
 
         Returns:
             List of audit log entries as dictionaries
         """
-        conditions: List[str] = []
-        params: Dict[str, Any] = {}
-
-        # Build WHERE clauses
-        if start_date:
-            conditions.append("timestamp >= :start_date")
-            params["start_date"] = start_date
-
-        if end_date:
-            conditions.append("timestamp <= :end_date")
-            params["end_date"] = end_date
-
-        if resource_type:
-            conditions.append("resource_type = :resource_type")
-            params["resource_type"] = resource_type
-
-        if resource_id:
-            conditions.append("resource_id = :resource_id")
-            params["resource_id"] = resource_id
-
-        if event_type:
-            conditions.append("event_type = :event_type")
-            params["event_type"] = event_type
-
-        if user_id:
-            conditions.append("user_id = :user_id")
-            params["user_id"] = user_id
+        if include_archived:
+            return self._query_with_archive(
+                start_date=start_date,
+                end_date=end_date,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                event_type=event_type,
+                user_id=user_id,
+                success=success,
+                limit=limit,
+                offset=offset,
+            )
 
-        if success is not None:
-            conditions.append("success = :success")
-            params["success"] = 1 if success else 0
+        conditions, params = self._filter_conditions(
+            start_date=start_date,
+            end_date=end_date,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            event_type=event_type,
+            user_id=user_id,
+            success=success,
+        )
 
         # Build SQL query
         sql = "SELECT * FROM audit_logs"
@@ -210,10 +361,72 @@ class AuditLogger:
         # Convert to list of dictionaries
         return [self._map_row_to_entry(dict(row._mapping)) for row in rows]
 
+    def _query_with_archive(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Query the hot table, then archived segments, newest first."""
+        # pylint: disable=import-outside-toplevel
+        from backend.services.audit_archive import iter_archived_logs
+
+        page_size = min(limit + (offset or 0), 1000) if limit else 1000
+        hot = (entry for page in self.iter_logs(page_size=page_size, **filters) for entry in page)
+        archived = iter_archived_logs(self.db, **filters)
+
+        start = offset or 0
+        stop = start + limit if limit else None
+        return list(islice(chain(hot, archived), start, stop))
+
+    def iter_entries(
+        self,
+        after_rowid: int = 0,
+        until_rowid: Optional[int] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Stream audit log entries in chain order, one page at a time.
+
+        Pages are fetched by ROWID keyset, so memory stays constant however
+        large the table grows.
+
+        Args:
+            after_rowid: Start after this ROWID (0 = from the first entry)
+            until_rowid: Stop after this ROWID (inclusive; None = to the end)
+            page_size: Rows fetched per query
+
+        Yields:
+            (rowid, entry) tuples
+        """
+        sql = "SELECT ROWID AS log_rowid, * FROM audit_logs WHERE ROWID > :after"
+        if until_rowid is not None:
+            sql += " AND ROWID <= :until"
+        sql += " ORDER BY ROWID ASC LIMIT :page_size"
+        query = text(sql)
+
+        while True:
+            rows = self.db.execute(
+                query,
+                {"after": after_rowid, "until": until_rowid, "page_size": page_size},
+            ).fetchall()
+            for row in rows:
+                mapping = dict(row._mapping)
+                yield mapping["log_rowid"], self._map_row_to_entry(mapping)
+            if len(rows) < page_size:
+                return
+            after_rowid = rows[-1]._mapping["log_rowid"]
+
     def verify_integrity(self) -> Dict[str, Any]:
         """
         Verify integrity of entire audit log chain.
 
+        Full scan for audits: every entry is rehashed, streamed in pages so
+        memory stays constant. Routine checks should use
+        AuditCheckpointService.verify_since_checkpoint() instead. Archived
+        segments are checked by AuditArchiveService.verify_archive(); the
+        scan starts from the last archived hash.
+
         Returns:
             Dictionary with validation status:
             {
@@ -225,25 +438,20 @@ class AuditLogger:
             }
         """
         try:
-            # Fetch all logs in chain order (insertion order via ROWID)
-            sql = "SELECT * FROM audit_logs ORDER BY ROWID ASC"
-            result = self.db.execute(text(sql))
-            rows = result.fetchall()
-
-            if not rows:
-                return {"valid": True, "totalLogs": 0}
+            # Entries before the hot table were moved to archive files
+            previous_hash = self._archive_anchor()
+            total = 0
 
-            entries = [self._map_row_to_entry(dict(row._mapping)) for row in rows]
-            previous_hash = None
+            # Verify each log entry in chain order (insertion order via ROWID)
+            for i, (_, entry) in enumerate(self.iter_entries()):
+                total = i + 1
 
-            # Verify each log entry
-            for i, entry in enumerate(entries):
                 # Verify integrity hash matches calculated hash
                 calculated_hash = self._calculate_integrity_hash(entry)
                 if entry["integrity_hash"] != calculated_hash:
                     return {
                         "valid": False,
-                        "totalLogs": len(entries),
+                        "totalLogs": self._count_logs(),
                         "brokenAt": i,
                         "brokenLog": entry,
                         "error": "Integrity hash mismatch - log entry may have been tampered with",
@@ -253,7 +461,7 @@ class AuditLogger:
                 if entry["previous_log_hash"] != previous_hash:
                     return {
                         "valid": False,
-                        "totalLogs": len(entries),
+                        "totalLogs": self._count_logs(),
                         "brokenAt": i,
                         "brokenLog": entry,
                         "error": "Chain broken - previousLogHash does not match previous entry",
@@ -261,12 +469,135 @@ class AuditLogger:
 
                 previous_hash = entry["integrity_hash"]
 
-            return {"valid": True, "totalLogs": len(entries)}
+            return {"valid": True, "totalLogs": total}
 
         except Exception as exc:
             logger.error("Audit integrity verification failed: %s", exc, exc_info=True)
             return {"valid": False, "totalLogs": 0, "error": str(exc)}
 
+    def _archive_anchor(self) -> Optional[str]:
+        """Chain hash the first entry in audit_logs follows (None if nothing is archived)."""
+        archive_indexed = self.db.execute(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'audit_archive_segments'"
+            )
+        ).scalar()
+        if not archive_indexed:
+            return None
+        return self.db.execute(
+            text("SELECT last_hash FROM audit_archive_segments ORDER BY checkpoint_id DESC LIMIT 1")
+        ).scalar()
+
+    def _count_logs(self) -> int:
+        """Count all audit log entries."""
+        return self.db.execute(text("SELECT COUNT(*) FROM audit_logs")).scalar() or 0
+
+    def iter_logs(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        user_id: Optional[str] = None,
+        success: Optional[bool] = None,
+        page_size: int = 1000,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream filtered audit logs, most recent first, one page at a time.
+
+        Same filters and order as query(), but pages are fetched by ROWID
+        keyset instead of fetchall(), so memory stays constant.
+
+        Yields:
+            Non-empty lists of at most page_size audit log entries
+        """
+        conditions, params = self._filter_conditions(
+            start_date=start_date,
+            end_date=end_date,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            event_type=event_type,
+            user_id=user_id,
+            success=success,
+        )
+        params["page_size"] = page_size
+
+        first_page = text(self._page_sql(conditions))
+        next_page = text(self._page_sql(conditions + ["ROWID < :before"]))
+        query = first_page
+
+        while True:
+            rows = self.db.execute(query, params).fetchall()
+            if rows:
+                yield [self._map_row_to_entry(dict(row._mapping)) for row in rows]
+            if len(rows) < page_size:
+                return
+            params["before"] = rows[-1]._mapping["log_rowid"]
+            query = next_page
+
+    def iter_export(
+        self,
+        format: str = "json",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        user_id: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[str]:
+        """
+        Encode an audit log export incrementally.
+
+        Args:
+            format: Export format ("json", "ndjson" or "csv")
+            start_date: Filter logs after this date (optional)
+            end_date: Filter logs before this date (optional)
+            resource_type: Filter by resource type (optional)
+            resource_id: Filter by resource ID (optional)
+            event_type: Filter by event type (optional)
+            user_id: Filter by user ID (optional)
+            page_size: Rows fetched (and encoded) per chunk
+
+        Yields:
+            Text chunks, one per page; joined they equal export_logs()
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        pages = self.iter_logs(
+            start_date=start_date,
+            end_date=end_date,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            event_type=event_type,
+            user_id=user_id,
+            page_size=page_size,
+        )
+
+        if format == "ndjson":
+            for logs in pages:
+                yield "".join(json.dumps(log) + "\n" for log in logs)
+            return
+
+        first = True
+        for logs in pages:
+            if format == "json":
+                # Same layout as json.dumps(logs, indent=2) over the whole list
+                items = ",\n".join(
+                    "  " + json.dumps(log, indent=2).replace("\n", "\n  ") for log in logs
+                )
+                yield ("[\n" if first else ",\n") + items
+            else:
+                rows = "\n".join(self._csv_row(log) for log in logs)
+                yield (",".join(CSV_HEADERS) + "\n" if first else "\n") + rows
+            first = False
+
+        if format == "json":
+            yield "[]" if first else "\n]"
+
     def export_logs(
         self,
         format: str = "json",
@@ -278,6 +609,8 @@ class AuditLogger:
         """
         Export audit logs in JSON or CSV format.
 
+        Builds the whole export in memory; use iter_export() for large ranges.
+
         Args:
             format: Export format ("json" or "csv")
             start_date: Filter logs after this date (optional)
@@ -288,94 +621,100 @@ class AuditLogger:
         Returns:
             Formatted string (JSON or CSV)
         """
-        logs = self.query(
-            start_date=start_date,
-            end_date=end_date,
-            resource_type=resource_type,
-            resource_id=resource_id,
+        return "".join(
+            self.iter_export(
+                format=format if format == "json" else "csv",
+                start_date=start_date,
+                end_date=end_date,
+                resource_type=resource_type,
+                resource_id=resource_id,
+            )
         )
 
-        if format == "json":
-            return json.dumps(logs, indent=2)
-
-        # CSV format
-        if not logs:
-            return ""
-
-        # CSV headers
-        headers = [
-            "id",
-            "timestamp",
-            "event_type",
-            "user_id",
-            "resource_type",
-            "resource_id",
-            "action",
-            "details",
-            "ip_address",
-            "user_agent",
-            "success",
-            "error_message",
-            "integrity_hash",
-            "previous_log_hash",
-            "created_at",
-        ]
+    def _filter_conditions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        user_id: Optional[str] = None,
+        success: Optional[bool] = None,
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Build WHERE conditions and bind parameters for the query filters."""
+        conditions: List[str] = []
+        params: Dict[str, Any] = {}
+
+        # Build WHERE clauses
+        if start_date:
+            conditions.append("timestamp >= :start_date")
+            params["start_date"] = start_date
+
+        if end_date:
+            conditions.append("timestamp <= :end_date")
+            params["end_date"] = end_date
+
+        if resource_type:
+            conditions.append("resource_type = :resource_type")
+            params["resource_type"] = resource_type
+
+        if resource_id:
+            conditions.append("resource_id = :resource_id")
+            params["resource_id"] = resource_id
+
+        if event_type:
+            conditions.append("event_type = :event_type")
+            params["event_type"] = event_type
+
+        if user_id:
+            conditions.append("user_id = :user_id")
+            params["user_id"] = user_id
 
-        # Build CSV rows
-        rows = []
-        for log in logs:
-            row = [
-                log.get("id", ""),
-                log.get("timestamp", ""),
-                log.get("event_type", ""),
-                log.get("user_id", ""),
-                log.get("resource_type", ""),
-                log.get("resource_id", ""),
-                log.get("action", ""),
-                json.dumps(log.get("details")) if log.get("details") else "",
-                log.get("ip_address", ""),
-                log.get("user_agent", ""),
-                str(log.get("success", "")),
-                log.get("error_message", ""),
-                log.get("integrity_hash", ""),
-                log.get("previous_log_hash", ""),
-                log.get("created_at", ""),
-            ]
-            rows.append(",".join([self._escape_csv_field(str(field)) for field in row]))
-
-        # Combine headers and rows
-        csv_lines = [",".join(headers)] + rows
-        return "\n".join(csv_lines)
+        if success is not None:
+            conditions.append("success = :success")
+            params["success"] = 1 if success else 0
+
+        return conditions, params
+
+    @staticmethod
+    def _page_sql(conditions: List[str]) -> str:
+        sql = "SELECT ROWID AS log_rowid, * FROM audit_logs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return sql + " ORDER BY ROWID DESC LIMIT :page_size"
+
+    def _csv_row(self, log: Dict[str, Any]) -> str:
+        """Encode one audit log entry as a CSV line."""
+        row = [
+            log.get("id", ""),
+            log.get("timestamp", ""),
+            log.get("event_type", ""),
+            log.get("user_id", ""),
+            log.get("resource_type", ""),
+            log.get("resource_id", ""),
+            log.get("action", ""),
+            json.dumps(log.get("details")) if log.get("details") else "",
+            log.get("ip_address", ""),
+            log.get("user_agent", ""),
+            str(log.get("success", "")),
+            log.get("error_message", ""),
+            log.get("integrity_hash", ""),
+            log.get("previous_log_hash", ""),
+            log.get("created_at", ""),
+        ]
+        return ",".join([self._escape_csv_field(str(field)) for field in row])
 
     def _calculate_integrity_hash(self, entry: Dict[str, Any]) -> str:
         """
         Calculate cryptographic integrity hash for an audit log entry.
 
-        Hash includes: id, timestamp, event_type, user_id, resource_type,
-        resource_id, action, details, success, previous_log_hash
-
         Args:
             entry: Audit log entry dictionary
 
         Returns:
             SHA-256 hash (hex string)
         """
-        data = {
-            "id": entry["id"],
-            "timestamp": entry["timestamp"],
-            "event_type": entry["event_type"],
-            "user_id": entry.get("user_id"),
-            "resource_type": entry["resource_type"],
-            "resource_id": entry["resource_id"],
-            "action": entry["action"],
-            "details": entry.get("details"),
-            "success": entry["success"],
-            "previous_log_hash": entry.get("previous_log_hash"),
-        }
-
-        # Deterministic JSON string (same input = same hash)
-        json_string = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(json_string.encode()).hexdigest()
+        return calculate_integrity_hash(entry)
 
     def _get_last_log_hash(self) -> Optional[str]:
         """
@@ -384,19 +723,7 @@ class AuditLogger:
         Returns:
             Hash of last log, or None if no logs exist or table doesn't exist
         """
-        try:
-            sql = """
-                SELECT integrity_hash
-                FROM audit_logs
-                ORDER BY ROWID DESC
-                LIMIT 1
-            """
-            result = self.db.execute(text(sql))
-            row = result.fetchone()
-            return row[0] if row else None
-        except Exception:
-            # Table doesn't exist yet, return None (genesis block)
-            return None
+        return get_last_log_hash(self.db)
 
     def _insert_audit_log(self, entry: Dict[str, Any]) -> None:
         """
@@ -405,40 +732,7 @@ class AuditLogger:
         Args:
             entry: Audit log entry dictionary
         """
-        sql = """
-            INSERT INTO audit_logs (
-                id, timestamp, event_type, user_id, resource_type, resource_id,
-                action, details, ip_address, user_agent, success, error_message,
-                integrity_hash, previous_log_hash, created_at
-            ) VALUES (
-                :id, :timestamp, :event_type, :user_id, :resource_type, :resource_id,
-                :action, :details, :ip_address, :user_agent, :success, :error_message,
-                :integrity_hash, :previous_log_hash, :created_at
-            )
-        """
-
-        self.db.execute(
-            text(sql),
-            {
-                "id": entry["id"],
-                "timestamp": entry["timestamp"],
-                "event_type": entry["event_type"],
-                "user_id": entry.get("user_id"),
-                "resource_type": entry["resource_type"],
-                "resource_id": entry["resource_id"],
-                "action": entry["action"],
-                "details": (
-                    json.dumps(entry["details"]) if entry.get("details") else None
-                ),
-                "ip_address": entry.get("ip_address"),
-                "user_agent": entry.get("user_agent"),
-                "success": 1 if entry["success"] else 0,
-                "error_message": entry.get("error_message"),
-                "integrity_hash": entry["integrity_hash"],
-                "previous_log_hash": entry.get("previous_log_hash"),
-                "created_at": entry["created_at"],
-            },
-        )
+        insert_audit_logs(self.db, [entry])
         self.db.commit()
 
     def _map_row_to_entry(self, row: Dict[str, Any]) -> Dict[str, Any]:
@@ -491,6 +785,24 @@ class AuditLogger:
             return f'"{field.replace(chr(34), chr(34) + chr(34))}"'
         return field
 
+def gzip_chunks(chunks: Iterable[str], level: int = 6) -> Iterator[bytes]:
+    """
+    Gzip a stream of text chunks incrementally.
+
+    Args:
+        chunks: UTF-8 text chunks (e.g. from AuditLogger.iter_export)
+        level: zlib compression level
+
+    Yields:
+        Pieces of one gzip file
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
 # ===== HELPER FUNCTION FOR EASY USAGE =====
 
 def log_audit_event(
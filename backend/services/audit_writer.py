@@ -0,0 +1,349 @@
+"""
+AuditWriter - batched, off-request-path audit log persistence.
+
+Synchronous AuditLogger.log runs a SELECT for the previous hash, an INSERT and
+a COMMIT per event, so every audited search, read or tag change costs the
+request an fsync. While an AuditWriter is running, AuditLogger.log instead:
+
+1. chains the entry from an in-memory head (one per database engine),
+2. hashes it and appends it to a queue,
+3. returns; a background task writes queued entries in grouped
+   transactions (one COMMIT per batch) every flush_interval seconds.
+
+Durability:
+- Durable entries (security events by default, or durable=True) are
+  committed, together with every entry queued before them, before log()
+  returns - the same guarantee as sync mode (which also commits the
+  caller's session). Entries queued after them are left to the background
+  flush.
+- A full queue is written through one batch at a time, so memory stays
+  bounded under sustained load.
+- Writers hold the flush lock for one batch (one transaction) at a time, so
+  a write-through on the event loop waits behind at most one background
+  batch, never a whole backlog.
+- Queued non-durable entries are lost if the process dies before the next
+  flush (at most flush_interval seconds of events).
+
+Chain safety and crash recovery:
+- Batches are committed in chain order, so the table is always a valid
+  chain prefix. The head is loaded from the last committed row on first use
+  (and so on startup after a crash).
+- Each flush re-reads the committed tail inside its transaction. If it does
+  not match the batch's first previous_log_hash (another process wrote,
+  or an earlier batch was dropped), the batch is re-chained from the real
+  tail before insertion, so the stored chain never forks.
+
+Configuration:
+- AUDIT_WRITE_MODE: "sync" (default) or "batched" (start the writer)
+- AUDIT_FLUSH_INTERVAL_MS: Background flush period (default: 50)
+
+Note: in batched mode AuditLogger.log no longer commits the caller's
+session for non-durable events; callers commit their own work.
+
+Usage:
+    from backend.services.audit_writer import get_audit_writer
+
+    writer = get_audit_writer()
+    writer.start()   # AuditLogger.log now enqueues
+    writer.stop()    # flushes and restores synchronous writes
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import threading
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.services import audit_logger
+from backend.services.audit_logger import (
+    calculate_integrity_hash,
+    get_last_log_hash,
+    insert_audit_logs,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Event types written and committed before AuditLogger.log returns
+DURABLE_EVENT_PREFIXES: Tuple[str, ...] = (
+    "auth.",
+    "authorization.",
+    "consent.",
+    "encryption.",
+    "gdpr.",
+    "security.",
+    "user.",
+)
+
+
+def get_audit_write_mode() -> str:
+    """
+    Get the configured audit write mode.
+
+    Returns:
+        "batched" or "sync"
+    """
+    mode = os.getenv("AUDIT_WRITE_MODE", "sync").strip().lower()
+    return mode if mode in ("sync", "batched") else "sync"
+
+
+def is_durable_event(event_type: str) -> bool:
+    """Return True if an event type is committed synchronously by default."""
+    return event_type.startswith(DURABLE_EVENT_PREFIXES)
+
+
+class _Chain:
+    """Head and pending entries for one database engine."""
+
+    __slots__ = ("head", "pending", "session_factory", "queued", "committed")
+
+    def __init__(self, head: Optional[str], session_factory: sessionmaker):
+        self.head = head
+        self.pending: Deque[Dict[str, Any]] = deque()
+        self.session_factory = session_factory
+        # Running totals; an entry is committed once committed >= its position
+        self.queued = 0
+        self.committed = 0
+
+
+class AuditWriter:
+    """
+    Queue audit entries and persist them in grouped transactions.
+
+    Attributes:
+        batch_size: Maximum entries per transaction
+        max_queue: Pending entries per engine before writing through
+        flush_interval: Seconds between background flushes
+        is_running: Flag indicating if batching is active
+        written: Entries committed since start
+        rechained: Batches re-chained because the committed tail moved
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        max_queue: int = 10000,
+        flush_interval: float = 0.05,
+    ):
+        """
+        Initialize audit writer.
+
+        Args:
+            batch_size: Maximum entries per transaction
+            max_queue: Pending entries per engine before writing through
+            flush_interval: Seconds between background flushes
+        """
+        self.batch_size = batch_size
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        self._chains: Dict[Any, _Chain] = {}
+        # Guards chain heads and queues; held only for hashing/appending
+        self._lock = threading.Lock()
+        # Serializes writers so batches commit in chain order
+        self._flush_lock = threading.Lock()
+        self.written = 0
+        self.rechained = 0
+
+    def submit(self, db: Session, entry: Dict[str, Any], durable: Optional[bool] = None) -> None:
+        """
+        Chain, hash and queue an entry; write it now if durable or the queue is full.
+
+        Args:
+            db: Caller's session (identifies the database; committed on write-through)
+            entry: Audit entry without previous_log_hash/integrity_hash
+            durable: Commit before returning (default: by event type)
+        """
+        if durable is None:
+            durable = is_durable_event(entry["event_type"])
+
+        engine = db.get_bind()
+        chain = self._chains.get(engine)
+        if chain is None:
+            # Recover the head from the last committed row (startup/crash)
+            head = get_last_log_hash(db)
+            with self._lock:
+                chain = self._chains.setdefault(
+                    engine, _Chain(head, sessionmaker(bind=engine))
+                )
+
+        with self._lock:
+            entry["previous_log_hash"] = chain.head
+            entry["integrity_hash"] = calculate_integrity_hash(entry)
+            chain.head = entry["integrity_hash"]
+            chain.pending.append(entry)
+            chain.queued += 1
+            if durable:
+                # This entry and everything queued before it
+                until: Optional[int] = chain.queued
+            elif len(chain.pending) >= self.max_queue:
+                # One batch frees enough room
+                until = chain.committed + self.batch_size
+            else:
+                until = None
+
+        if until is not None:
+            # Commit the caller's work first (as sync mode does) so its session
+            # holds no write lock while waiting behind a background flush
+            db.commit()
+            self._flush_own_session(chain, until)
+
+    def flush(self) -> int:
+        """
+        Write every queued entry using the writer's own sessions.
+
+        Returns:
+            Number of entries committed
+        """
+        written = 0
+        for chain in list(self._chains.values()):
+            if not chain.pending:
+                continue
+            try:
+                written += self._flush_own_session(chain)
+            except Exception as error:
+                logger.error(f"Audit flush failed: {str(error)}", exc_info=True)
+        return written
+
+    def pending_count(self) -> int:
+        """Number of queued entries not yet committed."""
+        with self._lock:
+            return sum(len(chain.pending) for chain in self._chains.values())
+
+    def _flush_own_session(self, chain: _Chain, until: Optional[int] = None) -> int:
+        db = chain.session_factory()
+        try:
+            return self._flush_chain(chain, db, until)
+        finally:
+            db.close()
+
+    def _flush_chain(self, chain: _Chain, db: Session, until: Optional[int] = None) -> int:
+        """
+        Commit queued entries of one chain in batches of batch_size.
+
+        The flush lock is taken per batch, so concurrent writers (the
+        background task and write-throughs on the event loop) interleave
+        batch by batch in chain order. Entries stay queued until their batch
+        commits; a failed batch is retried by the next flush.
+
+        Args:
+            chain: Chain to flush
+            db: Session used for the inserts
+            until: Stop once this many entries of the chain are committed
+                (default: flush everything queued)
+        """
+        written = 0
+        while True:
+            with self._flush_lock:
+                with self._lock:
+                    if until is not None and chain.committed >= until:
+                        return written
+                    batch: List[Dict[str, Any]] = [
+                        chain.pending[i] for i in range(min(self.batch_size, len(chain.pending)))
+                    ]
+                if not batch:
+                    return written
+
+                try:
+                    tail = get_last_log_hash(db)
+                    if batch[0]["previous_log_hash"] != tail:
+                        self._rechain(chain, batch, tail)
+                    insert_audit_logs(db, batch)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+
+                with self._lock:
+                    for _ in batch:
+                        chain.pending.popleft()
+                    chain.committed += len(batch)
+                written += len(batch)
+                self.written += len(batch)
+
+    def _rechain(self, chain: _Chain, batch: List[Dict[str, Any]], tail: Optional[str]) -> None:
+        """Re-link a batch (and the queue behind it) onto the committed tail."""
+        self.rechained += 1
+        logger.warning("Audit chain tail moved; re-chaining %d queued entries", len(batch))
+        with self._lock:
+            previous = tail
+            # Every pending entry follows the batch, so re-link the whole queue
+            for entry in chain.pending:
+                entry["previous_log_hash"] = previous
+                entry["integrity_hash"] = calculate_integrity_hash(entry)
+                previous = entry["integrity_hash"]
+            chain.head = previous
+
+    def start(self) -> None:
+        """
+        Start batching: route AuditLogger.log here and flush in the background.
+
+        This method is non-blocking.
+        """
+        if self.is_running:
+            logger.warning("AuditWriter is already running")
+            return
+
+        self.is_running = True
+        # Heads are re-read from the database on first use
+        self._chains.clear()
+        audit_logger.set_audit_writer(self)
+        logger.info(
+            "Starting AuditWriter (flush every %dms, batch size %d)",
+            int(self.flush_interval * 1000),
+            self.batch_size,
+        )
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Restore synchronous audit writes and flush everything still queued."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        audit_logger.set_audit_writer(None)
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        flushed = self.flush()
+        logger.info(f"Stopped AuditWriter (flushed {flushed} queued entries)")
+
+    async def _run_scheduler(self) -> None:
+        """Flush every flush_interval seconds until stopped."""
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                if self.pending_count():
+                    await asyncio.to_thread(self.flush)
+            except asyncio.CancelledError:
+                logger.info("Audit writer task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error flushing audit log: {str(error)}", exc_info=True)
+
+
+# ===== SINGLETON =====
+
+_audit_writer: Optional[AuditWriter] = None
+
+
+def get_audit_writer() -> AuditWriter:
+    """
+    Get the process-wide audit writer.
+
+    Returns:
+        AuditWriter instance
+    """
+    global _audit_writer
+
+    if _audit_writer is None:
+        _audit_writer = AuditWriter(
+            flush_interval=int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "50")) / 1000
+        )
+
+    return _audit_writer
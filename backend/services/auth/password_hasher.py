@@ -0,0 +1,244 @@
+"""
+Bounded, off-loop scrypt password hashing.
+
+scrypt (n=16384, r=8) takes tens of milliseconds of CPU and 16 MB of RAM per
+call. Run directly inside ``async def`` handlers it blocks the event loop, so
+a login burst stalls every other request on the worker, including SSE chat
+streams.
+
+Features:
+- Hashing runs in a dedicated thread pool (hashlib.scrypt releases the GIL,
+  so threads hash in parallel without blocking the loop)
+- A non-blocking semaphore bounds running + queued hashes; when it is
+  exhausted the call fails fast with PasswordHasherBusyError (HTTP 503)
+  instead of queueing without limit. Slots are held until the hash itself
+  finishes, even if the awaiting request is cancelled
+- Peak memory is bounded by max_workers * 16 MB
+- Queue-wait and hash-time metrics (count, mean, p95, max)
+
+Configuration:
+- PASSWORD_HASH_WORKERS: Concurrent hashes (default: min(4, CPU count))
+- PASSWORD_HASH_QUEUE: Hashes allowed to wait for a worker (default: 32)
+
+Usage:
+    from backend.services.auth.password_hasher import get_password_hasher
+
+    password_hash = await get_password_hasher().hash(password, salt)
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Python's hashlib.scrypt parameters match Node.js crypto.scrypt
+# n=16384, r=8, p=1 are scrypt defaults (secure for OWASP)
+SCRYPT_N = 16384  # CPU/memory cost parameter
+SCRYPT_R = 8  # Block size parameter
+SCRYPT_P = 1  # Parallelization parameter
+KEY_LENGTH = 64  # bytes
+
+DEFAULT_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+DEFAULT_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "32"))
+
+# Number of recent samples used for percentiles
+_SAMPLE_WINDOW = 512
+
+
+def scrypt_hash(password: str, salt: bytes, dklen: int = KEY_LENGTH) -> bytes:
+    """
+    Hash a password with the application's scrypt parameters (blocking).
+
+    Args:
+        password: Plain text password
+        salt: Random salt bytes
+        dklen: Derived key length in bytes
+
+    Returns:
+        Password hash as bytes
+    """
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt,
+        n=SCRYPT_N,
+        r=SCRYPT_R,
+        p=SCRYPT_P,
+        dklen=dklen,
+    )
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the hashing queue is full; the request should be retried later."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Password hashing capacity exceeded, retry shortly")
+        self.retry_after = retry_after
+
+
+def _percentile(samples: Deque[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PasswordHasher:
+    """
+    Thread pool for scrypt with admission control.
+
+    Attributes:
+        max_workers: Hashes running concurrently
+        max_queue: Hashes allowed to wait for a worker before rejecting
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, max_queue: int = DEFAULT_QUEUE):
+        """
+        Initialize password hasher.
+
+        Args:
+            max_workers: Hashes running concurrently
+            max_queue: Hashes allowed to wait for a worker
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._queue_waits: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._hash_times: Deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="scrypt"
+                )
+            return self._executor
+
+    def _run(self, password: str, salt: bytes, dklen: int, submitted_at: float) -> bytes:
+        started_at = time.perf_counter()
+        try:
+            return scrypt_hash(password, salt, dklen)
+        finally:
+            finished_at = time.perf_counter()
+            queue_wait = started_at - submitted_at
+            with self._lock:
+                self.completed += 1
+                self._queue_wait_total += queue_wait
+                self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+                self._queue_waits.append(queue_wait)
+                self._hash_times.append(finished_at - started_at)
+
+    async def hash(self, password: str, salt: bytes, dklen: int = KEY_LENGTH) -> bytes:
+        """
+        Hash a password without blocking the event loop.
+
+        Args:
+            password: Plain text password
+            salt: Random salt bytes
+            dklen: Derived key length in bytes
+
+        Returns:
+            Password hash as bytes
+
+        Raises:
+            PasswordHasherBusyError: If max_workers + max_queue hashes are pending
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            logger.warning(
+                "Password hashing queue full (%d running, %d queued); rejecting",
+                self.max_workers,
+                self.max_queue,
+            )
+            raise PasswordHasherBusyError()
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._get_executor().submit(
+                self._run, password, salt, dklen, time.perf_counter()
+            )
+        except BaseException:
+            self._release_slot()
+            raise
+
+        # Release when the job finishes (or is cancelled before starting),
+        # not when the caller stops waiting: a disconnected client must not
+        # free a slot while its hash is still queued or running
+        future.add_done_callback(self._release_slot)
+        return await asyncio.wrap_future(future)
+
+    def _release_slot(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool occupancy and timing metrics.
+
+        Returns:
+            Dictionary with capacity, in-flight/queued counts, completed and
+            rejected totals, and queue-wait / hash-time percentiles in ms
+        """
+        with self._lock:
+            completed = self.completed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.max_workers),
+                "completed": completed,
+                "rejected": self.rejected,
+                "queue_wait_ms": {
+                    "mean": (self._queue_wait_total / completed * 1000) if completed else 0.0,
+                    "p95": _percentile(self._queue_waits, 0.95) * 1000,
+                    "max": self._queue_wait_max * 1000,
+                },
+                "hash_time_ms": {
+                    "p50": _percentile(self._hash_times, 0.50) * 1000,
+                    "p95": _percentile(self._hash_times, 0.95) * 1000,
+                },
+            }
+
+    def shutdown(self) -> None:
+        """Stop worker threads (waits for running hashes)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# ===== SINGLETON =====
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Get the process-wide password hasher.
+
+    Returns:
+        PasswordHasher instance
+    """
+    global _password_hasher
+
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+
+    return _password_hasher
@@ -4,10 +4,13 @@ Migrated from src/services/AuthenticationService.ts
 
 Features:
 - User registration with OWASP password requirements
-- Password hashing using scrypt (OWASP recommended)
+- Password hashing using scrypt (OWASP recommended), run off the event
+  loop in a bounded worker pool (see password_hasher.py)
 - Session management with 24-hour expiration
 - Session ID regeneration on login (prevents session fixation)
 - Remember Me with 30-day expiration
+- Optional signed session tokens (SESSION_TOKEN_MODE=signed) verified
+  without database access
 - Timing-safe password comparison (prevents timing attacks)
 - Comprehensive audit logging
 - Rate limiting for brute force protection
@@ -20,8 +23,8 @@ Security:
 - All authentication events audited
 """
 
-import hashlib
 import hmac
+import logging
 import secrets
 import re
 from datetime import datetime, timedelta
@@ -31,6 +34,16 @@ from sqlalchemy.orm import Session
 
 from backend.models.user import User
 from backend.models.session import Session as SessionModel
+from backend.services.auth.password_hasher import get_password_hasher, scrypt_hash
+from backend.services.auth.session_tokens import (
+    TOKEN_MODE_SIGNED,
+    get_session_token_mode,
+    get_session_token_service,
+    resolve_session_id,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
 
 class AuthenticationError(Exception):
     """Authentication error exception."""
@@ -62,6 +75,8 @@ class AuthenticationService:
         """
         Hash password using scrypt (OWASP recommended).
 
+        Blocks the calling thread; async code should use _hash_password_async.
+
         Args:
             password: Plain text password
             salt: Random salt bytes
@@ -69,16 +84,16 @@ class AuthenticationService:
         Returns:
             Password hash as bytes
         """
-        # Python's hashlib.scrypt parameters match Node.js crypto.scrypt
-        # n=16384, r=8, p=1 are scrypt defaults (secure for OWASP)
-        return hashlib.scrypt(
-            password.encode("utf-8"),
-            salt=salt,
-            n=16384,  # CPU/memory cost parameter
-            r=8,  # Block size parameter
-            p=1,  # Parallelization parameter
-            dklen=self.KEY_LENGTH,
-        )
+        return scrypt_hash(password, salt, dklen=self.KEY_LENGTH)
+
+    async def _hash_password_async(self, password: str, salt: bytes) -> bytes:
+        """
+        Hash password in the bounded scrypt worker pool.
+
+        Raises:
+            PasswordHasherBusyError: If too many hashes are already pending
+        """
+        return await get_password_hasher().hash(password, salt, dklen=self.KEY_LENGTH)
 
     def _validate_password_strength(self, password: str) -> None:
         """
@@ -184,7 +199,7 @@ class AuthenticationService:
 
         # Generate salt and hash password
         salt = secrets.token_bytes(self.SALT_LENGTH)
-        password_hash = self._hash_password(password, salt)
+        password_hash = await self._hash_password_async(password, salt)
 
         # Create user
         user = User(
@@ -252,6 +267,7 @@ class AuthenticationService:
         remember_me: bool = False,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        issue_token: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Login user and create session.
@@ -264,6 +280,9 @@ class AuthenticationService:
             remember_me: If True, session lasts 30 days instead of 24 hours
             ip_address: Client IP address (optional)
             user_agent: Client user agent (optional)
+            issue_token: Return a signed session token as the session id
+                (default: SESSION_TOKEN_MODE). The session row is created
+                either way so it can be listed and revoked.
 
         Returns:
             Dictionary with user and session data
@@ -308,7 +327,7 @@ class AuthenticationService:
         # Verify password using timing-safe comparison
         password_salt_hex = self._coerce_str(user.password_salt)
         salt = bytes.fromhex(password_salt_hex)
-        computed_hash = self._hash_password(password, salt)
+        computed_hash = await self._hash_password_async(password, salt)
 
         # Timing-safe comparison (prevents timing attacks)
         stored_hash_hex = self._coerce_str(user.password_hash)
@@ -369,15 +388,32 @@ class AuthenticationService:
             },
         )
 
-        return {"user": user.to_dict(), "session": session.to_dict()}
+        session_data = session.to_dict()
+
+        if issue_token is None:
+            issue_token = get_session_token_mode() == TOKEN_MODE_SIGNED
+        if issue_token:
+            token_service = get_session_token_service()
+            if token_service is None:
+                logger.warning("Signed session tokens requested but SESSION_TOKEN_SECRET is not set")
+            else:
+                session_data["id"] = token_service.issue(
+                    user_id=user_db_id,
+                    username=self._coerce_str(user.username),
+                    session_id=new_session_id,
+                    expires_at=expires_at,
+                )
+
+        return {"user": user.to_dict(), "session": session_data}
 
     async def logout(self, session_id: str) -> None:
         """
         Logout user and delete session.
 
         Args:
-            session_id: Session UUID to delete
+            session_id: Session UUID or signed session token to delete
         """
+        session_id = resolve_session_id(session_id)
         session = (
             self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
         )
@@ -404,11 +440,12 @@ class AuthenticationService:
         Get session by ID and validate it's not expired.
 
         Args:
-            session_id: Session UUID
+            session_id: Session UUID or signed session token
 
         Returns:
             Session model if valid, None if not found or expired
         """
+        session_id = resolve_session_id(session_id)
         session = (
             self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
         )
@@ -416,11 +453,8 @@ class AuthenticationService:
         if not session:
             return None
 
-        # Check if session is expired
+        # Expired rows are left for ExpiredSessionSweeper
         if session.expires_at < datetime.utcnow():
-            # Session expired - delete it
-            self.db.delete(session)
-            self.db.commit()
             return None
 
         return session
@@ -438,6 +472,7 @@ class AuthenticationService:
         if not session_id:
             return None
 
+        session_id = resolve_session_id(session_id)
         session = (
             self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
         )
@@ -445,10 +480,8 @@ class AuthenticationService:
         if not session:
             return None
 
-        # Check if session is expired
+        # Expired rows are left for ExpiredSessionSweeper
         if session.expires_at < datetime.utcnow():
-            self.db.delete(session)
-            self.db.commit()
             return None
 
         # Return session data as dictionary
@@ -489,7 +522,7 @@ class AuthenticationService:
         # Verify old password
         salt_hex = self._coerce_str(user.password_salt)
         salt = bytes.fromhex(salt_hex)
-        computed_hash = self._hash_password(old_password, salt)
+        computed_hash = await self._hash_password_async(old_password, salt)
 
         stored_hash_hex = self._coerce_str(user.password_hash)
         is_valid = hmac.compare_digest(bytes.fromhex(stored_hash_hex), computed_hash)
@@ -511,7 +544,7 @@ class AuthenticationService:
 
         # Hash new password
         new_salt = secrets.token_bytes(self.SALT_LENGTH)
-        new_hash = self._hash_password(new_password, new_salt)
+        new_hash = await self._hash_password_async(new_password, new_salt)
 
         # Update user password
         setattr(user, "password_hash", new_hash.hex())
@@ -0,0 +1,270 @@
+"""
+Process-wide cache of validated sessions.
+
+Every authenticated request validates its session. Without a cache that is
+two ORM queries (session, then user) before any route logic runs. This cache
+maps session_id -> (user_id, username, is_active, expires_at) for a short TTL
+so most requests resolve with a dict lookup.
+
+Consistency:
+- Entries never outlive the session's own expires_at
+- Entries are dropped after ttl_seconds even without invalidation, which
+  bounds staleness for writes that bypass the hooks below
+- destroy_session / revoke_user_sessions invalidate explicitly
+- ORM hooks invalidate on session row deletes and on user password or
+  is_active changes (password change, reset, deactivation)
+- Invalidation happens after the commit: a validation running between the
+  change and the commit still sees the old row and would re-cache it
+- A generation counter stops an in-flight validation that started before an
+  invalidation from re-caching the stale result
+
+Usage:
+    from backend.services.auth.session_cache import get_session_cache
+
+    cache = get_session_cache()
+    entry = cache.get(session_id)
+    cache.invalidate_user(user_id)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session as OrmSession, object_session
+
+from backend.models.session import Session as SessionModel
+from backend.models.user import User
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "30"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """Validated session snapshot."""
+
+    session_id: str
+    user_id: int
+    username: str
+    is_active: bool
+    expires_at: datetime
+    cached_at: float
+
+
+class SessionValidationCache:
+    """
+    Thread-safe LRU + TTL cache of validated sessions.
+
+    Attributes:
+        ttl_seconds: Maximum age of an entry
+        max_entries: Maximum number of cached sessions (least recently used evicted)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize session validation cache.
+
+        Args:
+            ttl_seconds: Maximum age of an entry in seconds
+            max_entries: Maximum number of cached sessions
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedSession]" = OrderedDict()
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass to put()."""
+        return self._generation
+
+    def get(self, session_id: str) -> Optional[CachedSession]:
+        """
+        Get a cached session if it is still fresh and unexpired.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            CachedSession or None on miss
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if (
+                time.monotonic() - entry.cached_at > self.ttl_seconds
+                or datetime.now(timezone.utc) >= entry.expires_at
+            ):
+                self._remove(session_id)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        session_id: str,
+        user_id: int,
+        username: str,
+        is_active: bool,
+        expires_at: datetime,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a validation result.
+
+        Args:
+            session_id: Session ID
+            user_id: Owning user ID
+            username: Owning username
+            is_active: Whether the user account is active
+            expires_at: Session expiration (naive values are treated as UTC)
+            generation: Value of ``generation`` read before the database
+                lookup; the entry is discarded if an invalidation happened since
+        """
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._remove(session_id)
+            self._entries[session_id] = CachedSession(
+                session_id=session_id,
+                user_id=user_id,
+                username=username,
+                is_active=is_active,
+                expires_at=expires_at,
+                cached_at=time.monotonic(),
+            )
+            self._by_user.setdefault(user_id, set()).add(session_id)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a single session."""
+        with self._lock:
+            self._generation += 1
+            self._remove(session_id)
+
+    def invalidate_user(self, user_id: int, except_session_id: Optional[str] = None) -> None:
+        """
+        Drop every cached session of a user.
+
+        Args:
+            user_id: User ID
+            except_session_id: Optional session to keep (current session)
+        """
+        with self._lock:
+            self._generation += 1
+            for session_id in list(self._by_user.get(user_id, ())):
+                if session_id != except_session_id:
+                    self._remove(session_id)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_user.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _remove(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return
+        sessions = self._by_user.get(entry.user_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._by_user[entry.user_id]
+
+
+# ===== SINGLETON =====
+
+_session_cache = SessionValidationCache()
+
+
+def get_session_cache() -> SessionValidationCache:
+    """
+    Get the process-wide session validation cache.
+
+    Returns:
+        SessionValidationCache instance
+    """
+    return _session_cache
+
+
+# ===== ORM INVALIDATION HOOKS =====
+
+# Session.info key collecting (kind, id) pairs flushed but not yet committed
+_PENDING_INVALIDATIONS = "session_cache_invalidations"
+
+
+def _invalidate_after_commit(target, kind: str, key) -> None:
+    db = object_session(target)
+    if db is None:
+        _apply_invalidation(kind, key)
+        return
+    db.info.setdefault(_PENDING_INVALIDATIONS, set()).add((kind, key))
+
+
+def _apply_invalidation(kind: str, key) -> None:
+    if kind == "user":
+        _session_cache.invalidate_user(key)
+    else:
+        _session_cache.invalidate(key)
+
+
+@event.listens_for(SessionModel, "after_delete")
+def _invalidate_deleted_session(_mapper, _connection, target) -> None:
+    """Drop sessions deleted through the ORM (logout, expiry cleanup)."""
+    _invalidate_after_commit(target, "session", target.id)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_changed_user(_mapper, _connection, target) -> None:
+    """Drop a user's sessions when their password or active flag changes."""
+    state = inspect(target)
+    for attribute in ("password_hash", "is_active"):
+        if state.attrs[attribute].history.has_changes():
+            _invalidate_after_commit(target, "user", target.id)
+            return
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _apply_pending_invalidations(db) -> None:
+    """Apply invalidations collected during flushes once they are committed."""
+    # Pending entries survive a rollback; invalidating on the next commit
+    # anyway only costs a cache miss
+    for kind, key in db.info.pop(_PENDING_INVALIDATIONS, ()):
+        _apply_invalidation(kind, key)
@@ -17,6 +17,9 @@ Key Differences from TypeScript Version:
 
 Features:
 - Fast session validation with optional in-memory caching
+- Optional process-wide validation cache shared by all request-scoped
+  instances (see session_cache.py), invalidated on logout/revocation
+- Signed session tokens verified without database access (see session_tokens.py)
 - Automatic session expiration handling
 - UUID v4 session IDs for security
 - Session cleanup on logout
@@ -64,6 +67,12 @@ from sqlalchemy.orm import Session
 
 from backend.models.session import Session as SessionModel
 from backend.models.user import User
+from backend.services.auth.session_cache import get_session_cache
+from backend.services.auth.session_tokens import (
+    get_session_token_service,
+    is_session_token,
+    resolve_session_id,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -131,7 +140,11 @@ class SessionManager:
     CLEANUP_INTERVAL_MINUTES = 5  # For periodic cleanup
 
     def __init__(
-        self, db: Session, audit_logger=None, enable_memory_cache: bool = False
+        self,
+        db: Session,
+        audit_logger=None,
+        enable_memory_cache: bool = False,
+        use_validation_cache: bool = False,
     ):
         """
         Initialize SessionManager.
@@ -140,10 +153,14 @@ class SessionManager:
             db: SQLAlchemy database session
             audit_logger: Optional AuditLogger instance for logging
             enable_memory_cache: Enable in-memory caching for faster validation
+            use_validation_cache: Serve validate_session from the process-wide
+                cache (invalidation always applies regardless of this flag)
         """
         self.db = db
         self.audit_logger = audit_logger
         self.enable_memory_cache = enable_memory_cache
+        self.use_validation_cache = use_validation_cache
+        self.validation_cache = get_session_cache()
 
         # In-memory session cache (optional for performance)
         self._memory_cache: Dict[str, InMemorySession] = {}
@@ -319,41 +336,29 @@ class SessionManager:
         """
         Validate a session and return user information.
 
-        First checks memory cache (if enabled), then falls back to database.
-        Automatically cleans up expired sessions.
+        Signed tokens are verified against their signature, expiry and the
+        revocation set only. Session UUIDs first check the memory cache (if
+        enabled), then the process-wide validation cache (if enabled), then
+        fall back to database. Expired sessions are rejected without writing;
+        ExpiredSessionSweeper deletes them in batches.
 
         Args:
-            session_id: Session UUID to validate
+            session_id: Session UUID or signed session token to validate
 
         Returns:
             SessionValidationResult with validation status and user info
         """
+        if is_session_token(session_id):
+            return self._validate_token(session_id)
+
         # Check memory cache first (if enabled)
         if self.enable_memory_cache and session_id in self._memory_cache:
             cached_session = self._memory_cache[session_id]
 
             # Check if cached session is expired
             if datetime.now(timezone.utc) > cached_session.expires_at:
-                # Remove from cache
+                # Remove from cache (the sweeper deletes the database row)
                 del self._memory_cache[session_id]
-
-                # Remove from database
-                try:
-                    self.db.query(SessionModel).filter(
-                        SessionModel.id == session_id
-                    ).delete()
-                    self.db.commit()
-                except Exception as exc:
-                    logger.error(
-                        "Failed to delete expired session %s: %s", session_id, exc
-                    )
-
-                logger.info(
-                    "[SessionManager] Cleaned up expired cached session %s for user %s",
-                    session_id,
-                    cached_session.username,
-                )
-
                 return SessionValidationResult(valid=False, user_id=None, username=None)
 
             # Cached session is valid
@@ -363,6 +368,17 @@ class SessionManager:
                 username=cached_session.username,
             )
 
+        # Check process-wide validation cache (if enabled)
+        generation = self.validation_cache.generation
+        if self.use_validation_cache:
+            cached = self.validation_cache.get(session_id)
+            if cached is not None:
+                if not cached.is_active:
+                    return SessionValidationResult(valid=False, user_id=None, username=None)
+                return SessionValidationResult(
+                    valid=True, user_id=cached.user_id, username=cached.username
+                )
+
         # Query database
         try:
             db_session = (
@@ -374,30 +390,28 @@ class SessionManager:
             if not db_session:
                 return SessionValidationResult(valid=False, user_id=None, username=None)
 
-            # Check if session is expired
+            # Reject expired sessions without writing (the sweeper deletes them)
             now = datetime.now(timezone.utc)
             if db_session.expires_at.replace(tzinfo=timezone.utc) < now:
-                # Clean up expired session
-                user_id = db_session.user_id
-                self.db.delete(db_session)
-                self.db.commit()
-
-                # Remove from cache if present
-                if self.enable_memory_cache and session_id in self._memory_cache:
-                    del self._memory_cache[session_id]
-
-                logger.info(
-                    "[SessionManager] Cleaned up expired session %s for user %s",
-                    session_id,
-                    user_id,
-                )
-
                 return SessionValidationResult(valid=False, user_id=None, username=None)
 
             # Get user information
             user = self.db.query(User).filter(User.id == db_session.user_id).first()
 
-            if not user or not user.is_active:
+            if not user:
+                return SessionValidationResult(valid=False, user_id=None, username=None)
+
+            if self.use_validation_cache:
+                self.validation_cache.put(
+                    session_id,
+                    user_id=user.id,
+                    username=user.username,
+                    is_active=bool(user.is_active),
+                    expires_at=db_session.expires_at,
+                    generation=generation,
+                )
+
+            if not user.is_active:
                 return SessionValidationResult(valid=False, user_id=None, username=None)
 
             # Add to memory cache if enabled
@@ -421,6 +435,18 @@ class SessionManager:
             logger.error("Session validation error for %s: %s", session_id, exc)
             return SessionValidationResult(valid=False, user_id=None, username=None)
 
+    def _validate_token(self, token: str) -> SessionValidationResult:
+        """Validate a signed session token without database access."""
+        token_service = get_session_token_service()
+        claims = token_service.verify(token) if token_service is not None else None
+
+        if claims is None:
+            return SessionValidationResult(valid=False, user_id=None, username=None)
+
+        return SessionValidationResult(
+            valid=True, user_id=claims.user_id, username=claims.username
+        )
+
     async def get_session(self, session_id: str) -> Optional[SessionModel]:
         """
         Get session by ID.
@@ -432,7 +458,7 @@ class SessionManager:
         try:
             return (
                 self.db.query(SessionModel)
-                .filter(SessionModel.id == session_id)
+                .filter(SessionModel.id == resolve_session_id(session_id))
                 .first()
             )
         except Exception as exc:
@@ -443,14 +469,17 @@ class SessionManager:
         """
         Destroy a session (logout).
 
-        Removes session from both memory cache and database.
+        Removes session from both memory cache and database. Deleting the
+        row also revokes any signed tokens issued for it.
 
         Args:
-            session_id: Session UUID to destroy
+            session_id: Session UUID or signed session token to destroy
 
         Returns:
             True if session was destroyed, False if not found
         """
+        session_id = resolve_session_id(session_id)
+
         # Remove from memory cache
         username = None
         if self.enable_memory_cache and session_id in self._memory_cache:
@@ -474,6 +503,10 @@ class SessionManager:
                 self.db.delete(db_session)
                 self.db.commit()
 
+                # Only after the commit: a validation running before it still
+                # sees the row and would cache it again
+                self.validation_cache.invalidate(session_id)
+
                 self._log_audit(
                     event_type="session.destroy",
                     user_id=user_id,
@@ -491,6 +524,7 @@ class SessionManager:
 
                 return True
 
+            self.validation_cache.invalidate(session_id)
             return False
 
         except Exception as exc:
@@ -678,8 +712,15 @@ class SessionManager:
             Number of sessions revoked
         """
         revoked_count = 0
+        if except_session_id:
+            except_session_id = resolve_session_id(except_session_id)
 
         try:
+            # Bulk deletes bypass ORM events, so record token revocations first
+            token_service = get_session_token_service()
+            if token_service is not None:
+                token_service.revoke_user(self.db, user_id, except_session_id)
+
             # Get sessions to revoke
             query = self.db.query(SessionModel).filter(SessionModel.user_id == user_id)
 
@@ -699,6 +740,9 @@ class SessionManager:
             revoked_count = query.delete(synchronize_session=False)
             self.db.commit()
 
+            # Bulk deletes bypass ORM events, so drop cached validations here
+            self.validation_cache.invalidate_user(user_id, except_session_id)
+
             self._log_audit(
                 event_type="session.revoke_user_sessions",
                 user_id=user_id,
@@ -14,7 +14,8 @@ backend version provides database-based session persistence instead, as:
 
 Features:
 - Session validation and restoration from database
-- Automatic cleanup of expired sessions
+- Expired sessions rejected on read; deleted in batches by
+  ExpiredSessionSweeper or cleanup_expired_sessions
 - Session metadata tracking (IP, user agent, last activity)
 - UUID v4 validation for session IDs
 - Comprehensive audit logging
@@ -56,6 +57,8 @@ from sqlalchemy.orm import Session
 
 from backend.models.session import Session as SessionModel
 from backend.models.user import User
+from backend.services.auth.session_cache import get_session_cache
+from backend.services.auth.session_tokens import get_session_token_service
 
 class SessionPersistenceError(Exception):
     """Exception raised for session persistence errors."""
@@ -158,22 +161,9 @@ class SessionPersistenceService:
             if not session:
                 return False
 
-            # Check if session is expired
+            # Reject expired sessions without writing (the sweeper deletes them)
             now = datetime.now(timezone.utc)
             if session.expires_at.replace(tzinfo=timezone.utc) < now:
-                # Session expired - clean it up
-                self.db.delete(session)
-                self.db.commit()
-
-                self._log_audit(
-                    event_type="session.expired",
-                    user_id=session.user_id,
-                    session_id=session_id,
-                    action="delete",
-                    success=True,
-                    details={"reason": "Session expired during validation"},
-                )
-
                 return False
 
             return True
@@ -250,19 +240,14 @@ class SessionPersistenceService:
                 )
                 return None
 
-            # Check if session is expired
+            # Reject expired sessions without writing (the sweeper deletes them)
             now = datetime.now(timezone.utc)
             if session.expires_at.replace(tzinfo=timezone.utc) < now:
-                # Session expired - clean it up
-                user_id = session.user_id
-                self.db.delete(session)
-                self.db.commit()
-
                 self._log_audit(
                     event_type="session.restore",
-                    user_id=user_id,
+                    user_id=session.user_id,
                     session_id=session_id,
-                    action="delete",
+                    action="read",
                     success=False,
                     details={"reason": "Session expired"},
                 )
@@ -645,10 +630,18 @@ class SessionPersistenceService:
             if revoked_count == 0:
                 return 0
 
+            # Bulk deletes bypass ORM events, so record token revocations first
+            token_service = get_session_token_service()
+            if token_service is not None:
+                token_service.revoke_user(self.db, user_id, except_session_id)
+
             # Delete sessions
             query.delete(synchronize_session=False)
             self.db.commit()
 
+            # Bulk deletes bypass ORM events, so drop cached validations here
+            get_session_cache().invalidate_user(user_id, except_session_id)
+
             self._log_audit(
                 event_type="session.revoke_user_sessions",
                 user_id=user_id,
@@ -0,0 +1,204 @@
+"""
+Expired session sweeper - deletes expired sessions in bounded batches.
+
+Validation paths only reject expired sessions; they never delete them, so
+authentication reads stay reads. This background task removes the expired
+rows instead, a bounded batch per transaction (selected through the
+sessions.expires_at index), so each write lock is held only briefly and
+logins are never queued behind one large DELETE.
+
+Features:
+- Runs every interval_seconds (default: 5 minutes)
+- Each batch is its own short transaction of at most batch_size rows
+- Pauses between batches to let request writes through
+- Works on SQLite and PostgreSQL (DELETE ... WHERE id IN (SELECT ... LIMIT n))
+
+Usage:
+    from backend.services.auth.session_sweeper import get_session_sweeper
+
+    sweeper = get_session_sweeper()
+    sweeper.start()
+    await sweeper.sweep()
+    sweeper.stop()
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Optional
+import asyncio
+import logging
+
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Subquery uses ix_sessions_expires_at for the range scan
+_DELETE_EXPIRED_BATCH = text(
+    """
+    DELETE FROM sessions
+    WHERE id IN (
+        SELECT id FROM sessions
+        WHERE expires_at < :now
+        ORDER BY expires_at
+        LIMIT :batch_size
+    )
+"""
+).bindparams(bindparam("now", type_=DateTime(timezone=True)))
+
+
+class ExpiredSessionSweeper:
+    """
+    Background service that deletes expired sessions in batches.
+
+    Attributes:
+        batch_size: Maximum rows deleted per transaction
+        interval_seconds: Seconds between sweeps
+        batch_pause: Seconds to sleep between batches of one sweep
+        is_running: Flag indicating if the background task is active
+        last_swept: Rows deleted by the most recent sweep
+        total_swept: Rows deleted since start
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: int = 500,
+        interval_seconds: int = 300,
+        batch_pause: float = 0.05,
+    ):
+        """
+        Initialize expired session sweeper.
+
+        Args:
+            session_factory: Callable returning a new database session
+                (defaults to backend.models.base.SessionLocal)
+            batch_size: Maximum rows deleted per transaction
+            interval_seconds: Seconds between sweeps
+            batch_pause: Seconds to sleep between batches
+        """
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.batch_pause = batch_pause
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        self.last_swept = 0
+        self.total_swept = 0
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from backend.models.base import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def sweep_batch(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete up to batch_size expired sessions in one transaction.
+
+        Args:
+            now: Cut-off time (default: current UTC time)
+
+        Returns:
+            Number of rows deleted
+        """
+        db = self._new_session()
+        try:
+            result = db.execute(
+                _DELETE_EXPIRED_BATCH,
+                {"now": now or datetime.now(timezone.utc), "batch_size": self.batch_size},
+            )
+            db.commit()
+            return result.rowcount or 0
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def sweep(self) -> int:
+        """
+        Delete all currently expired sessions, one batch at a time.
+
+        Returns:
+            Number of rows deleted
+        """
+        now = datetime.now(timezone.utc)
+        swept = 0
+
+        while True:
+            deleted = await asyncio.to_thread(self.sweep_batch, now)
+            swept += deleted
+            if deleted < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause)
+
+        self.last_swept = swept
+        self.total_swept += swept
+        if swept:
+            logger.info("Swept %d expired sessions", swept)
+        return swept
+
+    def start(self) -> None:
+        """
+        Start periodic sweeping in the background.
+
+        This method is non-blocking.
+        """
+        if self.is_running:
+            logger.warning("ExpiredSessionSweeper is already running")
+            return
+
+        self.is_running = True
+        logger.info(
+            "Starting ExpiredSessionSweeper (every %ds, batch size %d)",
+            self.interval_seconds,
+            self.batch_size,
+        )
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped ExpiredSessionSweeper")
+
+    async def _run_scheduler(self) -> None:
+        """Sweep every interval_seconds until stopped."""
+        while self.is_running:
+            try:
+                await self.sweep()
+                await asyncio.sleep(self.interval_seconds)
+            except asyncio.CancelledError:
+                logger.info("Expired session sweeper task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error sweeping expired sessions: {str(error)}", exc_info=True)
+                await asyncio.sleep(self.interval_seconds)
+
+
+# ===== SINGLETON =====
+
+_session_sweeper: Optional[ExpiredSessionSweeper] = None
+
+
+def get_session_sweeper() -> ExpiredSessionSweeper:
+    """
+    Get the process-wide expired session sweeper.
+
+    Returns:
+        ExpiredSessionSweeper instance
+    """
+    global _session_sweeper
+
+    if _session_sweeper is None:
+        _session_sweeper = ExpiredSessionSweeper()
+
+    return _session_sweeper
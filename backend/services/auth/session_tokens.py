@@ -0,0 +1,527 @@
+"""
+Signed stateless session tokens with an in-memory revocation set.
+
+Database-backed sessions need at least one query per request on a cold
+worker. In token mode, login additionally issues an HMAC-SHA256 signed token
+carrying the user id, username, session id and expiry, and validation is a
+signature check plus a set lookup - no database access at all.
+
+Token format:
+    st1.<base64url(JSON [user_id, username, session_id, expires_epoch])>.<base64url(HMAC)>
+
+Revocation:
+- The session row is still written at login, so both modes coexist and
+  session listing / revocation keep working
+- Logout, revocation, password changes and deactivation record the affected
+  session ids in the session_revocations table
+- Every worker mirrors unexpired revocations into a RevocationSet, loaded in
+  full at startup and refreshed incrementally by revoked_at watermark
+- Revocations recorded by this worker apply immediately; other workers pick
+  them up within refresh_interval seconds
+
+Configuration:
+- SESSION_TOKEN_SECRET: HMAC key; token verification is disabled without it
+- SESSION_TOKEN_MODE: "database" (default) or "signed" - what login issues
+
+Usage:
+    from backend.services.auth.session_tokens import get_session_token_service
+
+    tokens = get_session_token_service()
+    if tokens is not None:
+        token = tokens.issue(user_id, username, session_id, expires_at)
+        claims = tokens.verify(token)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.orm import Session
+
+from backend.models.session import Session as SessionModel, SessionRevocation
+from backend.models.user import User
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TOKEN_PREFIX = "st1."
+
+TOKEN_MODE_DATABASE = "database"
+TOKEN_MODE_SIGNED = "signed"
+
+# Revocations committed by other workers may carry a revoked_at slightly older
+# than the newest row already seen, so each refresh re-reads this window.
+REFRESH_OVERLAP = timedelta(seconds=30)
+
+_INSERT_REVOCATION = text(
+    """
+    INSERT INTO session_revocations (session_id, user_id, revoked_at, expires_at)
+    SELECT :session_id, :user_id, :revoked_at, :expires_at
+    WHERE NOT EXISTS (
+        SELECT 1 FROM session_revocations WHERE session_id = :session_id
+    )
+"""
+)
+
+
+def is_session_token(value: Optional[str]) -> bool:
+    """Whether a bearer credential is a signed token rather than a session UUID."""
+    return bool(value) and value.startswith(TOKEN_PREFIX)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Verified contents of a session token."""
+
+    user_id: int
+    username: str
+    session_id: str
+    expires_at: int  # Unix timestamp (seconds)
+
+
+class SessionTokenSigner:
+    """Issue and verify HMAC-SHA256 signed session tokens."""
+
+    def __init__(self, secret: bytes):
+        """
+        Initialize signer.
+
+        Args:
+            secret: HMAC key (at least 32 bytes recommended)
+        """
+        if not secret:
+            raise ValueError("Session token secret must not be empty")
+        self._secret = secret
+
+    def _sign(self, payload: str) -> str:
+        mac = hmac.new(self._secret, payload.encode("ascii"), hashlib.sha256).digest()
+        return _b64encode(mac)
+
+    def issue(self, user_id: int, username: str, session_id: str, expires_at: datetime) -> str:
+        """
+        Issue a token for a session.
+
+        Args:
+            user_id: Owning user ID
+            username: Owning username
+            session_id: Session ID recorded in the sessions table
+            expires_at: Session expiration (naive values are treated as UTC)
+
+        Returns:
+            Signed token string
+        """
+        expires_epoch = int(_as_utc(expires_at).timestamp())
+        payload = _b64encode(
+            json.dumps([user_id, username, session_id, expires_epoch], separators=(",", ":")).encode(
+                "utf-8"
+            )
+        )
+        return f"{TOKEN_PREFIX}{payload}.{self._sign(payload)}"
+
+    def decode(self, token: str) -> Optional[TokenClaims]:
+        """
+        Check the signature and return the claims, ignoring expiry.
+
+        Args:
+            token: Token string
+
+        Returns:
+            TokenClaims, or None if the token is malformed or forged
+        """
+        if not is_session_token(token):
+            return None
+
+        try:
+            payload, signature = token[len(TOKEN_PREFIX):].split(".", 1)
+        except ValueError:
+            return None
+
+        if not hmac.compare_digest(self._sign(payload), signature):
+            return None
+
+        try:
+            user_id, username, session_id, expires_epoch = json.loads(_b64decode(payload))
+            return TokenClaims(
+                user_id=int(user_id),
+                username=str(username),
+                session_id=str(session_id),
+                expires_at=int(expires_epoch),
+            )
+        except (ValueError, TypeError):
+            return None
+
+    def verify(self, token: str, now: Optional[float] = None) -> Optional[TokenClaims]:
+        """
+        Check the signature and expiry.
+
+        Args:
+            token: Token string
+            now: Current Unix time (default: time.time())
+
+        Returns:
+            TokenClaims, or None if invalid or expired
+        """
+        claims = self.decode(token)
+        if claims is None:
+            return None
+        if (time.time() if now is None else now) >= claims.expires_at:
+            return None
+        return claims
+
+
+class RevocationSet:
+    """
+    Thread-safe set of revoked session ids.
+
+    Each entry is kept only until the revoked session would have expired,
+    so the set never grows beyond the sessions revoked within one session
+    lifetime (30 days for remember-me).
+    """
+
+    def __init__(self):
+        """Initialize an empty revocation set."""
+        self._revoked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self.last_refresh: Optional[float] = None
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def add(self, session_id: str, expires_at: datetime) -> None:
+        """Mark a session as revoked until its expiry."""
+        with self._lock:
+            self._revoked[session_id] = _as_utc(expires_at).timestamp()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop entries whose sessions have expired; returns the number removed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [sid for sid, expires in self._revoked.items() if expires <= now]
+            for session_id in expired:
+                del self._revoked[session_id]
+        return len(expired)
+
+    def refresh(self, db: Session) -> int:
+        """
+        Load revocations recorded since the last refresh.
+
+        The first call loads every unexpired revocation.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of rows read
+        """
+        now = datetime.now(timezone.utc)
+        query = select(
+            SessionRevocation.session_id,
+            SessionRevocation.revoked_at,
+            SessionRevocation.expires_at,
+        ).where(SessionRevocation.expires_at > now)
+        if self._watermark is not None:
+            query = query.where(SessionRevocation.revoked_at >= self._watermark - REFRESH_OVERLAP)
+
+        rows = db.execute(query).all()
+        newest = self._watermark
+        for session_id, revoked_at, expires_at in rows:
+            self.add(session_id, expires_at)
+            revoked_at = _as_utc(revoked_at)
+            if newest is None or revoked_at > newest:
+                newest = revoked_at
+
+        self._watermark = newest or now
+        self.last_refresh = time.monotonic()
+        self.prune()
+        return len(rows)
+
+
+class SessionTokenService:
+    """
+    Signed token issuing and DB-free verification.
+
+    Attributes:
+        signer: SessionTokenSigner
+        revocations: RevocationSet mirrored from session_revocations
+        refresh_interval: Seconds between incremental refreshes (default: 5)
+        is_running: Flag indicating if the refresh task is active
+    """
+
+    # Expired revocation rows are deleted at most this often
+    PURGE_INTERVAL_SECONDS = 3600
+
+    def __init__(
+        self,
+        secret: bytes,
+        refresh_interval: float = 5.0,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        """
+        Initialize session token service.
+
+        Args:
+            secret: HMAC key
+            refresh_interval: Seconds between revocation refreshes
+            session_factory: Callable returning a new database session
+                (defaults to backend.models.base.SessionLocal)
+        """
+        self.signer = SessionTokenSigner(secret)
+        self.revocations = RevocationSet()
+        self.refresh_interval = refresh_interval
+        self._session_factory = session_factory
+        self._last_purge = 0.0
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from backend.models.base import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def issue(self, user_id: int, username: str, session_id: str, expires_at: datetime) -> str:
+        """Issue a signed token for an existing session row."""
+        return self.signer.issue(user_id, username, session_id, expires_at)
+
+    def verify(self, token: str) -> Optional[TokenClaims]:
+        """
+        Verify signature, expiry and revocation without touching the database.
+
+        Args:
+            token: Token string
+
+        Returns:
+            TokenClaims, or None if the token must be rejected
+        """
+        claims = self.signer.verify(token)
+        if claims is None or claims.session_id in self.revocations:
+            return None
+        return claims
+
+    def resolve_session_id(self, value: str) -> str:
+        """
+        Map a credential to the session id stored in the sessions table.
+
+        Correctly signed tokens (expired or not) resolve to their session id;
+        anything else is returned unchanged.
+        """
+        claims = self.signer.decode(value)
+        return claims.session_id if claims is not None else value
+
+    def record_revocations(
+        self, connection: Any, sessions: Iterable[Tuple[str, int, datetime]]
+    ) -> int:
+        """
+        Record revoked sessions in the caller's transaction.
+
+        Args:
+            connection: SQLAlchemy Session or Connection (caller commits)
+            sessions: (session_id, user_id, expires_at) tuples
+
+        Returns:
+            Number of sessions recorded
+        """
+        revoked_at = datetime.now(timezone.utc)
+        params = []
+        for session_id, user_id, expires_at in sessions:
+            expires_at = _as_utc(expires_at)
+            if expires_at <= revoked_at:
+                continue
+            self.revocations.add(session_id, expires_at)
+            params.append(
+                {
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "revoked_at": revoked_at,
+                    "expires_at": expires_at,
+                }
+            )
+
+        for row in params:
+            connection.execute(_INSERT_REVOCATION, row)
+        return len(params)
+
+    def revoke_user(self, connection: Any, user_id: int, except_session_id: Optional[str] = None) -> int:
+        """
+        Record revocations for a user's current sessions.
+
+        Must run before the sessions are deleted, in the same transaction.
+
+        Args:
+            connection: SQLAlchemy Session or Connection (caller commits)
+            user_id: User ID
+            except_session_id: Optional session to keep (current session)
+
+        Returns:
+            Number of sessions recorded
+        """
+        query = select(SessionModel.id, SessionModel.user_id, SessionModel.expires_at).where(
+            SessionModel.user_id == user_id
+        )
+        if except_session_id:
+            query = query.where(SessionModel.id != except_session_id)
+        return self.record_revocations(connection, connection.execute(query).all())
+
+    def refresh(self) -> int:
+        """Pull new revocations from the database; purge expired rows occasionally."""
+        db = self._new_session()
+        try:
+            count = self.revocations.refresh(db)
+            if time.monotonic() - self._last_purge >= self.PURGE_INTERVAL_SECONDS:
+                self.purge_expired(db)
+            return count
+        finally:
+            db.close()
+
+    def purge_expired(self, db: Session) -> int:
+        """
+        Delete revocation rows whose sessions have expired.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = (
+            db.query(SessionRevocation)
+            .filter(SessionRevocation.expires_at <= datetime.now(timezone.utc))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        self._last_purge = time.monotonic()
+        return deleted
+
+    def start(self) -> None:
+        """
+        Load all revocations, then refresh incrementally in the background.
+
+        The initial load is synchronous so a freshly started worker never
+        accepts a revoked token.
+        """
+        if self.is_running:
+            logger.warning("SessionTokenService is already running")
+            return
+
+        self.refresh()
+        self.is_running = True
+        logger.info(
+            "Starting SessionTokenService (%d active revocations)", len(self.revocations)
+        )
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background refresh task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped SessionTokenService")
+
+    async def _run_scheduler(self) -> None:
+        """Refresh the revocation set every refresh_interval seconds until stopped."""
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.refresh_interval)
+                if self.is_running:
+                    await asyncio.to_thread(self.refresh)
+            except asyncio.CancelledError:
+                logger.info("Session revocation refresh task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error refreshing session revocations: {str(error)}", exc_info=True)
+                continue
+
+
+# ===== SINGLETON =====
+
+_session_token_service: Optional[SessionTokenService] = None
+_session_token_service_loaded = False
+
+
+def get_session_token_mode() -> str:
+    """What login issues: "database" (default) or "signed"."""
+    mode = os.getenv("SESSION_TOKEN_MODE", TOKEN_MODE_DATABASE).strip().lower()
+    return TOKEN_MODE_SIGNED if mode == TOKEN_MODE_SIGNED else TOKEN_MODE_DATABASE
+
+
+def get_session_token_service() -> Optional[SessionTokenService]:
+    """
+    Get the process-wide token service.
+
+    Returns:
+        SessionTokenService, or None when SESSION_TOKEN_SECRET is not set
+    """
+    global _session_token_service, _session_token_service_loaded
+
+    if not _session_token_service_loaded:
+        secret = os.getenv("SESSION_TOKEN_SECRET")
+        if secret:
+            if len(secret) < 32:
+                logger.warning("SESSION_TOKEN_SECRET is shorter than 32 characters")
+            _session_token_service = SessionTokenService(secret.encode("utf-8"))
+        _session_token_service_loaded = True
+
+    return _session_token_service
+
+
+def resolve_session_id(value: str) -> str:
+    """Session id behind a bearer credential (token or plain session UUID)."""
+    service = get_session_token_service()
+    if service is None or not is_session_token(value):
+        return value
+    return service.resolve_session_id(value)
+
+
+# ===== ORM REVOCATION HOOKS =====
+
+@event.listens_for(SessionModel, "after_delete")
+def _revoke_deleted_session(_mapper, connection, target) -> None:
+    """Record sessions deleted through the ORM (logout)."""
+    service = get_session_token_service()
+    if service is not None:
+        service.record_revocations(connection, [(target.id, target.user_id, target.expires_at)])
+
+
+@event.listens_for(User, "after_update")
+def _revoke_changed_user(_mapper, connection, target) -> None:
+    """Revoke a user's tokens when their password changes or they are deactivated."""
+    service = get_session_token_service()
+    if service is None:
+        return
+
+    state = inspect(target)
+    deactivated = state.attrs["is_active"].history.has_changes() and not target.is_active
+    if deactivated or state.attrs["password_hash"].history.has_changes():
+        service.revoke_user(connection, target.id)
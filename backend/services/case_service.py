@@ -21,7 +21,7 @@ Security:
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, func
 from fastapi import HTTPException
 import json
 
@@ -609,20 +609,27 @@ class CaseService:
             Dictionary with total cases and status breakdown
         """
         try:
-            cases = self.db.query(Case).filter(Case.user_id == user_id).all()
+            rows = (
+                self.db.query(Case.status, func.count(Case.id))
+                .filter(Case.user_id == user_id)
+                .group_by(Case.status)
+                .all()
+            )
 
             status_counts = {"active": 0, "closed": 0, "pending": 0}
+            total_cases = 0
 
-            for case in cases:
+            for case_status, count in rows:
                 status_key = (
-                    case.status.value
-                    if isinstance(case.status, CaseStatus)
-                    else case.status
+                    case_status.value
+                    if isinstance(case_status, CaseStatus)
+                    else case_status
                 )
+                total_cases += count
                 if status_key in status_counts:
-                    status_counts[status_key] += 1
+                    status_counts[status_key] += count
 
-            return {"total_cases": len(cases), "status_counts": status_counts}
+            return {"total_cases": total_cases, "status_counts": status_counts}
 
         except Exception as error:
             raise DatabaseError(f"Failed to get case statistics: {str(error)}")
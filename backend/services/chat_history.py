@@ -0,0 +1,256 @@
+"""
+Token-budgeted conversation history for AI chat.
+
+Sending every message of a conversation on every turn makes long chats
+slower and more expensive per turn until they overflow the model context.
+Instead each request gets:
+- The system prompt, extended with a rolling summary of older turns
+  (stored on the Conversation row)
+- The most recent turns verbatim, newest first until the token budget is used
+- The new user message
+
+Older turns are folded into the summary in batches: once more than 2 x N
+turns are unsummarized, all but the last N are summarized together. The
+summary is therefore rewritten once every N turns, and each turn reads at
+most 2 x N turns from the database regardless of conversation length.
+
+Usage:
+    from backend.services.chat_history import (
+        build_history_messages, get_history_turns, make_ai_summarizer,
+    )
+
+    turns = get_history_turns()
+    history = await chat_service.load_recent_history(
+        conversation_id, user_id, max_messages=max_loaded_messages(turns)
+    )
+    messages = build_history_messages(system_prompt, history, user_message)
+    ...
+    await chat_service.update_rolling_summary(
+        conversation_id, make_ai_summarizer(ai_service), keep_messages=2 * turns
+    )
+"""
+
+import logging
+import os
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from backend.services.ai.models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_TURNS = 6
+DEFAULT_HISTORY_TOKEN_BUDGET = 4000
+DEFAULT_SUMMARY_MAX_TOKENS = 600
+
+# Rough English average for BPE tokenizers; providers differ, so budgets
+# are estimates with headroom rather than exact limits
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Longest excerpt of one message kept by the extractive fallback summary
+EXTRACT_MAX_TOKENS = 60
+
+SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation between a user and a UK legal "
+    "information assistant. Update the summary with the new messages. Keep facts the "
+    "user shared (names, dates, amounts, deadlines, case details), questions asked and "
+    "guidance given. Drop pleasantries. Write plain prose of at most {max_words} words "
+    "and reply with the summary only."
+)
+
+# (previous summary, messages to fold in) -> new summary
+Summarizer = Callable[[Optional[str], Sequence], Awaitable[str]]
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def get_history_turns() -> int:
+    """
+    Get the number of recent turns always sent verbatim.
+
+    Environment:
+        CHAT_HISTORY_TURNS: User/assistant turns kept verbatim (default: 6)
+    """
+    return _env_int("CHAT_HISTORY_TURNS", DEFAULT_HISTORY_TURNS, 1)
+
+
+def get_history_token_budget() -> int:
+    """
+    Get the token budget for conversation history per request.
+
+    Environment:
+        CHAT_HISTORY_TOKEN_BUDGET: Estimated tokens for summary + recent turns (default: 4000)
+    """
+    return _env_int("CHAT_HISTORY_TOKEN_BUDGET", DEFAULT_HISTORY_TOKEN_BUDGET, 0)
+
+
+def get_summary_max_tokens() -> int:
+    """
+    Get the maximum size of the rolling summary.
+
+    Environment:
+        CHAT_SUMMARY_MAX_TOKENS: Estimated tokens kept in the summary (default: 600)
+    """
+    return _env_int("CHAT_SUMMARY_MAX_TOKENS", DEFAULT_SUMMARY_MAX_TOKENS, 50)
+
+
+def max_loaded_messages(turns: int) -> int:
+    """Most messages loaded per turn: the unsummarized tail is at most 2 x N turns."""
+    return 4 * turns
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimate the token count of a text (about 4 characters per token)."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def message_tokens(message) -> int:
+    """Token estimate of a stored message, preferring its recorded token_count."""
+    token_count = getattr(message, "token_count", None)
+    if token_count is None:
+        token_count = estimate_tokens(message.content)
+    return token_count + MESSAGE_OVERHEAD_TOKENS
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens, at a word boundary where possible."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    last_space = cut.rfind(" ")
+    if last_space > max_chars // 2:
+        cut = cut[:last_space]
+    return cut.rstrip() + "..."
+
+
+def build_history_messages(
+    system_prompt: str,
+    history,
+    user_message: str,
+    token_budget: Optional[int] = None,
+) -> List[ChatMessage]:
+    """
+    Build the provider message list for one turn.
+
+    The summary is appended to the system prompt (some providers accept a
+    single system message only). Recent messages are added newest first
+    while they fit the budget left after the summary.
+
+    Args:
+        system_prompt: Base system prompt (may include RAG context)
+        history: ConversationHistoryResponse, or None for a new conversation
+        user_message: The new user message
+        token_budget: Tokens for summary + recent messages (default: CHAT_HISTORY_TOKEN_BUDGET)
+
+    Returns:
+        System message, recent history oldest first, then the user message
+    """
+    if token_budget is None:
+        token_budget = get_history_token_budget()
+
+    summary = history.summary if history is not None else None
+    recent = list(history.messages) if history is not None else []
+
+    if summary:
+        system_prompt = f"{system_prompt}\n\n{SUMMARY_HEADER}\n{summary}"
+        token_budget -= estimate_tokens(summary)
+
+    kept: List[ChatMessage] = []
+    for message in reversed(recent):
+        cost = message_tokens(message)
+        if cost > token_budget:
+            break
+        token_budget -= cost
+        kept.append(ChatMessage(role=message.role, content=message.content))
+    kept.reverse()
+
+    # A dangling assistant reply without its question confuses some models
+    while kept and kept[0].role == "assistant":
+        kept.pop(0)
+
+    if len(kept) < len(recent):
+        logger.debug(
+            f"History trimmed to {len(kept)} of {len(recent)} recent messages by token budget"
+        )
+
+    return (
+        [ChatMessage(role="system", content=system_prompt)]
+        + kept
+        + [ChatMessage(role="user", content=user_message)]
+    )
+
+
+# ===== SUMMARIZERS =====
+
+def extractive_summary(
+    previous_summary: Optional[str], messages: Sequence, max_tokens: Optional[int] = None
+) -> str:
+    """
+    Summary without a model call: one shortened line per message.
+
+    Oldest lines are dropped once the summary exceeds max_tokens. Used when
+    the AI provider is unavailable so the history stays bounded anyway.
+    """
+    if max_tokens is None:
+        max_tokens = get_summary_max_tokens()
+
+    lines = previous_summary.splitlines() if previous_summary else []
+    for message in messages:
+        speaker = "User" if message.role == "user" else "Assistant"
+        excerpt = " ".join(message.content.split())
+        lines.append(f"{speaker}: {truncate_to_tokens(excerpt, EXTRACT_MAX_TOKENS)}")
+
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return truncate_to_tokens("\n".join(lines), max_tokens)
+
+
+def make_ai_summarizer(ai_service, max_tokens: Optional[int] = None) -> Summarizer:
+    """
+    Create a summarizer that asks the chat model to update the summary.
+
+    Falls back to extractive_summary() if the provider call fails.
+
+    Args:
+        ai_service: Service with an async chat(messages) -> str method
+        max_tokens: Summary size limit (default: CHAT_SUMMARY_MAX_TOKENS)
+    """
+    if max_tokens is None:
+        max_tokens = get_summary_max_tokens()
+
+    async def summarize(previous_summary: Optional[str], messages: Sequence) -> str:
+        transcript = "\n\n".join(
+            f"{'User' if m.role == 'user' else 'Assistant'}: {m.content}" for m in messages
+        )
+        prompt = (
+            f"Current summary:\n{previous_summary or '(none)'}\n\n"
+            f"New messages:\n{transcript}"
+        )
+        try:
+            summary = await ai_service.chat([
+                ChatMessage(
+                    role="system",
+                    content=SUMMARY_SYSTEM_PROMPT.format(max_words=max_tokens * 3 // 4),
+                ),
+                ChatMessage(role="user", content=prompt),
+            ])
+        except Exception as exc:
+            logger.warning(f"AI summary failed, using extractive summary: {exc}")
+            return extractive_summary(previous_summary, messages, max_tokens)
+
+        summary = (summary or "").strip()
+        if not summary:
+            return extractive_summary(previous_summary, messages, max_tokens)
+        return truncate_to_tokens(summary, max_tokens)
+
+    return summarize
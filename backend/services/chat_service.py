@@ -6,6 +6,7 @@ Features:
 - Full conversation CRUD operations with user ownership verification
 - Message management with thinking content support
 - Conversation history retrieval and loading
+- Bounded AI history: recent messages plus a rolling summary of older ones
 - User isolation (users can only access their own conversations)
 - Optional field-level encryption for sensitive messages
 - Comprehensive audit logging for all operations
@@ -18,7 +19,7 @@ Security:
 - All security events audited
 """
 
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Awaitable, Callable, Sequence
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -95,6 +96,16 @@ class ConversationWithMessagesResponse(ConversationResponse):
 
     model_config = ConfigDict(from_attributes=True)
 
+class ConversationHistoryResponse(BaseModel):
+    """Rolling summary plus the most recent messages not folded into it."""
+
+    conversation_id: int
+    summary: Optional[str] = None
+    summary_message_id: Optional[int] = None
+    messages: List[MessageResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
 class StartConversationInput(BaseModel):
     """Input model for starting a new conversation with first message."""
 
@@ -399,6 +410,137 @@ class ChatService:
 
         return ConversationWithMessagesResponse(**response_data)
 
+    def _unsummarized_messages(self, conversation: Conversation):
+        """Query for messages newer than the conversation's rolling summary."""
+        query = self.db.query(Message).filter(Message.conversation_id == conversation.id)
+        if conversation.summary_message_id is not None:
+            query = query.filter(Message.id > conversation.summary_message_id)
+        return query
+
+    async def load_recent_history(
+        self, conversation_id: int, user_id: int, max_messages: int
+    ) -> ConversationHistoryResponse:
+        """
+        Load the rolling summary and the latest messages not covered by it.
+        Used to build AI prompts; reads at most max_messages rows however
+        long the conversation is.
+
+        Args:
+            conversation_id: Conversation ID to load
+            user_id: User ID making the request
+            max_messages: Maximum number of recent messages to load
+
+        Returns:
+            Summary and recent messages (oldest first)
+
+        Raises:
+            ConversationNotFoundError: If conversation doesn't exist
+            HTTPException: 403 if user doesn't own the conversation
+        """
+        conversation = (
+            self.db.query(Conversation).filter(Conversation.id == conversation_id).first()
+        )
+
+        if not conversation:
+            raise ConversationNotFoundError(f"Conversation with ID {conversation_id} not found")
+
+        # Verify ownership
+        self._verify_ownership(conversation, user_id)
+
+        messages = (
+            self._unsummarized_messages(conversation)
+            .order_by(Message.id.desc())
+            .limit(max_messages)
+            .all()
+        )
+        messages.reverse()
+
+        return ConversationHistoryResponse(
+            conversation_id=conversation.id,
+            summary=conversation.summary,
+            summary_message_id=conversation.summary_message_id,
+            messages=[MessageResponse.model_validate(msg) for msg in messages],
+        )
+
+    async def update_rolling_summary(
+        self,
+        conversation_id: int,
+        summarize: Callable[[Optional[str], Sequence[MessageResponse]], Awaitable[str]],
+        keep_messages: int,
+    ) -> bool:
+        """
+        Fold older messages into the conversation's rolling summary.
+
+        Runs only once more than 2 x keep_messages messages are unsummarized,
+        then summarizes all but the last keep_messages (at most
+        2 x keep_messages per call, so long legacy conversations catch up
+        over several turns instead of in one huge request).
+
+        Args:
+            conversation_id: Conversation ID
+            summarize: Async (previous summary, messages) -> new summary
+            keep_messages: Recent messages that stay verbatim
+
+        Returns:
+            True if the summary was updated
+
+        Raises:
+            ConversationNotFoundError: If conversation doesn't exist
+            DatabaseError: If saving the summary fails
+        """
+        conversation = (
+            self.db.query(Conversation).filter(Conversation.id == conversation_id).first()
+        )
+
+        if not conversation:
+            raise ConversationNotFoundError(f"Conversation with ID {conversation_id} not found")
+
+        unsummarized = self._unsummarized_messages(conversation).count()
+        if unsummarized <= 2 * keep_messages:
+            return False
+
+        fold_count = min(unsummarized - keep_messages, 2 * keep_messages)
+        messages = [
+            MessageResponse.model_validate(msg)
+            for msg in self._unsummarized_messages(conversation)
+            .order_by(Message.id.asc())
+            .limit(fold_count)
+            .all()
+        ]
+
+        summary = await summarize(conversation.summary, messages)
+
+        try:
+            conversation.summary = summary
+            conversation.summary_message_id = messages[-1].id
+            self.db.commit()
+
+            self._log_audit(
+                event_type="chat.conversation.summarize",
+                user_id=conversation.user_id,
+                resource_id=str(conversation_id),
+                action="update",
+                success=True,
+                details={
+                    "messages_folded": len(messages),
+                    "summary_message_id": messages[-1].id,
+                },
+            )
+
+            return True
+
+        except Exception as error:
+            self.db.rollback()
+            self._log_audit(
+                event_type="chat.conversation.summarize",
+                user_id=conversation.user_id,
+                resource_id=str(conversation_id),
+                action="update",
+                success=False,
+                error_message=str(error),
+            )
+            raise DatabaseError(f"Failed to update conversation summary: {str(error)}")
+
     async def add_message(
         self, input_data: CreateMessageInput, user_id: Optional[int] = None
     ) -> MessageResponse:
@@ -43,30 +43,13 @@ from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 from urllib.parse import quote
 
+from backend.utils.lazy_import import is_installed, optional_import
+
 # Eyecite is the standard Python library for legal citation extraction
-# Originally developed by Free Law Project
-try:
-    from eyecite import get_citations, clean_text, annotate_citations
-    from eyecite.models import (
-        CitationBase,
-        FullCaseCitation,
-        ShortCaseCitation,
-        IdCitation,
-        SupraCitation,
-        FullLawCitation,
-    )
-
-    EYECITE_AVAILABLE = True
-except ImportError as e:
-    EYECITE_AVAILABLE = False
-    IMPORT_ERROR = str(e)
-    # Fallback types for when eyecite is not installed
-    CitationBase = None
-    FullCaseCitation = None
-    ShortCaseCitation = None
-    IdCitation = None
-    SupraCitation = None
-    FullLawCitation = None
+# Originally developed by Free Law Project. It loads its reporter database
+# on import (~0.4s), so it is imported when the first CitationService is
+# created rather than at startup.
+EYECITE_AVAILABLE = is_installed("eyecite")
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -155,7 +138,8 @@ class CitationService:
         Raises:
             ImportError: If eyecite library is not installed
         """
-        if not EYECITE_AVAILABLE:
+        self._eyecite = optional_import("eyecite") if EYECITE_AVAILABLE else None
+        if self._eyecite is None:
             logger.error(
                 "CitationService requires eyecite library. " "Install with: pip install eyecite"
             )
@@ -193,12 +177,12 @@ class CitationService:
                 return []
 
             # Clean text (remove HTML, normalize whitespace)
-            cleaned = clean_text(text, ["html", "inline_whitespace"])
+            cleaned = self._eyecite.clean_text(text, ["html", "inline_whitespace"])
 
             # Extract citations
             # Note: Python eyecite doesn't have overlapHandling parameter
             # It automatically handles overlaps by default
-            citations = get_citations(cleaned, remove_ambiguous=remove_ambiguous)
+            citations = self._eyecite.get_citations(cleaned, remove_ambiguous=remove_ambiguous)
 
             logger.info(
                 f"Extracted {len(citations)} citations from text " f"(length: {len(text)} chars)"
@@ -332,10 +316,10 @@ class CitationService:
                 return text
 
             # Clean text
-            cleaned = clean_text(text, ["html", "inline_whitespace"])
+            cleaned = self._eyecite.clean_text(text, ["html", "inline_whitespace"])
 
             # Get citations
-            citations = get_citations(cleaned)
+            citations = self._eyecite.get_citations(cleaned)
 
             if not citations:
                 return text
@@ -352,7 +336,7 @@ class CitationService:
                 annotations.append((span, before_tag, after_tag))
 
             # Apply annotations
-            return annotate_citations(cleaned, annotations)
+            return self._eyecite.annotate_citations(cleaned, annotations)
 
         except Exception as error:
             logger.error(f"Failed to highlight citations: {error}", exc_info=True)
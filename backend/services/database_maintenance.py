@@ -0,0 +1,456 @@
+"""
+Database maintenance service for SQLite storage.
+
+Replaces blocking full VACUUM runs with small, interruptible steps.
+
+Features:
+- auto_vacuum=INCREMENTAL support (new databases get it on first connect;
+  existing ones are converted by migrations/003_enable_incremental_auto_vacuum.py)
+- Background task that runs PRAGMA incremental_vacuum(N) in small steps
+  while the server is idle
+- Bounded PRAGMA optimize (analysis_limit) instead of a full ANALYZE
+- Offline VACUUM INTO compaction with integrity check and atomic file swap
+- dbstat-based per-table and per-index size report
+
+Usage:
+    from backend.services.database_maintenance import get_database_maintenance_service
+
+    maintenance = get_database_maintenance_service()
+    maintenance.start()      # idle-time incremental vacuum
+    maintenance.optimize()   # cheap planner statistics refresh
+    maintenance.stop()
+
+Offline compaction (server stopped):
+    python -m backend.services.database_maintenance compact
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+import asyncio
+import logging
+import os
+import time
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+# Rows examined per index by PRAGMA optimize; keeps ANALYZE to milliseconds
+ANALYSIS_LIMIT = 400
+
+
+def _default_idle_probe() -> float:
+    from backend.utils.performance_metrics import get_metrics_collector
+
+    return get_metrics_collector().seconds_since_last_request()
+
+
+def get_auto_vacuum_mode(connection) -> str:
+    """
+    Get the auto_vacuum mode of a SQLite connection.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        "none", "full" or "incremental"
+    """
+    value = connection.execute(text("PRAGMA auto_vacuum")).scalar()
+    return AUTO_VACUUM_MODES.get(int(value or 0), "none")
+
+
+class DatabaseMaintenanceService:
+    """
+    Non-blocking maintenance for the SQLite database.
+
+    Each incremental vacuum step frees at most ``step_pages`` pages in its own
+    short write transaction, so writers are never blocked for more than a few
+    milliseconds. The background loop only runs while the server is idle.
+
+    Attributes:
+        engine: SQLAlchemy engine for the application database
+        step_pages: Pages freed per incremental_vacuum step (default: 256)
+        idle_seconds: Seconds without requests before the server counts as idle
+        check_interval: Seconds between idle checks (default: 300)
+        step_pause: Seconds to yield between steps (default: 0.05)
+        is_running: Flag indicating if the background task is active
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        step_pages: int = 256,
+        idle_seconds: float = 30.0,
+        check_interval: int = 300,  # 5 minutes
+        step_pause: float = 0.05,
+        idle_probe: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize database maintenance service.
+
+        Args:
+            engine: SQLAlchemy engine
+            step_pages: Pages freed per step
+            idle_seconds: Idle threshold in seconds
+            check_interval: Seconds between idle checks
+            step_pause: Seconds to sleep between steps
+            idle_probe: Callable returning seconds since the last request
+                (defaults to the performance metrics collector)
+        """
+        self.engine = engine
+        self.step_pages = step_pages
+        self.idle_seconds = idle_seconds
+        self.check_interval = check_interval
+        self.step_pause = step_pause
+        self.idle_probe = idle_probe or _default_idle_probe
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        self._vacuum_lock = asyncio.Lock()
+        self.pages_reclaimed_total = 0
+        self.last_run_at: Optional[float] = None
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the engine points at a SQLite database."""
+        return self.engine.dialect.name == "sqlite"
+
+    # ===== INSPECTION =====
+
+    def get_storage_info(self) -> Dict[str, Any]:
+        """
+        Get page-level storage information.
+
+        Returns:
+            Dictionary with page size, page/freelist counts, auto_vacuum mode
+            and bytes reclaimable by incremental vacuum
+        """
+        if not self.is_sqlite:
+            return {"auto_vacuum": "unsupported"}
+
+        with self.engine.connect() as conn:
+            page_size = int(conn.execute(text("PRAGMA page_size")).scalar() or 0)
+            page_count = int(conn.execute(text("PRAGMA page_count")).scalar() or 0)
+            freelist_count = int(conn.execute(text("PRAGMA freelist_count")).scalar() or 0)
+            mode = get_auto_vacuum_mode(conn)
+
+        return {
+            "auto_vacuum": mode,
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_count": freelist_count,
+            "reclaimable_bytes": freelist_count * page_size,
+        }
+
+    def get_storage_report(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get on-disk size of every table and index from the dbstat virtual table.
+
+        Returns:
+            List of objects (largest first) with name, type, owning table,
+            pages, size and unused bytes, or None if dbstat is unavailable
+            (SQLite built without SQLITE_ENABLE_DBSTAT_VTAB)
+        """
+        if not self.is_sqlite:
+            return None
+
+        query = text(
+            """
+            SELECT s.name, COALESCE(m.type, 'table'), COALESCE(m.tbl_name, s.name),
+                   COUNT(*), SUM(s.pgsize), SUM(s.unused)
+            FROM dbstat AS s
+            LEFT JOIN sqlite_master AS m ON m.name = s.name
+            GROUP BY s.name
+            ORDER BY SUM(s.pgsize) DESC, s.name
+        """
+        )
+
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(query).fetchall()
+        except Exception as exc:
+            logger.warning(f"dbstat storage report unavailable: {str(exc)}")
+            return None
+
+        return [
+            {
+                "name": name,
+                "type": object_type,
+                "table": table_name,
+                "pages": int(pages or 0),
+                "size_bytes": int(size or 0),
+                "unused_bytes": int(unused or 0),
+            }
+            for name, object_type, table_name, pages, size, unused in rows
+        ]
+
+    def is_idle(self) -> bool:
+        """Whether no request has completed within the idle threshold."""
+        try:
+            return self.idle_probe() >= self.idle_seconds
+        except Exception:
+            return False
+
+    # ===== OPERATIONS =====
+
+    def optimize(self) -> None:
+        """
+        Refresh query planner statistics with a bounded PRAGMA optimize.
+
+        Unlike ANALYZE, this only re-analyzes tables whose statistics are
+        stale and samples at most ANALYSIS_LIMIT rows per index.
+        """
+        if not self.is_sqlite:
+            return
+
+        with self.engine.connect() as conn:
+            conn.execute(text(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}"))
+            conn.execute(text("PRAGMA optimize"))
+            conn.commit()
+
+    def incremental_vacuum_step(self, pages: Optional[int] = None) -> int:
+        """
+        Free up to ``pages`` pages from the freelist in one short transaction.
+
+        Args:
+            pages: Maximum pages to free (default: step_pages)
+
+        Returns:
+            Number of pages actually freed
+        """
+        if not self.is_sqlite:
+            return 0
+
+        pages = pages or self.step_pages
+        with self.engine.connect() as conn:
+            if get_auto_vacuum_mode(conn) != "incremental":
+                return 0
+
+            before = int(conn.execute(text("PRAGMA freelist_count")).scalar() or 0)
+            if before == 0:
+                return 0
+            conn.commit()
+
+            # sqlite3 only steps a pragma statement once unless it is run as
+            # a script, which would free a single page per call.
+            conn.connection.driver_connection.executescript(
+                f"PRAGMA incremental_vacuum({int(pages)});"
+            )
+
+            after = int(conn.execute(text("PRAGMA freelist_count")).scalar() or 0)
+            conn.commit()
+
+        freed = max(before - after, 0)
+        self.pages_reclaimed_total += freed
+        return freed
+
+    async def run_incremental_vacuum(
+        self, max_pages: Optional[int] = None, require_idle: bool = True
+    ) -> int:
+        """
+        Reclaim free pages in small steps, yielding to the event loop between them.
+
+        Args:
+            max_pages: Stop after freeing this many pages (default: all)
+            require_idle: Stop as soon as request traffic resumes
+
+        Returns:
+            Total pages freed
+        """
+        if not self.is_sqlite:
+            return 0
+
+        total = 0
+        async with self._vacuum_lock:
+            while max_pages is None or total < max_pages:
+                if require_idle and not self.is_idle():
+                    break
+
+                step = self.step_pages
+                if max_pages is not None:
+                    step = min(step, max_pages - total)
+
+                freed = await asyncio.to_thread(self.incremental_vacuum_step, step)
+                if freed == 0:
+                    break
+                total += freed
+                await asyncio.sleep(self.step_pause)
+
+        self.last_run_at = time.time()
+        if total:
+            logger.info(f"Incremental vacuum reclaimed {total} pages")
+        return total
+
+    # ===== BACKGROUND TASK =====
+
+    def start(self) -> None:
+        """
+        Start idle-time incremental vacuuming in the background.
+
+        This method is non-blocking.
+        """
+        if not self.is_sqlite:
+            return
+
+        if self.is_running:
+            logger.warning("DatabaseMaintenanceService is already running")
+            return
+
+        self.is_running = True
+        logger.info("Starting DatabaseMaintenanceService")
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped DatabaseMaintenanceService")
+
+    async def _run_scheduler(self) -> None:
+        """Check for idle periods and reclaim free pages until stopped."""
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.check_interval)
+                if self.is_running and self.is_idle():
+                    await self.run_incremental_vacuum(require_idle=True)
+            except asyncio.CancelledError:
+                logger.info("Maintenance task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error in database maintenance loop: {str(error)}", exc_info=True)
+                # Continue running even if one pass fails
+                continue
+
+
+# ===== OFFLINE COMPACTION =====
+
+def compact_database(
+    engine: Engine, db_path: str, auto_vacuum: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Compact the database with VACUUM INTO and atomically swap it in.
+
+    OFFLINE ONLY: the server (and any other process using the file) must be
+    stopped, otherwise writes made after the snapshot would be lost.
+
+    Steps:
+    1. Checkpoint and truncate the WAL
+    2. Optionally set a pending auto_vacuum mode (applied by VACUUM INTO)
+    3. VACUUM INTO a temporary file next to the database
+    4. quick_check the copy
+    5. fsync and os.replace() it over the original
+
+    Args:
+        engine: SQLAlchemy engine for the database (connection hooks, e.g.
+            the SQLCipher key, are applied to the copy as well)
+        db_path: Path of the database file
+        auto_vacuum: Optional mode to apply ("none", "full", "incremental")
+
+    Returns:
+        Dictionary with size before/after and resulting auto_vacuum mode
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError("Compaction is only supported for SQLite databases")
+    if auto_vacuum is not None and auto_vacuum not in AUTO_VACUUM_MODES.values():
+        raise ValueError(f"Invalid auto_vacuum mode: {auto_vacuum}")
+
+    path = Path(db_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Database file not found: {db_path}")
+
+    tmp_path = path.with_name(f"{path.name}.compact-{os.getpid()}")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    size_before = path.stat().st_size
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+            if auto_vacuum is not None:
+                conn.execute(text(f"PRAGMA auto_vacuum = {auto_vacuum.upper()}"))
+            conn.commit()
+
+            conn.execute(text("VACUUM INTO :target"), {"target": str(tmp_path)})
+
+            conn.execute(text("ATTACH DATABASE :target AS compacted"), {"target": str(tmp_path)})
+            try:
+                check = conn.execute(text("PRAGMA compacted.quick_check")).scalar()
+            finally:
+                conn.execute(text("DETACH DATABASE compacted"))
+
+            if check != "ok":
+                raise RuntimeError(f"Compacted copy failed quick_check: {check}")
+
+        # Close pooled handles on the old file before swapping it out
+        engine.dispose()
+
+        with open(tmp_path, "rb") as handle:
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+
+        # The old WAL/SHM belong to the replaced file
+        for suffix in ("-wal", "-shm"):
+            stale = path.with_name(path.name + suffix)
+            if stale.exists():
+                stale.unlink()
+
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    with engine.connect() as conn:
+        mode = get_auto_vacuum_mode(conn)
+
+    size_after = path.stat().st_size
+    logger.info(f"Compacted {db_path}: {size_before} -> {size_after} bytes (auto_vacuum={mode})")
+
+    return {
+        "size_before_bytes": size_before,
+        "size_after_bytes": size_after,
+        "space_reclaimed_bytes": size_before - size_after,
+        "auto_vacuum": mode,
+    }
+
+
+# ===== SINGLETON =====
+
+_maintenance_service: Optional[DatabaseMaintenanceService] = None
+
+
+def get_database_maintenance_service() -> DatabaseMaintenanceService:
+    """
+    Get the process-wide maintenance service bound to the application engine.
+
+    Returns:
+        DatabaseMaintenanceService instance
+    """
+    global _maintenance_service
+    if _maintenance_service is None:
+        from backend.models.base import engine
+
+        _maintenance_service = DatabaseMaintenanceService(engine)
+    return _maintenance_service
+
+
+if __name__ == "__main__":
+    import sys
+
+    from backend.models.base import SQLALCHEMY_DATABASE_URL, engine as app_engine
+
+    if len(sys.argv) < 2 or sys.argv[1] != "compact":
+        print("Usage: python -m backend.services.database_maintenance compact [--incremental]")
+        sys.exit(1)
+
+    target_path = SQLALCHEMY_DATABASE_URL.replace("sqlite:///", "", 1)
+    mode = "incremental" if "--incremental" in sys.argv else None
+    print(compact_database(app_engine, target_path, auto_vacuum=mode))
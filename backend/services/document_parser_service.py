@@ -26,29 +26,19 @@ Usage:
     summary = parser.extract_summary(result.text, max_words=100)
 """
 
-import importlib
 import os
 import re
 import logging
-from types import ModuleType
 from typing import Optional, Dict, Any, List
 
 from pydantic import BaseModel, Field, field_validator
 from fastapi import HTTPException
 
-# PDF parsing
-pypdf: ModuleType | None
-try:
-    pypdf = importlib.import_module("pypdf")
-except ImportError:
-    pypdf = None
+from backend.utils.lazy_import import is_installed, optional_import
 
-# Word document parsing
-docx: ModuleType | None
-try:
-    docx = importlib.import_module("docx")
-except ImportError:
-    docx = None
+# PDF and Word parsers are imported on first use (~0.1s at startup otherwise)
+PYPDF_AVAILABLE = is_installed("pypdf")
+DOCX_AVAILABLE = is_installed("docx")
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -129,9 +119,9 @@ class DocumentParserService:
         self.max_file_size = max_file_size or self.MAX_FILE_SIZE
 
         # Log warnings if dependencies are missing
-        if pypdf is None:
+        if not PYPDF_AVAILABLE:
             logger.warning("pypdf not installed - PDF parsing will fail")
-        if docx is None:
+        if not DOCX_AVAILABLE:
             logger.warning("python-docx not installed - DOCX parsing will fail")
 
     async def parse_document(
@@ -338,7 +328,7 @@ class DocumentParserService:
         Raises:
             HTTPException: If pypdf not installed or parsing fails
         """
-        if pypdf is None:
+        if not PYPDF_AVAILABLE:
             raise HTTPException(
                 status_code=500,
                 detail="PDF parsing not available (pypdf not installed)",
@@ -363,6 +353,7 @@ class DocumentParserService:
         Raises:
             HTTPException: If pypdf not installed or parsing fails
         """
+        pypdf = optional_import("pypdf")
         if pypdf is None:
             raise HTTPException(
                 status_code=500,
@@ -473,7 +464,7 @@ class DocumentParserService:
         Raises:
             HTTPException: If python-docx not installed or parsing fails
         """
-        if docx is None:
+        if not DOCX_AVAILABLE:
             raise HTTPException(
                 status_code=500,
                 detail="DOCX parsing not available (python-docx not installed)",
@@ -498,6 +489,7 @@ class DocumentParserService:
         Raises:
             HTTPException: If python-docx not installed or parsing fails
         """
+        docx = optional_import("docx")
         if docx is None:
             raise HTTPException(
                 status_code=500,
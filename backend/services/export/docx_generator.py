@@ -21,16 +21,46 @@ Python Version: 3.12+
 """
 
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 import io
+import threading
 
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
 from pydantic import BaseModel, Field, field_validator
 
+from backend.utils.tracing import trace_methods
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocxDocument
+
+# python-docx names, bound by _import_docx() when the first DOCXGenerator is
+# created (importing python-docx at startup costs ~0.1s)
+Document = Pt = WD_ALIGN_PARAGRAPH = qn = OxmlElement = None
+_import_lock = threading.Lock()
+
+# python-docx lengths are integer EMUs; the class constants below are
+# defined without importing it
+_EMU_PER_INCH = 914400
+_EMU_PER_POINT = 12700
+
+
+def _import_docx() -> None:
+    """Import the python-docx names used by DOCXGenerator into this module."""
+    global Document, Pt, WD_ALIGN_PARAGRAPH, qn, OxmlElement
+
+    # OxmlElement is bound last
+    if OxmlElement is not None:
+        return
+
+    with _import_lock:
+        if OxmlElement is not None:
+            return
+
+        from docx import Document
+        from docx.shared import Pt
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.oxml.ns import qn
+        from docx.oxml import OxmlElement
+
 # Type definitions matching TypeScript models
 
 class TimelineEvent(BaseModel):
@@ -128,6 +158,7 @@ class NotesExportData(BaseModel):
     exported_by: str
     total_notes: int
 
+@trace_methods()
 class DOCXGenerator:
     """
     DOCX document generator for legal case exports.
@@ -153,21 +184,21 @@ class DOCXGenerator:
     """
 
     # Constants for document formatting (matching TypeScript 1440 twips = 1 inch)
-    MARGIN_TOP = Inches(1)
-    MARGIN_RIGHT = Inches(1)
-    MARGIN_BOTTOM = Inches(1)
-    MARGIN_LEFT = Inches(1)
-
-    FONT_SIZE_TITLE = Pt(24)
-    FONT_SIZE_HEADING_1 = Pt(18)
-    FONT_SIZE_HEADING_2 = Pt(14)
-    FONT_SIZE_HEADING_3 = Pt(12)
-    FONT_SIZE_BODY = Pt(11)
-    FONT_SIZE_FOOTER = Pt(9)
-
-    SPACING_AFTER_TITLE = Pt(10)
-    SPACING_AFTER_HEADING = Pt(10)
-    SPACING_AFTER_PARAGRAPH = Pt(5)
+    MARGIN_TOP = 1 * _EMU_PER_INCH
+    MARGIN_RIGHT = 1 * _EMU_PER_INCH
+    MARGIN_BOTTOM = 1 * _EMU_PER_INCH
+    MARGIN_LEFT = 1 * _EMU_PER_INCH
+
+    FONT_SIZE_TITLE = 24 * _EMU_PER_POINT
+    FONT_SIZE_HEADING_1 = 18 * _EMU_PER_POINT
+    FONT_SIZE_HEADING_2 = 14 * _EMU_PER_POINT
+    FONT_SIZE_HEADING_3 = 12 * _EMU_PER_POINT
+    FONT_SIZE_BODY = 11 * _EMU_PER_POINT
+    FONT_SIZE_FOOTER = 9 * _EMU_PER_POINT
+
+    SPACING_AFTER_TITLE = 10 * _EMU_PER_POINT
+    SPACING_AFTER_HEADING = 10 * _EMU_PER_POINT
+    SPACING_AFTER_PARAGRAPH = 5 * _EMU_PER_POINT
 
     def __init__(self, audit_logger: Optional[Any] = None):
         """
@@ -176,6 +207,7 @@ class DOCXGenerator:
         Args:
             audit_logger: Optional audit logger for tracking export operations
         """
+        _import_docx()
         self.audit_logger = audit_logger
 
     async def generate_case_summary(self, case_data: CaseExportData) -> bytes:
@@ -482,7 +514,7 @@ class DOCXGenerator:
 
     # Private helper methods
 
-    def _set_margins(self, doc: Document) -> None:
+    def _set_margins(self, doc: "DocxDocument") -> None:
         """Set document margins (1 inch on all sides)."""
         sections = doc.sections
         for section in sections:
@@ -491,7 +523,7 @@ class DOCXGenerator:
             section.left_margin = self.MARGIN_LEFT
             section.right_margin = self.MARGIN_RIGHT
 
-    def _add_header(self, doc: Document, text: str) -> None:
+    def _add_header(self, doc: "DocxDocument", text: str) -> None:
         """
         Add header to document with right-aligned bold text.
 
@@ -508,7 +540,7 @@ class DOCXGenerator:
         run.bold = True
         run.font.size = self.FONT_SIZE_BODY
 
-    def _add_footer(self, doc: Document, export_info: str) -> None:
+    def _add_footer(self, doc: "DocxDocument", export_info: str) -> None:
         """
         Add footer to document with export info and page numbers (center-aligned).
 
@@ -575,7 +607,7 @@ class DOCXGenerator:
         run._r.append(fldChar2)
         run.font.size = self.FONT_SIZE_FOOTER
 
-    def _add_title(self, doc: Document, title: str) -> None:
+    def _add_title(self, doc: "DocxDocument", title: str) -> None:
         """
         Add main title (Heading 1) to document.
 
@@ -587,7 +619,7 @@ class DOCXGenerator:
         p.space_after = self.SPACING_AFTER_TITLE
         # Heading 1 is automatically bold and larger
 
-    def _add_case_info(self, doc: Document, case_data: CaseExportData) -> None:
+    def _add_case_info(self, doc: "DocxDocument", case_data: CaseExportData) -> None:
         """
         Add case information section.
 
@@ -610,7 +642,7 @@ class DOCXGenerator:
         p.add_run(f"Status: {case_data.case.status}")
         p.space_after = Pt(10)
 
-    def _add_evidence_section(self, doc: Document, evidence_list: List[Evidence]) -> None:
+    def _add_evidence_section(self, doc: "DocxDocument", evidence_list: List[Evidence]) -> None:
         """
         Add evidence inventory section.
 
@@ -645,7 +677,7 @@ class DOCXGenerator:
                     # Skip invalid dates
                     pass
 
-    def _add_timeline_section(self, doc: Document, timeline_items: List[TimelineEvent]) -> None:
+    def _add_timeline_section(self, doc: "DocxDocument", timeline_items: List[TimelineEvent]) -> None:
         """
         Add timeline section with chronological events.
 
@@ -678,7 +710,7 @@ class DOCXGenerator:
                 # Skip invalid dates
                 pass
 
-    def _add_notes_section(self, doc: Document, notes: List[Note]) -> None:
+    def _add_notes_section(self, doc: "DocxDocument", notes: List[Note]) -> None:
         """
         Add notes section with all case notes.
 
@@ -711,7 +743,7 @@ class DOCXGenerator:
                 # Skip invalid dates
                 pass
 
-    def _document_to_bytes(self, doc: Document) -> bytes:
+    def _document_to_bytes(self, doc: "DocxDocument") -> bytes:
         """
         Convert Document object to bytes buffer.
 
@@ -20,30 +20,57 @@ Author: Justice Companion Development Team
 License: MIT
 """
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
 from io import BytesIO
 import logging
+import threading
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    PageBreak,
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER
-from reportlab.pdfgen import canvas as pdf_canvas
 from pydantic import BaseModel, Field, field_validator
 
 from backend.services.audit_logger import AuditLogger
+from backend.utils.tracing import trace_methods
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# ReportLab names, bound by _import_reportlab() when the first PDFGenerator
+# is created (importing reportlab at startup costs ~80ms)
+A4 = inch = HexColor = None
+SimpleDocTemplate = Paragraph = Spacer = PageBreak = None
+getSampleStyleSheet = ParagraphStyle = TA_CENTER = None
+_import_lock = threading.Lock()
+
+
+def _import_reportlab() -> None:
+    """Import the ReportLab names used by PDFGenerator into this module."""
+    global A4, inch, HexColor, SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    global getSampleStyleSheet, ParagraphStyle, TA_CENTER
+
+    # The names are bound one by one, so test the last one; the lock keeps
+    # a concurrent first caller from seeing a partly bound set
+    if TA_CENTER is not None:
+        return
+
+    with _import_lock:
+        if TA_CENTER is not None:
+            return
+
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.lib.colors import HexColor
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            PageBreak,
+        )
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+
 # ============================================================================
 # Pydantic Models for Type Safety
 # ============================================================================
@@ -197,6 +224,7 @@ class NotesExportData(BaseModel):
 # PDF Generator Service
 # ============================================================================
 
+@trace_methods()
 class PDFGenerator:
     """
     PDF Generator service for creating formatted PDF documents.
@@ -239,6 +267,7 @@ class PDFGenerator:
         self.audit_logger = audit_logger
 
         # Create ReportLab styles
+        _import_reportlab()
         self._setup_reportlab_styles()
 
         logger.info("PDFGenerator initialized with custom styles")
@@ -1019,8 +1048,8 @@ class PDFGenerator:
 
     def _add_footer(
         self,
-        canvas: pdf_canvas.Canvas,
-        doc: SimpleDocTemplate,
+        canvas: "Canvas",
+        doc: "SimpleDocTemplate",
         export_date: datetime,
         exported_by: str,
     ) -> None:
@@ -36,6 +36,8 @@ import httpx
 from defusedxml import ElementTree as ET
 from fastapi import HTTPException
 
+from backend.utils.tracing import trace_methods
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -316,6 +318,7 @@ def get_retry_delay(attempt: int) -> float:
 # LEGAL API SERVICE CLASS
 # ============================================================================
 
+@trace_methods(include=("_fetch_with_retry",), exclude=("classify_question", "clear_cache"))
 class LegalAPIService:
     """
     Service for interacting with UK Legal APIs.
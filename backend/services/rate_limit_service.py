@@ -2,42 +2,39 @@
 Rate Limiting Service for Justice Companion
 
 This module provides rate limiting functionality to prevent brute force attacks
-and abuse of API endpoints. It implements a sliding window algorithm with
-automatic lockout and cleanup of expired entries.
+and abuse of API endpoints. Each key keeps GCRA (generic cell rate algorithm)
+state: a single "theoretical arrival time" that drains one attempt every
+window_seconds / max_attempts. Checks and increments are O(1) and never scan
+other keys.
 
 Key Features:
-- Sliding window rate limiting
+- GCRA leaky-bucket rate limiting (O(1) per check and increment)
 - Automatic account lockout on max attempts
 - Configurable limits per operation type
 - Thread-safe operations
-- Automatic cleanup of expired entries
-- In-memory storage with optional Redis support
+- Amortized expiry of idle entries (no periodic full scans)
+- In-memory storage, or a WAL-mode SQLite file shared by all workers on the
+  host (RATE_LIMIT_STORE_PATH) so limits and lockouts hold across processes
 """
 
 import logging
+import math
+import os
 import threading
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Callable, Dict, Optional, Union
 
-logger = logging.getLogger(__name__)
-
-@dataclass
-class RateLimitAttempt:
-    """
-    Represents a rate limit attempt record.
+from backend.services.rate_limit_store import (
+    MemoryRateLimitStore,
+    RateLimitState,
+    SqliteRateLimitStore,
+)
 
-    Attributes:
-        count: Number of attempts made
-        first_attempt_at: Timestamp of first attempt in current window
-        last_attempt_at: Timestamp of most recent attempt
-        locked_until: Timestamp when lock expires (None if not locked)
-    """
+logger = logging.getLogger(__name__)
 
-    count: int = 0
-    first_attempt_at: datetime = field(default_factory=datetime.now)
-    last_attempt_at: datetime = field(default_factory=datetime.now)
-    locked_until: Optional[datetime] = None
+RateLimitStore = Union[MemoryRateLimitStore, SqliteRateLimitStore]
 
 @dataclass
 class RateLimitResult:
@@ -71,13 +68,20 @@ class RateLimitConfig:
     window_seconds: int
     lock_duration_seconds: int
 
+    @property
+    def emission_interval(self) -> float:
+        """Seconds for one counted attempt to drain."""
+        return self.window_seconds / max(1, self.max_attempts)
+
 class RateLimitService:
     """
-    Thread-safe rate limiting service using sliding window algorithm.
+    Thread-safe rate limiting service using GCRA.
 
     This service tracks rate limits per user per operation and automatically
     locks accounts that exceed the maximum number of attempts within a time
-    window. It includes automatic cleanup of expired entries.
+    window. Counted attempts drain continuously (one per
+    window_seconds / max_attempts) instead of resetting at a window edge.
+    Idle entries are dropped when their deadline passes.
 
     Example:
         >>> rate_limiter = RateLimitService()
@@ -120,29 +124,35 @@ class RateLimitService:
         cleanup_interval_seconds: int = 5 * 60,  # 5 minutes
         use_redis: bool = False,
         redis_client=None,
+        clock: Callable[[], float] = time.time,
+        store: Optional[RateLimitStore] = None,
     ):
         """
         Initialize the rate limit service.
 
         Args:
-            cleanup_interval_seconds: Interval for automatic cleanup (default: 5 minutes)
+            cleanup_interval_seconds: Kept for compatibility; expiry is now
+                amortized into check_rate_limit/increment
             use_redis: Whether to use Redis for storage (default: False)
             redis_client: Redis client instance (required if use_redis=True)
+            clock: Source of epoch seconds (injectable for tests)
+            store: State storage (default: in-process MemoryRateLimitStore)
         """
-        self._attempts: Dict[str, RateLimitAttempt] = {}
-        self._lock = threading.RLock()
+        self._store: RateLimitStore = store or MemoryRateLimitStore()
+        # Limits passed to check_rate_limit, reused by increment/get_remaining
+        self._override_configs: Dict[str, RateLimitConfig] = {}
+        self._clock = clock
         self._cleanup_interval = cleanup_interval_seconds
-        self._cleanup_timer: Optional[threading.Timer] = None
         self._use_redis = use_redis
         self._redis_client = redis_client
 
         if use_redis and not redis_client:
             raise ValueError("redis_client is required when use_redis=True")
 
-        self._start_cleanup_timer()
+        storage = "sqlite" if isinstance(self._store, SqliteRateLimitStore) else "memory"
         logger.info(
-            f"RateLimitService initialized (storage={'redis' if use_redis else 'memory'}, "
-            f"cleanup_interval={cleanup_interval_seconds}s)"
+            f"RateLimitService initialized (storage={'redis' if use_redis else storage}, "
+            f"algorithm=gcra)"
         )
 
     def check_rate_limit(
@@ -158,6 +168,8 @@ class RateLimitService:
         This method checks if the user has exceeded the rate limit for the
         specified operation. If a default configuration exists for the
         operation, it will be used unless overridden by parameters.
+        Overrides are remembered for later increment/get_remaining calls on
+        the same operation.
 
         Args:
             user_id: User identifier
@@ -173,85 +185,77 @@ class RateLimitService:
             >>> if not result.allowed:
             ...     print(f"Try again in {result.remaining_time} seconds")
         """
-        # Get configuration
         config = self._get_config(operation, max_requests, window_seconds)
         key = self._get_key(user_id, operation)
-        now = datetime.now()
-
-        with self._lock:
-            # Clean up expired entries first
-            self._cleanup_expired_entries()
-
-            attempt = self._attempts.get(key)
+        now = self._clock()
+
+        self._store.maybe_expire(now)
+        state = self._store.get(key)
+        count = self._count(state, config, now) if state else 0
+
+        # Check if locked
+        if state and state.locked_until > now:
+            remaining_seconds = int(state.locked_until - now)
+            logger.warning(
+                f"Rate limit exceeded for user {user_id}, operation '{operation}'. "
+                f"Attempts: {count}, Lock time remaining: {remaining_seconds}s"
+            )
+            return RateLimitResult(
+                allowed=False,
+                remaining_time=remaining_seconds,
+                message=f"Too many attempts. Try again in {remaining_seconds} seconds.",
+            )
 
-            # No previous attempts
-            if not attempt:
-                return RateLimitResult(
-                    allowed=True,
-                    attempts_remaining=config.max_attempts,
-                    message="Operation allowed",
-                )
+        # No attempts left in the bucket
+        if not count:
+            return RateLimitResult(
+                allowed=True,
+                attempts_remaining=config.max_attempts,
+                message="Operation allowed",
+            )
 
-            # Check if locked
-            if attempt.locked_until and attempt.locked_until > now:
-                remaining_seconds = int((attempt.locked_until - now).total_seconds())
+        # Check if max attempts reached
+        if count >= config.max_attempts:
+            # Lock if configured
+            if config.lock_duration_seconds > 0:
+                state = self._store.update(key, lambda current: self._locked(current, now, config))
+                remaining_seconds = int(state.locked_until - now)
                 logger.warning(
-                    f"Rate limit exceeded for user {user_id}, operation '{operation}'. "
-                    f"Attempts: {attempt.count}, Lock time remaining: {remaining_seconds}s"
+                    f"Account locked for user {user_id}, operation '{operation}'. "
+                    f"Attempts: {count}, Lock duration: {remaining_seconds}s"
                 )
                 return RateLimitResult(
                     allowed=False,
                     remaining_time=remaining_seconds,
                     message=f"Too many attempts. Try again in {remaining_seconds} seconds.",
                 )
-
-            # Check if sliding window has expired
-            window_start = now - timedelta(seconds=config.window_seconds)
-            if attempt.first_attempt_at < window_start:
-                # Window expired, reset
-                del self._attempts[key]
+            else:
+                # No lockout, but deny request
                 return RateLimitResult(
-                    allowed=True,
-                    attempts_remaining=config.max_attempts,
-                    message="Operation allowed",
+                    allowed=False,
+                    remaining_time=math.ceil(
+                        state.tat - config.window_seconds + config.emission_interval - now
+                    ),
+                    message=f"Rate limit exceeded. Please try again later.",
                 )
 
-            # Check if max attempts reached
-            if attempt.count >= config.max_attempts:
-                # Lock if configured
-                if config.lock_duration_seconds > 0:
-                    attempt.locked_until = now + timedelta(seconds=config.lock_duration_seconds)
-                    logger.warning(
-                        f"Account locked for user {user_id}, operation '{operation}'. "
-                        f"Attempts: {attempt.count}, Lock duration: {config.lock_duration_seconds}s"
-                    )
-                    return RateLimitResult(
-                        allowed=False,
-                        remaining_time=config.lock_duration_seconds,
-                        message=f"Too many attempts. Try again in {config.lock_duration_seconds} seconds.",
-                    )
-                else:
-                    # No lockout, but deny request
-                    return RateLimitResult(
-                        allowed=False,
-                        message=f"Rate limit exceeded. Please try again later.",
-                    )
-
-            # Still within limits
-            attempts_remaining = config.max_attempts - attempt.count
-            return RateLimitResult(
-                allowed=True,
-                attempts_remaining=attempts_remaining,
-                message=f"Operation allowed. {attempts_remaining} attempts remaining.",
-            )
+        # Still within limits
+        attempts_remaining = config.max_attempts - count
+        return RateLimitResult(
+            allowed=True,
+            attempts_remaining=attempts_remaining,
+            message=f"Operation allowed. {attempts_remaining} attempts remaining.",
+        )
 
     def increment(self, user_id: int, operation: str) -> None:
         """
         Increment the attempt count for a user and operation.
 
         This method is called after a failed operation (e.g., failed login).
-        It updates the attempt count and may trigger a lockout if the maximum
-        number of attempts is exceeded.
+        It adds one emission interval to the key's theoretical arrival time
+        (capped at a full window) and may trigger a lockout if the maximum
+        number of attempts is reached. The read-modify-write is atomic in
+        the store, so concurrent workers cannot lose increments.
 
         Args:
             user_id: User identifier
@@ -262,59 +266,41 @@ class RateLimitService:
         """
         config = self._get_config(operation)
         key = self._get_key(user_id, operation)
-        now = datetime.now()
-
-        with self._lock:
-            attempt = self._attempts.get(key)
-
-            if not attempt:
-                # First failed attempt
-                attempt = RateLimitAttempt(
-                    count=1,
-                    first_attempt_at=now,
-                    last_attempt_at=now,
-                    locked_until=None,
-                )
-                self._attempts[key] = attempt
-                logger.debug(
-                    f"First failed attempt recorded for user {user_id}, operation '{operation}'"
-                )
-                return
+        now = self._clock()
+        outcome = {}
+
+        def apply(state: Optional[RateLimitState]) -> Optional[RateLimitState]:
+            if state is None:
+                state = RateLimitState()
+            elif state.locked_until > now:
+                # If already locked, don't increment further
+                outcome["locked"] = True
+                return None
 
-            # If already locked, don't increment further
-            if attempt.locked_until and attempt.locked_until > now:
-                attempt.last_attempt_at = now
-                logger.debug(
-                    f"Attempt on locked account for user {user_id}, operation '{operation}'"
-                )
-                return
-
-            # Check if we're still within the sliding window
-            window_start = now - timedelta(seconds=config.window_seconds)
-
-            if attempt.first_attempt_at < window_start:
-                # Reset if outside window
-                attempt.count = 1
-                attempt.first_attempt_at = now
-                attempt.last_attempt_at = now
-                attempt.locked_until = None
-                logger.debug(
-                    f"Window expired, reset attempts for user {user_id}, operation '{operation}'"
-                )
-            else:
-                # Increment count only if not at max
-                if attempt.count < config.max_attempts:
-                    attempt.count += 1
-                attempt.last_attempt_at = now
-
-                # Lock if max attempts reached
-                if attempt.count >= config.max_attempts and not attempt.locked_until:
-                    if config.lock_duration_seconds > 0:
-                        attempt.locked_until = now + timedelta(seconds=config.lock_duration_seconds)
-                        logger.error(
-                            f"RATE LIMIT EXCEEDED for user {user_id}, operation '{operation}'. "
-                            f"Account locked for {config.lock_duration_seconds}s"
-                        )
+            state.tat = min(
+                max(state.tat, now) + config.emission_interval,
+                now + config.window_seconds,
+            )
+
+            # Lock if max attempts reached
+            if (
+                self._count(state, config, now) >= config.max_attempts
+                and config.lock_duration_seconds > 0
+            ):
+                state.locked_until = now + config.lock_duration_seconds
+                outcome["locked_now"] = True
+            return state
+
+        self._store.maybe_expire(now)
+        self._store.update(key, apply)
+
+        if outcome.get("locked"):
+            logger.debug(f"Attempt on locked account for user {user_id}, operation '{operation}'")
+        elif outcome.get("locked_now"):
+            logger.error(
+                f"RATE LIMIT EXCEEDED for user {user_id}, operation '{operation}'. "
+                f"Account locked for {config.lock_duration_seconds}s"
+            )
 
     def get_remaining(self, user_id: int, operation: str) -> int:
         """
@@ -332,21 +318,12 @@ class RateLimitService:
             >>> print(f"You have {remaining} attempts remaining")
         """
         config = self._get_config(operation)
-        key = self._get_key(user_id, operation)
-        now = datetime.now()
+        state = self._store.get(self._get_key(user_id, operation))
 
-        with self._lock:
-            attempt = self._attempts.get(key)
+        if not state:
+            return config.max_attempts
 
-            if not attempt:
-                return config.max_attempts
-
-            # Check if window has expired
-            window_start = now - timedelta(seconds=config.window_seconds)
-            if attempt.first_attempt_at < window_start:
-                return config.max_attempts
-
-            return max(0, config.max_attempts - attempt.count)
+        return max(0, config.max_attempts - self._count(state, config, self._clock()))
 
     def reset(self, user_id: int, operation: str) -> None:
         """
@@ -362,12 +339,8 @@ class RateLimitService:
         Example:
             >>> rate_limiter.reset(123, "login")
         """
-        key = self._get_key(user_id, operation)
-
-        with self._lock:
-            if key in self._attempts:
-                del self._attempts[key]
-                logger.debug(f"Rate limit reset for user {user_id}, operation '{operation}'")
+        if self._store.delete(self._get_key(user_id, operation)):
+            logger.debug(f"Rate limit reset for user {user_id}, operation '{operation}'")
 
     def is_locked(self, user_id: int, operation: str) -> bool:
         """
@@ -384,16 +357,9 @@ class RateLimitService:
             >>> if rate_limiter.is_locked(123, "login"):
             ...     print("Account is locked")
         """
-        key = self._get_key(user_id, operation)
-        now = datetime.now()
-
-        with self._lock:
-            attempt = self._attempts.get(key)
-
-            if not attempt or not attempt.locked_until:
-                return False
+        state = self._store.get(self._get_key(user_id, operation))
 
-            return attempt.locked_until > now
+        return bool(state and state.locked_until > self._clock())
 
     def get_attempt_count(self, user_id: int, operation: str) -> int:
         """
@@ -404,28 +370,19 @@ class RateLimitService:
             operation: Operation name
 
         Returns:
-            Number of attempts made in current window
+            Number of attempts still counted (not yet drained)
 
         Example:
             >>> count = rate_limiter.get_attempt_count(123, "login")
             >>> print(f"User has made {count} attempts")
         """
         config = self._get_config(operation)
-        key = self._get_key(user_id, operation)
-        now = datetime.now()
-
-        with self._lock:
-            attempt = self._attempts.get(key)
+        state = self._store.get(self._get_key(user_id, operation))
 
-            if not attempt:
-                return 0
+        if not state:
+            return 0
 
-            # Check if window has expired
-            window_start = now - timedelta(seconds=config.window_seconds)
-            if attempt.first_attempt_at < window_start:
-                return 0
-
-            return attempt.count
+        return self._count(state, config, self._clock())
 
     def get_reset_time(self, user_id: int, operation: str) -> Optional[datetime]:
         """
@@ -443,25 +400,25 @@ class RateLimitService:
             >>> if reset_time:
             ...     print(f"Limit resets at {reset_time}")
         """
-        config = self._get_config(operation)
-        key = self._get_key(user_id, operation)
-
-        with self._lock:
-            attempt = self._attempts.get(key)
+        state = self._store.get(self._get_key(user_id, operation))
+        now = self._clock()
 
-            if not attempt:
-                return None
+        if not state or state.deadline <= now:
+            return None
 
-            # If locked, return unlock time
-            if attempt.locked_until and attempt.locked_until > datetime.now():
-                return attempt.locked_until
+        # If locked, return unlock time
+        if state.locked_until > now:
+            return datetime.fromtimestamp(state.locked_until)
 
-            # Otherwise, return window expiry time
-            return attempt.first_attempt_at + timedelta(seconds=config.window_seconds)
+        # Otherwise, return the time every counted attempt has drained
+        return datetime.fromtimestamp(state.tat)
 
     def cleanup_expired(self) -> int:
         """
-        Manually trigger cleanup of expired entries.
+        Drop every entry whose deadline has passed.
+
+        Normal operations already expire entries incrementally; this drains
+        the whole backlog at once.
 
         Returns:
             Number of entries cleaned up
@@ -470,8 +427,10 @@ class RateLimitService:
             >>> cleaned = rate_limiter.cleanup_expired()
             >>> print(f"Cleaned up {cleaned} expired entries")
         """
-        with self._lock:
-            return self._cleanup_expired_entries()
+        cleaned = self._store.expire(self._clock())
+        if cleaned:
+            logger.debug(f"Cleaned up {cleaned} expired rate limit entries")
+        return cleaned
 
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -481,49 +440,34 @@ class RateLimitService:
             Dictionary with statistics:
             - total_tracked: Total number of tracked entries
             - locked_accounts: Number of currently locked accounts
-            - active_attempts: Number of entries with active attempts
+            - active_attempts: Number of entries with undrained attempts
 
         Example:
             >>> stats = rate_limiter.get_statistics()
             >>> print(f"Tracking {stats['total_tracked']} users")
         """
-        now = datetime.now()
-        locked_accounts = 0
-        active_attempts = 0
-
-        with self._lock:
-            for attempt in self._attempts.values():
-                if attempt.locked_until and attempt.locked_until > now:
-                    locked_accounts += 1
-
-                # Check if has attempts in recent window (use longest window)
-                # For simplicity, use 24 hours
-                window_start = now - timedelta(hours=24)
-                if attempt.first_attempt_at >= window_start:
-                    active_attempts += 1
-
-            return {
-                "total_tracked": len(self._attempts),
-                "locked_accounts": locked_accounts,
-                "active_attempts": active_attempts,
-            }
+        now = self._clock()
+        states = self._store.states()
+
+        return {
+            "total_tracked": len(states),
+            "locked_accounts": sum(1 for state in states if state.locked_until > now),
+            "active_attempts": sum(1 for state in states if state.tat > now),
+        }
 
     def destroy(self) -> None:
         """
-        Clean up resources and stop background timers.
+        Clean up resources.
 
         This method should be called when shutting down the service
-        to ensure proper cleanup.
+        to ensure proper cleanup. A shared store keeps its state for the
+        other workers; only this process's connections are closed.
 
         Example:
             >>> rate_limiter.destroy()
         """
-        if self._cleanup_timer:
-            self._cleanup_timer.cancel()
-            self._cleanup_timer = None
-
-        with self._lock:
-            self._attempts.clear()
+        self._store.close()
+        self._override_configs.clear()
 
         logger.info("RateLimitService destroyed")
 
@@ -540,8 +484,8 @@ class RateLimitService:
         window_seconds: Optional[int] = None,
     ) -> RateLimitConfig:
         """Get configuration for operation, with optional overrides."""
-        # Use default config if available
-        config = self.DEFAULT_CONFIGS.get(operation)
+        # Limits from an earlier check, then defaults
+        config = self._override_configs.get(operation) or self.DEFAULT_CONFIGS.get(operation)
 
         if not config:
             # Create config from parameters or use sensible defaults
@@ -551,60 +495,37 @@ class RateLimitService:
                 lock_duration_seconds=5 * 60,  # 5 minutes default
             )
 
-        # Override with explicit parameters
-        if max_requests is not None:
-            config.max_attempts = max_requests
-        if window_seconds is not None:
-            config.window_seconds = window_seconds
+        # Override with explicit parameters (copy, never mutate the defaults)
+        if max_requests is not None or window_seconds is not None:
+            config = replace(
+                config,
+                max_attempts=config.max_attempts if max_requests is None else max_requests,
+                window_seconds=config.window_seconds if window_seconds is None else window_seconds,
+            )
+            self._override_configs[operation] = config
 
         return config
 
-    def _cleanup_expired_entries(self) -> int:
-        """Clean up expired entries from memory. Must be called with lock held."""
-        now = datetime.now()
-        keys_to_delete = []
-
-        for key, attempt in self._attempts.items():
-            # Determine longest window for this entry
-            # For simplicity, use 24 hours as max window
-            max_window = timedelta(hours=24)
-            window_start = now - max_window
-
-            # Remove if:
-            # 1. Lock has expired and last attempt was long ago
-            # 2. No lock and last attempt was long ago
-            lock_expired = not attempt.locked_until or attempt.locked_until <= now
-            window_expired = attempt.last_attempt_at < window_start
-
-            if lock_expired and window_expired:
-                keys_to_delete.append(key)
-
-        # Delete expired entries
-        for key in keys_to_delete:
-            del self._attempts[key]
-
-        if keys_to_delete:
-            logger.debug(f"Cleaned up {len(keys_to_delete)} expired rate limit entries")
-
-        return len(keys_to_delete)
-
-    def _start_cleanup_timer(self) -> None:
-        """Start automatic cleanup timer."""
-        if self._cleanup_timer:
-            self._cleanup_timer.cancel()
-
-        def cleanup_task():
-            try:
-                self.cleanup_expired()
-            except Exception as exc:
-                logger.error(f"Error during rate limit cleanup: {e}")
-            finally:
-                # Schedule next cleanup
-                self._start_cleanup_timer()
-
-        self._cleanup_timer = threading.Timer(self._cleanup_interval, cleanup_task)
-        self._cleanup_timer.daemon = True
-        self._cleanup_timer.start()
+    @staticmethod
+    def _count(state: RateLimitState, config: RateLimitConfig, now: float) -> int:
+        """Attempts still counted against a key (0 once fully drained)."""
+        backlog = state.tat - now
+        if backlog <= 0:
+            return 0
+        # Tolerance keeps a just-added interval from rounding up to two
+        return min(config.max_attempts, math.ceil(backlog / config.emission_interval - 1e-9))
+
+    @staticmethod
+    def _locked(
+        state: Optional[RateLimitState], now: float, config: RateLimitConfig
+    ) -> Optional[RateLimitState]:
+        """State transition that locks a key unless another worker already did."""
+        if state is None:
+            state = RateLimitState()
+        elif state.locked_until > now:
+            return None
+        state.locked_until = now + config.lock_duration_seconds
+        return state
 
 # Singleton instance for convenience
 _rate_limit_service: Optional[RateLimitService] = None
@@ -614,6 +535,10 @@ def get_rate_limiter() -> RateLimitService:
     """
     Get singleton instance of RateLimitService.
 
+    When RATE_LIMIT_STORE_PATH is set, state lives in that SQLite file and
+    is shared by every worker process on the host; otherwise it is
+    per-process memory.
+
     Returns:
         Singleton RateLimitService instance
 
@@ -626,7 +551,10 @@ def get_rate_limiter() -> RateLimitService:
     if _rate_limit_service is None:
         with _instance_lock:
             if _rate_limit_service is None:
-                _rate_limit_service = RateLimitService()
+                store_path = os.getenv("RATE_LIMIT_STORE_PATH")
+                _rate_limit_service = RateLimitService(
+                    store=SqliteRateLimitStore(store_path) if store_path else None
+                )
 
     return _rate_limit_service
 
@@ -0,0 +1,324 @@
+"""
+Storage backends for RateLimitService.
+
+RateLimitService keeps its GCRA logic in one place and hands every
+read-modify-write to a store. Two stores are provided:
+
+- MemoryRateLimitStore: per-process dict with a deadline min-heap for
+  amortized expiry (the default; a single worker).
+- SqliteRateLimitStore: a small WAL-mode SQLite file shared by every worker
+  process on the host. Each update runs in a BEGIN IMMEDIATE transaction,
+  so concurrent increments from different workers serialize and a lockout
+  set by one worker is seen by all of them. Reads use the WAL snapshot and
+  take no lock.
+
+The shared file holds only (key, tat, locked_until, deadline) rows. It is
+separate from the application database, so rate-limit writes never contend
+with request transactions. Do not put it on a network filesystem: WAL needs
+shared memory between the processes.
+
+Configuration:
+- RATE_LIMIT_STORE_PATH: Path of the shared SQLite file (unset: in-memory)
+
+Usage:
+    from backend.services.rate_limit_store import SqliteRateLimitStore
+    from backend.services.rate_limit_service import RateLimitService
+
+    limiter = RateLimitService(store=SqliteRateLimitStore("/run/app/rate_limits.db"))
+"""
+
+import heapq
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Maximum expired heap entries drained by a single memory-store operation
+_EXPIRE_BATCH = 16
+
+@dataclass
+class RateLimitState:
+    """
+    Per-key GCRA state.
+
+    Attributes:
+        tat: Theoretical arrival time (epoch seconds). Attempts still counted
+            against the key are ceil((tat - now) / emission interval)
+        locked_until: Epoch seconds when the lock expires (0.0 if not locked)
+    """
+
+    tat: float = 0.0
+    locked_until: float = 0.0
+
+    @property
+    def deadline(self) -> float:
+        """Epoch seconds after which the state no longer affects any limit."""
+        return max(self.tat, self.locked_until)
+
+# Receives the current state (None if the key is untracked) and returns the
+# state to persist, or None to leave storage untouched
+StateUpdate = Callable[[Optional[RateLimitState]], Optional[RateLimitState]]
+
+class MemoryRateLimitStore:
+    """
+    In-process store: dict of states plus a deadline min-heap.
+
+    Each state has at most one heap entry. Entries for reset states are
+    discarded when popped. Entries whose state was extended since they were
+    pushed are re-pushed at the new deadline.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._states: Dict[str, RateLimitState] = {}
+        # (deadline, sequence, key, state); stale entries are skipped on pop
+        self._expiry_heap: List[Tuple[float, int, str, RateLimitState]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[RateLimitState]:
+        """Get the live state for a key (callers must not mutate it)."""
+        return self._states.get(key)
+
+    def update(self, key: str, apply: StateUpdate) -> Optional[RateLimitState]:
+        """
+        Atomically apply a state transition to one key.
+
+        Args:
+            key: Storage key
+            apply: Transition function (may mutate and return its argument)
+
+        Returns:
+            The persisted state, or the current state if apply returned None
+        """
+        with self._lock:
+            current = self._states.get(key)
+            updated = apply(current)
+
+            if updated is None:
+                return current
+            if updated is not current:
+                self._states[key] = updated
+                self._push(key, updated)
+            return updated
+
+    def delete(self, key: str) -> bool:
+        """Forget a key. Returns True if it was tracked."""
+        with self._lock:
+            # The heap entry becomes stale and is skipped when popped
+            return self._states.pop(key, None) is not None
+
+    def maybe_expire(self, now: float) -> int:
+        """Drop a bounded batch of due entries (O(1) when none are due)."""
+        with self._lock:
+            return self._expire(now, _EXPIRE_BATCH)
+
+    def expire(self, now: float) -> int:
+        """Drop every entry whose deadline has passed."""
+        with self._lock:
+            return self._expire(now, None)
+
+    def states(self) -> List[RateLimitState]:
+        """Snapshot of all tracked states."""
+        with self._lock:
+            return list(self._states.values())
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._states.clear()
+            self._expiry_heap.clear()
+
+    def close(self) -> None:
+        """Release the store; in-process state does not outlive it."""
+        self.clear()
+
+    def _push(self, key: str, state: RateLimitState) -> None:
+        heapq.heappush(
+            self._expiry_heap, (state.deadline, next(self._sequence), key, state)
+        )
+
+    def _expire(self, now: float, limit: Optional[int]) -> int:
+        """Pop due heap entries and drop their states. Must be called with lock held."""
+        heap = self._expiry_heap
+        removed = 0
+        popped = 0
+
+        while heap and heap[0][0] <= now and (limit is None or popped < limit):
+            _, _, key, state = heapq.heappop(heap)
+            popped += 1
+
+            if self._states.get(key) is not state:
+                continue
+            if state.deadline > now:
+                self._push(key, state)
+                continue
+
+            del self._states[key]
+            removed += 1
+
+        return removed
+
+class SqliteRateLimitStore:
+    """
+    Store shared by processes on one host through a WAL-mode SQLite file.
+
+    Attributes:
+        path: SQLite file path
+        expire_interval: Minimum seconds between expiry sweeps per process
+        expire_batch: Maximum rows deleted per sweep
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rate_limits (
+            key TEXT PRIMARY KEY,
+            tat REAL NOT NULL,
+            locked_until REAL NOT NULL,
+            deadline REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS ix_rate_limits_deadline ON rate_limits (deadline);
+    """
+
+    def __init__(
+        self,
+        path: str,
+        expire_interval: float = 1.0,
+        expire_batch: int = 500,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Initialize the shared store, creating the file and table if needed.
+
+        Args:
+            path: SQLite file path
+            expire_interval: Minimum seconds between expiry sweeps per process
+            expire_batch: Maximum rows deleted per sweep
+            busy_timeout_ms: How long a writer waits for another worker's lock
+        """
+        self.path = path
+        self.expire_interval = expire_interval
+        self.expire_batch = expire_batch
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._next_expire_at = 0.0
+
+        self._connection().executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection (sqlite3 connections are not shared)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            # WAL + NORMAL: commits skip fsync, only checkpoints sync
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[RateLimitState]:
+        """Get the current state for a key."""
+        row = self._connection().execute(
+            "SELECT tat, locked_until FROM rate_limits WHERE key = ?", (key,)
+        ).fetchone()
+        return RateLimitState(*row) if row else None
+
+    def update(self, key: str, apply: StateUpdate) -> Optional[RateLimitState]:
+        """
+        Atomically apply a state transition to one key across processes.
+
+        BEGIN IMMEDIATE takes the database write lock before reading, so two
+        workers cannot both read the old state and overwrite each other.
+
+        Args:
+            key: Storage key
+            apply: Transition function
+
+        Returns:
+            The persisted state, or the current state if apply returned None
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tat, locked_until FROM rate_limits WHERE key = ?", (key,)
+            ).fetchone()
+            current = RateLimitState(*row) if row else None
+            updated = apply(current)
+
+            if updated is not None:
+                conn.execute(
+                    """
+                    INSERT INTO rate_limits (key, tat, locked_until, deadline)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        tat = excluded.tat,
+                        locked_until = excluded.locked_until,
+                        deadline = excluded.deadline
+                    """,
+                    (key, updated.tat, updated.locked_until, updated.deadline),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        return current if updated is None else updated
+
+    def delete(self, key: str) -> bool:
+        """Forget a key. Returns True if it was tracked."""
+        cursor = self._connection().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def maybe_expire(self, now: float) -> int:
+        """Delete one batch of due rows, at most once per expire_interval."""
+        if time.monotonic() < self._next_expire_at:
+            return 0
+        self._next_expire_at = time.monotonic() + self.expire_interval
+        return self._expire(now, self.expire_batch)
+
+    def expire(self, now: float) -> int:
+        """Delete every row whose deadline has passed."""
+        return self._expire(now, -1)
+
+    def states(self) -> List[RateLimitState]:
+        """Snapshot of all tracked states."""
+        rows = self._connection().execute(
+            "SELECT tat, locked_until FROM rate_limits"
+        ).fetchall()
+        return [RateLimitState(*row) for row in rows]
+
+    def clear(self) -> None:
+        """Forget every key, for every worker."""
+        self._connection().execute("DELETE FROM rate_limits")
+
+    def close(self) -> None:
+        """Close this process's connections; shared state is kept for other workers."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _expire(self, now: float, limit: int) -> int:
+        # Subquery is a range scan on ix_rate_limits_deadline; LIMIT -1 is unbounded
+        cursor = self._connection().execute(
+            """
+            DELETE FROM rate_limits WHERE key IN (
+                SELECT key FROM rate_limits WHERE deadline <= ? LIMIT ?
+            )
+            """,
+            (now, limit),
+        )
+        return cursor.rowcount
@@ -0,0 +1,350 @@
+"""
+Pluggable full-text search backends for SearchService and SearchIndexBuilder.
+
+The search_index table is dialect-specific:
+- SQLite: FTS5 virtual table, MATCH queries ranked with bm25()
+- PostgreSQL: regular table with a generated, weighted tsvector column and a
+  GIN index, @@ queries ranked with ts_rank_cd() and excerpts from ts_headline()
+
+Both backends expose the same columns (entity_type, entity_id, user_id,
+case_id, title, content, tags, created_at and per-entity metadata), so the
+services only need the backend for the SQL that differs between engines.
+
+Usage:
+    backend = get_search_backend(db)
+    fts_query = backend.build_query("contract dispute")
+    rows = db.execute(backend.search_sql(where_clause), params).fetchall()
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Columns shared by every search_index implementation
+INDEX_COLUMNS = [
+    "entity_type",
+    "entity_id",
+    "user_id",
+    "case_id",
+    "title",
+    "content",
+    "tags",
+    "created_at",
+    "status",
+    "case_type",
+    "evidence_type",
+    "file_path",
+    "message_count",
+    "is_pinned",
+]
+
+
+def _dialect_name(bind: Any) -> str:
+    try:
+        return bind.dialect.name
+    except AttributeError:
+        return ""
+
+
+class SearchBackend(ABC):
+    """
+    Base class for search_index implementations.
+
+    Subclasses must provide the dialect-specific DDL, query syntax, ranking and
+    index maintenance. ``where_clause`` arguments are AND-ed conditions on
+    unqualified search_index columns, built by the caller with bound params.
+    """
+
+    name = "base"
+
+    # Whether a failed search statement aborts the surrounding transaction,
+    # so it must run inside a SAVEPOINT before falling back to LIKE search.
+    requires_savepoint = False
+
+    @abstractmethod
+    def build_query(self, query: str) -> str:
+        """Convert user input into the backend's query syntax (prefix matching, OR-ed terms)."""
+        pass
+
+    @abstractmethod
+    def count_sql(self, where_clause: str):
+        """SQL counting matches for ``:fts_query`` and ``where_clause``."""
+        pass
+
+    @abstractmethod
+    def search_sql(self, where_clause: str):
+        """SQL returning ranked matches with a ``rank`` column (higher |rank| is better)."""
+        pass
+
+    @abstractmethod
+    def upsert_sql(self, columns: List[str]):
+        """SQL inserting or replacing one document keyed by (entity_type, entity_id)."""
+        pass
+
+    @abstractmethod
+    def optimize(self, db: Session) -> None:
+        """Run backend-specific index maintenance."""
+        pass
+
+    @abstractmethod
+    def install(self, connection) -> None:
+        """Create the search_index table and indexes if missing."""
+        pass
+
+
+class SqliteFtsSearchBackend(SearchBackend):
+    """SQLite FTS5 backend with BM25 ranking."""
+
+    name = "sqlite_fts5"
+
+    def build_query(self, query: str) -> str:
+        """
+        Build FTS5 query from user input with prefix matching.
+
+        Example:
+            "contract dispute" -> '"contract"* OR "dispute"*'
+        """
+        # Escape special characters
+        escaped = query.replace('"', '""').strip()
+
+        # Split into terms
+        terms = [t for t in escaped.split() if t]
+
+        # Build FTS5 query with prefix matching
+        return " OR ".join([f'"{term}"*' for term in terms])
+
+    def count_sql(self, where_clause: str):
+        return text(
+            f"""
+            SELECT COUNT(*) as total
+            FROM search_index
+            WHERE search_index MATCH :fts_query
+              AND {where_clause}
+        """
+        )
+
+    def search_sql(self, where_clause: str):
+        return text(
+            f"""
+            SELECT
+                si.*,
+                bm25(search_index) AS rank
+            FROM search_index si
+            WHERE search_index MATCH :fts_query
+              AND {where_clause}
+            ORDER BY rank
+            LIMIT :limit OFFSET :offset
+        """
+        )
+
+    def upsert_sql(self, columns: List[str]):
+        return text(
+            f"""
+            INSERT OR REPLACE INTO search_index ({", ".join(columns)})
+            VALUES ({", ".join(f":{column}" for column in columns)})
+        """
+        )
+
+    def optimize(self, db: Session) -> None:
+        """Run FTS5 'rebuild' and 'optimize' commands."""
+        db.execute(text("INSERT INTO search_index(search_index) VALUES('rebuild')"))
+        db.execute(text("INSERT INTO search_index(search_index) VALUES('optimize')"))
+
+    def install(self, connection) -> None:
+        connection.execute(
+            text(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+                    {", ".join(INDEX_COLUMNS)}
+                )
+            """
+            )
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    PostgreSQL backend using a generated tsvector column and a GIN index.
+
+    Title matches are weighted above tags, and tags above body content.
+    """
+
+    name = "postgresql_tsvector"
+    requires_savepoint = True
+
+    # Text search configuration used for both documents and queries
+    config = "english"
+
+    # Normalization 32 scales ts_rank_cd into 0..1 (rank / (rank + 1))
+    rank_normalization = 32
+
+    headline_options = 'MaxFragments=1, MinWords=10, MaxWords=30, StartSel="", StopSel=""'
+
+    def build_query(self, query: str) -> str:
+        """
+        Build a to_tsquery() expression with prefix matching.
+
+        Only word characters are kept so user input can never inject
+        tsquery operators.
+
+        Example:
+            "contract dispute" -> "contract:* | dispute:*"
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            raise ValueError("Search query has no searchable terms")
+        return " | ".join(f"{term}:*" for term in terms)
+
+    def count_sql(self, where_clause: str):
+        return text(
+            f"""
+            SELECT COUNT(*) AS total
+            FROM search_index
+            WHERE document @@ to_tsquery('{self.config}', :fts_query)
+              AND {where_clause}
+        """
+        )
+
+    def search_sql(self, where_clause: str):
+        # ts_headline re-parses the document, so only run it on the page of rows
+        columns = ", ".join(f"si.{column}" for column in INDEX_COLUMNS)
+        return text(
+            f"""
+            SELECT
+                {columns},
+                si.rank,
+                ts_headline(
+                    '{self.config}', COALESCE(si.content, ''),
+                    to_tsquery('{self.config}', :fts_query),
+                    '{self.headline_options}'
+                ) AS headline
+            FROM (
+                SELECT
+                    search_index.*,
+                    ts_rank_cd(
+                        document, to_tsquery('{self.config}', :fts_query),
+                        {self.rank_normalization}
+                    ) AS rank
+                FROM search_index
+                WHERE document @@ to_tsquery('{self.config}', :fts_query)
+                  AND {where_clause}
+                ORDER BY rank DESC
+                LIMIT :limit OFFSET :offset
+            ) si
+            ORDER BY si.rank DESC
+        """
+        )
+
+    def upsert_sql(self, columns: List[str]):
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column not in ("entity_type", "entity_id")
+        )
+        return text(
+            f"""
+            INSERT INTO search_index ({", ".join(columns)})
+            VALUES ({", ".join(f":{column}" for column in columns)})
+            ON CONFLICT (entity_type, entity_id) DO UPDATE SET {updates}
+        """
+        )
+
+    def optimize(self, db: Session) -> None:
+        """Flush the GIN pending list and refresh planner statistics."""
+        db.execute(text("SELECT gin_clean_pending_list('ix_search_index_document'::regclass)"))
+        db.execute(text("ANALYZE search_index"))
+
+    def install(self, connection) -> None:
+        connection.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS search_index (
+                    id BIGSERIAL PRIMARY KEY,
+                    entity_type TEXT NOT NULL,
+                    entity_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    case_id INTEGER,
+                    title TEXT,
+                    content TEXT,
+                    tags TEXT,
+                    created_at TEXT,
+                    status TEXT,
+                    case_type TEXT,
+                    evidence_type TEXT,
+                    file_path TEXT,
+                    message_count INTEGER,
+                    is_pinned INTEGER,
+                    document tsvector GENERATED ALWAYS AS (
+                        setweight(to_tsvector('{self.config}', COALESCE(title, '')), 'A') ||
+                        setweight(to_tsvector('{self.config}', COALESCE(tags, '')), 'B') ||
+                        setweight(to_tsvector('{self.config}', COALESCE(content, '')), 'C')
+                    ) STORED,
+                    UNIQUE (entity_type, entity_id)
+                )
+            """
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_search_index_document "
+                "ON search_index USING GIN (document)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_search_index_user "
+                "ON search_index (user_id, entity_type)"
+            )
+        )
+
+
+_BACKENDS: Dict[str, SearchBackend] = {
+    "postgresql": PostgresSearchBackend(),
+    "sqlite": SqliteFtsSearchBackend(),
+}
+
+
+def get_search_backend(db: Any) -> SearchBackend:
+    """
+    Choose the search backend for a session, connection or engine.
+
+    Args:
+        db: SQLAlchemy Session, Connection or Engine
+
+    Returns:
+        Backend matching the dialect (SQLite FTS5 when it cannot be determined)
+    """
+    bind: Optional[Any] = db
+    if isinstance(db, Session):
+        try:
+            bind = db.get_bind()
+        except Exception:
+            bind = None
+
+    return _BACKENDS.get(_dialect_name(bind), _BACKENDS["sqlite"])
+
+
+def install_search_index(connection) -> None:
+    """
+    Create the search_index table for the connection's dialect if missing.
+
+    Failures are logged rather than raised so that builds without FTS5
+    (SearchService then falls back to LIKE queries) still start.
+
+    Args:
+        connection: SQLAlchemy connection
+    """
+    backend = get_search_backend(connection)
+    try:
+        # SAVEPOINT keeps a failed CREATE from aborting the caller's transaction
+        with connection.begin_nested():
+            backend.install(connection)
+    except Exception as exc:
+        logger.warning(f"Could not create search_index ({backend.name}): {str(exc)}")
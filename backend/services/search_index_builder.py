@@ -8,7 +8,8 @@ Features:
 - Incremental index updates (indexCase, indexEvidence, etc.)
 - Automatic decryption of encrypted fields during indexing
 - Tag extraction (hashtags, dates, emails, phone numbers)
-- FTS5 index optimization
+- Index optimization (FTS5 rebuild/optimize or GIN pending-list flush)
+- SQLite FTS5 or PostgreSQL tsvector index, chosen from the engine dialect
 - Index statistics and monitoring
 - Transaction safety with rollback on error
 - Comprehensive audit logging
@@ -29,17 +30,18 @@ from sqlalchemy import text
 
 from backend.services.security.encryption import EncryptionService, EncryptedData
 from backend.services.audit_logger import log_audit_event
+from backend.services.search_backends import SearchBackend, get_search_backend
 
 class SearchIndexBuilder:
     """
-    Search index builder for FTS5 full-text search.
+    Search index builder for full-text search (SQLite FTS5 or PostgreSQL tsvector).
 
     Manages the search_index table by:
     1. Rebuilding entire index from source tables
     2. Incrementally updating individual entities
     3. Extracting searchable tags from content
     4. Decrypting encrypted fields for indexing
-    5. Optimizing FTS5 index performance
+    5. Optimizing index performance
 
     Example:
         builder = SearchIndexBuilder(
@@ -71,6 +73,7 @@ class SearchIndexBuilder:
         """
         self.db = db
         self.encryption_service = encryption_service
+        self.backend: SearchBackend = get_search_backend(db)
 
     async def rebuild_index(self) -> None:
         """
@@ -269,16 +272,19 @@ class SearchIndexBuilder:
             tags = self._extract_tags(content)
 
             # Insert into search index
-            query = text(
-                """
-                INSERT OR REPLACE INTO search_index (
-                    entity_type, entity_id, user_id, case_id, title, content, tags, created_at,
-                    status, case_type
-                ) VALUES (
-                    :entity_type, :entity_id, :user_id, :case_id, :title, :content, :tags, :created_at,
-                    :status, :case_type
-                )
-            """
+            query = self.backend.upsert_sql(
+                [
+                    "entity_type",
+                    "entity_id",
+                    "user_id",
+                    "case_id",
+                    "title",
+                    "content",
+                    "tags",
+                    "created_at",
+                    "status",
+                    "case_type",
+                ]
             )
 
             self.db.execute(
@@ -340,16 +346,19 @@ class SearchIndexBuilder:
             tags = self._extract_tags(full_content)
 
             # Insert into search index
-            query = text(
-                """
-                INSERT OR REPLACE INTO search_index (
-                    entity_type, entity_id, user_id, case_id, title, content, tags, created_at,
-                    evidence_type, file_path
-                ) VALUES (
-                    :entity_type, :entity_id, :user_id, :case_id, :title, :content, :tags, :created_at,
-                    :evidence_type, :file_path
-                )
-            """
+            query = self.backend.upsert_sql(
+                [
+                    "entity_type",
+                    "entity_id",
+                    "user_id",
+                    "case_id",
+                    "title",
+                    "content",
+                    "tags",
+                    "created_at",
+                    "evidence_type",
+                    "file_path",
+                ]
             )
 
             self.db.execute(
@@ -411,16 +420,18 @@ class SearchIndexBuilder:
             tags = self._extract_tags(content)
 
             # Insert into search index
-            query = text(
-                """
-                INSERT OR REPLACE INTO search_index (
-                    entity_type, entity_id, user_id, case_id, title, content, tags, created_at,
-                    message_count
-                ) VALUES (
-                    :entity_type, :entity_id, :user_id, :case_id, :title, :content, :tags, :created_at,
-                    :message_count
-                )
-            """
+            query = self.backend.upsert_sql(
+                [
+                    "entity_type",
+                    "entity_id",
+                    "user_id",
+                    "case_id",
+                    "title",
+                    "content",
+                    "tags",
+                    "created_at",
+                    "message_count",
+                ]
             )
 
             self.db.execute(
@@ -472,16 +483,18 @@ class SearchIndexBuilder:
             tags = self._extract_tags(full_content)
 
             # Insert into search index
-            query = text(
-                """
-                INSERT OR REPLACE INTO search_index (
-                    entity_type, entity_id, user_id, case_id, title, content, tags, created_at,
-                    is_pinned
-                ) VALUES (
-                    :entity_type, :entity_id, :user_id, :case_id, :title, :content, :tags, :created_at,
-                    :is_pinned
-                )
-            """
+            query = self.backend.upsert_sql(
+                [
+                    "entity_type",
+                    "entity_id",
+                    "user_id",
+                    "case_id",
+                    "title",
+                    "content",
+                    "tags",
+                    "created_at",
+                    "is_pinned",
+                ]
             )
 
             self.db.execute(
@@ -601,20 +614,16 @@ class SearchIndexBuilder:
 
     async def optimize_index(self) -> None:
         """
-        Optimize the FTS5 search index for better performance.
+        Optimize the search index for better performance.
 
-        Runs FTS5 'rebuild' and 'optimize' commands.
+        SQLite runs FTS5 'rebuild' and 'optimize' commands; PostgreSQL
+        flushes the GIN pending list and refreshes planner statistics.
 
         Raises:
             Exception: If optimization fails
         """
         try:
-            # Rebuild FTS5 index
-            self.db.execute(text('INSERT INTO search_index(search_index) VALUES("rebuild")'))
-
-            # Optimize FTS5 index
-            self.db.execute(text('INSERT INTO search_index(search_index) VALUES("optimize")'))
-
+            self.backend.optimize(self.db)
             self.db.commit()
 
             log_audit_event(
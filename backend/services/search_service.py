@@ -4,8 +4,9 @@ Ported from src/services/SearchService.ts
 
 Provides comprehensive search functionality across all legal entities:
 - Cases, evidence, conversations, notes
-- FTS5 full-text search with BM25 ranking
-- Fallback to LIKE queries when FTS5 unavailable
+- FTS5 full-text search with BM25 ranking (SQLite)
+- tsvector/GIN full-text search with ts_rank_cd ranking (PostgreSQL)
+- Fallback to LIKE queries when the search index is unavailable
 - Saved searches with history
 - User ownership filtering for security
 """
@@ -20,6 +21,7 @@ from sqlalchemy.engine import CursorResult
 
 from backend.services.security.encryption import EncryptionService, EncryptedData
 from backend.services.audit_logger import log_audit_event
+from backend.services.search_backends import SearchBackend, get_search_backend
 
 # ===== TYPE DEFINITIONS =====
 
@@ -152,8 +154,9 @@ class SearchService:
     Full-text search service for Justice Companion.
 
     Provides comprehensive search across all legal entities with:
-    - FTS5 full-text search with BM25 ranking
-    - Fallback to LIKE queries when FTS5 unavailable
+    - Full-text search backend chosen from the engine dialect
+      (SQLite FTS5 + BM25, PostgreSQL tsvector + ts_rank_cd)
+    - Fallback to LIKE queries when the search index is unavailable
     - Encryption support for sensitive content
     - User ownership filtering for security
     - Saved searches with history
@@ -178,6 +181,7 @@ class SearchService:
         """
         self.db = db
         self.encryption_service = encryption_service
+        self.backend: SearchBackend = get_search_backend(db)
 
     def search(self, user_id: int, query: SearchQuery) -> SearchResponse:
         """
@@ -218,8 +222,8 @@ class SearchService:
             entity_types = ["case", "evidence", "conversation", "note"]
 
         try:
-            # Try FTS5 search first
-            results, total = self._search_with_fts5(
+            # Try the full-text index first
+            results, total = self._search_with_index(
                 user_id=user_id,
                 original_query=query.query,
                 filters=query.filters,
@@ -228,7 +232,7 @@ class SearchService:
                 offset=query.offset,
             )
         except Exception:
-            # Fallback to LIKE search if FTS5 fails
+            # Fallback to LIKE search if the index query fails
             results, total = self._fallback_search(
                 user_id=user_id,
                 query=query.query,
@@ -254,7 +258,7 @@ class SearchService:
             execution_time=execution_time,
         )
 
-    def _search_with_fts5(
+    def _search_with_index(
         self,
         user_id: int,
         original_query: str,
@@ -264,7 +268,10 @@ class SearchService:
         offset: int,
     ) -> Tuple[List[SearchResult], int]:
         """
-        Search using SQLite FTS5 full-text search with BM25 ranking.
+        Search using the dialect's full-text index.
+
+        SQLite uses FTS5 with BM25 ranking; PostgreSQL uses the GIN-indexed
+        tsvector column with ts_rank_cd ranking and ts_headline excerpts.
 
         Args:
             user_id: User ID for ownership filtering
@@ -278,12 +285,12 @@ class SearchService:
             Tuple of (results list, total count)
 
         Raises:
-            Exception: If FTS5 query fails (caller should fallback to LIKE)
+            Exception: If the index query fails (caller should fallback to LIKE)
         """
         results: List[SearchResult] = []
 
-        # Build FTS5 query
-        fts_query = self._build_fts_query(original_query)
+        # Build backend-specific full-text query
+        fts_query = self.backend.build_query(original_query)
 
         # Build WHERE conditions
         where_conditions = ["user_id = :user_id"]
@@ -317,38 +324,23 @@ class SearchService:
 
         where_clause = " AND ".join(where_conditions)
 
-        # Count query
-        count_query = text(
-            f"""
-            SELECT COUNT(*) as total
-            FROM search_index
-            WHERE search_index MATCH :fts_query
-              AND {where_clause}
-        """
-        )
-
-        # Search query with BM25 ranking
-        search_query = text(
-            f"""
-            SELECT
-                si.*,
-                bm25(search_index) AS rank
-            FROM search_index si
-            WHERE search_index MATCH :fts_query
-              AND {where_clause}
-            ORDER BY rank
-            LIMIT :limit OFFSET :offset
-        """
-        )
+        count_query = self.backend.count_sql(where_clause)
+        search_query = self.backend.search_sql(where_clause)
 
         params["limit"] = limit
         params["offset"] = offset
 
-        # Execute queries
-        count_result = self.db.execute(count_query, params).fetchone()
-        total = count_result[0] if count_result else 0
+        # A failed statement aborts a PostgreSQL transaction; isolate it so
+        # the LIKE fallback can still run on the same session.
+        if self.backend.requires_savepoint:
+            with self.db.begin_nested():
+                count_result = self.db.execute(count_query, params).fetchone()
+                rows = self.db.execute(search_query, params).fetchall()
+        else:
+            count_result = self.db.execute(count_query, params).fetchone()
+            rows = self.db.execute(search_query, params).fetchall()
 
-        rows = self.db.execute(search_query, params).fetchall()
+        total = count_result[0] if count_result else 0
 
         # Transform rows to SearchResult objects
         for row in rows:
@@ -372,7 +364,7 @@ class SearchService:
         offset: int,
     ) -> Tuple[List[SearchResult], int]:
         """
-        Fallback search using LIKE queries when FTS5 is not available.
+        Fallback search using LIKE queries when the search index is not available.
 
         Args:
             user_id: User ID for ownership filtering
@@ -643,7 +635,7 @@ class SearchService:
 
         Args:
             row: Database row as dictionary
-            relevance_score: BM25 rank or calculated relevance score
+            relevance_score: BM25/ts_rank_cd rank or calculated relevance score
             search_term: Original search term for excerpt generation
 
         Returns:
@@ -659,11 +651,17 @@ class SearchService:
             # Map metadata based on entity type
             metadata = self._map_metadata(row)
 
+            # Prefer the index's highlighted fragment (PostgreSQL ts_headline)
+            # unless the stored content is still encrypted
+            excerpt = row.get("headline")
+            if not excerpt or row.get("content_encrypted"):
+                excerpt = self._extract_excerpt(content, search_term)
+
             return SearchResult(
                 id=row.get("entity_id", 0),
                 type=row.get("entity_type", ""),
                 title=row.get("title", ""),
-                excerpt=self._extract_excerpt(content, search_term),
+                excerpt=excerpt,
                 relevance_score=abs(relevance_score),
                 case_id=row.get("case_id"),
                 case_title=case_title,
@@ -765,28 +763,6 @@ class SearchService:
 
         return {}
 
-    def _build_fts_query(self, query: str) -> str:
-        """
-        Build FTS5 query from user input with prefix matching.
-
-        Args:
-            query: User's search query
-
-        Returns:
-            FTS5-formatted query string
-
-        Example:
-            "contract dispute" -> '"contract"* OR "dispute"*'
-        """
-        # Escape special characters
-        escaped = query.replace('"', '""').strip()
-
-        # Split into terms
-        terms = [t for t in escaped.split() if t]
-
-        # Build FTS5 query with prefix matching
-        return " OR ".join([f'"{term}"*' for term in terms])
-
     def _extract_excerpt(self, content: str, query: str, max_length: int = 150) -> str:
         """
         Extract an excerpt from content around the query terms.
@@ -17,6 +17,8 @@ import threading
 from typing import Optional, Dict, Any, List, Union
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+from backend.utils.tracing import trace_methods
+
 class EncryptedData:
     """Encrypted data format with authentication."""
 
@@ -53,6 +55,7 @@ class EncryptedData:
             version=data["version"],
         )
 
+@trace_methods(exclude=("is_encrypted",))
 class EncryptionService:
     """
     AES-256-GCM encryption service for protecting sensitive legal data.
@@ -9,7 +9,8 @@ Ported from: src/services/ServiceContainer.ts
 Features:
 - Singleton pattern for core services
 - Type-safe service registration and resolution
-- Lazy initialization support
+- Lazy initialization support (initialize_deferred: services are built on
+  first use, keeping their construction out of application startup)
 - Thread-safe operations
 - Clear error messages for uninitialized services
 
@@ -33,7 +34,7 @@ Usage:
 """
 
 import threading
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Callable, Dict, Optional, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from backend.services.security.encryption import EncryptionService
@@ -76,7 +77,9 @@ class ServiceContainer:
             self._encryption_service: Optional["EncryptionService"] = None
             self._audit_logger: Optional["AuditLogger"] = None
             self._key_manager: Optional[Any] = None  # KeyManager type not yet defined
-            self._service_lock = threading.Lock()
+            self._factories: Dict[str, Callable[[], Any]] = {}
+            # Reentrant: a service factory may resolve other services
+            self._service_lock = threading.RLock()
             self._initialized = True
 
     def initialize(
@@ -110,7 +113,7 @@ class ServiceContainer:
         """
         with self._service_lock:
             # Check if already initialized
-            if self._encryption_service is not None or self._audit_logger is not None:
+            if self._encryption_service is not None or self._audit_logger is not None or self._factories:
                 raise ValueError(
                     "ServiceContainer is already initialized. "
                     "Call reset() first if you need to reinitialize."
@@ -127,6 +130,64 @@ class ServiceContainer:
             self._audit_logger = audit_logger
             self._key_manager = key_manager
 
+    def initialize_deferred(
+        self,
+        encryption_service: Callable[[], "EncryptionService"],
+        audit_logger: Callable[[], "AuditLogger"],
+        key_manager: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """
+        Initialize the service container with service factories.
+
+        Each factory is called once, on the first get_*() call for its
+        service, so startup does not pay for services a session never uses.
+
+        Args:
+            encryption_service: Zero-argument factory for the EncryptionService
+            audit_logger: Zero-argument factory for the AuditLogger
+            key_manager: Zero-argument factory for the KeyManager (optional)
+
+        Raises:
+            ValueError: If services are already initialized
+            TypeError: If a required factory is None
+
+        Example:
+            container.initialize_deferred(
+                encryption_service=lambda: EncryptionService(key),
+                audit_logger=lambda: AuditLogger(SessionLocal()),
+            )
+        """
+        with self._service_lock:
+            if self._encryption_service is not None or self._audit_logger is not None or self._factories:
+                raise ValueError(
+                    "ServiceContainer is already initialized. "
+                    "Call reset() first if you need to reinitialize."
+                )
+
+            if encryption_service is None:
+                raise TypeError("encryption_service cannot be None")
+            if audit_logger is None:
+                raise TypeError("audit_logger cannot be None")
+
+            self._factories = {
+                "_encryption_service": encryption_service,
+                "_audit_logger": audit_logger,
+            }
+            if key_manager is not None:
+                self._factories["_key_manager"] = key_manager
+
+    def _resolve(self, attribute: str) -> Any:
+        """Return a service, building it from its factory on first use."""
+        service = getattr(self, attribute)
+        if service is None and attribute in self._factories:
+            with self._service_lock:
+                service = getattr(self, attribute)
+                if service is None and attribute in self._factories:
+                    service = self._factories[attribute]()
+                    setattr(self, attribute, service)
+                    del self._factories[attribute]
+        return service
+
     def get_encryption_service(self) -> "EncryptionService":
         """
         Get the encryption service instance.
@@ -141,7 +202,7 @@ class ServiceContainer:
             encryption = container.get_encryption_service()
             encrypted = encryption.encrypt("sensitive data")
         """
-        if self._encryption_service is None:
+        if self._resolve("_encryption_service") is None:
             raise ServiceContainerError(
                 "ServiceContainer not initialized. "
                 "Call initialize() with encryption_service first."
@@ -166,7 +227,7 @@ class ServiceContainer:
                 action="create"
             )
         """
-        if self._audit_logger is None:
+        if self._resolve("_audit_logger") is None:
             raise ServiceContainerError(
                 "ServiceContainer not initialized. " "Call initialize() with audit_logger first."
             )
@@ -186,7 +247,7 @@ class ServiceContainer:
             key_mgr = container.get_key_manager()
             key = key_mgr.get_encryption_key()
         """
-        if self._key_manager is None:
+        if self._resolve("_key_manager") is None:
             raise ServiceContainerError(
                 "ServiceContainer not initialized. " "Call initialize() with key_manager first."
             )
@@ -197,7 +258,7 @@ class ServiceContainer:
         Check if the service container has been initialized.
 
         Returns:
-            bool: True if at least one service is registered
+            bool: True if at least one service (or service factory) is registered
 
         Example:
             if not container.is_initialized():
@@ -207,6 +268,7 @@ class ServiceContainer:
             self._encryption_service is not None
             or self._audit_logger is not None
             or self._key_manager is not None
+            or bool(self._factories)
         )
 
     def reset(self) -> None:
@@ -234,6 +296,7 @@ class ServiceContainer:
             self._encryption_service = None
             self._audit_logger = None
             self._key_manager = None
+            self._factories = {}
 
 # Module-level convenience functions (matching TypeScript API)
 
@@ -12,6 +12,10 @@ Features:
 - Calculate phase deltas and total startup time
 - Provide performance recommendations
 - Export metrics as JSON for analysis
+- Per-module import-time breakdown of a cold start, with a budget
+  (STARTUP_IMPORT_BUDGET_MS, or TEST_IMPORT_TIME_CEILING_MS in test runs
+  where it is unset) and a list of heavy modules that must stay deferred
+  (DEFERRED_MODULES); both are enforced by tests
 
 Usage:
     from backend.services.startup_metrics import startup_metrics
@@ -26,13 +30,27 @@ Usage:
 
     # Export metrics to JSON
     json_data = startup_metrics.export_metrics()
+
+    # Cold-start import breakdown (fresh interpreter)
+    timings = measure_import_times("backend.main")
+    print(format_import_report(timings))
+    violations = check_import_budget(timings)
+
+    # Or from the command line:
+    #   python -m backend.services.startup_metrics [module]
 """
 
+import os
+import re
+import subprocess
+import sys
 import time
 import json
 import logging
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass, asdict
+from pathlib import Path
 from enum import Enum
 
 # Configure logger
@@ -442,3 +460,211 @@ def export_startup_metrics() -> str:
         >>> print(json_data)
     """
     return startup_metrics.export_metrics()
+
+# ===== IMPORT TIME BREAKDOWN =====
+
+# Cold-start import budget for the application module, in milliseconds
+DEFAULT_IMPORT_TIME_BUDGET_MS = 2000
+
+# Budget the test suite enforces when STARTUP_IMPORT_BUDGET_MS is unset:
+# loose enough for slow or loaded runners, still catches an eagerly imported
+# heavy dependency or a startup regression of several seconds
+TEST_IMPORT_TIME_CEILING_MS = 3 * DEFAULT_IMPORT_TIME_BUDGET_MS
+
+# Heavy optional dependencies that services import on first use
+# (backend.utils.lazy_import); importing any of them at startup is a regression
+DEFERRED_MODULES = (
+    "eyecite",
+    "reportlab",
+    "pypdf",
+    "docx",
+    "openai",
+    "anthropic",
+    "huggingface_hub",
+)
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass
+class ModuleImportTime:
+    """Import cost of one module, as reported by python -X importtime."""
+
+    module: str
+    self_ms: float  # Time spent executing this module's own body
+    cumulative_ms: float  # Including the modules it imported first
+    depth: int  # Nesting level (0 = imported directly by the measured module)
+
+
+def get_import_time_budget_ms() -> float:
+    """
+    Get the cold-start import budget.
+
+    Environment:
+        STARTUP_IMPORT_BUDGET_MS: Budget in milliseconds (default: 2000)
+    """
+    try:
+        return float(os.getenv("STARTUP_IMPORT_BUDGET_MS", DEFAULT_IMPORT_TIME_BUDGET_MS))
+    except ValueError:
+        return float(DEFAULT_IMPORT_TIME_BUDGET_MS)
+
+
+def parse_import_times(output: str) -> List[ModuleImportTime]:
+    """
+    Parse python -X importtime output.
+
+    Args:
+        output: stderr of an interpreter run with -X importtime
+
+    Returns:
+        One entry per imported module, in import completion order
+    """
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ModuleImportTime(
+                module=module,
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=max(0, (len(indent) - 1) // 2),
+            )
+        )
+    return timings
+
+
+def measure_import_times(
+    module: str = "backend.main",
+    python: Optional[str] = None,
+    timeout: float = 120,
+) -> List[ModuleImportTime]:
+    """
+    Import a module in a fresh interpreter and return its import breakdown.
+
+    A subprocess is used because modules already imported by the current
+    process would not be measured.
+
+    Args:
+        module: Module to import (default: the FastAPI application)
+        python: Interpreter to use (default: the current one)
+        timeout: Seconds before the measurement is abandoned
+
+    Returns:
+        Parsed timings (see parse_import_times)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    # Run from the repository root so "backend" is importable whatever the
+    # caller's working directory (CI runs pytest from backend/)
+    repo_root = str(Path(__file__).resolve().parents[2])
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        cwd=repo_root,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_import_times(result.stderr)
+
+
+def total_import_time_ms(timings: List[ModuleImportTime], module: str = "backend.main") -> float:
+    """Cumulative import time of the measured module (sum of roots if absent)."""
+    for timing in timings:
+        if timing.module == module:
+            return timing.cumulative_ms
+    return sum(t.cumulative_ms for t in timings if t.depth == 0)
+
+
+def summarize_import_times(timings: List[ModuleImportTime], top: int = 15) -> Dict[str, object]:
+    """
+    Summarize an import breakdown.
+
+    Returns:
+        total_ms, slowest modules by self time, and self time per top-level
+        package (third-party libraries and backend subpackages)
+    """
+    by_package: Dict[str, float] = defaultdict(float)
+    for timing in timings:
+        parts = timing.module.split(".")
+        package = ".".join(parts[:2]) if parts[0] == "backend" else parts[0]
+        by_package[package] += timing.self_ms
+
+    slowest = sorted(timings, key=lambda t: t.self_ms, reverse=True)[:top]
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "total_ms": round(total_import_time_ms(timings), 1),
+        "module_count": len(timings),
+        "slowest_modules": [
+            {"module": t.module, "self_ms": round(t.self_ms, 1), "cumulative_ms": round(t.cumulative_ms, 1)}
+            for t in slowest
+        ],
+        "by_package": [{"package": name, "self_ms": round(ms, 1)} for name, ms in packages],
+    }
+
+
+def check_import_budget(
+    timings: List[ModuleImportTime],
+    budget_ms: Optional[float] = None,
+    deferred: Iterable[str] = DEFERRED_MODULES,
+    module: str = "backend.main",
+) -> List[str]:
+    """
+    Check a cold-start import breakdown against the budget.
+
+    Args:
+        timings: Output of measure_import_times()
+        budget_ms: Total budget (default: STARTUP_IMPORT_BUDGET_MS)
+        deferred: Top-level modules that must not be imported at startup
+        module: Module whose cumulative time is budgeted
+
+    Returns:
+        Human-readable violations (empty when within budget)
+    """
+    budget_ms = get_import_time_budget_ms() if budget_ms is None else budget_ms
+    violations = []
+
+    total_ms = total_import_time_ms(timings, module)
+    if total_ms > budget_ms:
+        violations.append(f"{module} imports in {total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+
+    deferred = set(deferred)
+    for timing in timings:
+        if timing.module in deferred:
+            violations.append(
+                f"{timing.module} is imported at startup ({timing.cumulative_ms:.0f}ms); "
+                f"import it on first use (backend.utils.lazy_import)"
+            )
+    return violations
+
+
+def format_import_report(timings: List[ModuleImportTime], top: int = 15) -> str:
+    """Plain-text import breakdown for logs and the command line."""
+    summary = summarize_import_times(timings, top)
+    lines = [f"Total import time: {summary['total_ms']}ms ({summary['module_count']} modules)", ""]
+    lines.append("Slowest modules (self / cumulative ms):")
+    for entry in summary["slowest_modules"]:
+        lines.append(f"  {entry['self_ms']:>8.1f} {entry['cumulative_ms']:>9.1f}  {entry['module']}")
+    lines.append("")
+    lines.append("By package (self ms):")
+    for entry in summary["by_package"]:
+        lines.append(f"  {entry['self_ms']:>8.1f}  {entry['package']}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "backend.main"
+    measured = measure_import_times(target)
+    print(format_import_report(measured))
+    problems = check_import_budget(measured, module=target)
+    for problem in problems:
+        print(f"BUDGET: {problem}")
+    sys.exit(1 if problems else 0)
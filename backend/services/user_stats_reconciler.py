@@ -0,0 +1,131 @@
+"""
+UserStats reconciler - nightly repair job for dashboard counters.
+
+Features:
+- Background asyncio task that recomputes every user's user_stats row
+- Corrects drift from writes made before the triggers existed, manual
+  database edits, or any path the triggers cannot observe
+- Reconciliation runs in a worker thread so the event loop stays responsive
+- Logs how many rows were corrected on each pass
+
+Usage:
+    reconciler = UserStatsReconciler(db)
+    reconciler.start()
+    ...
+    reconciler.stop()
+"""
+
+from typing import Optional, Dict
+import asyncio
+import logging
+
+from sqlalchemy.orm import Session
+
+from backend.repositories.user_stats_repository import UserStatsRepository
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class UserStatsReconciler:
+    """
+    Background service that periodically reconciles user_stats with source tables.
+
+    Attributes:
+        db: SQLAlchemy database session (owned by the reconciler)
+        check_interval: Seconds between reconciliation passes (default: 86400 = 24 hours)
+        initial_delay: Seconds to wait before the first pass (default: 300)
+        is_running: Flag indicating if reconciler is active
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        check_interval: int = 86400,  # 24 hours in seconds
+        initial_delay: int = 300,  # Let startup traffic settle first
+    ):
+        """
+        Initialize user stats reconciler.
+
+        Args:
+            db: SQLAlchemy database session
+            check_interval: Seconds between passes (default: 86400 = 24 hours)
+            initial_delay: Seconds before the first pass (default: 300)
+        """
+        self.db = db
+        self.check_interval = check_interval
+        self.initial_delay = initial_delay
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        self.last_result: Optional[Dict[str, int]] = None
+
+    def start(self) -> None:
+        """
+        Start the reconciler in the background.
+
+        This method is non-blocking.
+        """
+        if self.is_running:
+            logger.warning("UserStatsReconciler is already running")
+            return
+
+        self.is_running = True
+        logger.info("Starting UserStatsReconciler")
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the reconciler and cancel the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped UserStatsReconciler")
+
+    async def _run_scheduler(self) -> None:
+        """Run reconciliation passes until stopped."""
+        delay = self.initial_delay
+        while self.is_running:
+            try:
+                await asyncio.sleep(delay)
+                if self.is_running:
+                    await self.reconcile_now()
+            except asyncio.CancelledError:
+                logger.info("Reconciler task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error in user stats reconciliation: {str(error)}", exc_info=True)
+                # Continue running even if one pass fails
+            delay = self.check_interval
+
+    async def reconcile_now(self) -> Dict[str, int]:
+        """
+        Manually trigger a reconciliation pass.
+
+        Can be called even when the reconciler is not running.
+
+        Returns:
+            Dictionary with number of users checked and rows corrected
+        """
+        result = await asyncio.to_thread(self._reconcile_sync)
+        self.last_result = result
+
+        if result["corrected"]:
+            logger.warning(
+                f"UserStats reconciliation corrected {result['corrected']} of "
+                f"{result['users']} users"
+            )
+        else:
+            logger.info(f"UserStats reconciliation found no drift ({result['users']} users)")
+
+        return result
+
+    def _reconcile_sync(self) -> Dict[str, int]:
+        try:
+            return UserStatsRepository(self.db).reconcile_all()
+        except Exception:
+            self.db.rollback()
+            raise
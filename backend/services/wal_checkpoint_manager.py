@@ -0,0 +1,283 @@
+"""
+WAL checkpoint manager - keeps the SQLite write-ahead log bounded.
+
+SQLite's automatic checkpoint is PASSIVE and never shrinks the -wal file, so
+a long-running server with constant audit writes lets it grow to its
+high-water mark, and readers slow down as they scan more WAL frames.
+
+Features:
+- Periodic PRAGMA wal_checkpoint(PASSIVE) (never blocks readers or writers)
+- Escalation to wal_checkpoint(TRUNCATE) when the server is idle, resetting
+  the -wal file to zero bytes
+- Tracks WAL file size, frame counts and checkpoint lag (frames written but
+  not yet copied back into the database)
+- Checkpoints run in a worker thread so the event loop stays responsive
+
+Usage:
+    from backend.services.wal_checkpoint_manager import get_wal_checkpoint_manager
+
+    manager = get_wal_checkpoint_manager()
+    manager.start()
+    manager.get_status()
+    manager.stop()
+"""
+
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import logging
+import os
+import time
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+def _seconds_since_last_request() -> float:
+    from backend.utils.performance_metrics import get_metrics_collector
+
+    return get_metrics_collector().seconds_since_last_request()
+
+
+class WalCheckpointManager:
+    """
+    Background service that checkpoints the SQLite WAL.
+
+    Attributes:
+        engine: SQLAlchemy engine for the application database
+        db_path: Path of the database file (the WAL lives at ``db_path + "-wal"``)
+        check_interval: Seconds between checkpoints (default: 60)
+        idle_seconds: Seconds without requests before escalating to TRUNCATE
+        is_running: Flag indicating if the background task is active
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        db_path: Optional[str] = None,
+        check_interval: int = 60,
+        idle_seconds: float = 30.0,
+        idle_probe: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize WAL checkpoint manager.
+
+        Args:
+            engine: SQLAlchemy engine
+            db_path: Database file path (default: derived from the engine URL)
+            check_interval: Seconds between checkpoints
+            idle_seconds: Idle threshold in seconds
+            idle_probe: Callable returning seconds since the last request
+                (defaults to the performance metrics collector)
+        """
+        self.engine = engine
+        self.db_path = db_path or engine.url.database
+        self.check_interval = check_interval
+        self.idle_seconds = idle_seconds
+        self.idle_probe = idle_probe or _seconds_since_last_request
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+
+        self.last_checkpoint: Optional[Dict[str, Any]] = None
+        self.checkpoint_counts: Dict[str, int] = {mode: 0 for mode in CHECKPOINT_MODES}
+        self.busy_count = 0
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the engine points at a file-backed SQLite database."""
+        return (
+            self.engine.dialect.name == "sqlite"
+            and bool(self.db_path)
+            and self.db_path != ":memory:"
+        )
+
+    @property
+    def wal_path(self) -> Optional[str]:
+        """Path of the -wal file."""
+        return f"{self.db_path}-wal" if self.is_sqlite else None
+
+    def get_wal_size(self) -> int:
+        """
+        Get the current size of the -wal file.
+
+        Returns:
+            Size in bytes (0 if there is no WAL file)
+        """
+        if not self.is_sqlite:
+            return 0
+        try:
+            return os.path.getsize(self.wal_path)
+        except OSError:
+            return 0
+
+    def is_idle(self) -> bool:
+        """Whether no request has completed within the idle threshold."""
+        try:
+            return self.idle_probe() >= self.idle_seconds
+        except Exception:
+            return False
+
+    # ===== CHECKPOINTING =====
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Dict[str, Any]:
+        """
+        Run a single WAL checkpoint.
+
+        Args:
+            mode: PASSIVE, FULL, RESTART or TRUNCATE
+
+        Returns:
+            Dictionary with mode, busy flag, WAL frame counts, checkpoint lag
+            and WAL size before/after
+        """
+        mode = mode.upper()
+        if mode not in CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        if not self.is_sqlite:
+            return {"mode": mode, "skipped": True}
+
+        size_before = self.get_wal_size()
+        started = time.perf_counter()
+
+        with self.engine.connect() as conn:
+            busy, log_frames, checkpointed_frames = conn.execute(
+                text(f"PRAGMA wal_checkpoint({mode})")
+            ).fetchone()
+            conn.commit()
+
+        # -1 means the database is not in WAL mode
+        log_frames = max(int(log_frames), 0)
+        checkpointed_frames = max(int(checkpointed_frames), 0)
+
+        result = {
+            "mode": mode,
+            "busy": bool(busy),
+            "wal_frames": log_frames,
+            "checkpointed_frames": checkpointed_frames,
+            "checkpoint_lag_frames": log_frames - checkpointed_frames,
+            "wal_size_before_bytes": size_before,
+            "wal_size_after_bytes": self.get_wal_size(),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "timestamp": time.time(),
+        }
+
+        self.last_checkpoint = result
+        self.checkpoint_counts[mode] += 1
+        if result["busy"]:
+            self.busy_count += 1
+            logger.debug(f"WAL checkpoint ({mode}) could not complete: database busy")
+
+        return result
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Run one scheduled checkpoint.
+
+        Always attempts a PASSIVE checkpoint. When the server is idle and the
+        WAL file is non-empty, escalates to TRUNCATE to reset the file.
+
+        Returns:
+            Result of the last checkpoint that ran
+        """
+        result = self.checkpoint("PASSIVE")
+
+        if self.is_idle() and self.get_wal_size() > 0:
+            result = self.checkpoint("TRUNCATE")
+            if not result["busy"]:
+                logger.info(
+                    f"WAL truncated: {result['wal_size_before_bytes']} -> "
+                    f"{result['wal_size_after_bytes']} bytes"
+                )
+
+        return result
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get WAL size and checkpoint statistics.
+
+        Returns:
+            Dictionary with WAL size, last checkpoint details and counters
+        """
+        last = self.last_checkpoint or {}
+        return {
+            "enabled": self.is_sqlite,
+            "is_running": self.is_running,
+            "wal_size_bytes": self.get_wal_size(),
+            "last_checkpoint_mode": last.get("mode"),
+            "last_checkpoint_at": last.get("timestamp"),
+            "last_checkpoint_busy": last.get("busy"),
+            "wal_frames": last.get("wal_frames", 0),
+            "checkpoint_lag_frames": last.get("checkpoint_lag_frames", 0),
+            "checkpoint_counts": dict(self.checkpoint_counts),
+            "busy_count": self.busy_count,
+        }
+
+    # ===== BACKGROUND TASK =====
+
+    def start(self) -> None:
+        """
+        Start periodic checkpointing in the background.
+
+        This method is non-blocking.
+        """
+        if not self.is_sqlite:
+            return
+
+        if self.is_running:
+            logger.warning("WalCheckpointManager is already running")
+            return
+
+        self.is_running = True
+        logger.info("Starting WalCheckpointManager")
+        self._task = asyncio.create_task(self._run_scheduler())
+
+    def stop(self) -> None:
+        """Stop the background task."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+        logger.info("Stopped WalCheckpointManager")
+
+    async def _run_scheduler(self) -> None:
+        """Checkpoint the WAL every check_interval seconds until stopped."""
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.check_interval)
+                if self.is_running:
+                    await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                logger.info("WAL checkpoint task cancelled")
+                break
+            except Exception as error:
+                logger.error(f"Error in WAL checkpoint loop: {str(error)}", exc_info=True)
+                # Continue running even if one checkpoint fails
+                continue
+
+
+# ===== SINGLETON =====
+
+_wal_checkpoint_manager: Optional[WalCheckpointManager] = None
+
+
+def get_wal_checkpoint_manager() -> WalCheckpointManager:
+    """
+    Get the process-wide WAL checkpoint manager bound to the application engine.
+
+    Returns:
+        WalCheckpointManager instance
+    """
+    global _wal_checkpoint_manager
+    if _wal_checkpoint_manager is None:
+        from backend.models.base import engine
+
+        _wal_checkpoint_manager = WalCheckpointManager(engine)
+    return _wal_checkpoint_manager
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for repository tests.
+
+Provides an in-memory SQLite session with foreign keys enabled (so
+ON DELETE CASCADE and the maintenance triggers behave as in production)
+and a test user owning the rows under test.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.base import Base
+from backend.models.user import User
+
+# Test database setup
+TEST_DATABASE_URL = "sqlite:///:memory:"
+
+@pytest.fixture
+def db_session():
+    """Create an in-memory SQLite database with foreign keys enabled."""
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+@pytest.fixture
+def user(db_session):
+    """Create a test user."""
+    user = User(
+        username="repository-user",
+        email="repository@example.com",
+        password_hash="hash",
+        password_salt="salt",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
@@ -0,0 +1,133 @@
+"""
+Test suite for ResourceVersionRepository.
+Verifies trigger-maintained collection versions and the stamps built from them.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from backend.models.case import Case, CaseStatus, CaseType
+from backend.models.deadline import Deadline
+from backend.models.evidence import Evidence, EvidenceType
+from backend.models.notification import Notification
+from backend.models.user import User
+from backend.repositories.resource_version_repository import ResourceVersionRepository
+
+@pytest.fixture
+def repository(db_session):
+    """Create resource version repository."""
+    return ResourceVersionRepository(db_session)
+
+def _add_case(db_session, user_id):
+    case = Case(title="Case", case_type=CaseType.EMPLOYMENT, status=CaseStatus.ACTIVE, user_id=user_id)
+    db_session.add(case)
+    db_session.commit()
+    return case
+
+# ===== STAMPS =====
+
+def test_stamp_is_stable_without_writes(repository, user):
+    first = repository.get_stamp(user.id, ("cases",))
+
+    assert first is not None
+    assert repository.get_stamp(user.id, ("cases",)) == first
+
+def test_first_stamp_does_not_commit_request_session(db_session, repository, user):
+    db_session.add(
+        Case(title="Draft", case_type=CaseType.EMPLOYMENT, status=CaseStatus.ACTIVE, user_id=user.id)
+    )
+
+    assert repository.get_stamp(user.id, ("cases",)) is not None
+
+    db_session.rollback()
+    assert db_session.execute(text("SELECT COUNT(*) FROM cases")).scalar() == 0
+    assert db_session.execute(text("SELECT COUNT(*) FROM resource_versions")).scalar() == 1
+
+def test_case_writes_change_case_stamp(db_session, repository, user):
+    before = repository.get_stamp(user.id, ("cases",))
+    case = _add_case(db_session, user.id)
+    after_insert = repository.get_stamp(user.id, ("cases",))
+
+    case.title = "Renamed"
+    db_session.commit()
+    after_update = repository.get_stamp(user.id, ("cases",))
+
+    assert len({before, after_insert, after_update}) == 3
+
+def test_raw_sql_evidence_insert_changes_only_evidence_stamp(db_session, repository, user):
+    case = _add_case(db_session, user.id)
+    cases_before = repository.get_stamp(user.id, ("cases",))
+    evidence_before = repository.get_stamp(user.id, ("evidence",))
+
+    db_session.execute(
+        text(
+            "INSERT INTO evidence (case_id, title, content, evidence_type) "
+            "VALUES (:case_id, 'Raw', 'text', 'document')"
+        ),
+        {"case_id": case.id},
+    )
+    db_session.commit()
+
+    assert repository.get_stamp(user.id, ("cases",)) == cases_before
+    assert repository.get_stamp(user.id, ("evidence",)) != evidence_before
+
+def test_case_delete_changes_evidence_and_deadline_stamps(db_session, repository, user):
+    case = _add_case(db_session, user.id)
+    db_session.add(Evidence(case_id=case.id, title="E", content="text", evidence_type=EvidenceType.NOTE))
+    db_session.add(
+        Deadline(
+            case_id=case.id,
+            user_id=user.id,
+            title="D",
+            deadline_date=(datetime.utcnow() + timedelta(days=1)).isoformat(),
+        )
+    )
+    db_session.commit()
+    before = repository.get_stamp(user.id, ("evidence", "deadlines"))
+
+    db_session.execute(text("DELETE FROM cases WHERE id = :id"), {"id": case.id})
+    db_session.commit()
+
+    assert repository.get_stamp(user.id, ("evidence", "deadlines")) != before
+
+def test_notification_read_changes_notification_stamp(db_session, repository, user):
+    notification = Notification(
+        user_id=user.id, type="system_alert", severity="low", title="T", message="M"
+    )
+    db_session.add(notification)
+    db_session.commit()
+    before = repository.get_stamp(user.id, ("notifications",))
+
+    notification.is_read = True
+    db_session.commit()
+
+    assert repository.get_stamp(user.id, ("notifications",)) != before
+
+def test_other_users_writes_do_not_change_stamp(db_session, repository, user):
+    other = User(username="other", email="other@example.com", password_hash="h", password_salt="s")
+    db_session.add(other)
+    db_session.commit()
+    before = repository.get_stamp(user.id, ("cases",))
+
+    _add_case(db_session, other.id)
+
+    assert repository.get_stamp(user.id, ("cases",)) == before
+
+def test_deleting_user_with_cases_succeeds(db_session, repository, user):
+    _add_case(db_session, user.id)
+    repository.get_stamp(user.id, ("cases",))
+
+    db_session.execute(text("DELETE FROM users WHERE id = :id"), {"id": user.id})
+    db_session.commit()
+
+    assert db_session.execute(text("SELECT COUNT(*) FROM cases")).scalar() == 0
+
+# ===== FALLBACK =====
+
+def test_missing_table_returns_none(db_session, repository, user):
+    db_session.execute(text("DROP TABLE resource_versions"))
+    db_session.commit()
+
+    assert repository.get_stamp(user.id, ("cases",)) is None
@@ -0,0 +1,204 @@
+"""
+Test suite for UserStatsRepository.
+Verifies trigger-maintained counters, lazy overdue refresh and reconciliation.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from backend.models.case import Case, CaseStatus, CaseType
+from backend.models.deadline import Deadline, DeadlineStatus
+from backend.models.evidence import Evidence, EvidenceType
+from backend.models.notification import Notification
+from backend.models.user_stats import UserStats
+from backend.repositories.user_stats_repository import UserStatsRepository
+
+@pytest.fixture
+def repository(db_session):
+    """Create user stats repository."""
+    return UserStatsRepository(db_session)
+
+def _add_case(db_session, user_id, status=CaseStatus.ACTIVE):
+    case = Case(title="Case", case_type=CaseType.EMPLOYMENT, status=status, user_id=user_id)
+    db_session.add(case)
+    db_session.commit()
+    return case
+
+def _add_evidence(db_session, case_id):
+    evidence = Evidence(
+        case_id=case_id, title="Evidence", content="text", evidence_type=EvidenceType.NOTE
+    )
+    db_session.add(evidence)
+    db_session.commit()
+    return evidence
+
+def _add_deadline(db_session, case_id, user_id, due):
+    deadline = Deadline(
+        case_id=case_id, user_id=user_id, title="Deadline", deadline_date=due.isoformat()
+    )
+    db_session.add(deadline)
+    db_session.commit()
+    return deadline
+
+def test_missing_row_is_built_from_source_tables(repository, db_session, user):
+    """Test first lookup creates the row from existing data."""
+    case = _add_case(db_session, user.id)
+    _add_evidence(db_session, case.id)
+
+    stats = repository.get_stats(user.id)
+
+    assert stats["total_cases"] == 1
+    assert stats["active_cases"] == 1
+    assert stats["evidence_count"] == 1
+    assert db_session.get(UserStats, user.id) is not None
+
+def test_concurrent_first_reads_do_not_conflict(repository, db_session, user, monkeypatch):
+    """Test a row created by another request between lookup and insert is reused."""
+    _add_case(db_session, user.id)
+    repository.get_stats(user.id)
+
+    # This read missed the row another request has just inserted
+    read_row = repository._read_row
+    missed = []
+
+    def _read_row_missing_once(user_id):
+        if not missed:
+            missed.append(user_id)
+            return None
+        return read_row(user_id)
+
+    monkeypatch.setattr(repository, "_read_row", _read_row_missing_once)
+
+    stats = repository.get_stats(user.id)
+
+    assert stats["total_cases"] == 1
+    assert db_session.execute(text("SELECT COUNT(*) FROM user_stats")).scalar() == 1
+
+def test_triggers_maintain_counters(repository, db_session, user):
+    """Test writes after the row exists update counters without recomputation."""
+    repository.get_stats(user.id)
+
+    case = _add_case(db_session, user.id)
+    _add_case(db_session, user.id, status=CaseStatus.CLOSED)
+    evidence = _add_evidence(db_session, case.id)
+    _add_evidence(db_session, case.id)
+    db_session.add(
+        Notification(user_id=user.id, type="system_info", severity="low", title="t", message="m")
+    )
+    db_session.commit()
+
+    db_session.expire_all()
+    row = db_session.get(UserStats, user.id)
+    assert row.total_cases == 2
+    assert row.active_cases == 1
+    assert row.closed_cases == 1
+    assert row.evidence_count == 2
+    assert row.unread_notifications == 1
+
+    # Status change moves the case between buckets
+    case.status = CaseStatus.PENDING
+    db_session.delete(evidence)
+    db_session.commit()
+    db_session.expire_all()
+    row = db_session.get(UserStats, user.id)
+    assert row.active_cases == 0
+    assert row.pending_cases == 1
+    assert row.evidence_count == 1
+
+def test_raw_sql_writes_are_counted(repository, db_session, user):
+    """Test triggers see raw SQL inserts that bypass the ORM."""
+    repository.get_stats(user.id)
+
+    db_session.execute(
+        text(
+            "INSERT INTO cases (title, case_type, status, user_id) "
+            "VALUES ('Raw', 'employment', 'active', :user_id)"
+        ),
+        {"user_id": user.id},
+    )
+    db_session.commit()
+
+    stats = repository.get_stats(user.id)
+    assert stats["total_cases"] == 1
+    assert stats["active_cases"] == 1
+
+def test_case_delete_cascades_evidence_count(repository, db_session, user):
+    """Test deleting a case removes its cascaded evidence from the count."""
+    case = _add_case(db_session, user.id)
+    _add_evidence(db_session, case.id)
+    _add_evidence(db_session, case.id)
+    repository.get_stats(user.id)
+
+    db_session.execute(text("DELETE FROM cases WHERE id = :id"), {"id": case.id})
+    db_session.commit()
+
+    stats = repository.get_stats(user.id)
+    assert stats["total_cases"] == 0
+    assert stats["evidence_count"] == 0
+
+def test_overdue_count_refreshes_when_deadline_passes(repository, db_session, user):
+    """Test overdue deadlines are recomputed once invalidated or expired."""
+    case = _add_case(db_session, user.id)
+    now = datetime.utcnow()
+    _add_deadline(db_session, case.id, user.id, now - timedelta(days=1))
+    upcoming = _add_deadline(db_session, case.id, user.id, now + timedelta(days=1))
+
+    stats = repository.get_stats(user.id)
+    assert stats["total_deadlines"] == 2
+    assert stats["open_deadlines"] == 2
+    assert stats["overdue_deadlines"] == 1
+
+    # The overdue count is exact until the next open deadline falls due
+    row = db_session.get(UserStats, user.id)
+    assert row.overdue_valid_until == upcoming.deadline_date
+
+    # Moving a deadline into the past invalidates the cached overdue count
+    db_session.execute(
+        text("UPDATE deadlines SET deadline_date = :due WHERE id = :id"),
+        {"due": (now - timedelta(hours=1)).isoformat(), "id": upcoming.id},
+    )
+    db_session.commit()
+
+    stats = repository.get_stats(user.id)
+    assert stats["overdue_deadlines"] == 2
+
+    upcoming.status = DeadlineStatus.COMPLETED
+    db_session.commit()
+    stats = repository.get_stats(user.id)
+    assert stats["open_deadlines"] == 1
+    assert stats["overdue_deadlines"] == 1
+
+def test_overdue_refresh_keeps_concurrent_invalidation(repository, db_session, user):
+    """Test a refresh computed before a deadline change does not overwrite it."""
+    repository.get_stats(user.id)
+    db_session.execute(
+        text("UPDATE user_stats SET overdue_valid_until = NULL WHERE user_id = :user_id"),
+        {"user_id": user.id},
+    )
+    db_session.commit()
+
+    repository._refresh_overdue(user.id, seen_valid_until="2000-01-01T00:00:00")
+
+    assert db_session.execute(
+        text("SELECT overdue_valid_until FROM user_stats WHERE user_id = :user_id"),
+        {"user_id": user.id},
+    ).scalar() is None
+
+def test_reconcile_all_corrects_drift(repository, db_session, user):
+    """Test reconciliation repairs counters that drifted from the source tables."""
+    _add_case(db_session, user.id)
+    repository.get_stats(user.id)
+
+    db_session.execute(
+        text("UPDATE user_stats SET total_cases = 42 WHERE user_id = :user_id"),
+        {"user_id": user.id},
+    )
+    db_session.commit()
+
+    result = repository.reconcile_all()
+
+    assert result == {"users": 1, "corrected": 1}
+    assert repository.get_stats(user.id)["total_cases"] == 1
+    assert repository.reconcile_all() == {"users": 1, "corrected": 0}
@@ -24,10 +24,12 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from backend.routes.auth import router
+from backend.routes.auth import get_current_user, router
 from backend.models.base import Base, get_db
 from backend.models.session import Session as SessionModel
+from backend.models.user import User
 from backend.services.rate_limit_service import RateLimitResult, RateLimitService
 
 from fastapi import FastAPI
@@ -642,6 +644,62 @@ class TestRateLimitStatus:
         assert data["attempts_remaining"] == 5
         assert data["is_locked"] is False
 
+# ===== Test: Hashing Status =====
+
+class TestHashingStatus:
+    """Test suite for the admin-only hashing pool metrics endpoint."""
+
+    @pytest.fixture
+    def hashing_client(self, app):
+        """Client whose requests share one in-memory database and accept a role."""
+        engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        def login_as(role):
+            user = User(
+                username=f"{role}_user", email=f"{role}@example.com",
+                password_hash="hash", password_salt="salt", role=role,
+            )
+            db.add(user)
+            db.commit()
+            user_id = user.id
+            app.dependency_overrides[get_current_user] = lambda: user_id
+
+        app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(app)
+        client.login_as = login_as
+        yield client
+        db.close()
+        engine.dispose()
+
+    def test_hashing_status_requires_authentication(self, client):
+        """Test anonymous requests are rejected."""
+        response = client.get("/auth/hashing-status")
+
+        assert response.status_code == 401
+
+    def test_hashing_status_requires_admin(self, hashing_client):
+        """Test regular users are rejected."""
+        hashing_client.login_as("user")
+
+        response = hashing_client.get("/auth/hashing-status")
+
+        assert response.status_code == 403
+
+    def test_hashing_status_for_admin(self, hashing_client):
+        """Test admins get the pool metrics."""
+        hashing_client.login_as("admin")
+
+        response = hashing_client.get("/auth/hashing-status")
+
+        assert response.status_code == 200
+        assert {"max_workers", "max_queue", "in_flight", "rejected"} <= response.json().keys()
+
 # ===== Integration Tests =====
 
 class TestAuthFlowIntegration:
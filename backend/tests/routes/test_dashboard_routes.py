@@ -16,7 +16,7 @@ Coverage:
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 
@@ -134,34 +134,32 @@ def sample_notifications():
 
 # ===== DASHBOARD STATS TESTS =====
 
+@pytest.fixture
+def sample_user_stats():
+    """Sample user_stats counters."""
+    return {
+        "total_cases": 15,
+        "active_cases": 10,
+        "closed_cases": 3,
+        "pending_cases": 2,
+        "evidence_count": 25,
+        "total_deadlines": 10,
+        "open_deadlines": 6,
+        "overdue_deadlines": 2,
+        "unread_notifications": 5,
+    }
+
 @pytest.mark.asyncio
-async def test_get_dashboard_stats_success(
-    mock_db,
-    mock_case_service,
-    mock_notification_service,
-    sample_case_stats
-):
+async def test_get_dashboard_stats_success(mock_db, sample_user_stats):
     """Test successful dashboard statistics retrieval."""
     # Arrange
     user_id = 1
-    mock_case_service.get_case_statistics.return_value = sample_case_stats
-    mock_notification_service.get_unread_count.return_value = 5
 
-    # Mock database queries
-    evidence_result = Mock(count=25)
-    deadlines_result = Mock(count=10)
-    overdue_result = Mock(count=2)
+    with patch("backend.routes.dashboard.UserStatsRepository") as repo_cls:
+        repo_cls.return_value.get_stats.return_value = sample_user_stats
 
-    mock_db.execute.side_effect = [
-        Mock(fetchone=lambda: evidence_result),
-        Mock(fetchone=lambda: deadlines_result),
-        Mock(fetchone=lambda: overdue_result)
-    ]
-
-    # Act
-    result = await get_dashboard_stats_internal(
-        user_id, mock_case_service, mock_notification_service, mock_db
-    )
+        # Act
+        result = await get_dashboard_stats_internal(user_id, mock_db)
 
     # Assert
     assert isinstance(result, DashboardStatsResponse)
@@ -173,36 +171,29 @@ async def test_get_dashboard_stats_success(
     assert result.overdueDeadlines == 2
     assert result.unreadNotifications == 5
 
-    # Verify service calls
-    mock_case_service.get_case_statistics.assert_called_once_with(user_id)
-    mock_notification_service.get_unread_count.assert_called_once_with(user_id)
+    # Single repository lookup, no per-widget queries
+    repo_cls.assert_called_once_with(mock_db)
+    repo_cls.return_value.get_stats.assert_called_once_with(user_id)
+    mock_db.execute.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_get_dashboard_stats_empty_data(
-    mock_db,
-    mock_case_service,
-    mock_notification_service
-):
+async def test_get_dashboard_stats_empty_data(mock_db):
     """Test dashboard statistics with no data."""
     # Arrange
     user_id = 1
-    mock_case_service.get_case_statistics.return_value = {
-        "total_cases": 0,
-        "status_counts": {}
-    }
-    mock_notification_service.get_unread_count.return_value = 0
 
-    # Mock empty database results
-    mock_db.execute.side_effect = [
-        Mock(fetchone=lambda: Mock(count=0)),
-        Mock(fetchone=lambda: Mock(count=0)),
-        Mock(fetchone=lambda: Mock(count=0))
-    ]
+    with patch("backend.routes.dashboard.UserStatsRepository") as repo_cls:
+        repo_cls.return_value.get_stats.return_value = dict.fromkeys(
+            [
+                "total_cases", "active_cases", "closed_cases", "pending_cases",
+                "evidence_count", "total_deadlines", "open_deadlines",
+                "overdue_deadlines", "unread_notifications",
+            ],
+            0,
+        )
 
-    # Act
-    result = await get_dashboard_stats_internal(
-        user_id, mock_case_service, mock_notification_service, mock_db
-    )
+        # Act
+        result = await get_dashboard_stats_internal(user_id, mock_db)
 
     # Assert
     assert result.totalCases == 0
@@ -214,21 +205,17 @@ async def test_get_dashboard_stats_empty_data(
     assert result.unreadNotifications == 0
 
 @pytest.mark.asyncio
-async def test_get_dashboard_stats_service_error(
-    mock_db,
-    mock_case_service,
-    mock_notification_service
-):
-    """Test dashboard statistics with service error."""
+async def test_get_dashboard_stats_service_error(mock_db):
+    """Test dashboard statistics with repository error."""
     # Arrange
     user_id = 1
-    mock_case_service.get_case_statistics.side_effect = Exception("Service error")
 
-    # Act & Assert
-    with pytest.raises(HTTPException) as exc_info:
-        await get_dashboard_stats_internal(
-            user_id, mock_case_service, mock_notification_service, mock_db
-        )
+    with patch("backend.routes.dashboard.UserStatsRepository") as repo_cls:
+        repo_cls.return_value.get_stats.side_effect = Exception("Service error")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_dashboard_stats_internal(user_id, mock_db)
 
     assert exc_info.value.status_code == 500
     assert "Failed to load dashboard statistics" in str(exc_info.value.detail)
@@ -692,14 +679,12 @@ async def test_database_error_handling(mock_db, mock_case_service, mock_notifica
     """Test database error handling in stats endpoint."""
     # Arrange
     user_id = 1
-    mock_case_service.get_case_statistics.return_value = {"total_cases": 0, "status_counts": {}}
-    mock_db.execute.side_effect = Exception("Database connection failed")
+    mock_db.get.side_effect = Exception("Database connection failed")
+    mock_db.get_bind.return_value.dialect.name = "sqlite"
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc_info:
-        await get_dashboard_stats_internal(
-            user_id, mock_case_service, mock_notification_service, mock_db
-        )
+        await get_dashboard_stats_internal(user_id, mock_db)
 
     assert exc_info.value.status_code == 500
 
@@ -146,10 +146,56 @@ def mock_auth_service():
     service.validate_session = Mock(return_value=user)
     return service
 
+@pytest.fixture
+def mock_maintenance():
+    """Mock DatabaseMaintenanceService."""
+    maintenance = Mock()
+    maintenance.optimize = Mock()
+    maintenance.get_storage_info = Mock(return_value={
+        "auto_vacuum": "incremental",
+        "page_size": 4096,
+        "page_count": 2560,
+        "freelist_count": 256,
+        "reclaimable_bytes": 1048576
+    })
+    maintenance.run_incremental_vacuum = AsyncMock(return_value=256)
+    maintenance.get_storage_report = Mock(return_value=[
+        {"name": "audit_logs", "type": "table", "table": "audit_logs",
+         "pages": 512, "size_bytes": 2097152, "unused_bytes": 4096},
+        {"name": "idx_audit_logs_timestamp", "type": "index", "table": "audit_logs",
+         "pages": 64, "size_bytes": 262144, "unused_bytes": 0},
+        {"name": "users", "type": "table", "table": "users",
+         "pages": 2, "size_bytes": 8192, "unused_bytes": 1024}
+    ])
+
+    # Optimize is limited to 1 per hour; isolate each test's rate limit state
+    with patch('backend.routes.database._rate_limits', {}):
+        yield maintenance
+
+@pytest.fixture
+def mock_wal_manager():
+    """Mock WalCheckpointManager."""
+    manager = Mock()
+    manager.get_status = Mock(return_value={
+        "enabled": True,
+        "is_running": True,
+        "wal_size_bytes": 4120032,
+        "last_checkpoint_mode": "PASSIVE",
+        "last_checkpoint_at": 1736764200.0,
+        "last_checkpoint_busy": False,
+        "wal_frames": 1000,
+        "checkpoint_lag_frames": 12,
+        "checkpoint_counts": {"PASSIVE": 10, "FULL": 0, "RESTART": 0, "TRUNCATE": 2},
+        "busy_count": 0
+    })
+    return manager
+
 # ===== TEST: DATABASE STATS =====
 
 @pytest.mark.asyncio
-async def test_get_database_stats_success(mock_db, mock_backup_service, mock_audit_logger):
+async def test_get_database_stats_success(
+    mock_db, mock_backup_service, mock_audit_logger, mock_maintenance, mock_wal_manager
+):
     """Test successful database stats retrieval."""
     # Mock table metadata
     mock_db.execute.return_value.fetchall.return_value = [
@@ -165,7 +211,9 @@ async def test_get_database_stats_success(mock_db, mock_backup_service, mock_aud
         user_id=1,
         db=mock_db,
         backup_service=mock_backup_service,
-        audit_logger=mock_audit_logger
+        audit_logger=mock_audit_logger,
+        maintenance=mock_maintenance,
+        wal_manager=mock_wal_manager
     )
 
     assert result["connected"] is True
@@ -176,13 +224,20 @@ async def test_get_database_stats_success(mock_db, mock_backup_service, mock_aud
     assert result["backups_count"] == 1
     assert result["backups_size_mb"] == 5.0
 
+    # Storage breakdown: indexes count towards their table
+    assert result["storage"][0]["name"] == "audit_logs"
+    assert result["table_sizes_bytes"] == {"audit_logs": 2359296, "users": 8192}
+    assert result["wal"]["checkpoint_lag_frames"] == 12
+
     # Verify audit logging
     mock_audit_logger.log.assert_called_once()
     assert mock_audit_logger.log.call_args[1]["event_type"] == "database.stats_viewed"
     assert mock_audit_logger.log.call_args[1]["success"] is True
 
 @pytest.mark.asyncio
-async def test_get_database_stats_database_error(mock_db, mock_backup_service, mock_audit_logger):
+async def test_get_database_stats_database_error(
+    mock_db, mock_backup_service, mock_audit_logger, mock_maintenance, mock_wal_manager
+):
     """Test database stats retrieval with database error."""
     # Mock database error
     mock_db.execute.side_effect = Exception("Database connection failed")
@@ -192,7 +247,9 @@ async def test_get_database_stats_database_error(mock_db, mock_backup_service, m
             user_id=1,
             db=mock_db,
             backup_service=mock_backup_service,
-            audit_logger=mock_audit_logger
+            audit_logger=mock_audit_logger,
+            maintenance=mock_maintenance,
+            wal_manager=mock_wal_manager
         )
 
     assert exc_info.value.status_code == 500
@@ -419,43 +476,72 @@ async def test_restore_backup_invalid_filename():
 # ===== TEST: OPTIMIZE DATABASE =====
 
 @pytest.mark.asyncio
-async def test_optimize_database_success(mock_db, mock_backup_service, mock_audit_logger):
+async def test_optimize_database_success(mock_backup_service, mock_audit_logger, mock_maintenance):
     """Test successful database optimization (admin only)."""
     mock_background_tasks = Mock()
 
     result = await optimize_database(
         background_tasks=mock_background_tasks,
         user_id=1,
-        db=mock_db,
         backup_service=mock_backup_service,
-        audit_logger=mock_audit_logger
+        audit_logger=mock_audit_logger,
+        maintenance=mock_maintenance
     )
 
     assert result["success"] is True
     assert result["analyze_completed"] is True
     assert result["space_reclaimed_bytes"] >= 0
+    assert result["auto_vacuum"] == "incremental"
+    assert result["reclaimable_bytes"] == 1048576
+    assert result["vacuum_scheduled"] is True
 
-    # Verify VACUUM and ANALYZE called
-    assert mock_db.execute.call_count >= 2
-    assert mock_db.commit.call_count >= 2
+    # Verify bounded optimize ran and incremental vacuum was queued (no full VACUUM)
+    mock_maintenance.optimize.assert_called_once()
+    mock_background_tasks.add_task.assert_called_once()
 
     # Verify audit logging
     mock_audit_logger.log.assert_called_once()
     assert mock_audit_logger.log.call_args[1]["event_type"] == "database.optimized"
 
 @pytest.mark.asyncio
-async def test_optimize_database_failure(mock_db, mock_backup_service, mock_audit_logger):
+async def test_optimize_database_without_incremental_auto_vacuum(
+    mock_backup_service, mock_audit_logger, mock_maintenance
+):
+    """Test optimization skips vacuum and recommends the migration when auto_vacuum is off."""
+    mock_background_tasks = Mock()
+    mock_maintenance.get_storage_info.return_value = {
+        "auto_vacuum": "none",
+        "page_size": 4096,
+        "page_count": 2560,
+        "freelist_count": 256,
+        "reclaimable_bytes": 1048576
+    }
+
+    result = await optimize_database(
+        background_tasks=mock_background_tasks,
+        user_id=1,
+        backup_service=mock_backup_service,
+        audit_logger=mock_audit_logger,
+        maintenance=mock_maintenance
+    )
+
+    assert result["vacuum_scheduled"] is False
+    assert "migration 003" in result["message"]
+    mock_background_tasks.add_task.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_optimize_database_failure(mock_backup_service, mock_audit_logger, mock_maintenance):
     """Test database optimization with failure."""
     mock_background_tasks = Mock()
-    mock_db.execute.side_effect = Exception("VACUUM failed")
+    mock_maintenance.optimize.side_effect = Exception("optimize failed")
 
     with pytest.raises(HTTPException) as exc_info:
         await optimize_database(
             background_tasks=mock_background_tasks,
             user_id=1,
-            db=mock_db,
             backup_service=mock_backup_service,
-            audit_logger=mock_audit_logger
+            audit_logger=mock_audit_logger,
+            maintenance=mock_maintenance
         )
 
     assert exc_info.value.status_code == 500
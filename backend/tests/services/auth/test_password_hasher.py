@@ -0,0 +1,125 @@
+"""
+Test suite for the bounded password hashing pool.
+
+Verifies hashes match the scrypt parameters, the event loop stays responsive
+while hashing, and excess load is rejected instead of queued.
+"""
+
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+from backend.services.auth import password_hasher
+from backend.services.auth.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    scrypt_hash,
+)
+
+SALT = b"0123456789abcdef"
+
+@pytest.fixture
+def hasher():
+    """Small hashing pool shut down after the test."""
+    hasher = PasswordHasher(max_workers=2, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_hash_matches_scrypt_parameters(hasher):
+    """Test pooled hashes are identical to the stored-hash format."""
+    expected = hashlib.scrypt(b"SecurePass123!", salt=SALT, n=16384, r=8, p=1, dklen=64)
+
+    assert await hasher.hash("SecurePass123!", SALT) == expected
+    assert scrypt_hash("SecurePass123!", SALT) == expected
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_while_hashing(hasher):
+    """Test other coroutines make progress during a hash."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await hasher.hash("SecurePass123!", SALT)
+    task.cancel()
+
+    assert ticks > 1
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full(monkeypatch):
+    """Test requests beyond workers + queue fail fast and are counted."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_hash(password, salt, dklen=64):
+        started.set()
+        release.wait(5)
+        return b"hash"
+
+    monkeypatch.setattr(password_hasher, "scrypt_hash", slow_hash)
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+
+    pending = asyncio.create_task(hasher.hash("a", SALT))
+    await asyncio.to_thread(started.wait, 5)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.hash("b", SALT)
+
+    release.set()
+    assert await pending == b"hash"
+    # Capacity is released once the running hash completes
+    assert await hasher.hash("c", SALT) == b"hash"
+
+    stats = hasher.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["in_flight"] == 0
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_stats_report_queue_wait(hasher):
+    """Test queue wait and hash time metrics are recorded."""
+    await asyncio.gather(*(hasher.hash(f"pw{i}", SALT) for i in range(3)))
+
+    stats = hasher.get_stats()
+
+    assert stats["completed"] == 3
+    assert stats["hash_time_ms"]["p50"] > 0
+    assert stats["queue_wait_ms"]["max"] >= stats["queue_wait_ms"]["mean"] >= 0
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_hash_finishes(monkeypatch):
+    """Test a disconnected client cannot free capacity while its hash still runs."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_hash(password, salt, dklen=64):
+        started.set()
+        release.wait(5)
+        return b"hash"
+
+    monkeypatch.setattr(password_hasher, "scrypt_hash", slow_hash)
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+
+    pending = asyncio.create_task(hasher.hash("a", SALT))
+    await asyncio.to_thread(started.wait, 5)
+    pending.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.hash("b", SALT)
+
+    # Capacity returns once the abandoned hash completes
+    release.set()
+    await asyncio.to_thread(hasher.shutdown)
+    assert hasher.get_stats()["in_flight"] == 0
+    assert await hasher.hash("c", SALT) == b"hash"
+    hasher.shutdown()
@@ -0,0 +1,272 @@
+"""
+Test suite for the process-wide session validation cache.
+
+Verifies cache hits skip the database and that logout, revocation, password
+change and deactivation invalidate cached sessions.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import Mock
+
+from backend.models.base import Base
+from backend.models.user import User
+from backend.services.auth.session_cache import SessionValidationCache, get_session_cache
+from backend.services.auth.session_manager import SessionManager
+
+@pytest.fixture
+def db_engine():
+    """Create test database engine."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db_session(db_engine):
+    """Create test database session."""
+    session = sessionmaker(bind=db_engine)()
+    yield session
+    session.close()
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate the process-wide cache between tests."""
+    get_session_cache().clear()
+    yield
+    get_session_cache().clear()
+
+@pytest.fixture
+def query_counter(db_engine):
+    """Count SQL statements executed against the test engine."""
+    statements = []
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+@pytest.fixture
+def test_user(db_session):
+    """Create test user."""
+    user = User(
+        username="cache_user",
+        email="cache@example.com",
+        password_hash="dummy_hash",
+        password_salt="dummy_salt",
+        role="user",
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+@pytest.fixture
+def manager(db_session):
+    """Create SessionManager using the shared validation cache."""
+    return SessionManager(db=db_session, audit_logger=Mock(), use_validation_cache=True)
+
+# ===== CACHE HITS =====
+
+@pytest.mark.asyncio
+async def test_cached_validation_skips_database(manager, test_user, query_counter):
+    """Test repeat validations are served without SQL."""
+    session_id = await manager.create_session(user_id=test_user.id, username=test_user.username)
+
+    first = await manager.validate_session(session_id)
+    queries_after_first = len(query_counter)
+    second = await manager.validate_session(session_id)
+
+    assert first.valid and second.valid
+    assert second.user_id == test_user.id
+    assert len(query_counter) == queries_after_first
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(db_session, test_user, query_counter):
+    """Test managers without use_validation_cache always hit the database."""
+    manager = SessionManager(db=db_session)
+    session_id = await manager.create_session(user_id=test_user.id, username=test_user.username)
+
+    await manager.validate_session(session_id)
+    queries_after_first = len(query_counter)
+    await manager.validate_session(session_id)
+
+    assert len(query_counter) > queries_after_first
+    assert get_session_cache().get(session_id) is None
+
+# ===== INVALIDATION =====
+
+@pytest.mark.asyncio
+async def test_destroy_session_invalidates(manager, test_user):
+    """Test logout removes the cached session."""
+    session_id = await manager.create_session(user_id=test_user.id, username=test_user.username)
+    await manager.validate_session(session_id)
+
+    await manager.destroy_session(session_id)
+
+    assert get_session_cache().get(session_id) is None
+    assert (await manager.validate_session(session_id)).valid is False
+
+@pytest.mark.asyncio
+async def test_revoke_user_sessions_keeps_current(manager, test_user):
+    """Test revocation drops every cached session except the current one."""
+    current = await manager.create_session(user_id=test_user.id, username=test_user.username)
+    other = await manager.create_session(user_id=test_user.id, username=test_user.username)
+    await manager.validate_session(current)
+    await manager.validate_session(other)
+
+    await manager.revoke_user_sessions(test_user.id, except_session_id=current)
+
+    assert get_session_cache().get(current) is not None
+    assert (await manager.validate_session(other)).valid is False
+
+@pytest.mark.asyncio
+async def test_password_change_invalidates(manager, db_session, test_user):
+    """Test a password update drops the user's cached sessions."""
+    session_id = await manager.create_session(user_id=test_user.id, username=test_user.username)
+    await manager.validate_session(session_id)
+
+    test_user.password_hash = "new_hash"
+    db_session.commit()
+
+    assert get_session_cache().get(session_id) is None
+
+@pytest.mark.asyncio
+async def test_deactivation_invalidates(manager, db_session, test_user):
+    """Test deactivating a user rejects their sessions immediately."""
+    session_id = await manager.create_session(user_id=test_user.id, username=test_user.username)
+    assert (await manager.validate_session(session_id)).valid is True
+
+    test_user.is_active = False
+    db_session.commit()
+
+    assert (await manager.validate_session(session_id)).valid is False
+    # The inactive result is cached too
+    assert (await manager.validate_session(session_id)).valid is False
+
+@pytest.fixture
+def file_sessions(tmp_path):
+    """Two sessions on one file database, like two concurrent requests."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'sessions.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    first, second = factory(), factory()
+    yield first, second
+    first.close()
+    second.close()
+    engine.dispose()
+
+def _validate_in_other_request(db, session_id):
+    """Validate from another thread and connection, as a concurrent request would."""
+    manager = SessionManager(db=db, audit_logger=Mock(), use_validation_cache=True)
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(asyncio.run(manager.validate_session(session_id)))
+    )
+    thread.start()
+    thread.join()
+    return results[0]
+
+def _add_user(db):
+    user = User(
+        username="race_user", email="race@example.com", password_hash="h",
+        password_salt="s", role="user", is_active=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+@pytest.mark.asyncio
+async def test_validation_before_logout_commit_is_not_kept(file_sessions):
+    """Test a validation between the delete and the commit cannot re-cache the session."""
+    db, other_db = file_sessions
+    user = _add_user(db)
+    manager = SessionManager(db=db, audit_logger=Mock(), use_validation_cache=True)
+    session_id = await manager.create_session(user_id=user.id, username=user.username)
+    await manager.validate_session(session_id)
+
+    seen = []
+    event.listen(
+        db, "after_flush",
+        lambda *args: seen.append(_validate_in_other_request(other_db, session_id)),
+    )
+    await manager.destroy_session(session_id)
+
+    # The concurrent validation still saw the uncommitted row
+    assert seen and seen[0].valid is True
+    assert get_session_cache().get(session_id) is None
+    assert (await manager.validate_session(session_id)).valid is False
+
+@pytest.mark.asyncio
+async def test_validation_before_deactivation_commit_is_not_kept(file_sessions):
+    """Test deactivation invalidates after its commit, not at flush time."""
+    db, other_db = file_sessions
+    user = _add_user(db)
+    manager = SessionManager(db=db, audit_logger=Mock(), use_validation_cache=True)
+    session_id = await manager.create_session(user_id=user.id, username=user.username)
+
+    seen = []
+    event.listen(
+        db, "after_flush",
+        lambda *args: seen.append(_validate_in_other_request(other_db, session_id)),
+    )
+    user.is_active = False
+    db.commit()
+
+    assert seen and seen[0].valid is True
+    assert (await manager.validate_session(session_id)).valid is False
+
+# ===== CACHE UNIT BEHAVIOUR =====
+
+def test_entries_expire_after_ttl():
+    """Test entries older than the TTL are misses."""
+    cache = SessionValidationCache(ttl_seconds=0)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    cache.put("s1", user_id=1, username="u", is_active=True, expires_at=expires_at)
+
+    assert cache.get("s1") is None
+
+def test_entries_never_outlive_session_expiry():
+    """Test an expired session is a miss even within the TTL."""
+    cache = SessionValidationCache(ttl_seconds=60)
+    expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    cache.put("s1", user_id=1, username="u", is_active=True, expires_at=expires_at)
+
+    assert cache.get("s1") is None
+
+def test_stale_generation_is_not_cached():
+    """Test a validation that raced with an invalidation is discarded."""
+    cache = SessionValidationCache()
+    generation = cache.generation
+    cache.invalidate_user(1)
+
+    cache.put(
+        "s1",
+        user_id=1,
+        username="u",
+        is_active=True,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        generation=generation,
+    )
+
+    assert cache.get("s1") is None
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted at capacity."""
+    cache = SessionValidationCache(max_entries=2)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    cache.put("s1", user_id=1, username="u", is_active=True, expires_at=expires_at)
+    cache.put("s2", user_id=1, username="u", is_active=True, expires_at=expires_at)
+    cache.get("s1")
+    cache.put("s3", user_id=2, username="v", is_active=True, expires_at=expires_at)
+
+    assert cache.get("s2") is None
+    assert cache.get("s1") is not None
+    assert cache.get_stats()["entries"] == 2
@@ -258,7 +258,7 @@ async def test_validate_session_nonexistent(session_manager):
 
 @pytest.mark.asyncio
 async def test_validate_session_expired(session_manager, test_user):
-    """Test validating an expired session automatically cleans it up."""
+    """Test validating an expired session rejects it without deleting the row."""
     # Create session
     session_id = await session_manager.create_session(
         user_id=test_user.id,
@@ -273,16 +273,16 @@ async def test_validate_session_expired(session_manager, test_user):
     db_session.expires_at = datetime.now(timezone.utc) - timedelta(hours=1)
     session_manager.db.commit()
 
-    # Validate should return invalid and clean up session
+    # Validate should return invalid without writing
     result = await session_manager.validate_session(session_id)
 
     assert result.valid is False
 
-    # Verify session was deleted from database
+    # The row is left for the batch sweeper
     db_session = session_manager.db.query(SessionModel).filter(
         SessionModel.id == session_id
     ).first()
-    assert db_session is None
+    assert db_session is not None
 
 @pytest.mark.asyncio
 async def test_validate_session_with_cache_hit(session_manager_with_cache, test_user):
@@ -155,15 +155,14 @@ async def test_is_session_valid_expired(service, db_session, test_user):
     db_session.add(session)
     db_session.commit()
 
-    # Validate - should return False and delete session
+    # Validate - should return False without deleting (left for the sweeper)
     is_valid = await service.is_session_valid(session_id)
     assert is_valid is False
 
-    # Verify session was deleted
-    deleted_session = db_session.query(SessionModel).filter(
+    expired_session = db_session.query(SessionModel).filter(
         SessionModel.id == session_id
     ).first()
-    assert deleted_session is None
+    assert expired_session is not None
 
 @pytest.mark.asyncio
 async def test_is_session_valid_invalid_uuid(service):
@@ -213,15 +212,14 @@ async def test_restore_session_expired(service, db_session, test_user):
     db_session.add(session)
     db_session.commit()
 
-    # Restore - should return None and delete session
+    # Restore - should return None without deleting (left for the sweeper)
     result = await service.restore_session(session_id)
     assert result is None
 
-    # Verify session was deleted
-    deleted_session = db_session.query(SessionModel).filter(
+    expired_session = db_session.query(SessionModel).filter(
         SessionModel.id == session_id
     ).first()
-    assert deleted_session is None
+    assert expired_session is not None
 
 @pytest.mark.asyncio
 async def test_restore_session_inactive_user(service, db_session, test_user):
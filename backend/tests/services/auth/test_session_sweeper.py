@@ -0,0 +1,89 @@
+"""
+Test suite for ExpiredSessionSweeper.
+
+Verifies expired sessions are deleted in bounded batches through the
+expires_at index and that live sessions are never touched.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.models.base import Base
+# Models via session_tokens: test_session_manager_simple rebinds the
+# backend.models.user / backend.models.session attributes at import time
+from backend.services.auth import session_tokens
+from backend.services.auth.session_sweeper import ExpiredSessionSweeper
+
+@pytest.fixture
+def session_factory():
+    """Session factory over a shared in-memory database with one user."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(
+            session_tokens.User(
+                id=1,
+                username="sweep_user",
+                email="sweep@example.com",
+                password_hash="hash",
+                password_salt="salt",
+            )
+        )
+        db.commit()
+    yield factory
+    engine.dispose()
+
+def _add_sessions(session_factory, count, expires_at):
+    with session_factory() as db:
+        db.add_all(
+            session_tokens.SessionModel(id=str(uuid4()), user_id=1, expires_at=expires_at)
+            for _ in range(count)
+        )
+        db.commit()
+
+def _count_sessions(session_factory):
+    with session_factory() as db:
+        return db.execute(text("SELECT COUNT(*) FROM sessions")).scalar()
+
+def test_sweep_batch_is_bounded(session_factory):
+    """Test one batch deletes at most batch_size expired rows."""
+    _add_sessions(session_factory, 7, datetime.now(timezone.utc) - timedelta(hours=1))
+    sweeper = ExpiredSessionSweeper(session_factory=session_factory, batch_size=5)
+
+    assert sweeper.sweep_batch() == 5
+    assert _count_sessions(session_factory) == 2
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_only_expired(session_factory):
+    """Test a full sweep drains expired rows across batches and keeps live ones."""
+    _add_sessions(session_factory, 12, datetime.now(timezone.utc) - timedelta(minutes=1))
+    _add_sessions(session_factory, 3, datetime.now(timezone.utc) + timedelta(hours=1))
+    sweeper = ExpiredSessionSweeper(
+        session_factory=session_factory, batch_size=5, batch_pause=0
+    )
+
+    assert await sweeper.sweep() == 12
+    assert _count_sessions(session_factory) == 3
+    assert sweeper.total_swept == 12
+
+def test_batch_select_uses_expires_at_index(session_factory):
+    """Test the batch subquery is an index range scan, not a table scan."""
+    with session_factory() as db:
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM sessions "
+                "WHERE expires_at < :now ORDER BY expires_at LIMIT 500"
+            ),
+            {"now": "2030-01-01"},
+        ).fetchall()
+
+    assert any("ix_sessions_expires_at" in row[-1] for row in plan)
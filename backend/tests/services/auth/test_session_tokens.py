@@ -0,0 +1,206 @@
+"""
+Test suite for signed session tokens and the revocation set.
+
+Verifies signing, DB-free validation and that logout, revocation and
+deactivation reject tokens on this and other workers.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import Mock
+
+from backend.models.base import Base
+from backend.models.session import SessionRevocation
+from backend.services.auth import session_tokens
+from backend.services.auth.service import AuthenticationService
+from backend.services.auth.session_manager import SessionManager
+from backend.services.auth.session_tokens import (
+    SessionTokenService,
+    SessionTokenSigner,
+    is_session_token,
+)
+
+SECRET = b"test-secret-that-is-at-least-32-bytes-long"
+PASSWORD = "SecurePass123!"
+
+@pytest.fixture
+def db_engine():
+    """Shared in-memory engine so several sessions see the same data."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(db_engine):
+    """Session factory bound to the test engine."""
+    return sessionmaker(bind=db_engine)
+
+@pytest.fixture
+def db_session(session_factory):
+    """Create test database session."""
+    session = session_factory()
+    yield session
+    session.close()
+
+@pytest.fixture
+def token_service(session_factory, monkeypatch):
+    """Install a process-wide token service for the test."""
+    service = SessionTokenService(SECRET, session_factory=session_factory)
+    monkeypatch.setattr(session_tokens, "_session_token_service", service)
+    monkeypatch.setattr(session_tokens, "_session_token_service_loaded", True)
+    return service
+
+@pytest.fixture
+def query_counter(db_engine):
+    """Count SQL statements executed against the test engine."""
+    statements = []
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+async def _login(db_session, username="token_user", issue_token=True):
+    auth_service = AuthenticationService(db=db_session)
+    await auth_service.register(username, PASSWORD, f"{username}@example.com")
+    return await auth_service.login(username, PASSWORD, issue_token=issue_token)
+
+# ===== SIGNING =====
+
+def test_signer_round_trip():
+    """Test issued tokens verify and carry their claims."""
+    signer = SessionTokenSigner(SECRET)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    token = signer.issue(7, "alice", "session-1", expires_at)
+    claims = signer.verify(token)
+
+    assert is_session_token(token)
+    assert (claims.user_id, claims.username, claims.session_id) == (7, "alice", "session-1")
+    assert claims.expires_at == int(expires_at.timestamp())
+
+def test_signer_rejects_tampering_and_expiry():
+    """Test forged, re-signed and expired tokens are rejected."""
+    signer = SessionTokenSigner(SECRET)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    token = signer.issue(7, "alice", "session-1", expires_at)
+    forged = SessionTokenSigner(b"another-secret-another-secret-xx").issue(
+        1, "admin", "session-1", expires_at
+    )
+    payload, signature = token.rsplit(".", 1)
+
+    assert signer.verify(forged) is None
+    assert signer.verify(f"{payload}.{signature[::-1]}") is None
+    assert signer.verify("not-a-token") is None
+    assert signer.verify(token, now=expires_at.timestamp() + 1) is None
+    # Expired tokens still resolve to their session for logout
+    assert signer.decode(token).session_id == "session-1"
+
+# ===== VALIDATION =====
+
+@pytest.mark.asyncio
+async def test_login_issues_token_validated_without_database(
+    db_session, token_service, query_counter
+):
+    """Test token-mode login returns a token that validates with zero SQL."""
+    result = await _login(db_session)
+    token = result["session"]["id"]
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+
+    query_counter.clear()
+    validation = await manager.validate_session(token)
+
+    assert is_session_token(token)
+    assert validation.valid is True
+    assert validation.user_id == result["user"]["id"]
+    assert validation.username == "token_user"
+    assert query_counter == []
+
+@pytest.mark.asyncio
+async def test_database_mode_is_default(db_session, token_service, monkeypatch):
+    """Test login keeps issuing session UUIDs unless token mode is selected."""
+    monkeypatch.delenv("SESSION_TOKEN_MODE", raising=False)
+
+    result = await _login(db_session, issue_token=None)
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+
+    assert not is_session_token(result["session"]["id"])
+    assert (await manager.validate_session(result["session"]["id"])).valid is True
+
+@pytest.mark.asyncio
+async def test_tokens_rejected_without_secret(db_session, monkeypatch):
+    """Test tokens are never accepted when no secret is configured."""
+    monkeypatch.setattr(session_tokens, "_session_token_service", None)
+    monkeypatch.setattr(session_tokens, "_session_token_service_loaded", True)
+    token = SessionTokenSigner(SECRET).issue(
+        1, "alice", "session-1", datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+
+    assert (await manager.validate_session(token)).valid is False
+
+# ===== REVOCATION =====
+
+@pytest.mark.asyncio
+async def test_logout_revokes_token(db_session, token_service):
+    """Test destroying a session by token rejects the token immediately."""
+    token = (await _login(db_session))["session"]["id"]
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+
+    assert await manager.destroy_session(token) is True
+
+    assert (await manager.validate_session(token)).valid is False
+    assert db_session.query(SessionRevocation).count() == 1
+
+@pytest.mark.asyncio
+async def test_revocation_reaches_other_workers(db_session, token_service, session_factory):
+    """Test another worker's revocation set picks up revocations on refresh."""
+    result = await _login(db_session)
+    token = result["session"]["id"]
+    other_worker = SessionTokenService(SECRET, session_factory=session_factory)
+    other_worker.refresh()
+    assert other_worker.verify(token) is not None
+
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+    await manager.revoke_user_sessions(result["user"]["id"])
+
+    assert other_worker.verify(token) is not None
+    other_worker.refresh()
+    assert other_worker.verify(token) is None
+
+@pytest.mark.asyncio
+async def test_deactivation_revokes_tokens(db_session, token_service):
+    """Test deactivating a user revokes their outstanding tokens."""
+    result = await _login(db_session)
+    token = result["session"]["id"]
+    manager = SessionManager(db=db_session, audit_logger=Mock())
+    # test_session_manager_simple rebinds backend.models.user.User at import time
+    user = db_session.get(session_tokens.User, result["user"]["id"])
+
+    user.is_active = False
+    db_session.commit()
+
+    assert (await manager.validate_session(token)).valid is False
+
+@pytest.mark.asyncio
+async def test_purge_and_prune_drop_expired_revocations(db_session, token_service):
+    """Test revocations are forgotten once the session would have expired."""
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db_session.add(
+        SessionRevocation(session_id="old", user_id=1, revoked_at=past, expires_at=past)
+    )
+    db_session.commit()
+    token_service.revocations.add("old", past)
+
+    assert token_service.purge_expired(db_session) == 1
+    assert token_service.revocations.prune() == 1
+    assert len(token_service.revocations) == 0
@@ -15,6 +15,10 @@ Run tests with:
     pytest backend/services/export/test_pdf_generator.py -v --cov=backend.services.export.pdf_generator
 """
 
+import sys
+import threading
+import types
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
@@ -256,6 +260,50 @@ def test_pdf_generator_with_audit_logger(mock_audit_logger):
     assert generator.audit_logger is not None
     assert generator.audit_logger == mock_audit_logger
 
+def test_concurrent_first_generators_share_one_import(monkeypatch):
+    """Test a generator created during the first import waits for all ReportLab names."""
+    from backend.services.export import pdf_generator
+    import reportlab.lib.styles
+
+    for name in (
+        "A4", "inch", "HexColor", "SimpleDocTemplate", "Paragraph", "Spacer",
+        "PageBreak", "getSampleStyleSheet", "ParagraphStyle", "TA_CENTER",
+    ):
+        monkeypatch.setattr(pdf_generator, name, None)
+
+    # Hold the first import between binding SimpleDocTemplate and the styles
+    importing = threading.Event()
+    release = threading.Event()
+
+    class _SlowStyles(types.ModuleType):
+        def __getattr__(self, name):
+            if name == "getSampleStyleSheet":
+                importing.set()
+                release.wait(5)
+            return getattr(reportlab.lib.styles, name)
+
+    monkeypatch.setitem(sys.modules, "reportlab.lib.styles", _SlowStyles("reportlab.lib.styles"))
+
+    errors = []
+
+    def create():
+        try:
+            PDFGenerator()
+        except Exception as exc:
+            errors.append(exc)
+
+    first = threading.Thread(target=create)
+    first.start()
+    assert importing.wait(5)
+    second = threading.Thread(target=create)
+    second.start()
+    second.join(0.2)
+    release.set()
+    first.join()
+    second.join()
+
+    assert errors == []
+
 # ============================================================================
 # Tests - Case Summary PDF
 # ============================================================================
@@ -0,0 +1,166 @@
+"""
+Test suite for AuditArchiveService.
+
+Verifies old checkpointed segments move to hash-chained files, the newest
+segment stays hot, the integrity chain verifies across the archive
+boundary, query() searches archived entries, and tampered files are
+detected.
+"""
+
+import gzip
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.audit_archive import AuditArchiveSegment
+from backend.models.audit_checkpoint import AuditCheckpoint
+from backend.services.audit_archive import AuditArchiveService, read_segment_header
+from backend.services.audit_checkpoints import AuditCheckpointService
+from backend.services.audit_logger import AuditLogger
+
+LATER = datetime.now(timezone.utc) + timedelta(days=100)
+
+@pytest.fixture
+def engine(tmp_path):
+    """File database with the raw audit_logs table and the checkpoint/archive tables."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE audit_logs (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    user_id TEXT,
+                    resource_type TEXT,
+                    resource_id TEXT,
+                    action TEXT NOT NULL,
+                    details TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    success INTEGER NOT NULL,
+                    error_message TEXT,
+                    integrity_hash TEXT,
+                    previous_log_hash TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+        )
+    AuditCheckpoint.__table__.create(engine)
+    AuditArchiveSegment.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+@pytest.fixture
+def checkpoints(session_factory):
+    return AuditCheckpointService(b"test-checkpoint-key", session_factory=session_factory, segment_size=4)
+
+@pytest.fixture
+def archive(checkpoints, session_factory, tmp_path):
+    return AuditArchiveService(
+        checkpoints,
+        archive_dir=tmp_path / "archive",
+        retention_days=30,
+        session_factory=session_factory,
+    )
+
+def _log(session_factory, count, start=0):
+    db = session_factory()
+    try:
+        for i in range(start, start + count):
+            AuditLogger(db).log(
+                event_type="case.read",
+                user_id=str(i % 2),
+                resource_type="case",
+                resource_id=str(i),
+                action="read",
+            )
+    finally:
+        db.close()
+
+def _hot_rowids(engine):
+    with engine.connect() as conn:
+        return [row[0] for row in conn.execute(text("SELECT ROWID FROM audit_logs ORDER BY ROWID"))]
+
+@pytest.fixture
+def archived(archive, checkpoints, session_factory):
+    """12 entries in 3 segments; the first two archived."""
+    _log(session_factory, 12)
+    checkpoints.create_checkpoints()
+    return archive.archive_segments(now=LATER)
+
+# ===== ARCHIVAL =====
+
+def test_old_segments_archived_except_newest(archived, archive, engine):
+    """Test segments move to files and the newest checkpoint stays hot."""
+    assert [segment.checkpoint_id for segment in archived] == [1, 2]
+    assert _hot_rowids(engine) == [9, 10, 11, 12]
+
+    header = read_segment_header(archive.archive_dir / archived[1].file_name)
+    assert header["previous_file_sha256"] == archived[0].file_sha256
+    assert archive.verify_archive() == {"valid": True, "totalSegments": 2, "checkedLogs": 8}
+
+def test_recent_segments_stay_hot(archive, checkpoints, session_factory, engine):
+    """Test nothing newer than retention_days is archived."""
+    _log(session_factory, 12)
+    checkpoints.create_checkpoints()
+
+    assert archive.archive_segments() == []
+    assert len(_hot_rowids(engine)) == 12
+
+# ===== CHAIN CONTINUITY =====
+
+def test_chain_continues_across_archive_boundary(archived, checkpoints, session_factory, engine):
+    """Test new entries keep ROWIDs and hashes continuing after archival."""
+    _log(session_factory, 5, start=12)
+    checkpoints.create_checkpoints()
+
+    db = session_factory()
+    try:
+        assert AuditLogger(db).verify_integrity() == {"valid": True, "totalLogs": 9}
+    finally:
+        db.close()
+    assert _hot_rowids(engine)[-1] == 17
+    assert checkpoints.verify_since_checkpoint()["valid"] is True
+    assert checkpoints.verify_random_segments(count=5)["segments"] == [3, 4]
+
+# ===== QUERY =====
+
+def test_query_includes_archived_entries(archived, archive, session_factory, monkeypatch):
+    """Test query() continues into archive files in newest-first order."""
+    monkeypatch.setenv("AUDIT_ARCHIVE_DIR", str(archive.archive_dir))
+    db = session_factory()
+    try:
+        audit_logger = AuditLogger(db)
+        assert len(audit_logger.query()) == 4
+
+        all_logs = audit_logger.query(include_archived=True)
+        assert [log["resource_id"] for log in all_logs] == [str(i) for i in range(11, -1, -1)]
+
+        filtered = audit_logger.query(user_id="1", include_archived=True, limit=3, offset=1)
+        assert [log["resource_id"] for log in filtered] == ["9", "7", "5"]
+
+        assert audit_logger.query(start_date=LATER.isoformat(), include_archived=True) == []
+    finally:
+        db.close()
+
+# ===== TAMPERING =====
+
+def test_rewritten_archive_file_detected(archived, archive):
+    """Test a replaced file fails verification even if it is valid gzip."""
+    path = archive.archive_dir / archived[0].file_name
+    lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()
+    path.write_bytes(gzip.compress("\n".join(lines[:-1] + [""]).encode("utf-8")))
+
+    result = archive.verify_archive()
+
+    assert result["valid"] is False
+    assert result["brokenAt"] == 1
@@ -0,0 +1,242 @@
+"""
+Test suite for AuditCheckpointService.
+
+Verifies the streaming Merkle root matches the RFC 6962 definition,
+checkpoints are only cut over a valid chain, incremental verification reads
+only entries after the newest checkpoint, and tampering with entries or
+checkpoints is detected.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.audit_archive import AuditArchiveSegment
+from backend.models.audit_checkpoint import AuditCheckpoint
+from backend.services.audit_checkpoints import (
+    AuditCheckpointService,
+    MerkleAccumulator,
+    merkle_leaf,
+    merkle_node,
+)
+from backend.services.audit_logger import AuditLogger
+
+@pytest.fixture
+def engine(tmp_path):
+    """File database with the raw audit_logs table and the checkpoint/archive tables."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE audit_logs (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    user_id TEXT,
+                    resource_type TEXT,
+                    resource_id TEXT,
+                    action TEXT NOT NULL,
+                    details TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    success INTEGER NOT NULL,
+                    error_message TEXT,
+                    integrity_hash TEXT,
+                    previous_log_hash TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+        )
+    AuditCheckpoint.__table__.create(engine)
+    AuditArchiveSegment.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+@pytest.fixture
+def service(session_factory):
+    return AuditCheckpointService(
+        b"test-checkpoint-key", session_factory=session_factory, segment_size=4, page_size=3
+    )
+
+def _log(session_factory, count):
+    db = session_factory()
+    try:
+        for i in range(count):
+            AuditLogger(db).log(
+                event_type="case.read",
+                user_id="1",
+                resource_type="case",
+                resource_id=str(i),
+                action="read",
+            )
+    finally:
+        db.close()
+
+def _execute(engine, sql, **params):
+    with engine.begin() as conn:
+        conn.execute(text(sql), params)
+
+def _naive_root(leaves):
+    """RFC 6962 Merkle tree hash, computed recursively."""
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return merkle_node(_naive_root(leaves[:split]), _naive_root(leaves[split:]))
+
+# ===== MERKLE ROOT =====
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13, 64, 100])
+def test_streaming_merkle_root_matches_recursive_definition(count):
+    """Test the O(log n) accumulator equals the recursive tree hash."""
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+    accumulator = MerkleAccumulator()
+    for value in hashes:
+        accumulator.add(value)
+
+    assert accumulator.root() == _naive_root([merkle_leaf(h) for h in hashes]).hex()
+
+# ===== CHECKPOINTING =====
+
+def test_checkpoints_cover_complete_segments(service, session_factory):
+    """Test one signed checkpoint per full segment, linked to its predecessor."""
+    _log(session_factory, 10)
+
+    created = service.create_checkpoints()
+
+    assert [(c.first_rowid, c.last_rowid, c.entry_count) for c in created] == [
+        (1, 4, 4),
+        (5, 8, 4),
+    ]
+    assert created[1].anchor_hash == created[0].last_hash
+    assert created[1].previous_signature == created[0].signature
+    assert service.create_checkpoints() == []
+    assert service.verify_checkpoint_chain() == {"valid": True, "totalCheckpoints": 2}
+
+    partial = service.create_checkpoints(include_partial=True)
+    assert [(c.first_rowid, c.last_rowid) for c in partial] == [(9, 10)]
+
+def test_broken_chain_is_not_checkpointed(service, session_factory, engine):
+    """Test a segment containing a tampered entry is never signed."""
+    _log(session_factory, 8)
+    _execute(engine, "UPDATE audit_logs SET action = 'delete' WHERE ROWID = 6")
+
+    created = service.create_checkpoints()
+
+    assert [c.last_rowid for c in created] == [4]
+
+def test_missing_audit_table_is_nothing_to_checkpoint(tmp_path, caplog):
+    """Test a fresh database without audit_logs is skipped quietly."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    service = AuditCheckpointService(b"test-checkpoint-key", session_factory=sessionmaker(bind=engine))
+
+    with caplog.at_level(logging.ERROR):
+        assert service.create_checkpoints(include_partial=True) == []
+
+    assert caplog.records == []
+    engine.dispose()
+
+@pytest.mark.asyncio
+async def test_scheduler_waits_one_interval_before_first_run(service, monkeypatch):
+    """Test the background task does not checkpoint during startup."""
+    calls = []
+    monkeypatch.setattr(service, "create_checkpoints", lambda *args: calls.append(args))
+    service.interval_seconds = 0.05
+
+    service.start()
+    await asyncio.sleep(0)
+    assert calls == []
+
+    await asyncio.sleep(0.15)
+    service.stop()
+    assert calls and calls[0] == (True,)
+
+# ===== VERIFICATION =====
+
+def test_verify_since_checkpoint_checks_only_new_entries(service, session_factory, engine):
+    """Test incremental verification skips checkpointed entries."""
+    _log(session_factory, 8)
+    service.create_checkpoints()
+    _log(session_factory, 3)
+
+    # Altering a checkpointed (non-anchor) entry is only caught by segment checks
+    _execute(engine, "UPDATE audit_logs SET action = 'delete' WHERE ROWID = 2")
+
+    assert service.verify_since_checkpoint() == {
+        "valid": True,
+        "checkpointId": 2,
+        "checkedLogs": 3,
+    }
+
+    result = service.verify_segment(1)
+    assert result["valid"] is False
+    assert result["brokenAtRowid"] == 2
+
+def test_verify_since_checkpoint_detects_new_tampering(service, session_factory, engine):
+    """Test entries after the checkpoint are fully verified."""
+    _log(session_factory, 4)
+    service.create_checkpoints()
+    _log(session_factory, 2)
+    _execute(engine, "UPDATE audit_logs SET user_id = '2' WHERE ROWID = 6")
+
+    result = service.verify_since_checkpoint()
+
+    assert result["valid"] is False
+    assert result["brokenAtRowid"] == 6
+    assert result["checkedLogs"] == 1
+
+def test_verify_since_checkpoint_detects_altered_anchor(service, session_factory, engine):
+    """Test the checkpoint's last entry must still carry the signed hash."""
+    _log(session_factory, 4)
+    service.create_checkpoints()
+    _execute(engine, "DELETE FROM audit_logs WHERE ROWID = 4")
+
+    result = service.verify_since_checkpoint()
+
+    assert result["valid"] is False
+    assert "anchor" in result["error"]
+
+def test_deleted_entry_detected_by_segment_check(service, session_factory, engine):
+    """Test removing an entry changes the segment's count and Merkle root."""
+    _log(session_factory, 8)
+    service.create_checkpoints()
+    _execute(engine, "DELETE FROM audit_logs WHERE ROWID = 7")
+
+    result = service.verify_segment(2)
+
+    assert result["valid"] is False
+
+def test_random_segments_verified(service, session_factory):
+    """Test spot checks verify the sampled segments."""
+    _log(session_factory, 16)
+    service.create_checkpoints()
+
+    result = service.verify_random_segments(count=2, rng=random.Random(7))
+
+    assert result["valid"] is True
+    assert len(result["segments"]) == 2
+    assert result["checkedLogs"] == 8
+
+def test_forged_checkpoint_rejected(service, session_factory, engine):
+    """Test checkpoints edited without the key fail signature verification."""
+    _log(session_factory, 8)
+    service.create_checkpoints()
+    _execute(engine, "UPDATE audit_checkpoints SET entry_count = 3 WHERE id = 1")
+
+    assert service.verify_checkpoint_chain()["brokenAt"] == 1
+    assert service.verify_segment(1)["error"] == "Checkpoint signature invalid"
+
+    other_key = AuditCheckpointService(b"other-key", session_factory=session_factory)
+    assert other_key.verify_since_checkpoint()["valid"] is False
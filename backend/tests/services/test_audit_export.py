@@ -0,0 +1,142 @@
+"""
+Test suite for streaming audit log exports.
+
+Verifies iter_export produces the same documents as the old in-memory
+export, reads the table in bounded keyset pages, and that the admin route
+streams (optionally gzipped) chunks.
+"""
+
+import gzip
+import json
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.routes.database import export_audit_logs
+from backend.services.audit_logger import CSV_HEADERS, AuditLogger, gzip_chunks
+
+@pytest.fixture
+def engine(tmp_path):
+    """File database with the raw audit_logs table."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE audit_logs (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    user_id TEXT,
+                    resource_type TEXT,
+                    resource_id TEXT,
+                    action TEXT NOT NULL,
+                    details TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    success INTEGER NOT NULL,
+                    error_message TEXT,
+                    integrity_hash TEXT,
+                    previous_log_hash TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+        )
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def audit_logger(engine):
+    """AuditLogger over 11 entries; odd ones have details needing CSV quoting."""
+    db = sessionmaker(bind=engine)()
+    audit_logger = AuditLogger(db)
+    for i in range(11):
+        audit_logger.log(
+            event_type="case.read",
+            user_id="1",
+            resource_type="case" if i < 8 else "evidence",
+            resource_id=str(i),
+            action="read",
+            details={"note": 'a, "b"\nc'} if i % 2 else None,
+        )
+    yield audit_logger
+    db.close()
+
+# ===== ENCODING =====
+
+def test_json_and_csv_match_in_memory_encoding(audit_logger):
+    """Test chunked output equals encoding query() results in one go."""
+    logs = audit_logger.query()
+    csv = "\n".join([",".join(CSV_HEADERS)] + [audit_logger._csv_row(log) for log in logs])
+
+    assert "".join(audit_logger.iter_export("json", page_size=4)) == json.dumps(logs, indent=2)
+    assert "".join(audit_logger.iter_export("csv", page_size=4)) == csv
+    assert audit_logger.export_logs(format="csv") == csv
+
+def test_ndjson_one_entry_per_line(audit_logger):
+    """Test NDJSON lines decode to the filtered entries, newest first."""
+    body = "".join(audit_logger.iter_export("ndjson", resource_type="evidence", page_size=2))
+
+    assert [json.loads(line)["resource_id"] for line in body.splitlines()] == ["10", "9", "8"]
+
+def test_empty_export(audit_logger):
+    """Test empty results keep the old JSON and CSV output."""
+    assert "".join(audit_logger.iter_export("json", resource_id="missing")) == "[]"
+    assert "".join(audit_logger.iter_export("csv", resource_id="missing")) == ""
+
+def test_unknown_format_rejected(audit_logger):
+    """Test unsupported formats raise before any query runs."""
+    with pytest.raises(ValueError):
+        next(audit_logger.iter_export("xml"))
+
+# ===== STREAMING =====
+
+def test_rows_fetched_in_bounded_pages(audit_logger, engine):
+    """Test each query returns at most page_size rows and chunks are per page."""
+    fetched = []
+    event.listen(
+        engine,
+        "after_cursor_execute",
+        lambda conn, cursor, statement, params, context, executemany: fetched.append(
+            params
+        ),
+    )
+
+    chunks = list(audit_logger.iter_export("ndjson", page_size=4))
+
+    assert [chunk.count("\n") for chunk in chunks] == [4, 4, 3]
+    assert len(fetched) == 3
+
+def test_gzip_chunks_round_trip(audit_logger):
+    """Test incremental gzip output is one valid gzip file."""
+    chunks = audit_logger.iter_export("csv", page_size=3)
+
+    compressed = b"".join(gzip_chunks(chunks))
+
+    assert gzip.decompress(compressed).decode("utf-8") == audit_logger.export_logs(format="csv")
+
+# ===== ROUTE =====
+
+@pytest.mark.asyncio
+async def test_export_route_streams_gzip_attachment(audit_logger):
+    """Test the admin route streams a gzipped attachment and audits the export."""
+    response = await export_audit_logs(
+        format="ndjson",
+        start_date=None,
+        end_date=None,
+        resource_type="case",
+        resource_id=None,
+        event_type=None,
+        gzip=True,
+        user_id=1,
+        audit_logger=audit_logger,
+    )
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.media_type == "application/gzip"
+    assert response.headers["content-disposition"].endswith('.ndjson.gz"')
+    assert len(gzip.decompress(body).decode("utf-8").splitlines()) == 8
+    assert audit_logger.query(event_type="database.audit_exported")
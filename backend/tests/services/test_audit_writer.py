@@ -0,0 +1,188 @@
+"""
+Test suite for the batched AuditWriter.
+
+Verifies entries are chained in memory and committed in grouped
+transactions, durable events are committed before log() returns, and the
+chain stays valid across restarts and writes from other processes.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.services import audit_logger as audit_logger_module
+from backend.services.audit_logger import AuditLogger
+from backend.services.audit_writer import AuditWriter
+
+@pytest.fixture
+def engine(tmp_path):
+    """File database so separate sessions see each other's commits."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                CREATE TABLE audit_logs (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    user_id TEXT,
+                    resource_type TEXT,
+                    resource_id TEXT,
+                    action TEXT NOT NULL,
+                    details TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    success INTEGER NOT NULL,
+                    error_message TEXT,
+                    integrity_hash TEXT,
+                    previous_log_hash TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+        )
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    """Request-style session."""
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def writer(monkeypatch):
+    """Writer installed for AuditLogger.log without the background task."""
+    writer = AuditWriter(batch_size=4)
+    monkeypatch.setattr(audit_logger_module, "_audit_writer", writer)
+    return writer
+
+@pytest.fixture
+def commits(engine):
+    """Count transactions committed against the engine."""
+    counter = []
+    event.listen(engine, "commit", lambda conn: counter.append(1))
+    return counter
+
+def _log(db, event_type="case.read", **kwargs):
+    AuditLogger(db).log(
+        event_type=event_type,
+        user_id="1",
+        resource_type="case",
+        resource_id="42",
+        action="read",
+        **kwargs,
+    )
+
+def _count(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM audit_logs")).scalar()
+
+# ===== BATCHING =====
+
+def test_entries_are_queued_then_committed_in_batches(engine, db, writer, commits):
+    """Test log() only queues, and a flush commits one transaction per batch."""
+    for _ in range(10):
+        _log(db)
+
+    assert _count(engine) == 0
+    assert writer.pending_count() == 10
+
+    commits.clear()
+    assert writer.flush() == 10
+    assert len(commits) == 3  # batch_size=4
+    assert _count(engine) == 10
+    assert AuditLogger(db).verify_integrity() == {"valid": True, "totalLogs": 10}
+
+def test_durable_event_commits_before_returning(engine, db, writer):
+    """Test security events are committed with everything queued before them."""
+    _log(db)
+    _log(db)
+    _log(db, event_type="user.login")
+
+    assert _count(engine) == 3
+    assert writer.pending_count() == 0
+
+    _log(db, durable=True)
+    assert _count(engine) == 4
+
+def test_full_queue_writes_through_one_batch(engine, db, monkeypatch):
+    """Test a full queue commits a single batch, leaving the rest queued."""
+    writer = AuditWriter(batch_size=4, max_queue=6)
+    monkeypatch.setattr(audit_logger_module, "_audit_writer", writer)
+
+    for _ in range(6):
+        _log(db)
+
+    assert _count(engine) == 4
+    assert writer.pending_count() == 2
+
+def test_flush_lock_held_for_one_batch_at_a_time(engine, db, writer, commits):
+    """Test a long flush lets other writers in between batches."""
+    holds = []
+
+    class _RecordingLock:
+        def __init__(self, lock):
+            self._lock = lock
+
+        def __enter__(self):
+            self._lock.acquire()
+            self._commits_before = len(commits)
+
+        def __exit__(self, *exc):
+            holds.append(len(commits) - self._commits_before)
+            self._lock.release()
+
+    writer._flush_lock = _RecordingLock(writer._flush_lock)
+    for _ in range(10):
+        _log(db)
+
+    assert writer.flush() == 10
+    assert holds == [1, 1, 1, 0]
+
+# ===== CHAIN RECOVERY =====
+
+def test_head_recovered_from_committed_tail(engine, db, monkeypatch):
+    """Test a new writer (e.g. after a crash) continues the committed chain."""
+    _log(db)
+    _log(db)
+
+    restarted = AuditWriter()
+    monkeypatch.setattr(audit_logger_module, "_audit_writer", restarted)
+    _log(db)
+    restarted.flush()
+
+    assert AuditLogger(db).verify_integrity() == {"valid": True, "totalLogs": 3}
+
+def test_batch_rechained_when_tail_moves(engine, db, writer, monkeypatch):
+    """Test entries written by another process never fork the chain."""
+    _log(db)
+    _log(db)
+
+    # Another worker in sync mode appends while our entries are queued
+    monkeypatch.setattr(audit_logger_module, "_audit_writer", None)
+    _log(db, event_type="case.update")
+    monkeypatch.setattr(audit_logger_module, "_audit_writer", writer)
+    _log(db)
+
+    assert writer.flush() == 3
+    assert writer.rechained == 1
+    assert AuditLogger(db).verify_integrity() == {"valid": True, "totalLogs": 4}
+
+# ===== LIFECYCLE =====
+
+@pytest.mark.asyncio
+async def test_start_routes_logging_and_stop_flushes(engine, db):
+    """Test start() installs the writer and stop() drains the queue."""
+    writer = AuditWriter(flush_interval=60)
+    writer.start()
+    try:
+        _log(db)
+        assert _count(engine) == 0
+    finally:
+        writer.stop()
+
+    assert _count(engine) == 1
+    assert audit_logger_module._audit_writer is None
@@ -0,0 +1,259 @@
+"""Tests for bounded chat history and the rolling conversation summary."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.base import Base
+from backend.models.chat import Message
+from backend.services.chat_history import (
+    SUMMARY_HEADER,
+    build_history_messages,
+    extractive_summary,
+    make_ai_summarizer,
+    max_loaded_messages,
+)
+from backend.services.chat_service import (
+    ChatService,
+    ConversationHistoryResponse,
+    CreateConversationInput,
+    MessageResponse,
+)
+
+USER_ID = 1
+
+
+@pytest.fixture
+def in_memory_db():
+    """Create an in-memory SQLite database for testing."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    session.statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: session.statements.append(statement),
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def chat_service(in_memory_db):
+    return ChatService(in_memory_db)
+
+
+async def _conversation_with_turns(chat_service, turns: int) -> int:
+    conversation = await chat_service.create_conversation(
+        CreateConversationInput(user_id=USER_ID, title="Long chat")
+    )
+    chat_service.db.add_all(
+        Message(conversation_id=conversation.id, role=role, content=f"{role} {turn}")
+        for turn in range(turns)
+        for role in ("user", "assistant")
+    )
+    chat_service.db.commit()
+    return conversation.id
+
+
+def _message(id_: int, role: str, content: str, token_count=None) -> MessageResponse:
+    return MessageResponse(
+        id=id_, conversation_id=1, role=role, content=content,
+        thinking_content=None, timestamp="2024-01-01T00:00:00", token_count=token_count,
+    )
+
+
+class _RecordingSummarizer:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, previous, messages):
+        self.calls.append((previous, [m.content for m in messages]))
+        return f"summary through {messages[-1].content}"
+
+
+# ===== PROMPT BUILDING =====
+
+def test_build_messages_puts_summary_in_system_prompt():
+    history = ConversationHistoryResponse(
+        conversation_id=1,
+        summary="User was dismissed in May.",
+        messages=[_message(1, "user", "Is that unfair?"), _message(2, "assistant", "Maybe.")],
+    )
+
+    messages = build_history_messages("Base prompt", history, "What next?", token_budget=1000)
+
+    assert [m.role for m in messages] == ["system", "user", "assistant", "user"]
+    assert messages[0].content == f"Base prompt\n\n{SUMMARY_HEADER}\nUser was dismissed in May."
+    assert messages[-1].content == "What next?"
+
+
+def test_build_messages_keeps_newest_messages_within_budget():
+    history = ConversationHistoryResponse(
+        conversation_id=1,
+        messages=[
+            _message(1, "user", "old question", token_count=500),
+            _message(2, "assistant", "old answer", token_count=500),
+            _message(3, "user", "recent question", token_count=10),
+            _message(4, "assistant", "recent answer", token_count=10),
+        ],
+    )
+
+    messages = build_history_messages("Base", history, "New", token_budget=100)
+
+    assert [m.content for m in messages[1:-1]] == ["recent question", "recent answer"]
+
+
+def test_build_messages_drops_leading_assistant_reply():
+    history = ConversationHistoryResponse(
+        conversation_id=1,
+        messages=[
+            _message(1, "user", "question", token_count=500),
+            _message(2, "assistant", "answer", token_count=10),
+        ],
+    )
+
+    messages = build_history_messages("Base", history, "New", token_budget=100)
+
+    assert [m.role for m in messages] == ["system", "user"]
+
+
+def test_build_messages_for_new_conversation():
+    messages = build_history_messages("Base", None, "Hello")
+
+    assert [(m.role, m.content) for m in messages] == [("system", "Base"), ("user", "Hello")]
+
+
+# ===== SUMMARIZERS =====
+
+def test_extractive_summary_stays_within_limit():
+    messages = [_message(i, "user", "word " * 200) for i in range(20)]
+
+    summary = extractive_summary("Earlier: greeting", messages, max_tokens=100)
+
+    assert len(summary) <= 100 * 4 + 3
+    assert summary.startswith("User: word")
+    assert "Earlier: greeting" not in summary
+
+
+@pytest.mark.asyncio
+async def test_ai_summarizer_falls_back_when_provider_fails():
+    class _FailingAI:
+        async def chat(self, messages):
+            raise RuntimeError("provider down")
+
+    summarize = make_ai_summarizer(_FailingAI(), max_tokens=100)
+
+    summary = await summarize(None, [_message(1, "user", "My landlord kept my deposit")])
+
+    assert summary == "User: My landlord kept my deposit"
+
+
+# ===== ROLLING SUMMARY =====
+
+@pytest.mark.asyncio
+async def test_load_recent_history_reads_bounded_tail(chat_service):
+    conversation_id = await _conversation_with_turns(chat_service, 50)
+    chat_service.db.statements.clear()
+
+    history = await chat_service.load_recent_history(
+        conversation_id, USER_ID, max_messages=max_loaded_messages(3)
+    )
+
+    # Up to 2 x N turns are unsummarized between folds
+    assert len(history.messages) == 12
+    assert [m.content for m in history.messages[:2]] == ["user 44", "assistant 44"]
+    assert history.messages[-1].content == "assistant 49"
+    assert any("LIMIT" in statement for statement in chat_service.db.statements)
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_folds_older_turns_in_batches(chat_service):
+    conversation_id = await _conversation_with_turns(chat_service, 4)
+    summarize = _RecordingSummarizer()
+
+    # 8 unsummarized messages, keep 4: not due until more than 8
+    assert not await chat_service.update_rolling_summary(conversation_id, summarize, keep_messages=4)
+
+    chat_service.db.add_all([
+        Message(conversation_id=conversation_id, role="user", content="user 4"),
+        Message(conversation_id=conversation_id, role="assistant", content="assistant 4"),
+    ])
+    chat_service.db.commit()
+
+    assert await chat_service.update_rolling_summary(conversation_id, summarize, keep_messages=4)
+    assert summarize.calls == [
+        (None, ["user 0", "assistant 0", "user 1", "assistant 1", "user 2", "assistant 2"])
+    ]
+
+    history = await chat_service.load_recent_history(conversation_id, USER_ID, max_messages=20)
+
+    assert history.summary == "summary through assistant 2"
+    assert [m.content for m in history.messages] == [
+        "user 3", "assistant 3", "user 4", "assistant 4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_catches_up_on_long_conversations(chat_service):
+    conversation_id = await _conversation_with_turns(chat_service, 50)
+    summarize = _RecordingSummarizer()
+
+    while await chat_service.update_rolling_summary(conversation_id, summarize, keep_messages=4):
+        pass
+
+    assert all(len(folded) <= 8 for _, folded in summarize.calls)
+    assert summarize.calls[1][0] == "summary through assistant 3"
+
+    history = await chat_service.load_recent_history(conversation_id, USER_ID, max_messages=20)
+    assert len(history.messages) <= 8
+    assert history.messages[-1].content == "assistant 49"
+
+
+@pytest.mark.asyncio
+async def test_background_summary_update_uses_its_own_session(tmp_path, monkeypatch):
+    from backend.routes import chat as chat_routes
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'chat.db'}")
+    Base.metadata.create_all(engine)
+    request_db = sessionmaker(bind=engine)()
+    conversation_id = await _conversation_with_turns(ChatService(request_db), 30)
+    request_db.close()
+
+    class _SummaryAI:
+        async def chat(self, messages):
+            return "Tenant disputes a deposit."
+
+    monkeypatch.setattr(chat_routes, "AuditLogger", lambda db: None)
+    await chat_routes.update_conversation_summary(engine, _SummaryAI(), conversation_id, 3)
+
+    check_db = sessionmaker(bind=engine)()
+    history = await ChatService(check_db).load_recent_history(conversation_id, USER_ID, 20)
+    check_db.close()
+    engine.dispose()
+
+    assert history.summary == "Tenant disputes a deposit."
+    assert chat_routes._summaries_in_progress == set()
+
+
+def test_summary_columns_added_to_existing_table(tmp_path):
+    from sqlalchemy import inspect, text
+
+    from backend.models.base import add_missing_columns
+    from backend.models.chat import Conversation
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE chat_conversations (id INTEGER PRIMARY KEY, title TEXT)"))
+
+    columns = ["summary", "summary_message_id"]
+    with engine.begin() as conn:
+        assert add_missing_columns(conn, Conversation.__table__, columns) == columns
+    with engine.begin() as conn:
+        assert add_missing_columns(conn, Conversation.__table__, columns) == []
+
+    names = {column["name"] for column in inspect(engine).get_columns("chat_conversations")}
+    engine.dispose()
+    assert set(columns) <= names
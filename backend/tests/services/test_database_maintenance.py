@@ -0,0 +1,147 @@
+"""
+Test suite for DatabaseMaintenanceService.
+Verifies incremental vacuum steps, idle gating and offline compaction.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from backend.services.database_maintenance import (
+    DatabaseMaintenanceService,
+    compact_database,
+    get_auto_vacuum_mode,
+)
+
+
+def _make_engine(path, auto_vacuum="INCREMENTAL"):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        # auto_vacuum only takes effect if set before WAL on a new database
+        cursor.execute(f"PRAGMA auto_vacuum = {auto_vacuum}")
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.close()
+
+    return engine
+
+
+def _fill_and_delete(engine, rows=2000):
+    """Create free pages by inserting then deleting bulky rows."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS blobs (id INTEGER PRIMARY KEY, data TEXT)"))
+        conn.execute(
+            text("INSERT INTO blobs (data) VALUES (:data)"),
+            [{"data": "x" * 2000} for _ in range(rows)],
+        )
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM blobs"))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-based SQLite engine with incremental auto_vacuum."""
+    engine = _make_engine(tmp_path / "maintenance.db")
+    yield engine
+    engine.dispose()
+
+
+def test_storage_info_reports_reclaimable_pages(engine):
+    """Test storage info reports mode and freelist size."""
+    _fill_and_delete(engine)
+    service = DatabaseMaintenanceService(engine)
+
+    info = service.get_storage_info()
+
+    assert info["auto_vacuum"] == "incremental"
+    assert info["freelist_count"] > 0
+    assert info["reclaimable_bytes"] == info["freelist_count"] * info["page_size"]
+
+
+def test_incremental_vacuum_step_is_bounded(engine):
+    """Test a single step frees at most the requested number of pages."""
+    _fill_and_delete(engine)
+    service = DatabaseMaintenanceService(engine, step_pages=100)
+    before = service.get_storage_info()["freelist_count"]
+
+    freed = service.incremental_vacuum_step()
+
+    assert freed == 100
+    assert service.get_storage_info()["freelist_count"] == before - 100
+
+
+@pytest.mark.asyncio
+async def test_run_incremental_vacuum_reclaims_all_free_pages(engine):
+    """Test the stepped vacuum drains the freelist when idle."""
+    _fill_and_delete(engine)
+    service = DatabaseMaintenanceService(
+        engine, step_pages=200, step_pause=0, idle_probe=lambda: 3600.0
+    )
+    before = service.get_storage_info()["freelist_count"]
+
+    freed = await service.run_incremental_vacuum()
+
+    assert freed == before
+    assert service.get_storage_info()["freelist_count"] == 0
+    assert service.pages_reclaimed_total == before
+
+
+@pytest.mark.asyncio
+async def test_run_incremental_vacuum_stops_when_busy(engine):
+    """Test the idle-gated vacuum does nothing while requests are arriving."""
+    _fill_and_delete(engine)
+    service = DatabaseMaintenanceService(engine, step_pause=0, idle_probe=lambda: 0.0)
+
+    assert await service.run_incremental_vacuum(require_idle=True) == 0
+    assert service.get_storage_info()["freelist_count"] > 0
+
+
+def test_incremental_vacuum_noop_without_incremental_mode(tmp_path):
+    """Test steps are skipped on databases still using auto_vacuum=NONE."""
+    engine = _make_engine(tmp_path / "legacy.db", auto_vacuum="NONE")
+    _fill_and_delete(engine)
+    service = DatabaseMaintenanceService(engine)
+
+    assert service.incremental_vacuum_step() == 0
+    engine.dispose()
+
+
+def test_compact_database_converts_mode_and_shrinks_file(tmp_path):
+    """Test offline compaction swaps in a smaller copy with the new mode."""
+    db_path = tmp_path / "legacy.db"
+    engine = _make_engine(db_path, auto_vacuum="NONE")
+    _fill_and_delete(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO blobs (data) VALUES ('kept')"))
+
+    result = compact_database(engine, str(db_path), auto_vacuum="incremental")
+
+    assert result["auto_vacuum"] == "incremental"
+    assert result["size_after_bytes"] < result["size_before_bytes"]
+    with engine.connect() as conn:
+        assert get_auto_vacuum_mode(conn) == "incremental"
+        assert conn.execute(text("SELECT data FROM blobs")).scalar() == "kept"
+    engine.dispose()
+
+
+def test_storage_report_lists_tables_and_indexes(engine):
+    """Test dbstat report attributes index pages to their owning table."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE blobs (id INTEGER PRIMARY KEY, data TEXT)"))
+        conn.execute(text("CREATE INDEX idx_blobs_data ON blobs (data)"))
+        conn.execute(
+            text("INSERT INTO blobs (data) VALUES (:data)"),
+            [{"data": f"{i:04d}" + "x" * 500} for i in range(500)],
+        )
+    service = DatabaseMaintenanceService(engine)
+
+    report = service.get_storage_report()
+
+    by_name = {obj["name"]: obj for obj in report}
+    assert by_name["blobs"]["type"] == "table"
+    assert by_name["idx_blobs_data"]["type"] == "index"
+    assert by_name["idx_blobs_data"]["table"] == "blobs"
+    assert by_name["blobs"]["size_bytes"] == by_name["blobs"]["pages"] * 4096
+    # Largest object first
+    assert report[0]["size_bytes"] == max(obj["size_bytes"] for obj in report)
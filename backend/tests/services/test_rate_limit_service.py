@@ -0,0 +1,204 @@
+"""
+Test suite for RateLimitService.
+
+Verifies GCRA counting and draining, lockout, per-operation overrides,
+that expired entries are dropped incrementally without full scans, and that
+the SQLite store enforces one limit across workers.
+"""
+
+import threading
+
+import pytest
+
+from backend.services.rate_limit_service import RateLimitService
+from backend.services.rate_limit_store import SqliteRateLimitStore
+
+class FakeClock:
+    """Manually advanced epoch clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    """Fake clock shared by the service under test."""
+    return FakeClock()
+
+@pytest.fixture
+def limiter(clock):
+    """Rate limiter driven by the fake clock."""
+    service = RateLimitService(clock=clock)
+    yield service
+    service.destroy()
+
+# ===== COUNTING =====
+
+def test_check_does_not_consume(limiter):
+    """Test checks are read-only and only increments count attempts."""
+    for _ in range(10):
+        assert limiter.check_rate_limit(1, "login").allowed is True
+
+    limiter.increment(1, "login")
+    limiter.increment(1, "login")
+
+    result = limiter.check_rate_limit(1, "login")
+    assert result.allowed is True
+    assert result.attempts_remaining == 3
+    assert limiter.get_remaining(1, "login") == 3
+    assert limiter.get_attempt_count(1, "login") == 2
+
+def test_attempts_drain_one_interval_at_a_time(limiter, clock):
+    """Test counted attempts leak out every window / max_attempts seconds."""
+    # api_request: 100 per 60s, emission interval 0.6s
+    for _ in range(10):
+        limiter.increment(1, "api_request")
+
+    clock.advance(0.6 * 4)
+    assert limiter.get_attempt_count(1, "api_request") == 6
+
+    clock.advance(60)
+    assert limiter.get_attempt_count(1, "api_request") == 0
+    assert limiter.get_reset_time(1, "api_request") is None
+
+# ===== LOCKOUT =====
+
+def test_lockout_after_max_attempts(limiter, clock):
+    """Test reaching max attempts locks the key for the lock duration."""
+    for _ in range(5):
+        limiter.increment(7, "login")
+
+    result = limiter.check_rate_limit(7, "login")
+    assert result.allowed is False
+    assert result.remaining_time == 15 * 60
+    assert limiter.is_locked(7, "login") is True
+    assert limiter.get_remaining(7, "login") == 0
+
+    # Attempts while locked do not extend the lock
+    limiter.increment(7, "login")
+    clock.advance(15 * 60 + 1)
+
+    assert limiter.is_locked(7, "login") is False
+    assert limiter.check_rate_limit(7, "login").allowed is True
+
+def test_reset_clears_key(limiter):
+    """Test reset forgets attempts and locks."""
+    for _ in range(5):
+        limiter.increment(7, "login")
+
+    limiter.reset(7, "login")
+
+    assert limiter.is_locked(7, "login") is False
+    assert limiter.get_remaining(7, "login") == 5
+
+def test_deny_without_lockout_reports_retry_time(limiter, clock):
+    """Test operations without lockout deny until one attempt drains."""
+    limiter.increment(3, "gdpr_delete")
+
+    result = limiter.check_rate_limit(3, "gdpr_delete")
+    assert result.allowed is False
+    assert result.remaining_time == 30 * 24 * 60 * 60
+    assert limiter.is_locked(3, "gdpr_delete") is False
+
+# ===== CONFIGURATION =====
+
+def test_overrides_apply_to_increment_and_keep_defaults(limiter):
+    """Test check overrides are reused by increment and never mutate defaults."""
+    limiter.check_rate_limit(1, "register", max_requests=2, window_seconds=3600)
+    limiter.check_rate_limit(1, "login", max_requests=2)
+
+    limiter.increment(1, "register")
+    limiter.increment(1, "register")
+
+    assert limiter.check_rate_limit(1, "register").allowed is False
+    assert RateLimitService.DEFAULT_CONFIGS["login"].max_attempts == 5
+
+# ===== EXPIRY =====
+
+def test_expired_entries_are_dropped_incrementally(limiter, clock):
+    """Test idle keys leave memory in bounded batches as traffic continues."""
+    for user_id in range(100):
+        limiter.increment(user_id, "api_request")
+    clock.advance(61)
+
+    limiter.check_rate_limit(1000, "api_request")
+    stats = limiter.get_statistics()
+    assert 0 < stats["total_tracked"] < 100
+    assert stats["active_attempts"] == 0
+
+    assert limiter.cleanup_expired() == stats["total_tracked"]
+    assert limiter.get_statistics()["total_tracked"] == 0
+
+def test_extended_keys_survive_their_first_deadline(limiter, clock):
+    """Test a key touched again is rescheduled rather than dropped."""
+    limiter.increment(1, "api_request")
+    clock.advance(0.5)
+    limiter.increment(1, "api_request")
+    clock.advance(0.2)
+
+    assert limiter.cleanup_expired() == 0
+    assert limiter.get_attempt_count(1, "api_request") == 1
+
+    clock.advance(1)
+    assert limiter.cleanup_expired() == 1
+
+# ===== SHARED STORE =====
+
+@pytest.fixture
+def store_path(tmp_path):
+    """Path of a shared rate limit file."""
+    return str(tmp_path / "rate_limits.db")
+
+def _worker(store_path, clock):
+    return RateLimitService(clock=clock, store=SqliteRateLimitStore(store_path))
+
+def test_lockout_is_shared_between_workers(store_path, clock):
+    """Test attempts on one worker count, and lock, on another."""
+    worker_a = _worker(store_path, clock)
+    worker_b = _worker(store_path, clock)
+
+    for worker in (worker_a, worker_b, worker_a, worker_b, worker_a):
+        worker.increment(9, "login")
+
+    assert worker_b.is_locked(9, "login") is True
+    assert worker_b.check_rate_limit(9, "login").allowed is False
+
+    worker_a.reset(9, "login")
+    assert worker_b.check_rate_limit(9, "login").allowed is True
+
+    worker_a.destroy()
+    worker_b.destroy()
+
+def test_concurrent_increments_are_not_lost(store_path, clock):
+    """Test increments racing from several workers are all counted."""
+    workers = [_worker(store_path, clock) for _ in range(4)]
+    # api_request allows 100 per minute, so 80 increments stay below the cap
+    threads = [
+        threading.Thread(target=lambda w=worker: [w.increment(1, "api_request") for _ in range(20)])
+        for worker in workers
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert workers[0].get_attempt_count(1, "api_request") == 80
+    for worker in workers:
+        worker.destroy()
+
+def test_shared_store_expires_idle_rows(store_path, clock):
+    """Test expired rows are deleted and live rows kept."""
+    limiter = _worker(store_path, clock)
+    limiter.increment(1, "api_request")
+    limiter.increment(2, "login")
+    clock.advance(120)
+
+    assert limiter.cleanup_expired() == 1
+    assert limiter.get_statistics()["total_tracked"] == 1
+    limiter.destroy()
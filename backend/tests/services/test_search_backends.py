@@ -0,0 +1,128 @@
+"""
+Test suite for full-text search backends.
+Verifies dialect selection, query building and the SQLite FTS5 round trip.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.services.search_backends import (
+    PostgresSearchBackend,
+    SearchBackend,
+    SqliteFtsSearchBackend,
+    get_search_backend,
+    install_search_index,
+)
+from backend.services.search_index_builder import SearchIndexBuilder
+from backend.services.search_service import SearchQuery, SearchService
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with the FTS5 search_index installed."""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        install_search_index(conn)
+        conn.execute(
+            text("CREATE TABLE cases (id INTEGER PRIMARY KEY, user_id INTEGER, title TEXT)")
+        )
+        conn.execute(text("INSERT INTO cases (id, user_id, title) VALUES (1, 1, 'Smith v Acme')"))
+        conn.execute(
+            text(
+                "CREATE TABLE audit_logs (id TEXT, timestamp TEXT, event_type TEXT, user_id TEXT, "
+                "resource_type TEXT, resource_id TEXT, action TEXT, details TEXT, ip_address TEXT, "
+                "user_agent TEXT, success INTEGER, error_message TEXT, integrity_hash TEXT, "
+                "previous_log_hash TEXT, created_at TEXT)"
+            )
+        )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+# ===== BACKEND SELECTION =====
+
+def test_backend_chosen_from_dialect():
+    """Test the backend follows the engine dialect."""
+    sqlite_engine = create_engine("sqlite:///:memory:")
+    postgres_engine = Mock()
+    postgres_engine.dialect.name = "postgresql"
+
+    assert isinstance(get_search_backend(sqlite_engine), SqliteFtsSearchBackend)
+    assert isinstance(get_search_backend(postgres_engine), PostgresSearchBackend)
+
+def test_unknown_bind_defaults_to_sqlite():
+    """Test sessions without a resolvable dialect keep the FTS5 behaviour."""
+    assert isinstance(get_search_backend(Mock()), SqliteFtsSearchBackend)
+
+def test_incomplete_backend_cannot_be_instantiated():
+    """Test a backend missing part of the interface fails at construction."""
+    class _QueryOnlyBackend(SearchBackend):
+        def build_query(self, query):
+            return query
+
+    with pytest.raises(TypeError):
+        _QueryOnlyBackend()
+
+# ===== QUERY BUILDING =====
+
+def test_sqlite_query_uses_prefix_terms():
+    """Test FTS5 queries OR quoted prefix terms."""
+    backend = SqliteFtsSearchBackend()
+
+    assert backend.build_query('contract "dispute') == '"contract"* OR """dispute"*'
+
+def test_postgres_query_strips_operators():
+    """Test tsquery building keeps only word characters."""
+    backend = PostgresSearchBackend()
+
+    assert backend.build_query("contract & !dispute | (wage") == "contract:* | dispute:* | wage:*"
+    with pytest.raises(ValueError):
+        backend.build_query("!!! &&")
+
+def test_postgres_sql_uses_gin_tsvector():
+    """Test PostgreSQL statements target the tsvector column and rank with ts_rank_cd."""
+    backend = PostgresSearchBackend()
+
+    search_sql = str(backend.search_sql("user_id = :user_id"))
+    upsert_sql = str(backend.upsert_sql(["entity_type", "entity_id", "title"]))
+
+    assert "document @@ to_tsquery('english', :fts_query)" in search_sql
+    assert "ts_rank_cd" in search_sql and "ts_headline" in search_sql
+    assert "ON CONFLICT (entity_type, entity_id) DO UPDATE SET title = EXCLUDED.title" in upsert_sql
+
+# ===== SQLITE ROUND TRIP =====
+
+@pytest.mark.asyncio
+async def test_indexed_documents_are_searchable(db_session):
+    """Test documents written by the builder are found through the FTS5 backend."""
+    builder = SearchIndexBuilder(db=db_session)
+    await builder.index_case(
+        {
+            "id": 1,
+            "user_id": 1,
+            "title": "Smith v Acme",
+            "description": "Unpaid wages after dismissal",
+            "case_type": "employment",
+            "status": "active",
+        }
+    )
+
+    service = SearchService(db=db_session)
+    results, total = service._search_with_index(
+        user_id=1,
+        original_query="wage",
+        filters=None,
+        entity_types=["case"],
+        limit=10,
+        offset=0,
+    )
+
+    assert total == 1
+    assert results[0].title == "Smith v Acme"
+    assert results[0].relevance_score > 0
+
+    # Another user's documents are never returned
+    response = service.search(user_id=2, query=SearchQuery(query="wage"))
+    assert response.total == 0
@@ -502,5 +502,59 @@ class TestRealWorldUsage:
         assert get_encryption_service() is mock_encryption2
         assert get_encryption_service() is not mock_encryption1
 
+class TestDeferredInitialization:
+    """Test cases for factory-based (deferred) initialization."""
+
+    def setup_method(self):
+        reset_service_container()
+
+    def teardown_method(self):
+        reset_service_container()
+
+    def test_factories_run_once_on_first_use(self):
+        """Services are built on first access and then reused."""
+        audit_factory = Mock(return_value=Mock(name="AuditLogger"))
+        container = get_container()
+
+        container.initialize_deferred(
+            encryption_service=lambda: "encryption",
+            audit_logger=audit_factory,
+        )
+
+        assert container.is_initialized()
+        audit_factory.assert_not_called()
+        assert get_audit_logger() is get_audit_logger()
+        audit_factory.assert_called_once_with()
+        assert get_encryption_service() == "encryption"
+
+    def test_failed_factory_is_retried(self):
+        """A factory that raises does not leave the service unset forever."""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return "audit"
+
+        get_container().initialize_deferred(encryption_service=Mock, audit_logger=flaky)
+
+        with pytest.raises(RuntimeError):
+            get_audit_logger()
+        assert get_audit_logger() == "audit"
+
+    def test_cannot_mix_with_eager_initialization(self):
+        """Deferred initialization counts as initialized."""
+        container = get_container()
+        container.initialize_deferred(encryption_service=Mock, audit_logger=Mock)
+
+        with pytest.raises(ValueError):
+            container.initialize(encryption_service=Mock(), audit_logger=Mock())
+
+        container.reset()
+        assert not container.is_initialized()
+        with pytest.raises(ServiceContainerError):
+            get_key_manager()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -11,6 +11,7 @@ Tests all functionality of the startup metrics tracking system including:
 - Performance recommendations
 """
 
+import os
 import pytest
 import time
 import json
@@ -24,6 +25,13 @@ from backend.services.startup_metrics import (
     startup_metrics,
     log_startup_metrics,
     export_startup_metrics,
+    DEFERRED_MODULES,
+    TEST_IMPORT_TIME_CEILING_MS,
+    check_import_budget,
+    get_import_time_budget_ms,
+    measure_import_times,
+    parse_import_times,
+    summarize_import_times,
 )
 
 class TestStartupTimestamps:
@@ -504,5 +512,57 @@ class TestIntegration:
         # Verify perceived startup time
         assert data["summary"]["perceived_startup_time"] == 350
 
+IMPORTTIME_SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |     starlette
+import time:      2000 |       3000 |   fastapi
+import time:      1000 |       1000 |     reportlab
+import time:      5000 |       9150 | backend.main
+"""
+
+
+class TestImportTimeBreakdown:
+    """Test the cold-start import breakdown and budget."""
+
+    def test_parse_import_times(self):
+        """-X importtime lines become per-module timings with nesting depth."""
+        timings = parse_import_times(IMPORTTIME_SAMPLE)
+
+        assert [t.module for t in timings] == ["starlette", "fastapi", "reportlab", "backend.main"]
+        assert [t.depth for t in timings] == [2, 1, 2, 0]
+        assert timings[-1].cumulative_ms == 9.15
+        assert summarize_import_times(timings)["total_ms"] == 9.2
+
+    def test_budget_violations(self):
+        """Over-budget totals and eagerly imported heavy modules are reported."""
+        timings = parse_import_times(IMPORTTIME_SAMPLE)
+
+        assert check_import_budget(timings, budget_ms=100, deferred=()) == []
+        violations = check_import_budget(timings, budget_ms=5)
+
+        assert len(violations) == 2
+        assert "budget 5ms" in violations[0]
+        assert violations[1].startswith("reportlab is imported at startup")
+
+    def test_application_defers_heavy_dependencies(self, tmp_path, monkeypatch):
+        """Importing the app (from any working directory) skips deferred modules."""
+        monkeypatch.chdir(tmp_path)
+        timings = measure_import_times("backend.main")
+        imported = {t.module for t in timings}
+
+        assert "backend.main" in imported
+        assert imported.isdisjoint(DEFERRED_MODULES)
+
+    @pytest.mark.performance
+    def test_application_cold_start_within_budget(self):
+        """Importing the app stays within STARTUP_IMPORT_BUDGET_MS, or the default ceiling."""
+        budget_ms = (
+            get_import_time_budget_ms()
+            if os.getenv("STARTUP_IMPORT_BUDGET_MS")
+            else TEST_IMPORT_TIME_CEILING_MS
+        )
+        timings = measure_import_times("backend.main")
+
+        assert check_import_budget(timings, budget_ms=budget_ms) == []
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,111 @@
+"""
+Test suite for WalCheckpointManager.
+Verifies checkpoint statistics, idle escalation to TRUNCATE and status reporting.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from backend.services.wal_checkpoint_manager import WalCheckpointManager
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-based SQLite engine in WAL mode without automatic checkpoints."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'wal.db'}", connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA wal_autocheckpoint = 0")
+        cursor.close()
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE audit (id INTEGER PRIMARY KEY, data TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def _write(engine, rows=200):
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO audit (data) VALUES (:data)"),
+            [{"data": "x" * 1000} for _ in range(rows)],
+        )
+
+
+def test_passive_checkpoint_reports_frames(engine):
+    """Test a PASSIVE checkpoint copies frames without shrinking the WAL."""
+    _write(engine)
+    manager = WalCheckpointManager(engine)
+    assert manager.get_wal_size() > 0
+
+    result = manager.checkpoint("PASSIVE")
+
+    assert result["busy"] is False
+    assert result["wal_frames"] > 0
+    assert result["checkpoint_lag_frames"] == 0
+    assert result["wal_size_after_bytes"] == result["wal_size_before_bytes"]
+    assert manager.checkpoint_counts["PASSIVE"] == 1
+
+
+def test_checkpoint_lag_while_reader_holds_snapshot(engine):
+    """Test frames newer than an open read snapshot are reported as lag."""
+    _write(engine, rows=10)
+    manager = WalCheckpointManager(engine)
+
+    with engine.connect() as reader:
+        reader.execute(text("BEGIN"))
+        reader.execute(text("SELECT COUNT(*) FROM audit")).scalar()
+        _write(engine, rows=50)
+
+        result = manager.checkpoint("PASSIVE")
+
+        assert result["checkpoint_lag_frames"] > 0
+        reader.execute(text("COMMIT"))
+
+
+def test_run_once_truncates_when_idle(engine):
+    """Test idle periods escalate to TRUNCATE and reset the WAL file."""
+    _write(engine)
+    manager = WalCheckpointManager(engine, idle_probe=lambda: 3600.0)
+
+    result = manager.run_once()
+
+    assert result["mode"] == "TRUNCATE"
+    assert manager.get_wal_size() == 0
+    assert manager.checkpoint_counts == {"PASSIVE": 1, "FULL": 0, "RESTART": 0, "TRUNCATE": 1}
+
+
+def test_run_once_stays_passive_when_busy(engine):
+    """Test request traffic keeps checkpoints PASSIVE."""
+    _write(engine)
+    manager = WalCheckpointManager(engine, idle_probe=lambda: 0.0)
+
+    result = manager.run_once()
+
+    assert result["mode"] == "PASSIVE"
+    assert manager.get_wal_size() > 0
+    status = manager.get_status()
+    assert status["last_checkpoint_mode"] == "PASSIVE"
+    assert status["wal_size_bytes"] == manager.get_wal_size()
+
+
+def test_invalid_mode_rejected(engine):
+    """Test unknown checkpoint modes are rejected before reaching SQLite."""
+    manager = WalCheckpointManager(engine)
+
+    with pytest.raises(ValueError):
+        manager.checkpoint("VACUUM")
+
+
+def test_memory_database_is_skipped():
+    """Test in-memory databases have no WAL to manage."""
+    manager = WalCheckpointManager(create_engine("sqlite:///:memory:"))
+
+    assert manager.is_sqlite is False
+    assert manager.checkpoint()["skipped"] is True
+    assert manager.get_status()["enabled"] is False
@@ -0,0 +1,171 @@
+"""Tests for the pure ASGI middleware stack (wrapping, logging, metrics)."""
+
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.middleware.error_handler import ErrorHandlingMiddleware
+from backend.middleware.logging_middleware import LoggingMiddleware
+from backend.middleware.performance_middleware import PerformanceMiddleware
+from backend.middleware.response_wrapper import ResponseWrapperMiddleware
+from backend.utils.performance_metrics import metrics_collector
+
+
+def _create_app(wrap: bool = True) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(PerformanceMiddleware, enable_system_metrics=False)
+    if wrap:
+        app.add_middleware(ResponseWrapperMiddleware)
+
+    @app.get("/items")
+    def items():  # pragma: no cover - exercised via TestClient
+        return [{"id": 1}]
+
+    @app.get("/wrapped")
+    def already_wrapped():  # pragma: no cover - exercised via TestClient
+        return {"success": True, "data": {"id": 1}}
+
+    @app.get("/text")
+    def text():  # pragma: no cover - exercised via TestClient
+        return PlainTextResponse("plain")
+
+    @app.get("/missing")
+    def missing():  # pragma: no cover - exercised via TestClient
+        raise HTTPException(status_code=404, detail="Case not found")
+
+    @app.get("/stream")
+    def stream():  # pragma: no cover - exercised directly
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    @app.get("/events")
+    def events():  # pragma: no cover - exercised directly
+        return StreamingResponse(
+            iter([b"data: one\n\n", b"data: two\n\n"]), media_type="text/event-stream"
+        )
+
+    @app.get("/export")
+    def export():  # pragma: no cover - exercised via TestClient
+        return StreamingResponse(iter([b"[", b"1", b"]"]), media_type="application/json")
+
+    @app.get("/status")
+    def status():  # pragma: no cover - exercised via TestClient
+        return {"message": "ok", "success": True}
+
+    return app
+
+
+def _send_messages(app, path: str) -> list:
+    """Call the ASGI app directly and return every message it sends."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # Client stays connected until the response completes
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+def test_json_response_is_wrapped():
+    client = TestClient(_create_app())
+
+    response = client.get("/items")
+
+    assert response.json() == {"success": True, "data": [{"id": 1}]}
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_already_wrapped_and_non_json_bodies_are_unchanged():
+    client = TestClient(_create_app())
+
+    assert client.get("/wrapped").json() == {"success": True, "data": {"id": 1}}
+    assert client.get("/text").text == "plain"
+    assert client.get("/status").json() == {"message": "ok", "success": True}
+
+
+def test_streaming_json_is_not_wrapped():
+    client = TestClient(_create_app())
+
+    assert client.get("/export").json() == [1]
+
+
+def test_errors_are_normalized_not_wrapped():
+    client = TestClient(_create_app())
+
+    response = client.get("/missing")
+
+    assert response.status_code == 404
+    assert response.json()["success"] is False
+    assert response.json()["error"]["message"] == "Case not found"
+
+
+def test_correlation_id_is_propagated():
+    client = TestClient(_create_app())
+
+    response = client.get("/items", headers={"X-Correlation-ID": "abc-123"})
+
+    assert response.headers["x-correlation-id"] == "abc-123"
+
+
+def test_streaming_body_passes_through_in_chunks():
+    messages = _send_messages(_create_app(wrap=False), "/stream")
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body" and m["body"]]
+    assert bodies == [b"a", b"b", b"c"]
+
+
+def test_event_stream_is_not_buffered_by_wrapper():
+    messages = _send_messages(_create_app(), "/events")
+
+    bodies = [m["body"] for m in messages if m["type"] == "http.response.body" and m["body"]]
+    assert bodies == [b"data: one\n\n", b"data: two\n\n"]
+
+
+def test_request_metrics_are_recorded():
+    app = _create_app()
+    before = metrics_collector.get_stats()["total_requests"]
+
+    _send_messages(app, "/items")
+
+    assert metrics_collector.get_stats()["total_requests"] == before + 1
+
+
+def test_request_metrics_are_keyed_by_route_template():
+    app = _create_app()
+
+    @app.get("/cases/{case_id}")
+    def get_case(case_id: int):  # pragma: no cover - exercised directly
+        return {"id": case_id}
+
+    metrics_collector.reset()
+    for path in ("/cases/1", "/cases/2", "/nowhere/1", "/nowhere/2"):
+        _send_messages(app, path)
+
+    assert sorted(metrics_collector.get_stats()["endpoints"]) == [
+        "GET /cases/{case_id}",
+        "GET <unmatched>",
+    ]
@@ -23,8 +23,12 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from backend.routes.cases import router
+from backend.models.base import Base, get_db
+from backend.routes.cases import resolve_case_service, resolve_current_user_id, router
 from backend.services.case_service import (
     CaseResponse,
     CaseNotFoundError,
@@ -677,3 +681,39 @@ Total Tests: 20+
 Mock Strategy: Service layer mocking (no database dependencies)
 Test Framework: pytest + FastAPI TestClient
 """
+
+# ===== TEST CONDITIONAL GET =====
+
+@pytest.mark.asyncio
+async def test_list_cases_returns_304_for_matching_etag(mock_case_service, mock_case_response):
+    """Test that If-None-Match with the current ETag skips the case query."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    mock_case_service.get_all_cases.return_value = [mock_case_response]
+    app.dependency_overrides.update({
+        get_db: lambda: session,
+        resolve_current_user_id: lambda: 42,
+        resolve_case_service: lambda: mock_case_service,
+    })
+
+    try:
+        first = client.get("/cases")
+        etag = first.headers["etag"]
+        cached = client.get("/cases", headers={"If-None-Match": etag})
+
+        session.execute(text("UPDATE resource_versions SET version = version + 1"))
+        session.commit()
+        changed = client.get("/cases", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert mock_case_service.get_all_cases.call_count == 2
+    finally:
+        app.dependency_overrides.clear()
+        session.close()
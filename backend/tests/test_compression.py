@@ -0,0 +1,161 @@
+"""Tests for negotiated response compression."""
+
+import asyncio
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.middleware.compression import CompressionMiddleware, negotiate_encoding
+from backend.middleware.response_wrapper import ResponseWrapperMiddleware
+from backend.utils.performance_metrics import metrics_collector
+
+LARGE = [{"id": i, "content": "Witness statement regarding the dismissal. " * 4} for i in range(50)]
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ResponseWrapperMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=("gzip",))
+
+    @app.get("/large")
+    def large():  # pragma: no cover - exercised via TestClient
+        return LARGE
+
+    @app.get("/small")
+    def small():  # pragma: no cover - exercised via TestClient
+        return {"id": 1}
+
+    @app.get("/export")
+    def export():  # pragma: no cover - exercised directly
+        return StreamingResponse(iter([b"line\n" * 200] * 3), media_type="application/x-ndjson")
+
+    @app.get("/events")
+    def events():  # pragma: no cover - exercised directly
+        return StreamingResponse(
+            iter([b"data: " + b"x" * 600 + b"\n\n", b"data: two\n\n"]),
+            media_type="text/event-stream",
+        )
+
+    @app.get("/image")
+    def image():  # pragma: no cover - exercised via TestClient
+        return Response(b"\x89PNG" + b"\x00" * 2000, media_type="image/png")
+
+    return app
+
+
+def _send_messages(app, path: str, accept_encoding: str = "gzip") -> list:
+    """Call the ASGI app directly and return every message it sends."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # Client stays connected until the response completes
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+def _headers(messages: list) -> dict:
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    return {k.decode(): v.decode() for k, v in start["headers"]}
+
+
+def _body(messages: list) -> bytes:
+    return b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+
+
+# ===== NEGOTIATION =====
+
+def test_negotiation_prefers_highest_q_then_server_order():
+    available = ("zstd", "br", "gzip")
+
+    assert negotiate_encoding("gzip, deflate, br, zstd", available) == "zstd"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert negotiate_encoding("br;q=0, *", available) == "zstd"
+    assert negotiate_encoding("deflate", available) is None
+    assert negotiate_encoding("", available) is None
+    assert negotiate_encoding("identity, gzip;q=0", ("gzip",)) is None
+
+
+# ===== RESPONSES =====
+
+def test_large_json_is_wrapped_then_compressed():
+    response = TestClient(_create_app()).get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == {"success": True, "data": LARGE}
+
+
+def test_content_length_matches_compressed_body():
+    messages = _send_messages(_create_app(), "/large")
+    body = _body(messages)
+
+    assert int(_headers(messages)["content-length"]) == len(body)
+    assert json.loads(gzip.decompress(body))["data"] == LARGE
+
+
+def test_small_bodies_and_unsupported_clients_are_not_compressed():
+    client = TestClient(_create_app())
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+    assert "content-encoding" not in identity.headers
+    assert identity.json()["data"] == LARGE
+
+
+def test_streaming_body_is_compressed_incrementally():
+    messages = _send_messages(_create_app(), "/export")
+    headers = _headers(messages)
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert gzip.decompress(_body(messages)) == b"line\n" * 600
+
+
+def test_event_stream_and_images_are_never_compressed():
+    events = _send_messages(_create_app(), "/events")
+    image = _send_messages(_create_app(), "/image")
+
+    bodies = [m["body"] for m in events if m["type"] == "http.response.body" and m["body"]]
+    assert bodies[1] == b"data: two\n\n"
+    assert "content-encoding" not in _headers(events)
+    assert "content-encoding" not in _headers(image)
+
+
+def test_compression_ratio_is_recorded():
+    metrics_collector.reset()
+
+    _send_messages(_create_app(), "/large")
+
+    totals = metrics_collector.get_stats()["compression"]["gzip"]
+    assert totals["responses"] == 1
+    assert totals["original_bytes"] > totals["compressed_bytes"] > 0
+    assert totals["ratio"] > 1
+    assert 'http_compression_ratio{encoding="gzip"}' in metrics_collector.export_prometheus()
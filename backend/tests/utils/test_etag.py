@@ -0,0 +1,43 @@
+"""Tests for the conditional GET helpers."""
+
+from starlette.requests import Request
+
+from backend.utils.etag import build_etag, etag_headers, etag_matches, not_modified
+
+
+def _request(path: str = "/cases", query: str = "", if_none_match: str = "") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request(
+        {"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": headers}
+    )
+
+
+def test_etag_depends_on_stamp_user_and_url():
+    etag = build_etag(_request(), 1, "cases:1:2")
+
+    assert etag.startswith('W/"')
+    assert build_etag(_request(), 1, "cases:1:2") == etag
+    assert build_etag(_request(), 1, "cases:1:3") != etag
+    assert build_etag(_request(), 2, "cases:1:2") != etag
+    assert build_etag(_request(query="page=2"), 1, "cases:1:2") != etag
+    assert build_etag(_request(), 1, None) is None
+
+
+def test_if_none_match_uses_weak_comparison_over_lists():
+    etag = build_etag(_request(), 1, "stamp")
+    opaque = etag.removeprefix("W/")
+
+    assert etag_matches(_request(if_none_match=f'"other", {opaque}'), etag)
+    assert etag_matches(_request(if_none_match="*"), etag)
+    assert not etag_matches(_request(if_none_match='"other"'), etag)
+    assert not etag_matches(_request(), etag)
+    assert not etag_matches(_request(if_none_match="*"), None)
+
+
+def test_not_modified_response_has_no_body():
+    response = not_modified('W/"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == 'W/"abc"'
+    assert etag_headers(None) == {}
@@ -0,0 +1,45 @@
+"""Tests for the fast JSON response helpers."""
+
+import json
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from backend.utils.json_response import DEFAULT_RESPONSE_CLASS, ORJSONResponse, json_dumps
+
+
+class _Item(BaseModel):
+    id: int
+    name: str
+
+
+def test_orjson_response_renders_compact_utf8():
+    response = ORJSONResponse({"name": "Café", 1: True})
+
+    assert response.body == '{"name":"Café","1":true}'.encode("utf-8")
+    assert response.media_type == "application/json"
+
+
+def test_json_dumps_round_trips_sse_payload():
+    event = {"type": "token", "data": "naïve \"quoted\" text\n", "done": False}
+
+    assert json.loads(json_dumps(event)) == event
+
+
+def test_default_response_class_serializes_response_models():
+    app = FastAPI(default_response_class=DEFAULT_RESPONSE_CLASS)
+
+    @app.get("/items", response_model=List[_Item])
+    def items():  # pragma: no cover - exercised via TestClient
+        return [{"id": 1, "name": "first", "ignored": "field"}]
+
+    @app.get("/plain")
+    def plain():  # pragma: no cover - exercised via TestClient
+        return {"count": 2}
+
+    client = TestClient(app)
+
+    assert client.get("/items").json() == [{"id": 1, "name": "first"}]
+    assert client.get("/plain").json() == {"count": 2}
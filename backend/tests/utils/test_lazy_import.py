@@ -0,0 +1,28 @@
+"""Tests for deferred optional imports."""
+
+import sys
+
+from backend.utils.lazy_import import deferred_import_times, is_installed, optional_import
+
+
+def test_is_installed_does_not_import():
+    sys.modules.pop("colorsys", None)
+
+    assert is_installed("colorsys")
+    assert "colorsys" not in sys.modules
+    assert not is_installed("justice_companion_missing_module")
+
+
+def test_optional_import_loads_once_and_records_time():
+    sys.modules.pop("colorsys", None)
+
+    module = optional_import("colorsys")
+
+    assert module is sys.modules["colorsys"]
+    assert optional_import("colorsys") is module
+    assert "colorsys" in deferred_import_times()
+
+
+def test_missing_module_returns_none():
+    assert optional_import("justice_companion_missing_module") is None
+    assert optional_import("justice_companion_missing_module") is None
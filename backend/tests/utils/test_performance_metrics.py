@@ -0,0 +1,98 @@
+"""Tests for latency histograms and endpoint metrics."""
+
+import random
+
+from backend.utils.performance_metrics import LatencyHistogram, PerformanceMetricsCollector
+
+
+def _exact_percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[round(percentile * (len(ordered) - 1))]
+
+
+def test_histogram_percentiles_are_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1.2) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (0.5, 0.9, 0.95, 0.99):
+        exact = _exact_percentile(values, percentile)
+        assert abs(histogram.percentile(percentile) - exact) <= exact * 0.02
+    assert histogram.count == len(values)
+    assert histogram.max == max(values)
+
+
+def test_histogram_memory_is_bounded():
+    histogram = LatencyHistogram()
+    for value in (0.0, 0.001, 10 ** 9, *range(1, 100000)):
+        histogram.record(value)
+
+    assert len(histogram._counts) <= histogram._MAX_INDEX - histogram._MIN_INDEX + 1
+    assert histogram.max == 10 ** 9
+
+
+def test_merged_histograms_match_single_histogram():
+    left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(1, 500):
+        (left if value % 2 else right).record(value)
+        combined.record(value)
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    assert left.percentile(0.95) == combined.percentile(0.95)
+    assert left.cumulative_buckets() == combined.cumulative_buckets()
+
+
+def test_prometheus_buckets_are_cumulative_and_exact():
+    histogram = LatencyHistogram()
+    for value in (4, 5, 6, 300, 20000):
+        histogram.record(value)
+
+    buckets = dict(histogram.cumulative_buckets())
+
+    assert buckets[5] == 2
+    assert buckets[10] == 3
+    assert buckets[500] == 4
+    assert buckets[float("inf")] == 5
+
+
+def test_endpoints_are_keyed_by_route_template():
+    collector = PerformanceMetricsCollector(enable_system_metrics=False)
+    for case_id in range(100):
+        collector.record_request("GET", f"/cases/{case_id}", 10.0, 200, route="/cases/{case_id}")
+
+    stats = collector.get_stats()
+
+    assert list(stats["endpoints"]) == ["GET /cases/{case_id}"]
+    assert stats["total_requests"] == 100
+    assert stats["p95_duration_ms"] == 10.0
+
+
+def test_overall_stats_cover_the_sliding_window_only():
+    collector = PerformanceMetricsCollector(window_minutes=5, enable_system_metrics=False)
+    collector.record_request("GET", "/cases", 900.0, 200, route="/cases")
+    collector.record_request("GET", "/cases", 20.0, 200, route="/cases")
+    collector._recent_requests[0].timestamp -= 6 * 60
+
+    stats = collector.get_stats()
+
+    assert stats["total_requests"] == 1
+    assert stats["max_duration_ms"] == 20.0
+    assert stats["endpoints"]["GET /cases"]["request_count"] == 2
+
+
+def test_prometheus_export_has_histogram_series_once_per_family():
+    collector = PerformanceMetricsCollector(enable_system_metrics=False)
+    collector.record_request("GET", "/cases/1", 12.0, 200, route="/cases/{case_id}")
+    collector.record_request("POST", "/cases", 40.0, 201, route="/cases")
+
+    text = collector.export_prometheus()
+
+    assert text.count("# TYPE http_request_duration_seconds histogram") == 1
+    assert text.count("# TYPE http_requests_total counter") == 1
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/cases/{case_id}",le="0.025"} 1' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/cases/{case_id}",le="0.01"} 0' in text
+    assert 'http_request_duration_seconds_count{method="POST",route="/cases"} 1' in text
@@ -0,0 +1,93 @@
+"""Tests for the on-demand sampling profiler and tracemalloc sessions."""
+
+import threading
+import time
+
+import pytest
+
+from backend.utils.profiler import MemorySession, ProfilerBusyError, SamplingProfiler
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    total = 0
+    while not stop.is_set():
+        total += sum(range(200))
+
+
+def _profile_busy_thread(**kwargs):
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    profiler = SamplingProfiler(interval=0.002, **kwargs)
+    profiler.start()
+    try:
+        time.sleep(0.2)
+    finally:
+        profile = profiler.stop()
+        stop.set()
+        worker.join()
+    return profile
+
+
+# ===== CPU =====
+
+def test_collapsed_stacks_contain_busy_function():
+    profile = _profile_busy_thread()
+
+    lines = profile.to_collapsed().splitlines()
+    busy = [line for line in lines if line.startswith("busy-worker;")]
+
+    assert profile.samples > 0
+    assert busy
+    assert any("_busy_loop" in line for line in busy)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_speedscope_profile_structure():
+    profile = _profile_busy_thread()
+
+    document = profile.to_speedscope()
+    frames = document["shared"]["frames"]
+    worker = next(p for p in document["profiles"] if p["name"] == "busy-worker")
+
+    assert worker["type"] == "sampled"
+    assert len(worker["samples"]) == len(worker["weights"])
+    assert all(0 <= index < len(frames) for stack in worker["samples"] for index in stack)
+    assert any(frames[i]["name"] == "_busy_loop" for stack in worker["samples"] for i in stack)
+
+
+def test_distinct_stacks_are_bounded():
+    profile = _profile_busy_thread(max_stacks=1)
+
+    assert profile.summary()["distinct_stacks"] == 1
+
+
+def test_only_one_session_runs_at_a_time():
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        with pytest.raises(ProfilerBusyError):
+            SamplingProfiler().start()
+        with pytest.raises(ProfilerBusyError):
+            MemorySession().start()
+    finally:
+        profiler.stop()
+
+    # Lock released again
+    again = SamplingProfiler()
+    again.start()
+    again.stop()
+
+
+# ===== MEMORY =====
+
+def test_memory_session_reports_growth():
+    session = MemorySession(frames=3)
+    session.start()
+    retained = [bytearray(1024) for _ in range(512)]
+    result = session.stop(top=5)
+
+    assert len(retained) == 512
+    assert result["total_growth_bytes"] >= 512 * 1024
+    assert result["top"][0]["size_diff_bytes"] >= 512 * 1024
+    assert any("test_profiler.py" in line for line in result["top"][0]["traceback"])
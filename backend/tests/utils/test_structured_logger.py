@@ -0,0 +1,126 @@
+"""Tests for structured JSON formatting and queue-based logging."""
+
+import json
+import logging
+import queue
+import sys
+from datetime import date
+
+from backend.utils import structured_logger
+from backend.utils.structured_logger import (
+    Lazy,
+    QueueLogHandler,
+    StructuredFormatter,
+    _ReportingQueueListener,
+    clear_context,
+    get_queue_log_handler,
+    set_correlation_id,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(StructuredFormatter())
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+def _record(msg="hello %s", args=("world",), level=logging.INFO, **extra):
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+# ===== FORMATTER =====
+
+def test_formatter_fields_and_redaction():
+    record = _record(token="abc", day=date(2024, 1, 2), rows=Lazy(lambda: 3))
+
+    entry = json.loads(StructuredFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["timestamp"].endswith("Z")
+    assert entry["extra"] == {"token": "[REDACTED]", "day": "2024-01-02", "rows": 3}
+
+
+def test_failing_lazy_field_does_not_break_logging():
+    record = _record(broken=Lazy(lambda: 1 / 0))
+
+    entry = json.loads(StructuredFormatter().format(record))
+
+    assert entry["extra"]["broken"] == "[lazy field failed: ZeroDivisionError]"
+
+
+# ===== QUEUE =====
+
+def test_queue_handler_captures_context_at_log_call():
+    handler = QueueLogHandler(queue.Queue())
+    set_correlation_id("req-1")
+    try:
+        handler.handle(_record())
+    finally:
+        clear_context()
+
+    target = _ListHandler()
+    target.handle(handler.queue.get_nowait())
+
+    assert target.lines[0]["context"] == {"correlation_id": "req-1"}
+    assert target.lines[0]["message"] == "hello world"
+
+
+def test_full_queue_drops_and_reports():
+    handler = QueueLogHandler(queue.Queue(maxsize=1))
+    for _ in range(3):
+        handler.handle(_record())
+
+    assert handler.stats()["dropped"] == 2
+
+    target = _ListHandler()
+    listener = _ReportingQueueListener(handler, target)
+    listener.start()
+    listener.stop()
+
+    assert target.lines[0]["message"] == "hello world"
+    assert target.lines[1]["message"] == "Log queue full: dropped 2 records"
+    assert target.lines[1]["extra"] == {"dropped_records": 2}
+
+
+def test_start_and_stop_queue_logging(monkeypatch):
+    # Leave the application's pipeline (started by main.py) untouched
+    monkeypatch.setattr(structured_logger, "_queue_handler", None)
+    monkeypatch.setattr(structured_logger, "_queue_listener", None)
+    root = logging.getLogger()
+    target = _ListHandler()
+    handler = start_queue_logging([target], maxsize=100)
+    root.addHandler(handler)
+    try:
+        assert get_queue_log_handler() is handler
+        logging.getLogger("test.queue").warning("queued")
+    finally:
+        stop_queue_logging()
+        root.removeHandler(target)
+
+    assert get_queue_log_handler() is None
+    assert handler not in root.handlers
+    assert [line["message"] for line in target.lines] == ["queued"]
+
+
+def test_queue_disabled_returns_none():
+    assert start_queue_logging([logging.NullHandler()], maxsize=0) is None
+
+
+def test_prepare_leaves_the_original_record_intact():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(exc_info=sys.exc_info())
+
+    prepared = QueueLogHandler(queue.Queue()).prepare(record)
+
+    assert record.exc_info is not None and record.args == ("world",)
+    assert prepared.exc_info is None and "ValueError: boom" in prepared.exc_text
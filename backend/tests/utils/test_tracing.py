@@ -0,0 +1,202 @@
+"""Tests for in-process tracing spans and the tracing middleware."""
+
+import asyncio
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.middleware.tracing_middleware import TracingMiddleware
+from backend.utils.tracing import (
+    NOOP_SPAN,
+    TraceRecorder,
+    span,
+    trace_methods,
+    traced,
+    tracing_active,
+)
+
+
+@trace_methods(exclude=("skipped",))
+class _Service:
+    def lookup(self):
+        with span("inner", rows=3):
+            return "row"
+
+    async def fetch(self):
+        await asyncio.sleep(0)
+        return self.lookup()
+
+    async def stream(self):
+        for token in ("a", "b"):
+            with span("token"):
+                yield token
+
+    def skipped(self):
+        return tracing_active()
+
+    def _private(self):
+        return "private"
+
+
+def _names(trace):
+    return sorted(s.name for s in trace.spans)
+
+
+def _run_traced(recorder, coro_factory):
+    async def run():
+        root = recorder.start("test")
+        try:
+            return await coro_factory()
+        finally:
+            recorder.finish(root)
+
+    result = asyncio.run(run())
+    return result, recorder.recent(1)[0]["trace_id"]
+
+
+# ===== SPANS =====
+
+def test_spans_are_noops_without_a_trace():
+    assert span("anything") is NOOP_SPAN
+    assert _Service().lookup() == "row"
+    assert not tracing_active()
+
+
+def test_nested_spans_record_parents_across_awaits():
+    recorder = TraceRecorder(sample_rate=1.0)
+
+    result, trace_id = _run_traced(recorder, lambda: _Service().fetch())
+
+    trace = recorder.get(trace_id)
+    by_name = {s.name: s for s in trace.spans}
+    assert result == "row"
+    assert _names(trace) == ["_Service.fetch", "_Service.lookup", "inner", "test"]
+    assert by_name["inner"].parent_id == by_name["_Service.lookup"].span_id
+    assert by_name["_Service.lookup"].parent_id == by_name["_Service.fetch"].span_id
+    assert by_name["_Service.fetch"].parent_id == by_name["test"].span_id
+    assert by_name["inner"].attributes == {"rows": 3}
+
+
+def test_async_generator_span_covers_iteration():
+    recorder = TraceRecorder(sample_rate=1.0)
+
+    async def consume():
+        return [token async for token in _Service().stream()]
+
+    result, trace_id = _run_traced(recorder, consume)
+
+    trace = recorder.get(trace_id)
+    stream = next(s for s in trace.spans if s.name == "_Service.stream")
+    tokens = [s for s in trace.spans if s.name == "token"]
+    assert result == ["a", "b"]
+    assert len(tokens) == 2
+    assert all(t.parent_id == stream.span_id for t in tokens)
+
+
+def test_errors_are_recorded_and_reraised():
+    recorder = TraceRecorder(sample_rate=1.0)
+
+    @traced("failing")
+    def failing():
+        raise ValueError("boom")
+
+    async def run():
+        try:
+            failing()
+        except ValueError:
+            return "caught"
+
+    _, trace_id = _run_traced(recorder, run)
+
+    failed = next(s for s in recorder.get(trace_id).spans if s.name == "failing")
+    assert failed.error == "ValueError"
+
+
+def test_trace_methods_skips_private_and_excluded_methods():
+    assert hasattr(_Service.lookup, "__wrapped__")
+    assert not hasattr(_Service.skipped, "__wrapped__")
+    assert not hasattr(_Service._private, "__wrapped__")
+
+
+# ===== EXPORT =====
+
+def test_chrome_and_otlp_exports():
+    recorder = TraceRecorder(sample_rate=1.0)
+    _, trace_id = _run_traced(recorder, lambda: _Service().fetch())
+    trace = recorder.get(trace_id)
+
+    chrome = trace.to_chrome_trace()
+    otlp = trace.to_otlp_json()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    assert {e["ph"] for e in chrome["traceEvents"]} == {"X"}
+    assert len(chrome["traceEvents"]) == len(trace.spans)
+    assert all(len(s["traceId"]) == 32 for s in otlp)
+    assert sum("parentSpanId" not in s for s in otlp) == 1
+    assert json.loads(json.dumps(chrome)) == chrome
+
+
+def test_recorder_writes_chrome_trace_files(tmp_path):
+    recorder = TraceRecorder(sample_rate=1.0, export_dir=str(tmp_path))
+    _, trace_id = _run_traced(recorder, lambda: _Service().fetch())
+
+    path = recorder.export_file(recorder.get(trace_id))
+
+    assert path.parent == tmp_path
+    assert "traceEvents" in json.loads(path.read_text())
+
+
+def test_ring_buffer_is_bounded():
+    recorder = TraceRecorder(sample_rate=1.0, buffer_size=2)
+    for _ in range(3):
+        _run_traced(recorder, lambda: _Service().fetch())
+
+    assert len(recorder.recent(10)) == 2
+
+
+# ===== MIDDLEWARE =====
+
+def _create_app(recorder: TraceRecorder) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, recorder=recorder)
+
+    @app.get("/cases/{case_id}")
+    async def get_case(case_id: int):  # pragma: no cover - exercised via TestClient
+        return {"id": case_id, "value": await _Service().fetch()}
+
+    @app.get("/stream")
+    def stream():  # pragma: no cover - exercised via TestClient
+        return StreamingResponse(_Service().stream(), media_type="text/plain")
+
+    return app
+
+
+def test_sampled_requests_are_traced_by_route_template():
+    recorder = TraceRecorder(sample_rate=1.0)
+    client = TestClient(_create_app(recorder))
+
+    client.get("/cases/7")
+
+    [summary] = recorder.recent()
+    trace = recorder.get(summary["trace_id"])
+    assert summary["name"] == "GET /cases/{case_id}"
+    assert "_Service.lookup" in _names(trace)
+    assert trace.root.attributes["http.status_code"] == 200
+
+
+def test_streamed_body_is_inside_the_request_trace():
+    recorder = TraceRecorder(sample_rate=1.0)
+
+    assert TestClient(_create_app(recorder)).get("/stream").text == "ab"
+
+    trace = recorder.get(recorder.recent()[0]["trace_id"])
+    assert _names(trace).count("token") == 2
+
+
+def test_unsampled_requests_record_nothing():
+    recorder = TraceRecorder(sample_rate=0.0)
+
+    TestClient(_create_app(recorder)).get("/cases/7")
+
+    assert recorder.recent() == []
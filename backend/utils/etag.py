@@ -0,0 +1,69 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Polled list endpoints build a weak ETag from a cheap version stamp (see
+ResourceVersionRepository) before doing any real work, and answer
+``304 Not Modified`` when the client already holds that version.
+
+Usage in a route:
+    stamp = ResourceVersionRepository(db).get_stamp(user_id, ("cases",))
+    etag = build_etag(request, user_id, stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    ...
+    response.headers.update(etag_headers(etag))
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Browsers keep the body but revalidate on every use, so polls become 304s
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(request: Request, user_id: int, stamp: Optional[str], *extra: str) -> Optional[str]:
+    """
+    Build a weak ETag for the current URL from a version stamp.
+
+    Args:
+        request: Incoming request (path and query string are part of the tag)
+        user_id: Authenticated user the response is built for
+        stamp: Version stamp, or None when versions are unavailable
+        *extra: Further inputs the response depends on (e.g. today's date)
+
+    Returns:
+        Quoted weak ETag, or None when no stamp is available
+    """
+    if stamp is None:
+        return None
+    parts = [str(user_id), request.url.path, request.url.query, stamp, *extra]
+    digest = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Whether If-None-Match names etag (weak comparison, RFC 9110 13.1.2)."""
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def etag_headers(etag: Optional[str]) -> Dict[str, str]:
+    """Response headers advertising etag (empty without one)."""
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match."""
+    return Response(status_code=304, headers=etag_headers(etag))
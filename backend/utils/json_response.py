@@ -0,0 +1,64 @@
+"""
+Fast JSON serialization for API responses and SSE frames.
+
+Provides:
+- ORJSONResponse: JSONResponse rendered with orjson
+- json_dumps(): compact str encoding for hand-built payloads (SSE events)
+- DEFAULT_RESPONSE_CLASS: the app-wide default_response_class
+
+FastAPI versions that accept ``dump_json`` in ``serialize_response`` already
+serialize ``response_model`` routes straight to bytes with pydantic-core
+(the model_dump_json path), but only while the route's response class is
+still the framework default. There DEFAULT_RESPONSE_CLASS stays the default
+placeholder so that path is kept; on older versions, where every response
+goes through jsonable_encoder + json.dumps, it is ORJSONResponse.
+
+orjson is optional: without it everything falls back to the stdlib encoder.
+
+Usage:
+    from backend.utils.json_response import DEFAULT_RESPONSE_CLASS, json_dumps
+
+    app = FastAPI(default_response_class=DEFAULT_RESPONSE_CLASS)
+    yield f"data: {json_dumps(event)}\\n\\n"
+"""
+
+import inspect
+import json
+from typing import Any
+
+from fastapi.datastructures import Default
+from fastapi.routing import serialize_response
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+# Non-str keys (ints from grouped counts) are accepted like json.dumps does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson (compact, UTF-8)."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def json_dumps(content: Any) -> str:
+    """Encode content as a compact JSON string."""
+    if orjson is None:
+        return json.dumps(content, separators=(",", ":"))
+    return orjson.dumps(content, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
+def _serializes_to_bytes() -> bool:
+    """Whether FastAPI dumps response models to JSON bytes itself."""
+    return "dump_json" in inspect.signature(serialize_response).parameters
+
+
+# A placeholder (not JSONResponse itself) keeps FastAPI's pydantic fast path
+DEFAULT_RESPONSE_CLASS = Default(JSONResponse) if _serializes_to_bytes() else ORJSONResponse
@@ -0,0 +1,85 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+Parsing and export libraries (eyecite, pypdf, python-docx, reportlab) add
+hundreds of milliseconds to startup but are only needed by a few
+endpoints. Services import them on first use through this module instead
+of at module level.
+
+Provides:
+- is_installed(): check availability without importing (importlib find_spec)
+- optional_import(): import on first call, None if not installed
+- deferred_import_times(): how long each deferred import took
+
+Usage:
+    from backend.utils.lazy_import import is_installed, optional_import
+
+    PYPDF_AVAILABLE = is_installed("pypdf")
+
+    def parse(path):
+        pypdf = optional_import("pypdf")
+        if pypdf is None:
+            raise HTTPException(500, "pypdf not installed")
+        return pypdf.PdfReader(path)
+"""
+
+import importlib
+import importlib.util
+import logging
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Modules that failed to import (not retried)
+_missing: set = set()
+_load_times_ms: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def is_installed(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def optional_import(name: str) -> Optional[ModuleType]:
+    """
+    Import a module on first use.
+
+    Args:
+        name: Absolute module name (e.g. "pypdf", "reportlab.platypus")
+
+    Returns:
+        The module, or None if it (or one of its dependencies) is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if name in _missing:
+        return None
+
+    with _lock:
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            _missing.add(name)
+            logger.warning(f"Optional dependency {name} unavailable: {e}")
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _load_times_ms.setdefault(name, round(elapsed_ms, 2))
+        logger.debug(f"Deferred import of {name} took {elapsed_ms:.1f}ms")
+        return module
+
+
+def deferred_import_times() -> Dict[str, float]:
+    """Milliseconds spent on each deferred import so far (first load only)."""
+    return dict(_load_times_ms)
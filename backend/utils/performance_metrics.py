@@ -4,14 +4,17 @@ Performance metrics collection and monitoring.
 Provides:
 - Request/response metrics (count, duration, status codes)
 - Database query performance tracking
+- Response compression ratios per encoding
 - Memory and CPU usage monitoring
 - Endpoint-specific metrics aggregation
 - Prometheus-compatible metrics export
 
 Features:
 - Thread-safe metric collection
-- Sliding window statistics (last N minutes)
-- Percentile calculations (p50, p95, p99)
+- Sliding window statistics (last N minutes) for overall request figures;
+  per-endpoint figures and Prometheus series are lifetime totals
+- Percentile calculations (p50, p95, p99) from fixed-memory histograms
+- Endpoints keyed by route template (/cases/{case_id}), not raw path
 - Rate limiting detection
 - Slow query detection
 - Memory leak detection
@@ -22,9 +25,10 @@ Usage:
     # In middleware:
     metrics_collector.record_request(
         method="GET",
-        path="/cases",
+        path="/cases/42",
         duration_ms=123.4,
         status_code=200,
+        route="/cases/{case_id}",
     )
 
     # Get metrics:
@@ -35,9 +39,11 @@ Usage:
     prometheus_text = metrics_collector.export_prometheus()
 """
 
+import math
 import time
 import psutil
 import logging
+from bisect import bisect_left
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict, deque
@@ -68,9 +74,98 @@ class RequestMetric:
     user_id: Optional[int] = None
 
 
+class LatencyHistogram:
+    """
+    Fixed-memory, mergeable latency histogram (log-linear, HDR-style).
+
+    Values are counted in logarithmic buckets that are RELATIVE_ACCURACY
+    wide, so any percentile is within 1% of the true value no matter how
+    many samples were recorded. Bucket indexes are bounded by
+    [MIN_TRACKABLE_MS, MAX_TRACKABLE_MS], capping memory per histogram at
+    about a thousand counters (a few dozen in practice). Histograms with the same
+    layout merge by adding counts.
+
+    Counts for the fixed Prometheus buckets (PROMETHEUS_BUCKETS_MS) are kept
+    exactly alongside, so exported ``_bucket`` series are not approximated.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    MIN_TRACKABLE_MS = 0.01
+    MAX_TRACKABLE_MS = 3_600_000.0  # 1 hour
+
+    # Prometheus "le" bounds, in milliseconds (exported in seconds)
+    PROMETHEUS_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    _GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+    _MIN_INDEX = math.ceil(math.log(MIN_TRACKABLE_MS) / _LOG_GAMMA)
+    _MAX_INDEX = math.ceil(math.log(MAX_TRACKABLE_MS) / _LOG_GAMMA)
+
+    __slots__ = ('count', 'sum', 'min', 'max', '_counts', '_bucket_counts')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self._counts: Dict[int, int] = {}
+        self._bucket_counts: List[int] = [0] * (len(self.PROMETHEUS_BUCKETS_MS) + 1)
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample (milliseconds)."""
+        self.count += 1
+        self.sum += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+        if value_ms <= self.MIN_TRACKABLE_MS:
+            index = self._MIN_INDEX
+        else:
+            index = min(math.ceil(math.log(value_ms) / self._LOG_GAMMA), self._MAX_INDEX)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._bucket_counts[bisect_left(self.PROMETHEUS_BUCKETS_MS, value_ms)] += 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add all samples of another histogram to this one."""
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        for position, count in enumerate(other._bucket_counts):
+            self._bucket_counts[position] += count
+
+    def percentile(self, percentile: float) -> float:
+        """Approximate percentile (e.g., 0.95 for p95), 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+
+        rank = percentile * (self.count - 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen > rank:
+                # Midpoint of (gamma^(i-1), gamma^i] in relative terms
+                value = 2 * self._GAMMA ** index / (self._GAMMA + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """Prometheus buckets as (upper bound in ms, cumulative count), +Inf last."""
+        buckets = []
+        total = 0
+        for bound, count in zip(self.PROMETHEUS_BUCKETS_MS + (float('inf'),), self._bucket_counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
 @dataclass
 class EndpointStats:
-    """Aggregated statistics for an endpoint."""
+    """Aggregated statistics for an endpoint (method + route template)."""
     request_count: int = 0
     total_duration_ms: float = 0.0
     min_duration_ms: float = float('inf')
@@ -78,20 +173,24 @@ class EndpointStats:
     status_codes: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
     error_count: int = 0
 
-    # Recent requests for percentile calculation
-    recent_durations: deque = field(default_factory=lambda: deque(maxlen=1000))
+    # Duration distribution for percentiles and Prometheus buckets
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    # Guards this endpoint only; requests to other endpoints never contend
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
 
     def add_request(self, duration_ms: float, status_code: int) -> None:
         """Add request to statistics."""
-        self.request_count += 1
-        self.total_duration_ms += duration_ms
-        self.min_duration_ms = min(self.min_duration_ms, duration_ms)
-        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
-        self.status_codes[status_code] += 1
-        self.recent_durations.append(duration_ms)
+        with self.lock:
+            self.request_count += 1
+            self.total_duration_ms += duration_ms
+            self.min_duration_ms = min(self.min_duration_ms, duration_ms)
+            self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+            self.status_codes[status_code] += 1
+            self.histogram.record(duration_ms)
 
-        if status_code >= 400:
-            self.error_count += 1
+            if status_code >= 400:
+                self.error_count += 1
 
     def get_avg_duration_ms(self) -> float:
         """Calculate average duration."""
@@ -101,12 +200,8 @@ class EndpointStats:
 
     def get_percentile(self, percentile: float) -> float:
         """Calculate percentile duration (e.g., 0.95 for p95)."""
-        if not self.recent_durations:
-            return 0.0
-
-        sorted_durations = sorted(self.recent_durations)
-        index = int(len(sorted_durations) * percentile)
-        return sorted_durations[min(index, len(sorted_durations) - 1)]
+        with self.lock:
+            return self.histogram.percentile(percentile)
 
     def get_error_rate(self) -> float:
         """Calculate error rate (errors / total requests)."""
@@ -149,7 +244,7 @@ class PerformanceMetricsCollector:
         self.enable_system_metrics = enable_system_metrics
 
         # Endpoint-specific metrics
-        self._endpoint_stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self._endpoint_stats: Dict[str, EndpointStats] = {}
         self._endpoint_stats_lock = Lock()
 
         # Recent requests for time-series analysis
@@ -165,6 +260,12 @@ class PerformanceMetricsCollector:
         self._db_total_duration_ms = 0.0
         self._db_lock = Lock()
 
+        # Response compression metrics (per content encoding)
+        self._compression: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'responses': 0, 'original_bytes': 0, 'compressed_bytes': 0}
+        )
+        self._compression_lock = Lock()
+
         # Start time
         self._start_time = time.time()
 
@@ -181,6 +282,7 @@ class PerformanceMetricsCollector:
         status_code: int,
         correlation_id: Optional[str] = None,
         user_id: Optional[int] = None,
+        route: Optional[str] = None,
     ) -> None:
         """
         Record request metric.
@@ -192,6 +294,8 @@ class PerformanceMetricsCollector:
             status_code: HTTP status code
             correlation_id: Optional correlation ID
             user_id: Optional user ID
+            route: Route template (e.g. /cases/{case_id}); endpoint stats are
+                keyed on it so path parameters do not create new series
         """
         # Create metric
         metric = RequestMetric(
@@ -204,14 +308,16 @@ class PerformanceMetricsCollector:
             user_id=user_id,
         )
 
-        # Add to recent requests
-        with self._requests_lock:
-            self._recent_requests.append(metric)
+        # Add to recent requests (deque.append is atomic)
+        self._recent_requests.append(metric)
 
-        # Update endpoint stats
-        endpoint_key = f"{method} {path}"
-        with self._endpoint_stats_lock:
-            self._endpoint_stats[endpoint_key].add_request(duration_ms, status_code)
+        # Update endpoint stats; the shared lock is only taken for a new endpoint
+        endpoint_key = f"{method} {route or path}"
+        endpoint_stats = self._endpoint_stats.get(endpoint_key)
+        if endpoint_stats is None:
+            with self._endpoint_stats_lock:
+                endpoint_stats = self._endpoint_stats.setdefault(endpoint_key, EndpointStats())
+        endpoint_stats.add_request(duration_ms, status_code)
 
         # Log slow requests (> 1 second)
         if duration_ms > 1000:
@@ -231,6 +337,21 @@ class PerformanceMetricsCollector:
             self._db_query_count += 1
             self._db_total_duration_ms += duration_ms
 
+    def record_compression(self, encoding: str, original_bytes: int, compressed_bytes: int) -> None:
+        """
+        Record one compressed response.
+
+        Args:
+            encoding: Content encoding used (gzip, br, zstd)
+            original_bytes: Body size before compression
+            compressed_bytes: Body size sent on the wire
+        """
+        with self._compression_lock:
+            totals = self._compression[encoding]
+            totals['responses'] += 1
+            totals['original_bytes'] += original_bytes
+            totals['compressed_bytes'] += compressed_bytes
+
     def record_system_metrics(self) -> None:
         """Record current system metrics (CPU, memory, disk)."""
         if not self.enable_system_metrics:
@@ -253,10 +374,25 @@ class PerformanceMetricsCollector:
         except Exception as e:
             logger.error(f"Failed to collect system metrics: {e}")
 
+    def seconds_since_last_request(self) -> float:
+        """
+        Seconds since the most recent request was recorded.
+
+        Used by background maintenance to detect idle periods. Returns the
+        collector uptime when no request has been recorded yet.
+        """
+        with self._requests_lock:
+            last = self._recent_requests[-1].timestamp if self._recent_requests else self._start_time
+        return time.time() - last
+
     def get_stats(self, endpoint: Optional[str] = None) -> Dict[str, Any]:
         """
         Get aggregated statistics.
 
+        Overall request figures (total_requests, *_duration_ms) cover the
+        sliding window: requests of the last window_minutes, at most the
+        10,000 most recent. Endpoint figures are totals since start or reset.
+
         Args:
             endpoint: Optional specific endpoint to get stats for (e.g., "GET /cases")
 
@@ -268,22 +404,17 @@ class PerformanceMetricsCollector:
             'timestamp': datetime.utcnow().isoformat() + 'Z',
         }
 
-        # Request stats
-        with self._requests_lock:
-            total_requests = len(self._recent_requests)
-            stats['total_requests'] = total_requests
-
-            if total_requests > 0:
-                durations = [r.duration_ms for r in self._recent_requests]
-                stats['avg_duration_ms'] = sum(durations) / len(durations)
-                stats['min_duration_ms'] = min(durations)
-                stats['max_duration_ms'] = max(durations)
+        # Request stats (sliding window)
+        overall = self._window_histogram()
+        stats['total_requests'] = overall.count
 
-                # Calculate percentiles
-                sorted_durations = sorted(durations)
-                stats['p50_duration_ms'] = sorted_durations[int(len(sorted_durations) * 0.50)]
-                stats['p95_duration_ms'] = sorted_durations[int(len(sorted_durations) * 0.95)]
-                stats['p99_duration_ms'] = sorted_durations[int(len(sorted_durations) * 0.99)]
+        if overall.count > 0:
+            stats['avg_duration_ms'] = overall.sum / overall.count
+            stats['min_duration_ms'] = overall.min
+            stats['max_duration_ms'] = overall.max
+            stats['p50_duration_ms'] = overall.percentile(0.50)
+            stats['p95_duration_ms'] = overall.percentile(0.95)
+            stats['p99_duration_ms'] = overall.percentile(0.99)
 
         # Database stats
         with self._db_lock:
@@ -291,6 +422,13 @@ class PerformanceMetricsCollector:
             if self._db_query_count > 0:
                 stats['db_avg_duration_ms'] = self._db_total_duration_ms / self._db_query_count
 
+        # Compression stats
+        with self._compression_lock:
+            stats['compression'] = {
+                encoding: {**totals, 'ratio': self._compression_ratio(totals)}
+                for encoding, totals in self._compression.items()
+            }
+
         # Endpoint-specific stats
         if endpoint:
             with self._endpoint_stats_lock:
@@ -340,26 +478,42 @@ class PerformanceMetricsCollector:
         """
         lines = []
 
-        # Request metrics by endpoint
+        # Request metrics by endpoint (one HELP/TYPE header per metric family)
         with self._endpoint_stats_lock:
-            for endpoint_key, stats in self._endpoint_stats.items():
-                # Sanitize endpoint key for Prometheus (replace spaces with underscores)
-                metric_name = endpoint_key.replace(' ', '_').replace('/', '_').lower()
-
-                # Request count
-                lines.append(f'# HELP http_requests_total Total HTTP requests for {endpoint_key}')
-                lines.append(f'# TYPE http_requests_total counter')
-                lines.append(f'http_requests_total{{endpoint="{endpoint_key}"}} {stats.request_count}')
-
-                # Average duration
-                lines.append(f'# HELP http_request_duration_ms Average request duration in milliseconds')
-                lines.append(f'# TYPE http_request_duration_ms gauge')
-                lines.append(f'http_request_duration_ms{{endpoint="{endpoint_key}"}} {stats.get_avg_duration_ms():.2f}')
-
-                # Error rate
-                lines.append(f'# HELP http_error_rate Request error rate percentage')
-                lines.append(f'# TYPE http_error_rate gauge')
-                lines.append(f'http_error_rate{{endpoint="{endpoint_key}"}} {stats.get_error_rate():.2f}')
+            endpoints = sorted(self._endpoint_stats.items())
+
+        if endpoints:
+            lines.append(f'# HELP http_requests_total Total HTTP requests by endpoint')
+            lines.append(f'# TYPE http_requests_total counter')
+            for endpoint_key, stats in endpoints:
+                lines.append(f'http_requests_total{{endpoint="{_escape_label(endpoint_key)}"}} {stats.request_count}')
+
+            lines.append(f'# HELP http_request_duration_ms Average request duration in milliseconds')
+            lines.append(f'# TYPE http_request_duration_ms gauge')
+            for endpoint_key, stats in endpoints:
+                label = _escape_label(endpoint_key)
+                lines.append(f'http_request_duration_ms{{endpoint="{label}"}} {stats.get_avg_duration_ms():.2f}')
+
+            lines.append(f'# HELP http_error_rate Request error rate percentage')
+            lines.append(f'# TYPE http_error_rate gauge')
+            for endpoint_key, stats in endpoints:
+                label = _escape_label(endpoint_key)
+                lines.append(f'http_error_rate{{endpoint="{label}"}} {stats.get_error_rate():.2f}')
+
+            lines.append(f'# HELP http_request_duration_seconds Request duration by method and route template')
+            lines.append(f'# TYPE http_request_duration_seconds histogram')
+            for endpoint_key, stats in endpoints:
+                method, _, route = endpoint_key.partition(' ')
+                labels = f'method="{_escape_label(method)}",route="{_escape_label(route)}"'
+                with stats.lock:
+                    buckets = stats.histogram.cumulative_buckets()
+                    total_seconds = stats.histogram.sum / 1000
+                    count = stats.histogram.count
+                for bound_ms, cumulative in buckets:
+                    le = '+Inf' if bound_ms == float('inf') else f'{bound_ms / 1000:g}'
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_sum{{{labels}}} {total_seconds:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{{labels}}} {count}')
 
         # Database metrics
         with self._db_lock:
@@ -373,6 +527,34 @@ class PerformanceMetricsCollector:
                 lines.append(f'# TYPE db_query_duration_ms gauge')
                 lines.append(f'db_query_duration_ms {avg_db_duration:.2f}')
 
+        # Compression metrics
+        with self._compression_lock:
+            if self._compression:
+                lines.append(f'# HELP http_compressed_responses_total Responses sent with a content encoding')
+                lines.append(f'# TYPE http_compressed_responses_total counter')
+                for encoding, totals in self._compression.items():
+                    lines.append(f'http_compressed_responses_total{{encoding="{encoding}"}} {totals["responses"]}')
+
+                lines.append(f'# HELP http_response_original_bytes_total Response body bytes before compression')
+                lines.append(f'# TYPE http_response_original_bytes_total counter')
+                for encoding, totals in self._compression.items():
+                    lines.append(
+                        f'http_response_original_bytes_total{{encoding="{encoding}"}} {totals["original_bytes"]}'
+                    )
+
+                lines.append(f'# HELP http_response_compressed_bytes_total Response body bytes after compression')
+                lines.append(f'# TYPE http_response_compressed_bytes_total counter')
+                for encoding, totals in self._compression.items():
+                    lines.append(
+                        f'http_response_compressed_bytes_total{{encoding="{encoding}"}} {totals["compressed_bytes"]}'
+                    )
+
+                lines.append(f'# HELP http_compression_ratio Original to compressed response size ratio')
+                lines.append(f'# TYPE http_compression_ratio gauge')
+                for encoding, totals in self._compression.items():
+                    ratio = self._compression_ratio(totals)
+                    lines.append(f'http_compression_ratio{{encoding="{encoding}"}} {ratio:.2f}')
+
         # System metrics
         if self.enable_system_metrics:
             with self._system_metrics_lock:
@@ -393,13 +575,31 @@ class PerformanceMetricsCollector:
 
         return '\n'.join(lines) + '\n'
 
+    def _window_histogram(self) -> LatencyHistogram:
+        """Histogram of the recent requests inside the sliding window."""
+        cutoff = time.time() - self.window_minutes * 60
+        with self._requests_lock:
+            recent = list(self._recent_requests)
+
+        histogram = LatencyHistogram()
+        for metric in recent:
+            if metric.timestamp >= cutoff:
+                histogram.record(metric.duration_ms)
+        return histogram
+
+    @staticmethod
+    def _compression_ratio(totals: Dict[str, int]) -> float:
+        if totals['compressed_bytes'] == 0:
+            return 0.0
+        return totals['original_bytes'] / totals['compressed_bytes']
+
     def reset(self) -> None:
         """Reset all metrics (useful for testing)."""
         with self._requests_lock:
             self._recent_requests.clear()
 
         with self._endpoint_stats_lock:
-            self._endpoint_stats.clear()
+            self._endpoint_stats = {}
 
         with self._system_metrics_lock:
             self._system_metrics.clear()
@@ -408,10 +608,18 @@ class PerformanceMetricsCollector:
             self._db_query_count = 0
             self._db_total_duration_ms = 0.0
 
+        with self._compression_lock:
+            self._compression.clear()
+
         self._start_time = time.time()
         logger.info("Metrics reset")
 
 
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
 # Global metrics collector singleton
 _global_collector: Optional[PerformanceMetricsCollector] = None
 
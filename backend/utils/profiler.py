@@ -0,0 +1,359 @@
+"""
+On-demand statistical profiling for live workers.
+
+Provides:
+- SamplingProfiler: thread-based stack sampler over sys._current_frames()
+- Profile: aggregated samples as collapsed stacks (flamegraph.pl, speedscope,
+  inferno) or a speedscope JSON profile
+- MemorySession: tracemalloc snapshot diff over a time window
+
+Safe under live load:
+- Sampling runs in its own daemon thread and only reads frame objects; the
+  sampled threads are never interrupted or signalled
+- Stacks are kept as tuples of code objects and only labelled when the
+  profile is exported, so each sample costs a few microseconds per thread
+- Duration, interval and the number of distinct stacks are bounded, and
+  only one profiling session (CPU or memory) can run at a time
+
+Usage:
+    from backend.utils.profiler import SamplingProfiler
+
+    profiler = SamplingProfiler(interval=0.01)
+    profiler.start()
+    await asyncio.sleep(10)
+    profile = profiler.stop()
+    text = profile.to_collapsed()
+
+    # Admin endpoints: POST /diagnostics/profile, POST /diagnostics/memory
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+# Limits for on-demand sessions
+MAX_DURATION_SECONDS = 60
+MIN_INTERVAL_SECONDS = 0.001
+MAX_STACK_DEPTH = 128
+MAX_DISTINCT_STACKS = 20000
+
+# Leaf functions of threads that are waiting rather than working (event
+# loop idle in select, worker threads idle on their queues)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("selectors.py", "EpollSelector.select"),
+    ("selectors.py", "KqueueSelector.select"),
+    ("selectors.py", "_PollLikeSelector.select"),
+    ("threading.py", "wait"),
+    ("threading.py", "Condition.wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("threading.py", "Thread._wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("queue.py", "Queue.get"),
+    ("socket.py", "accept"),
+    ("socket.py", "socket.accept"),
+}
+
+# Only one profiling session per process
+_session_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running."""
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to site-packages, the working directory or the stdlib."""
+    for marker in ("site-packages" + os.sep, "dist-packages" + os.sep):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    cwd = os.getcwd() + os.sep
+    if filename.startswith(cwd):
+        return filename[len(cwd):]
+    return os.path.basename(filename)
+
+
+def _code_name(code: CodeType) -> str:
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def _is_idle(code: CodeType) -> bool:
+    return (os.path.basename(code.co_filename), _code_name(code)) in IDLE_FRAMES
+
+
+class Profile:
+    """Aggregated stack samples of one profiling session."""
+
+    def __init__(
+        self,
+        stacks: Counter,
+        samples: int,
+        idle_samples: int,
+        dropped_samples: int,
+        interval: float,
+        duration: float,
+    ):
+        self.stacks = stacks
+        self.samples = samples
+        self.idle_samples = idle_samples
+        self.dropped_samples = dropped_samples
+        self.interval = interval
+        self.duration = duration
+        self._labels: Dict[CodeType, str] = {}
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{_short_path(code.co_filename)}:{_code_name(code)}"
+            self._labels[code] = label
+        return label
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "dropped_samples": self.dropped_samples,
+            "distinct_stacks": len(self.stacks),
+            "interval_ms": self.interval * 1000,
+            "duration_seconds": round(self.duration, 3),
+        }
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks: "thread;root;...;leaf count" per line, hottest first."""
+        lines = []
+        for (thread_name, codes), count in self.stacks.most_common():
+            frames = ";".join(self._label(code) for code in codes)
+            lines.append(f"{thread_name};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """speedscope file format: one sampled profile per thread, weights in ms."""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[CodeType, int] = {}
+        by_thread: Dict[str, Tuple[List[List[int]], List[float]]] = {}
+        interval_ms = self.interval * 1000
+
+        for (thread_name, codes), count in self.stacks.items():
+            stack = []
+            for code in codes:
+                index = frame_index.get(code)
+                if index is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append({
+                        "name": _code_name(code),
+                        "file": _short_path(code.co_filename),
+                        "line": code.co_firstlineno,
+                    })
+                stack.append(index)
+            samples, weights = by_thread.setdefault(thread_name, ([], []))
+            samples.append(stack)
+            weights.append(count * interval_ms)
+
+        profiles = [
+            {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+            for thread_name, (samples, weights) in sorted(by_thread.items())
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": f"Justice Companion backend (pid {os.getpid()})",
+            "exporter": "backend.utils.profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+class SamplingProfiler:
+    """
+    Samples the Python stacks of all threads at a fixed interval.
+
+    Runs in a background daemon thread between start() and stop().
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        include_idle: bool = False,
+        max_stacks: int = MAX_DISTINCT_STACKS,
+    ):
+        """
+        Initialize sampling profiler.
+
+        Args:
+            interval: Seconds between samples (default: 10ms, i.e. 100 Hz)
+            include_idle: Keep samples of threads waiting in select/queues
+            max_stacks: Distinct stacks kept; further new stacks are dropped
+        """
+        self.interval = max(interval, MIN_INTERVAL_SECONDS)
+        self.include_idle = include_idle
+        self.max_stacks = max_stacks
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._idle_samples = 0
+        self._dropped_samples = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        """
+        Start sampling.
+
+        Raises:
+            ProfilerBusyError: Another profiling session is running
+        """
+        if not _session_lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profiling session is already running")
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """Stop sampling and return the aggregated profile."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            _session_lock.release()
+        return Profile(
+            stacks=self._stacks,
+            samples=self._samples,
+            idle_samples=self._idle_samples,
+            dropped_samples=self._dropped_samples,
+            interval=self.interval,
+            duration=time.perf_counter() - self._started_at,
+        )
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names: Dict[int, str] = {}
+        next_sample = time.perf_counter()
+
+        while not self._stop_event.wait(max(0.0, next_sample - time.perf_counter())):
+            next_sample += self.interval
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                name = thread_names.get(ident)
+                if name is None:
+                    thread_names = {t.ident: t.name for t in threading.enumerate()}
+                    name = thread_names.get(ident, f"thread-{ident}")
+                self._record(name, frame)
+
+    def _record(self, thread_name: str, frame: FrameType) -> None:
+        if not self.include_idle and _is_idle(frame.f_code):
+            self._idle_samples += 1
+            return
+
+        codes = []
+        current: Optional[FrameType] = frame
+        while current is not None and len(codes) < MAX_STACK_DEPTH:
+            codes.append(current.f_code)
+            current = current.f_back
+        codes.reverse()  # root first
+
+        key = (thread_name, tuple(codes))
+        if key in self._stacks or len(self._stacks) < self.max_stacks:
+            self._stacks[key] += 1
+            self._samples += 1
+        else:
+            self._dropped_samples += 1
+
+
+# ===== MEMORY =====
+
+class MemorySession:
+    """
+    tracemalloc snapshot diff over a time window.
+
+    Starts tracemalloc if it is not tracing yet (and stops it again at the
+    end). Allocations are slower while tracing, which is why the window is
+    bounded like CPU profiling.
+    """
+
+    def __init__(self, frames: int = 5):
+        """
+        Args:
+            frames: Traceback depth recorded per allocation
+        """
+        self.frames = frames
+        self._started_tracing = False
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    def start(self) -> None:
+        """
+        Take the baseline snapshot.
+
+        Raises:
+            ProfilerBusyError: Another profiling session is running
+        """
+        if not _session_lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profiling session is already running")
+        try:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracing = True
+            self._baseline = self._snapshot()
+        except BaseException:
+            _session_lock.release()
+            raise
+
+    def stop(self, top: int = 25) -> Dict[str, Any]:
+        """
+        Diff a new snapshot against the baseline.
+
+        Args:
+            top: Number of allocation sites returned (largest growth first)
+
+        Returns:
+            Traced memory totals and the top allocation sites by growth
+        """
+        try:
+            current = self._snapshot()
+            current_size, peak_size = tracemalloc.get_traced_memory()
+            stats = current.compare_to(self._baseline, "traceback")
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+            _session_lock.release()
+
+        return {
+            "traced_memory_bytes": current_size,
+            "traced_peak_bytes": peak_size,
+            "total_growth_bytes": sum(stat.size_diff for stat in stats),
+            "top": [
+                {
+                    "size_diff_bytes": stat.size_diff,
+                    "size_bytes": stat.size,
+                    "count_diff": stat.count_diff,
+                    "count": stat.count,
+                    "traceback": [
+                        f"{_short_path(frame.filename)}:{frame.lineno}"
+                        for frame in stat.traceback
+                    ],
+                }
+                for stat in stats[:top]
+            ],
+        }
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
@@ -14,6 +14,11 @@ Features:
 - Performance timing helpers
 - GDPR-compliant PII filtering
 - Log aggregation support (ELK, CloudWatch, etc.)
+- Non-blocking output: a bounded queue and a background writer thread
+  (start_queue_logging), so a log call on the request path costs a queue
+  put; records are dropped and counted instead of blocking when full
+- Lazy fields: extra={"rows": Lazy(lambda: len(rows))} is only computed
+  when the record is written
 
 Usage:
     from backend.utils.structured_logger import get_logger, set_correlation_id
@@ -26,18 +31,31 @@ Usage:
     # In application code:
     logger.info("User logged in", extra={"user_id": user_id})
     logger.error("Database query failed", extra={"query": query, "error": str(e)})
+
+    # At startup (main.py):
+    root_logger.addHandler(start_queue_logging([json_handler]) or json_handler)
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
+import threading
 import time
 import uuid
-from typing import Optional, Dict, Any, List
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Optional, Dict, Any, List
 from contextvars import ContextVar
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
 # Context variables for request-scoped data (thread-safe)
 correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 user_id_var: ContextVar[Optional[int]] = ContextVar('user_id', default=None)
@@ -69,6 +87,51 @@ class LogContext:
         return {k: v for k, v in asdict(self).items() if v is not None}
 
 
+# LogRecord attributes that are not extra fields
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    'message', 'asctime', 'log_context',
+}
+
+
+class Lazy:
+    """
+    Extra field computed only when the record is formatted.
+
+    With queue logging the callable runs on the writer thread, so it must
+    only read data that is not modified after the log call.
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def __call__(self) -> Any:
+        return self.func()
+
+
+def _current_context() -> Dict[str, Any]:
+    """Request context from context vars (None values omitted)."""
+    context = {}
+    correlation_id = correlation_id_var.get()
+    if correlation_id is not None:
+        context['correlation_id'] = correlation_id
+    user_id = user_id_var.get()
+    if user_id is not None:
+        context['user_id'] = user_id
+    request_path = request_path_var.get()
+    if request_path is not None:
+        context['request_path'] = request_path
+    return context
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Encode a log entry; values JSON cannot represent are logged as str()."""
+    if orjson is None:
+        return json.dumps(log_entry, default=str)
+    return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
 class StructuredFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
@@ -91,52 +154,53 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        # Base log entry
+        # Base log entry (timestamp is when the record was created, not written)
+        created = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': created.isoformat() + 'Z',
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
         }
 
-        # Add context from context vars
-        context = LogContext(
-            correlation_id=correlation_id_var.get(),
-            user_id=user_id_var.get(),
-            request_path=request_path_var.get(),
-        )
-        context_dict = context.to_dict()
+        # Context captured at the log call (queue logging) or from context vars
+        context_dict = getattr(record, 'log_context', None)
+        if context_dict is None:
+            context_dict = _current_context()
         if context_dict:
             log_entry['context'] = context_dict
 
         # Add extra fields from record
         extra_fields = {}
         for key, value in record.__dict__.items():
-            # Skip standard fields
-            if key not in [
-                'name', 'msg', 'args', 'created', 'filename', 'funcName',
-                'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                'message', 'pathname', 'process', 'processName', 'relativeCreated',
-                'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
-            ]:
-                # Filter PII
-                if key.lower() in self.PII_FIELDS:
-                    extra_fields[key] = '[REDACTED]'
-                else:
-                    extra_fields[key] = value
+            if key in _RECORD_ATTRS:
+                continue
+            # Filter PII
+            if key.lower() in self.PII_FIELDS:
+                extra_fields[key] = '[REDACTED]'
+            elif isinstance(value, Lazy):
+                try:
+                    extra_fields[key] = value()
+                except Exception as e:
+                    extra_fields[key] = f'[lazy field failed: {type(e).__name__}]'
+            else:
+                extra_fields[key] = value
 
         if extra_fields:
             log_entry['extra'] = extra_fields
 
-        # Add exception info if present
-        if record.exc_info and self.include_trace:
-            log_entry['exception'] = self.formatException(record.exc_info)
+        # Add exception info if present (pre-rendered by QueueLogHandler)
+        if self.include_trace:
+            if record.exc_info:
+                log_entry['exception'] = self.formatException(record.exc_info)
+            elif record.exc_text:
+                log_entry['exception'] = record.exc_text
 
         # Add source location (file:line)
         if self.include_trace:
             log_entry['source'] = f"{record.filename}:{record.lineno}"
 
-        return json.dumps(log_entry)
+        return _dumps(log_entry)
 
 
 def get_logger(
@@ -161,9 +225,11 @@ def get_logger(
     """
     logger = logging.getLogger(name)
 
-    # Only configure if not already configured
-    if not logger.handlers:
+    # Only configure if not already configured; with queue logging running
+    # records propagate to the root queue handler instead
+    if not logger.handlers and _queue_handler is None:
         handler = logging.StreamHandler()
+        handler._structured_default = True
 
         if structured:
             formatter = StructuredFormatter()
@@ -179,6 +245,182 @@ def get_logger(
     return logger
 
 
+# ===== QUEUE LOGGING =====
+
+# Records of this level and above wait briefly for queue space before being dropped
+BLOCKING_LEVEL = logging.ERROR
+BLOCKING_TIMEOUT_SECONDS = 0.05
+
+
+def get_log_queue_size() -> int:
+    """
+    Get the configured log queue capacity.
+
+    Environment:
+        LOG_QUEUE_SIZE: Maximum queued records (default: 10000, 0 = write synchronously)
+    """
+    try:
+        return max(0, int(os.getenv('LOG_QUEUE_SIZE', '10000')))
+    except ValueError:
+        return 10000
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller on a full queue.
+
+    prepare() only does what must happen on the calling thread: merging
+    the message arguments, capturing the request context and rendering the
+    traceback. JSON formatting happens on the writer thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+        self._reported_drops = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers on the same logger still see the original record
+        prepared = logging.LogRecord.__new__(logging.LogRecord)
+        prepared.__dict__.update(record.__dict__)
+        record = prepared
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_context = _current_context()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= BLOCKING_LEVEL:
+                self.queue.put(record, timeout=BLOCKING_TIMEOUT_SECONDS)
+            else:
+                self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+    def take_drop_report(self) -> int:
+        """Number of records dropped since the last report."""
+        with self._drop_lock:
+            unreported = self.dropped - self._reported_drops
+            self._reported_drops = self.dropped
+        return unreported
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'queued': self.queue.qsize(),
+            'capacity': self.queue.maxsize,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+        }
+
+
+class _ReportingQueueListener(QueueListener):
+    """QueueListener that logs a warning after records were dropped."""
+
+    def __init__(self, queue_handler: QueueLogHandler, *handlers: logging.Handler):
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for space: the writer thread is still draining the queue
+        self.queue.put(self._sentinel)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        dropped = self.queue_handler.take_drop_report()
+        if dropped:
+            super().handle(logging.makeLogRecord({
+                'name': __name__,
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f'Log queue full: dropped {dropped} records',
+                'dropped_records': dropped,
+                'log_context': {},
+            }))
+
+
+_queue_handler: Optional[QueueLogHandler] = None
+_queue_listener: Optional[_ReportingQueueListener] = None
+_queue_lock = threading.Lock()
+
+
+def get_queue_log_handler() -> Optional[QueueLogHandler]:
+    """Get the running queue handler (None when logging synchronously)."""
+    return _queue_handler
+
+
+def start_queue_logging(
+    handlers: List[logging.Handler],
+    maxsize: Optional[int] = None,
+) -> Optional[QueueLogHandler]:
+    """
+    Move writing of log records to a background thread.
+
+    Handlers that get_logger() attached to individual loggers are removed
+    so their records propagate to the root logger (and so the queue).
+
+    Args:
+        handlers: Handlers that write the records (e.g. the stdout JSON handler)
+        maxsize: Queue capacity (default: LOG_QUEUE_SIZE)
+
+    Returns:
+        Handler to add to the root logger, or None if the queue is disabled
+        (LOG_QUEUE_SIZE=0); add the handlers directly in that case
+    """
+    global _queue_handler, _queue_listener
+
+    maxsize = get_log_queue_size() if maxsize is None else maxsize
+    if maxsize <= 0:
+        return None
+
+    with _queue_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        _queue_handler = QueueLogHandler(queue.Queue(maxsize))
+        _queue_listener = _ReportingQueueListener(_queue_handler, *handlers)
+        _queue_listener.start()
+
+        for existing in list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(existing, logging.Logger):
+                for handler in existing.handlers[:]:
+                    if getattr(handler, '_structured_default', False):
+                        existing.removeHandler(handler)
+
+    atexit.register(stop_queue_logging)
+    return _queue_handler
+
+
+def stop_queue_logging() -> None:
+    """
+    Write out queued records and stop the writer thread.
+
+    The root logger's queue handler is replaced by the writer handlers, so
+    records logged during shutdown are still written (synchronously).
+    """
+    global _queue_handler, _queue_listener
+
+    with _queue_lock:
+        handler, listener = _queue_handler, _queue_listener
+        if handler is None or listener is None:
+            return
+        _queue_handler = _queue_listener = None
+
+        root_logger = logging.getLogger()
+        if handler in root_logger.handlers:
+            root_logger.removeHandler(handler)
+            for target in listener.handlers:
+                root_logger.addHandler(target)
+        listener.stop()
+
+
 # Context management functions
 
 def set_correlation_id(correlation_id: str) -> None:
@@ -0,0 +1,507 @@
+"""
+Lightweight in-process tracing spans.
+
+Provides:
+- span(): context manager timing one operation inside the current trace
+- traced(): decorator for functions, coroutines and (async) generators
+- trace_methods(): class decorator tracing every public method
+- TraceRecorder: in-memory ring buffer of finished traces, optionally also
+  written to disk as Chrome trace files (chrome://tracing, Perfetto)
+- Chrome trace and OTLP/JSON export of recorded traces
+
+Features:
+- Trace IDs are the request correlation ID (see structured_logger), so a
+  trace can be matched with the request's log lines
+- Requests are sampled (TRACE_SAMPLE_RATE, default 0 = off); outside a
+  sampled request span() returns a shared no-op object and traced
+  functions run with a single ContextVar lookup of overhead
+- Parent/child nesting follows contextvars, so spans nest correctly across
+  awaits, threadpool calls and streaming generators
+
+Configuration (environment):
+- TRACE_SAMPLE_RATE: Fraction of requests traced (0.0-1.0, default 0.0)
+- TRACE_BUFFER_SIZE: Finished traces kept in memory (default 200)
+- TRACE_EXPORT_DIR: Also write each trace there as a Chrome trace file
+
+Usage:
+    from backend.utils.tracing import span, traced, trace_methods
+
+    with span("evidence.decrypt", count=len(rows)):
+        ...
+
+    @traced("pdf.render")
+    async def render(...): ...
+
+    @trace_methods()
+    class CaseRepository: ...
+
+    # Recorded traces: GET /diagnostics/traces (admin only)
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from backend.utils.structured_logger import generate_correlation_id, get_correlation_id
+
+logger = logging.getLogger(__name__)
+
+# Spans recorded per trace before further spans are only counted
+MAX_SPANS_PER_TRACE = 5000
+
+SERVICE_NAME = "justice-companion-backend"
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    """Returned by span() outside a sampled trace; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "trace", "name", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "thread_id", "error", "_token",
+    )
+
+    def __init__(self, trace: "Trace", name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.trace = trace
+        self.name = name
+        self.span_id = trace.next_span_id()
+        self.parent_id: Optional[str] = None
+        self.attributes = attributes or {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+        self.error: Optional[str] = None
+        self._token = None
+
+    def start(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.end_ns = time.perf_counter_ns()
+        if error is not None:
+            self.error = type(error).__name__
+        self.trace.add_span(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def __enter__(self):
+        self.start()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Exited in another context (e.g. a generator resumed elsewhere)
+            pass
+        self.finish(exc_val)
+        return False
+
+
+class Trace:
+    """Spans recorded for one sampled request."""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or get_correlation_id() or generate_correlation_id()
+        self.name = name
+        self.started_at = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.context_token = None
+        self._next_span_id = 0
+        self._lock = threading.Lock()
+
+    def next_span_id(self) -> str:
+        with self._lock:
+            self._next_span_id += 1
+            return f"{self._next_span_id:016x}"
+
+    def add_span(self, finished: Span) -> None:
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append(finished)
+        else:
+            self.dropped_spans += 1
+
+    @property
+    def root(self) -> Optional[Span]:
+        return next((s for s in self.spans if s.parent_id is None), None)
+
+    @property
+    def duration_ms(self) -> float:
+        root = self.root
+        return root.duration_ms if root is not None else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Short description for listings."""
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at // 1_000_000,
+            "duration_ms": round(self.duration_ms, 3),
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event format (complete "X" events, microseconds)."""
+        events = [
+            {
+                "name": s.name,
+                "cat": "span",
+                "ph": "X",
+                "ts": (s.start_ns - self.start_ns) / 1000,
+                "dur": (s.end_ns - s.start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": s.thread_id,
+                "args": {**s.attributes, **({"error": s.error} if s.error else {})},
+            }
+            for s in self.spans
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id, "name": self.name},
+        }
+
+    def to_otlp_json(self) -> Dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest with one resource and scope."""
+        trace_id = _otlp_trace_id(self.trace_id)
+        spans = []
+        for s in self.spans:
+            otlp_span = {
+                "traceId": trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                # SPAN_KIND_SERVER for the request, SPAN_KIND_INTERNAL otherwise
+                "kind": 2 if s.parent_id is None else 1,
+                "startTimeUnixNano": str(self.started_at + s.start_ns - self.start_ns),
+                "endTimeUnixNano": str(self.started_at + s.end_ns - self.start_ns),
+                "attributes": [_otlp_attribute(k, v) for k, v in s.attributes.items()],
+                "status": {"code": 2, "message": s.error} if s.error else {"code": 0},
+            }
+            if s.parent_id is not None:
+                otlp_span["parentSpanId"] = s.parent_id
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+                }
+            ]
+        }
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """32 hex digits: the correlation UUID itself, or a hash of other IDs."""
+    candidate = trace_id.replace("-", "").lower()
+    if len(candidate) == 32 and all(c in "0123456789abcdef" for c in candidate):
+        return candidate
+    return hashlib.sha256(trace_id.encode("utf-8")).hexdigest()[:32]
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# ===== SPAN API =====
+
+def span(name: str, **attributes: Any):
+    """
+    Time an operation as a child of the current span.
+
+    Returns a no-op context manager when the current request is not sampled.
+    Attributes must not contain personal data (plaintext, names, content).
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return NOOP_SPAN
+    return Span(trace, name, attributes)
+
+
+def tracing_active() -> bool:
+    """Whether the current context belongs to a sampled trace."""
+    return _current_trace.get() is not None
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording a span for every call.
+
+    Coroutines are timed until they return; generators and async
+    generators until they are exhausted or closed. Without an active trace
+    the wrapped function is called directly.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            def async_gen_wrapper(*args, **kwargs):
+                trace = _current_trace.get()
+                if trace is None:
+                    return func(*args, **kwargs)
+                return _traced_async_gen(Span(trace, span_name), func(*args, **kwargs))
+
+            return async_gen_wrapper
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                trace = _current_trace.get()
+                if trace is None:
+                    return func(*args, **kwargs)
+                return _traced_gen(Span(trace, span_name), func(*args, **kwargs))
+
+            return gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def coroutine_wrapper(*args, **kwargs):
+                trace = _current_trace.get()
+                if trace is None:
+                    return await func(*args, **kwargs)
+                with Span(trace, span_name):
+                    return await func(*args, **kwargs)
+
+            return coroutine_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with Span(trace, span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def _traced_async_gen(current: Span, agen):
+    # The body of agen runs in the consumer's context on every __anext__, so
+    # the span is made current only while the generator itself is running.
+    current.start()
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            token = _current_span.set(current)
+            try:
+                item = await agen.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            yield item
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        await agen.aclose()
+        current.finish(error if not isinstance(error, GeneratorExit) else None)
+
+
+def _traced_gen(current: Span, gen):
+    current.start()
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            token = _current_span.set(current)
+            try:
+                item = next(gen)
+            except StopIteration:
+                break
+            finally:
+                _current_span.reset(token)
+            yield item
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        gen.close()
+        current.finish(error if not isinstance(error, GeneratorExit) else None)
+
+
+def trace_methods(
+    prefix: Optional[str] = None,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+) -> Callable:
+    """
+    Class decorator applying traced() to every public method of a class.
+
+    Static methods, class methods, properties, abstract and inherited
+    methods are left alone. Spans are named "<prefix>.<method>".
+
+    Args:
+        prefix: Span name prefix (default: the class name)
+        include: Private methods to trace as well (e.g. "_fetch_with_retry")
+        exclude: Public methods too trivial to be worth a span
+    """
+    extra = set(include)
+    skipped = set(exclude)
+
+    def decorator(cls: type) -> type:
+        span_prefix = prefix or cls.__name__
+        for attr, value in list(vars(cls).items()):
+            if not inspect.isfunction(value) or getattr(value, "__isabstractmethod__", False):
+                continue
+            if (attr.startswith("_") and attr not in extra) or attr in skipped:
+                continue
+            setattr(cls, attr, traced(f"{span_prefix}.{attr}")(value))
+        return cls
+
+    return decorator
+
+
+# ===== TRACE RECORDING =====
+
+class TraceRecorder:
+    """
+    Samples requests and keeps their finished traces.
+
+    Finished traces go to an in-memory ring buffer and, when export_dir is
+    set, to one Chrome trace file each.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        buffer_size: int = 200,
+        export_dir: Optional[str] = None,
+    ):
+        """
+        Initialize trace recorder.
+
+        Args:
+            sample_rate: Fraction of requests traced (0.0 disables tracing)
+            buffer_size: Number of finished traces kept in memory
+            export_dir: Directory for Chrome trace files (None: memory only)
+        """
+        self.sample_rate = sample_rate
+        self.export_dir = Path(export_dir) if export_dir else None
+        self._traces: deque = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def set_sample_rate(self, sample_rate: float) -> None:
+        """Change the sampled fraction of requests (0.0-1.0)."""
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+
+    def should_sample(self) -> bool:
+        rate = self.sample_rate
+        return rate > 0.0 and (rate >= 1.0 or random.random() < rate)
+
+    def start(self, name: str) -> Span:
+        """
+        Begin a trace in the current context and return its root span.
+
+        The caller must pass the root span to finish() in the same context.
+        """
+        trace = Trace(name)
+        trace.context_token = _current_trace.set(trace)
+        return Span(trace, name).__enter__()
+
+    def finish(self, root: Span, error: Optional[BaseException] = None) -> Trace:
+        """End a trace started with start() and record it."""
+        root.__exit__(type(error) if error else None, error, None)
+        trace = root.trace
+        _current_trace.reset(trace.context_token)
+        with self._lock:
+            self._traces.append(trace)
+        return trace
+
+    def export_file(self, trace: Trace) -> Optional[Path]:
+        """Write a trace as a Chrome trace file (no-op without export_dir)."""
+        if self.export_dir is None:
+            return None
+        try:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            path = self.export_dir / f"trace-{trace.started_at // 1_000_000}-{trace.trace_id}.json"
+            path.write_text(json.dumps(trace.to_chrome_trace()), encoding="utf-8")
+            return path
+        except OSError as e:
+            logger.warning(f"Failed to export trace {trace.trace_id}: {e}")
+            return None
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Summaries of the most recent traces, newest first."""
+        with self._lock:
+            traces = list(self._traces)
+        return [trace.summary() for trace in reversed(traces[-limit:])] if limit > 0 else []
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        """Find a recorded trace by ID."""
+        with self._lock:
+            return next((t for t in reversed(self._traces) if t.trace_id == trace_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+# Global trace recorder singleton
+_trace_recorder: Optional[TraceRecorder] = None
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """Get global trace recorder instance (singleton)."""
+    global _trace_recorder
+    if _trace_recorder is None:
+        _trace_recorder = TraceRecorder(
+            sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0") or 0),
+            buffer_size=int(os.getenv("TRACE_BUFFER_SIZE", "200")),
+            export_dir=os.getenv("TRACE_EXPORT_DIR") or None,
+        )
+    return _trace_recorder
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Microbenchmark per-request overhead of the HTTP middleware stack.
+
+Drives a small FastAPI app directly through ASGI (no server, no sockets) and
+reports latency for three stacks serving the same JSON endpoint:
+
+- bare: no middleware at all
+- base-http: --layers no-op BaseHTTPMiddleware layers, the cost the stack
+  paid before error handling, logging, metrics and response wrapping were
+  rewritten as pure ASGI middleware
+- asgi: the production stack from backend.main (ErrorHandling, Logging,
+  Performance, ResponseWrapper)
+
+Log output is silenced unless --verbose is passed, so the numbers measure
+middleware work rather than log formatting.
+
+With --stream the endpoint is a text/event-stream that yields --events
+events --event-delay ms apart (like /chat/stream), and time-to-first-token
+(first non-empty body chunk) is reported next to total request time. A
+buffering middleware shows up as TTFT equal to the full generation time.
+
+Usage:
+    python scripts/benchmark_middleware.py --requests 5000
+    python scripts/benchmark_middleware.py --items 200 --layers 4
+    python scripts/benchmark_middleware.py --stream --requests 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from backend.middleware.error_handler import ErrorHandlingMiddleware  # noqa: E402
+from backend.middleware.logging_middleware import LoggingMiddleware  # noqa: E402
+from backend.middleware.performance_middleware import PerformanceMiddleware  # noqa: E402
+from backend.middleware.response_wrapper import ResponseWrapperMiddleware  # noqa: E402
+
+
+class PassthroughMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer that does nothing but call the next app."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def build_app(
+    stack: str, items: int, layers: int, events: int = 0, event_delay_ms: float = 0.0
+) -> FastAPI:
+    """Create the benchmark app with the requested middleware stack."""
+    app = FastAPI()
+    payload = [{"id": i, "name": f"item {i}"} for i in range(items)]
+
+    @app.get("/items")
+    async def list_items():
+        return payload
+
+    @app.get("/events")
+    async def stream_events():
+        async def generate():
+            for i in range(events):
+                await asyncio.sleep(event_delay_ms / 1000)
+                yield f'data: {{"type": "token", "data": "token {i}"}}\n\n'.encode()
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    if stack == "base-http":
+        for _ in range(layers):
+            app.add_middleware(PassthroughMiddleware)
+    elif stack == "asgi":
+        # Same order as backend.main
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(PerformanceMiddleware, enable_system_metrics=False)
+        app.add_middleware(ResponseWrapperMiddleware)
+
+    return app
+
+
+async def run_requests(app: FastAPI, count: int, path: str = "/items") -> List[Tuple[float, float]]:
+    """Send count GET requests and return (first chunk, total) seconds per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    def make_receive() -> Callable:
+        pending = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if pending:
+                return pending.pop()
+            await asyncio.Event().wait()
+
+        return receive
+
+    first_chunk_at = 0.0
+
+    async def send(message):
+        nonlocal first_chunk_at
+        if message["type"] == "http.response.body" and message.get("body") and not first_chunk_at:
+            first_chunk_at = time.perf_counter()
+
+    # Warm up routing and lazy imports
+    await app(dict(scope), make_receive(), send)
+
+    timings: List[Tuple[float, float]] = []
+    for _ in range(count):
+        receive = make_receive()
+        first_chunk_at = 0.0
+        start = time.perf_counter()
+        await app(dict(scope), receive, send)
+        end = time.perf_counter()
+        timings.append(((first_chunk_at or end) - start, end - start))
+    return timings
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    """Mean and percentiles in microseconds."""
+    ordered = sorted(timings)
+    return {
+        "mean": statistics.mean(ordered) * 1e6,
+        "p50": ordered[len(ordered) // 2] * 1e6,
+        "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HTTP middleware overhead")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per stack")
+    parser.add_argument("--items", type=int, default=20, help="Items in the JSON response")
+    parser.add_argument(
+        "--layers", type=int, default=4, help="BaseHTTPMiddleware layers in the base-http stack"
+    )
+    parser.add_argument("--stream", action="store_true", help="Measure time-to-first-token on SSE")
+    parser.add_argument("--events", type=int, default=50, help="Events per streamed response")
+    parser.add_argument("--event-delay", type=float, default=2.0, help="Milliseconds between events")
+    parser.add_argument("--verbose", action="store_true", help="Keep log output enabled")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    if args.stream:
+        run_stream(args)
+        return
+
+    print(f"{args.requests} requests per stack, {args.items} items per response")
+    print(f"{'stack':<10} {'mean':>10} {'p50':>10} {'p99':>10} {'overhead':>10}")
+
+    baseline = None
+    for stack in ("bare", "base-http", "asgi"):
+        app = build_app(stack, args.items, args.layers)
+        sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with sink:
+            stats = summarize([total for _, total in asyncio.run(run_requests(app, args.requests))])
+        if baseline is None:
+            baseline = stats["mean"]
+        print(
+            f"{stack:<10} {stats['mean']:>8.1f}us {stats['p50']:>8.1f}us "
+            f"{stats['p99']:>8.1f}us {stats['mean'] - baseline:>8.1f}us"
+        )
+
+
+def run_stream(args: argparse.Namespace) -> None:
+    """Report time-to-first-token and total time for the SSE endpoint."""
+    print(
+        f"{args.requests} streamed requests per stack, "
+        f"{args.events} events {args.event_delay}ms apart"
+    )
+    print(f"{'stack':<10} {'ttft p50':>10} {'ttft p99':>10} {'total p50':>10}")
+
+    for stack in ("bare", "base-http", "asgi"):
+        app = build_app(stack, args.items, args.layers, args.events, args.event_delay)
+        sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with sink:
+            timings = asyncio.run(run_requests(app, args.requests, path="/events"))
+        ttft = summarize([first for first, _ in timings])
+        total = summarize([total for _, total in timings])
+        print(
+            f"{stack:<10} {ttft['p50'] / 1000:>8.2f}ms {ttft['p99'] / 1000:>8.2f}ms "
+            f"{total['p50'] / 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Microbenchmark RateLimitService with a large number of active keys.
+
+Measures check_rate_limit / increment latency while --keys keys hold
+undrained attempts, then again while all of those keys expire at once, to
+confirm per-call cost stays flat instead of growing with the key count.
+
+With --store-path the shared SQLite store (RATE_LIMIT_STORE_PATH) is
+benchmarked instead of the in-process one.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py --keys 100000 --ops 200000
+    python scripts/benchmark_rate_limiter.py --store-path /tmp/rate_limits.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.services.rate_limit_service import RateLimitService  # noqa: E402
+from backend.services.rate_limit_store import SqliteRateLimitStore  # noqa: E402
+
+
+class ManualClock:
+    """Epoch clock advanced by the benchmark."""
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark rate limiter checks with many active keys",
+    )
+    parser.add_argument(
+        "--keys",
+        type=int,
+        default=100_000,
+        help="Number of active keys (default: 100000)",
+    )
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=200_000,
+        help="Operations timed per phase (default: 200000)",
+    )
+    parser.add_argument(
+        "--store-path",
+        type=Path,
+        default=None,
+        help="Benchmark the shared SQLite store at this path (default: in-memory)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    return parser.parse_args()
+
+
+def time_ops(label: str, ops: int, operation: Callable[[int], object]) -> None:
+    samples: List[float] = []
+    started = time.perf_counter()
+    for i in range(ops):
+        op_start = time.perf_counter_ns()
+        operation(i)
+        samples.append(time.perf_counter_ns() - op_start)
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+    p50 = samples[len(samples) // 2] / 1000
+    p99 = samples[int(len(samples) * 0.99)] / 1000
+    worst = samples[-1] / 1000
+    print(
+        f"{label:<32} {ops / elapsed:>12,.0f} ops/s  "
+        f"p50 {p50:7.2f}us  p99 {p99:7.2f}us  max {worst:9.2f}us"
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    clock = ManualClock()
+    store = SqliteRateLimitStore(str(args.store_path)) if args.store_path else None
+    limiter = RateLimitService(clock=clock, store=store)
+    if store:
+        store.clear()
+    user_ids = [rng.randrange(args.keys) for _ in range(args.ops)]
+
+    populate_start = time.perf_counter()
+    for user_id in range(args.keys):
+        limiter.increment(user_id, "api_request")
+    print(
+        f"Populated {args.keys:,} keys in {time.perf_counter() - populate_start:.2f}s"
+    )
+
+    time_ops(
+        "check_rate_limit (active)",
+        args.ops,
+        lambda i: limiter.check_rate_limit(user_ids[i], "api_request"),
+    )
+    time_ops(
+        "increment (active)",
+        args.ops,
+        lambda i: limiter.increment(user_ids[i], "api_request"),
+    )
+
+    # Every key is now idle; expiry is paid a bounded batch per call
+    clock.now += 3600
+    time_ops(
+        "check_rate_limit (mass expiry)",
+        args.ops,
+        lambda i: limiter.check_rate_limit(args.keys + i, "api_request"),
+    )
+
+    stats = limiter.get_statistics()
+    print(f"Still tracked after expiry phase: {stats['total_tracked']:,}")
+    limiter.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())